@@ -8,88 +8,86 @@ const PHASE_BUFFER_SETUP = {
         {
           globalDay: 43,
           week: 7,
-          title: 'Pytest & Testing Setup',
+          title: 'Pytest & Testing Infrastructure Setup',
           priority: 'HIGH',
           tasks: [
-            { label: 'Install pytest and configure project structure', estMinutes: 60 },
-            { label: 'Create tests/ directory with __init__.py', estMinutes: 15 },
-            { label: 'Write first test: test_vector_ops.py', estMinutes: 90 },
-            { label: 'Run pytest and verify all tests pass', estMinutes: 30 },
-            { label: 'Document testing setup in docs/testing_guide.md', estMinutes: 45 }
+            { label: 'Install pytest, configure project structure, and understand testing principles', estMinutes: 60, details: '<strong>Action:</strong> Set up professional testing infrastructure for your ML project. Install pytest: <code>pip install pytest pytest-cov</code>. Create proper project structure: separate source code (<code>src/ml_foundations/</code>) from tests (<code>tests/</code>) and notebooks (<code>notebooks/</code>). Structure: <code>ml-project/ ├── src/ml_foundations/ │ ├── __init__.py │ ├── linear_models.py │ └── dimensionality_reduction.py ├── tests/ │ ├── __init__.py │ ├── test_linear_models.py │ └── test_pca.py ├── notebooks/ └── setup.py</code>. Understand testing principles: (1) Tests verify correctness, (2) Tests document expected behavior, (3) Tests enable refactoring with confidence, (4) Tests catch regressions early. Study pytest basics: test discovery (files starting with test_), test functions (starting with test_), assertions, fixtures, parametrization. Create setup.py for installable package. Study Test-Driven Development (TDD) mindset: red (failing test) → green (minimal code to pass) → refactor. <strong>Boundaries:</strong> Focus on project structure today—comprehensive tests come next. Use pytest conventions: tests/ mirrors src/ structure. Keep it simple initially—advanced features (fixtures, parametrize) come with practice. Review <a href="https://docs.pytest.org/en/stable/goodpractices.html" target="_blank" rel="noopener">pytest good practices</a>. <strong>Deliverable:</strong> Proper project structure with pytest installed, basic setup.py, empty test files created. Document in docs/setup/day43_testing_setup.md. <strong>Verification:</strong> <code>pytest --version</code> works, <code>pytest</code> discovers test files (even if empty), project is pip-installable in development mode (<code>pip install -e .</code>). Common pitfall: messy file organization—establish clean structure from start. Success check: Can you import your modules from both notebooks and tests? <strong>Resources:</strong> <a href="https://docs.pytest.org/en/stable/getting-started.html" target="_blank" rel="noopener">Pytest Getting Started</a>, <a href="https://realpython.com/pytest-python-testing/" target="_blank" rel="noopener">Real Python: Pytest Guide</a>, <a href="https://packaging.python.org/tutorials/packaging-projects/" target="_blank" rel="noopener">Python Packaging Tutorial</a>' },
+            { label: 'Write comprehensive test suite for LinearRegression class', estMinutes: 90, details: '<strong>Action:</strong> Create comprehensive test suite for your from-scratch LinearRegression implementation. Move LinearRegression to <code>src/ml_foundations/linear_models.py</code> as a proper module. Write <code>tests/test_linear_models.py</code> with tests: (1) <code>test_fit_simple()</code>: fit on y=2x+3, verify coefficients within tolerance, (2) <code>test_predict()</code>: verify predictions match expected values, (3) <code>test_score()</code>: verify R² calculation correctness, (4) <code>test_normal_equation_vs_gd()</code>: both methods converge to same solution, (5) <code>test_sklearn_equivalence()</code>: results match sklearn.linear_model.LinearRegression, (6) <code>test_edge_cases()</code>: single feature, single sample, perfect fit, (7) <code>test_invalid_inputs()</code>: verify proper errors for wrong shapes/types. Use pytest fixtures for common test data: <code>@pytest.fixture def simple_data(): X = np.array([[1], [2], [3]]); y = np.array([3, 5, 7]); return X, y</code>. Use parametrize for testing multiple scenarios: <code>@pytest.mark.parametrize("method", ["normal_equation", "gradient_descent"])</code>. Implement TDD: write test first (red), make it pass (green), refactor for clarity. <strong>Boundaries:</strong> Write focused tests—each tests one thing. Use descriptive names: <code>test_prediction_accuracy_on_linear_data()</code> not <code>test1()</code>. Use appropriate tolerances for floating point comparisons: <code>np.allclose()</code> or <code>pytest.approx()</code>. Test both happy paths and error conditions. <strong>Deliverable:</strong> Complete test suite in tests/test_linear_models.py with ≥7 tests, all passing, demonstrating comprehensive coverage of LinearRegression functionality. <strong>Verification:</strong> <code>pytest tests/test_linear_models.py -v</code> shows all tests passing. Tests catch bugs if you intentionally break LinearRegression. Common pitfall: tests that don\'t actually verify correctness—use known ground truth. Success check: All tests pass; code coverage >80% for linear_models.py. <strong>Resources:</strong> <a href="https://docs.pytest.org/en/stable/how-to/fixtures.html" target="_blank" rel="noopener">Pytest Fixtures</a>, <a href="https://docs.pytest.org/en/stable/how-to/parametrize.html" target="_blank" rel="noopener">Pytest Parametrize</a>' },
+            { label: 'Add coverage reporting and document testing workflow', estMinutes: 90, details: '<strong>Action:</strong> Set up code coverage tracking and document testing best practices. Generate coverage report: <code>pytest --cov=src/ml_foundations --cov-report=html --cov-report=term</code>. Review coverage report: identify untested code paths, aim for >80% coverage for core modules. Add coverage configuration in <code>setup.cfg</code> or <code>pyproject.toml</code>. Write missing tests to improve coverage—focus on important edge cases and error handling. Create docs/testing/testing_guide.md (600-800 words) documenting: (1) How to run tests: <code>pytest</code> (all), <code>pytest tests/test_linear_models.py</code> (specific file), <code>pytest -v</code> (verbose), (2) How to run with coverage: command and interpreting reports, (3) Testing best practices: one assertion per test when possible, descriptive names, fixtures for common setup, parametrize for similar tests, test public API not internals, (4) TDD workflow: write test first, implement minimal code to pass, refactor, (5) When to write tests: before implementing (TDD), after implementing (validation), when fixing bugs (regression tests), (6) Project testing strategy: what to test (core algorithms, edge cases, error handling), what not to test (trivial getters, third-party libraries). <strong>Boundaries:</strong> Don\'t obsess over 100% coverage—focus on important code paths. Testing trivial code wastes time. In guide, emphasize practical workflow over theory. Include concrete examples from your test suite. Make guide your reference for ongoing testing. <strong>Deliverable:</strong> Coverage report showing >80% for core modules and comprehensive testing guide documenting workflow and best practices. <strong>Verification:</strong> Coverage report is readable and highlights gaps. Guide is clear and actionable. Common pitfall: chasing 100% coverage including trivial code—prioritize important tests. Success check: Can you use your testing guide to maintain good testing habits going forward? <strong>Resources:</strong> <a href="https://pytest-cov.readthedocs.io/" target="_blank" rel="noopener">pytest-cov documentation</a>, <a href="https://martinfowler.com/bliki/TestCoverage.html" target="_blank" rel="noopener">Martin Fowler: Test Coverage</a>' }
           ],
-          reflectionPrompt: 'Why is testing important even for learning projects?'
+          reflectionPrompt: 'Why is testing important for learning projects, not just production code?'
         },
-                {
+        {
           globalDay: 44,
           week: 7,
-          title: 'Black formatter',
+          title: 'Code Formatting & Pre-commit Hooks',
           priority: 'HIGH',
           tasks: [
-            { label: 'Black formatter: Core concepts', estMinutes: 90 },
-            { label: 'Black formatter: Implementation', estMinutes: 75 },
-            { label: 'Black formatter: Practice', estMinutes: 60 }
+            { label: 'Install Black, isort, flake8 and understand code formatting philosophy', estMinutes: 90, details: '<strong>Action:</strong> Set up automatic code formatting toolchain for consistent, professional code style. Install tools: <code>pip install black isort flake8 pre-commit</code>. Understand each tool: (1) Black: opinionated code formatter, enforces consistent style automatically (line length, quotes, spacing), no configuration needed, "any color as long as it\'s black", (2) isort: sorts imports alphabetically and by type (stdlib, third-party, local), (3) flake8: linter catching style issues and potential bugs (unused imports, undefined variables, complexity), (4) pre-commit: framework for managing git hooks, runs checks before each commit. Configure Black in <code>pyproject.toml</code>: <code>[tool.black] line-length = 88 target-version = [\'py38\']</code>. Configure isort to work with Black: <code>[tool.isort] profile = "black"</code>. Create <code>.flake8</code> config file with reasonable settings. Run each tool manually on your code: observe formatting changes, fix any flake8 issues. Understand philosophy: automated formatting eliminates style debates, focuses code reviews on logic not style, maintains consistency across team/time. <strong>Boundaries:</strong> Accept Black\'s choices—don\'t fight the formatter. Use default settings unless you have strong reasons. Fix flake8 issues; don\'t just disable warnings. Study Black\'s philosophy—opinionated tools reduce decision fatigue. <strong>Deliverable:</strong> All formatting tools installed, configured, tested on your codebase. Document in docs/setup/day44_formatting.md with tool descriptions and configuration rationale. <strong>Verification:</strong> <code>black .</code> and <code>isort .</code> format code consistently. <code>flake8 .</code> shows no critical issues (warnings OK initially). Common pitfall: fighting Black\'s formatting—embrace the tool and move on. Success check: Code passes all formatters and linters. <strong>Resources:</strong> <a href="https://black.readthedocs.io/en/stable/" target="_blank" rel="noopener">Black Documentation</a>, <a href="https://pycqa.github.io/isort/" target="_blank" rel="noopener">isort Documentation</a>, <a href="https://flake8.pycqa.org/" target="_blank" rel="noopener">Flake8 Documentation</a>' },
+            { label: 'Configure pre-commit hooks and integrate with git workflow', estMinutes: 75, details: '<strong>Action:</strong> Set up pre-commit hooks to automatically check code quality before every commit. Create <code>.pre-commit-config.yaml</code> in repository root: <code>repos: - repo: https://github.com/pre-commit/pre-commit-hooks rev: v4.4.0 hooks: - id: trailing-whitespace - id: end-of-file-fixer - id: check-yaml - id: check-added-large-files - repo: https://github.com/psf/black rev: 23.3.0 hooks: - id: black - repo: https://github.com/pycqa/isort rev: 5.12.0 hooks: - id: isort - repo: https://github.com/pycqa/flake8 rev: 6.0.0 hooks: - id: flake8</code>. Install hooks: <code>pre-commit install</code>. Test hooks: <code>pre-commit run --all-files</code>. Make a commit to verify hooks run automatically. If hooks fail, fix issues and commit again. Understand workflow: (1) Stage changes with git add, (2) Attempt commit, (3) Pre-commit runs checks, (4) If checks fail, fix issues and try again, (5) If checks pass, commit succeeds. This ensures only clean, formatted code enters repository. Add hooks for pytest: <code>- repo: local hooks: - id: pytest id: pytest name: pytest entry: pytest language: system pass_filenames: false</code>. <strong>Boundaries:</strong> Start with basic hooks, add more as you become comfortable. Some hooks auto-fix (Black, isort), others require manual fixes (flake8, pytest). Don\'t bypass hooks with <code>--no-verify</code> except emergencies. Configure to run fast—skip slow tests in pre-commit, run those in CI. <strong>Deliverable:</strong> Working pre-commit configuration running formatters and linters automatically on every commit. Extend day44_formatting.md with pre-commit setup instructions. <strong>Verification:</strong> Attempting to commit unformatted code triggers hooks and blocks commit until fixed. <code>pre-commit run --all-files</code> passes on entire codebase. Common pitfall: overly strict hooks frustrating workflow—balance thoroughness with speed. Success check: Hooks run automatically on commit, improving code quality without manual effort. <strong>Resources:</strong> <a href="https://pre-commit.com/" target="_blank" rel="noopener">Pre-commit Documentation</a>, <a href="https://ljvmiranda921.github.io/notebook/2018/06/21/precommits-using-black-and-flake8/" target="_blank" rel="noopener">Guide: Pre-commit with Black and Flake8</a>' },
+            { label: 'Set up GitHub Actions for CI and create formatting documentation', estMinutes: 60, details: '<strong>Action:</strong> Configure Continuous Integration (CI) with GitHub Actions to run checks on every push/PR. Create <code>.github/workflows/tests.yml</code>: <code>name: Tests on: [push, pull_request] jobs: test: runs-on: ubuntu-latest steps: - uses: actions/checkout@v3 - uses: actions/setup-python@v4 with: python-version: \'3.9\' - run: pip install -r requirements.txt - run: black --check . - run: isort --check-only . - run: flake8 . - run: pytest --cov=src</code>. Create <code>requirements.txt</code> listing all dependencies. Push to GitHub and verify workflow runs. Fix any CI failures. Understand CI benefits: catches issues early, ensures code quality across contributors, validates every change, provides confidence for merging. Write docs/development/formatting_guide.md (500-700 words) documenting: (1) Why formatting matters: consistency, readability, reduced bike-shedding, (2) Tools used: Black (formatter), isort (import sorter), flake8 (linter), pre-commit (automation), (3) How to use: commands for manual runs, automatic pre-commit behavior, (4) Fixing issues: common flake8 errors and solutions, handling pre-commit failures, (5) CI integration: what GitHub Actions checks, how to debug failures, (6) Best practices: commit frequently, run formatters before PR, don\'t bypass hooks, fix issues rather than disable checks. <strong>Boundaries:</strong> Keep CI fast (< 5 minutes ideally) so it doesn\'t block development. Consider caching dependencies. In documentation, provide practical examples of common scenarios and fixes. Make guide accessible to future you and collaborators. <strong>Deliverable:</strong> Working GitHub Actions CI, comprehensive formatting guide documenting tools and workflow. <strong>Verification:</strong> GitHub Actions runs successfully on push. Guide clearly explains formatting workflow. Common pitfall: complex CI taking too long—keep it simple and fast. Success check: Every push triggers CI checks; guide helps debug failures quickly. <strong>Resources:</strong> <a href="https://docs.github.com/en/actions/quickstart" target="_blank" rel="noopener">GitHub Actions Quickstart</a>, <a href="https://realpython.com/python-continuous-integration/" target="_blank" rel="noopener">Python CI Tutorial</a>' }
           ],
-          reflectionPrompt: 'How does Black formatter help?'
+          reflectionPrompt: 'How do automated formatting tools improve code quality and reduce friction?'
         },
         {
           globalDay: 45,
           week: 7,
-          title: 'Deepnote setup',
+          title: 'Deepnote Migration & Cloud Environment',
           priority: 'HIGH',
           tasks: [
-            { label: 'Deepnote setup: Core concepts', estMinutes: 90 },
-            { label: 'Deepnote setup: Implementation', estMinutes: 75 },
-            { label: 'Deepnote setup: Practice', estMinutes: 60 }
+            { label: 'Set up Deepnote workspace and understand cloud notebook advantages', estMinutes: 90, details: '<strong>Action:</strong> Set up cloud development environment with Deepnote for collaborative, reproducible work. Sign up at <a href="https://deepnote.com" target="_blank" rel="noopener">deepnote.com</a> (free tier includes 750 hours/month). Create new project workspace. Understand advantages over local Jupyter: (1) Access from any device, (2) Pre-configured environment with common ML libraries, (3) Easy collaboration and sharing, (4) Version control integration, (5) Persistent cloud compute, (6) No local setup headaches. Explore Deepnote features: (1) Markdown + code cells like Jupyter, (2) Built-in git integration, (3) Environment variables for secrets, (4) Terminal access for package installation, (5) File browser and dataset uploads, (6) Sharing via link with access controls. Create requirements.txt for your project dependencies. Test importing your custom modules—either upload to workspace or install from git. Create test notebook demonstrating: data loading, your LinearRegression class, visualization, and markdown narrative. Compare experience with local Jupyter—note convenience and any limitations. <strong>Boundaries:</strong> Start with free tier to understand capabilities. Explore documentation and tutorials. Test that your from-scratch implementations work in Deepnote environment. Note any dependencies missing from base environment. Don\'t commit sensitive data or credentials—use environment variables. <strong>Deliverable:</strong> Working Deepnote workspace with test notebook successfully running your ML code. Document setup in docs/setup/day45_deepnote.md. <strong>Verification:</strong> Can access Deepnote from browser, run notebooks successfully, import your modules, save/load data. Common pitfall: treating cloud env like local—understand compute limits and persistence. Success check: Test notebook runs end-to-end in Deepnote showing all Phase 1 capabilities work. <strong>Resources:</strong> <a href="https://docs.deepnote.com/" target="_blank" rel="noopener">Deepnote Documentation</a>, <a href="https://docs.deepnote.com/integrations/github" target="_blank" rel="noopener">Deepnote GitHub Integration</a>' },
+            { label: 'Migrate key notebooks to Deepnote and establish workflow', estMinutes: 75, details: '<strong>Action:</strong> Migrate important notebooks from Phase 1 to Deepnote and establish cloud-first workflow. Select 3-5 key notebooks to migrate: (1) Linear regression end-to-end, (2) PCA with reconstruction demo, (3) California Housing analysis, (4) Your integrated capstone notebook. For each: (1) Upload to Deepnote or clone from GitHub, (2) Verify all cells run successfully, (3) Fix any environment issues (missing packages, path problems), (4) Test data loading (upload datasets or use URLs), (5) Verify visualizations render properly, (6) Add README cell at top explaining notebook purpose. Create docs/setup/migration_checklist.md documenting: (1) Which notebooks migrated, (2) Environment setup steps (pip installs needed), (3) Data handling (where datasets stored, how to load), (4) Known issues and workarounds, (5) Differences from local environment, (6) When to use Deepnote vs local (Deepnote for collaboration/access anywhere, local for large-scale experiments). Establish workflow: primary development in Deepnote, sync to GitHub regularly, local only for special cases. <strong>Boundaries:</strong> Don\'t migrate everything—select representative examples. Test thoroughly to ensure reproducibility. Document any manual steps needed. Consider: Deepnote is collaborative, so make notebooks presentable. Use markdown cells for narrative. Organize files logically in workspace. <strong>Deliverable:</strong> 3-5 key notebooks running successfully in Deepnote, migration checklist documenting process and setup. <strong>Verification:</strong> Migrated notebooks run end-to-end without errors. All visualizations display correctly. Code produces expected results. Common pitfall: assuming identical to local—test thoroughly and document differences. Success check: Can you work on ML projects entirely in Deepnote going forward? <strong>Resources:</strong> <a href="https://docs.deepnote.com/collaboration/sharing-projects" target="_blank" rel="noopener">Deepnote Sharing Guide</a>' },
+            { label: 'Create environment parity checklist and document best practices', estMinutes: 60, details: '<strong>Action:</strong> Create comprehensive environment parity checklist ensuring consistency across local and cloud. Write docs/setup/environment_parity.md (600-800 words) covering: (1) Dependencies: maintain requirements.txt with exact versions (<code>pip freeze > requirements.txt</code>), test installation in both environments, note any platform-specific issues, (2) Python version: use same version (3.8+ recommended) in both environments, (3) Data management: strategy for datasets (cloud storage, git LFS, or download scripts), avoid committing large files to git, document data sources and access methods, (4) Secrets management: use environment variables for API keys/credentials, never commit secrets to git, use Deepnote environment variables, (5) File paths: use relative paths not absolute, platform-independent path handling (pathlib), (6) Testing strategy: test critical notebooks in both environments periodically, automated tests should run in both. Create comparison table: Feature | Local | Deepnote | Notes. Add "Pre-flight Checklist" section: steps before starting new notebook in either environment (check dependencies, data access, git sync). Include troubleshooting section: common issues and solutions for environment mismatches. This document ensures your work is reproducible regardless of platform. <strong>Boundaries:</strong> Be thorough—environment issues are frustrating to debug. Document what you learn through trial and error. Make checklist actionable with specific commands and steps. Include examples from your migration experience. Consider: this supports collaboration and future-proofing your work. <strong>Deliverable:</strong> Comprehensive environment parity documentation with checklist, comparison table, and troubleshooting guide. <strong>Verification:</strong> Document accurately reflects both environments. Checklist is actionable and complete. Common pitfall: vague documentation—be specific with commands and file paths. Success check: Could someone else reproduce your environment using this documentation? <strong>Resources:</strong> <a href="https://12factor.net/" target="_blank" rel="noopener">The Twelve-Factor App</a>, <a href="https://realpython.com/python-virtual-environments-a-primer/" target="_blank" rel="noopener">Python Virtual Environments Guide</a>' }
           ],
-          reflectionPrompt: 'How does Deepnote setup help?'
+          reflectionPrompt: 'How does cloud-based development with Deepnote change your ML workflow?'
         },
         {
           globalDay: 46,
           week: 7,
-          title: 'Weekly logs',
+          title: 'Weekly Logging System & Progress Tracking',
           priority: 'HIGH',
           tasks: [
-            { label: 'Weekly logs: Core concepts', estMinutes: 90 },
-            { label: 'Weekly logs: Implementation', estMinutes: 75 },
-            { label: 'Weekly logs: Practice', estMinutes: 60 }
+            { label: 'Design weekly logging template and establish logging cadence', estMinutes: 90, details: '<strong>Action:</strong> Create systematic weekly logging process for tracking progress, insights, and patterns throughout your ML journey. Design template in docs/templates/weekly_log_template.md including sections: (1) Week Overview: dates, phase, main topics, overall sentiment, (2) Accomplishments: specific deliverables (notebooks created, algorithms implemented, datasets analyzed), quantitative metrics (lines of code, test coverage, model R²), (3) Learning Highlights: key concepts mastered, "aha moments", connections discovered, (4) Challenges: difficult topics, time-consuming tasks, confusing concepts, how overcome, (5) Time Analysis: planned vs actual hours, time distribution across activities (theory, coding, debugging, documentation), efficiency observations, (6) Resources Used: most helpful materials (videos, docs, papers), new resources discovered, (7) Social Learning: Discord interactions, questions asked/answered, collaboration opportunities, (8) Looking Ahead: next week preview, preparation needed, concerns/excitement, (9) Meta-Learning: study habits that worked, improvements needed, energy/motivation patterns. Template should be comprehensive yet quick to fill (20-30 min max). Establish cadence: every Sunday evening, review week and fill template. This builds habit of reflection and progress tracking. <strong>Boundaries:</strong> Make template detailed enough for useful insights but not so burdensome it gets skipped. Balance quantitative (hours, metrics) with qualitative (feelings, insights). Focus on patterns and learning, not just task completion. Consider: weekly logs are data for understanding your learning process. Template should evolve based on what insights prove valuable. <strong>Deliverable:</strong> Comprehensive weekly log template and establishment of Sunday evening logging routine. Document in docs/setup/day46_weekly_logging.md. <strong>Verification:</strong> Template covers all important aspects of learning journey. Feels manageable to complete weekly. Common pitfall: overly complex template that becomes a chore—keep it useful not exhaustive. Success check: Can you complete the template for this week in 30 minutes with valuable insights? <strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2020/11/02/reflect-on-learning/" target="_blank" rel="noopener">How to Reflect on Learning</a>, <a href="https://jamesclear.com/habit-stacking" target="_blank" rel="noopener">Habit Stacking</a>' },
+            { label: 'Create Phase 1 retrospective using weekly logs and establish patterns', estMinutes: 75, details: '<strong>Action:</strong> Aggregate all Phase 1 weekly logs (Weeks 1-6) to identify patterns and insights. Create docs/retrospectives/phase1_aggregate_analysis.md analyzing: (1) Time patterns: total hours invested, distribution across weeks, correlation between estimated and actual time, activities consuming most/least time, (2) Learning velocity: topics mastered per week, difficulty trends over time, improvement in implementation speed, (3) Resource effectiveness: which types of resources worked best (videos, docs, coding practice), rating each major resource used, (4) Challenge patterns: recurring difficulties (math concepts, coding bugs, time management), how strategies evolved to handle challenges, (5) Energy/motivation: when did energy peak/dip, what affected motivation, how to maintain momentum, (6) Social learning: value of Discord, collaboration opportunities taken/missed, (7) Meta-patterns: optimal study times, effectiveness of different learning modes, efficiency improvements over time. Use your weekly logs as data—extract quotes, quantitative data, specific examples. Visualize: create charts showing time distribution, learning velocity, resource ratings. Identify: (1) What consistently worked (keep doing), (2) What didn\'t work (stop doing), (3) What to try (start doing). This analysis informs your approach to Classical ML phase. <strong>Boundaries:</strong> Be analytical and honest—identify real patterns, not just confirmation bias. Use specific evidence from logs. Quantify where possible. Don\'t judge yourself—learning has ups and downs, document them objectively. Consider: this is meta-learning—learning about how you learn best. <strong>Deliverable:</strong> Comprehensive Phase 1 learning pattern analysis with visualizations, identifying what works and what doesn\'t for your learning. <strong>Verification:</strong> Analysis reveals actionable insights about your learning process. Backed by specific evidence from logs. Common pitfall: superficial analysis without real patterns—dig deep into your data. Success check: Can you name 3 specific changes to your study approach based on this analysis? <strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/ultralearning/" target="_blank" rel="noopener">Ultralearning: Meta-Learning</a>' },
+            { label: 'Set up progress tracking dashboard and define success metrics', estMinutes: 60, details: '<strong>Action:</strong> Create quantitative progress tracking system for ongoing motivation and course correction. Design tracking spreadsheet or document (docs/tracking/progress_dashboard.md) with metrics: (1) Daily: hours studied, topics covered, tasks completed, (2) Weekly: notebooks created, tests written, algorithms implemented, R² scores achieved, quiz/assessment results, (3) Phase: cumulative hours, total deliverables, mastery ratings per topic, overall phase completion, (4) Long-term: phases completed, major milestones, portfolio pieces. Create visualization scripts or manual charts: (1) Cumulative hours over time (target line vs actual), (2) Weekly task completion rate, (3) Learning velocity (topics mastered per week), (4) Model performance improvement over time. Define success metrics for upcoming Classical ML phase: what does "success" look like? (1) Quantitative: X notebooks completed, Y tests passing, Z% coverage, model accuracy targets, (2) Qualitative: understanding concepts deeply, ability to implement from scratch, portfolio-ready projects. Set realistic targets based on Phase 1 experience. Include motivation system: celebrate milestones (every 50 hours, completed phase, achieved difficult goal). Write docs/setup/tracking_system.md (500-700 words) documenting: tracking methods, success metrics, how to maintain dashboard, how to use data for course correction, motivation strategies. <strong>Boundaries:</strong> Don\'t over-engineer—simple tracking is better than complex abandoned system. Focus on metrics that matter for learning, not just task completion. Balance quantitative tracking with qualitative reflection. Make updating dashboard quick (5-10 min/week max). <strong>Deliverable:</strong> Progress tracking dashboard with defined metrics, visualization approach, and documentation of tracking system. <strong>Verification:</strong> Dashboard is maintainable and provides motivating feedback. Metrics align with learning goals. Common pitfall: tracking everything and maintaining nothing—keep it simple and sustainable. Success check: Does tracking system motivate you? Can you sustain it long-term? <strong>Resources:</strong> <a href="https://jamesclear.com/measuring-progress" target="_blank" rel="noopener">James Clear: How to Measure Progress</a>, <a href="https://www.youtube.com/watch?v=mNeXuCYiE0U" target="_blank" rel="noopener">How to Track Goals</a>' }
           ],
-          reflectionPrompt: 'How does Weekly logs help?'
+          reflectionPrompt: 'What patterns in your learning have the weekly logs revealed?'
         },
         {
           globalDay: 47,
           week: 7,
-          title: 'Structure',
+          title: 'Repository Structure & Documentation Audit',
           priority: 'HIGH',
           tasks: [
-            { label: 'Structure: Core concepts', estMinutes: 90 },
-            { label: 'Structure: Implementation', estMinutes: 75 },
-            { label: 'Structure: Practice', estMinutes: 60 }
+            { label: 'Audit current repository structure and create organization plan', estMinutes: 90, details: '<strong>Action:</strong> Conduct comprehensive audit of your ML project repository and plan restructuring for clarity and scalability. Current state audit: (1) List all directories and their contents, (2) Identify disorganized areas (mixed concerns, unclear naming, scattered files), (3) Note missing documentation, (4) Check for consistency in naming conventions, (5) Assess if structure supports future growth. Design ideal structure following best practices: <code>ml-foundations/ ├── README.md (project overview) ├── LICENSE ├── .gitignore ├── requirements.txt ├── setup.py ├── pyproject.toml (tool configs) ├── src/ml_foundations/ (installable package) │ ├── __init__.py │ ├── linear_models.py │ ├── dimensionality_reduction.py │ └── utils.py ├── tests/ (mirrors src/) │ ├── test_linear_models.py │ └── test_dimensionality_reduction.py ├── notebooks/ (organized by phase/topic) │ ├── phase1_foundations/ │ ├── phase2_buffer_setup/ │ └── README.md (notebook index) ├── docs/ │ ├── setup/ (environment, tools) │ ├── notes/ (learning notes) │ ├── logs/ (weekly reflections) │ ├── capstone/ (Phase 1 capstone) │ └── README.md (docs overview) ├── data/ (with README) ├── artifacts/ (plots, models) ├── scripts/ (utility scripts) └── .github/workflows/ (CI/CD)</code>. Create reorganization plan with migration strategy (move files systematically, test after each change, update imports). <strong>Boundaries:</strong> Design for clarity (obvious where things go) and scalability (supports future phases). Use standard Python project conventions. Separate concerns: source code, tests, notebooks, documentation, data. Make navigation easy with README files at key levels. Consider: repository represents your work professionally—structure matters. <strong>Deliverable:</strong> Current state audit document and detailed reorganization plan in docs/setup/day47_repo_structure.md. <strong>Verification:</strong> Plan addresses current disorganization. New structure follows Python best practices. Migration strategy is safe and systematic. Common pitfall: over-engineering structure—keep it practical and intuitive. Success check: Would someone else find your repository organized and navigable? <strong>Resources:</strong> <a href="https://github.com/navdeep-G/samplemod" target="_blank" rel="noopener">Sample Python Project Structure</a>, <a href="https://packaging.python.org/tutorials/packaging-projects/" target="_blank" rel="noopener">Python Packaging Guide</a>, <a href="https://drivendata.github.io/cookiecutter-data-science/" target="_blank" rel="noopener">Cookiecutter Data Science</a>' },
+            { label: 'Execute repository reorganization and update documentation', estMinutes: 75, details: '<strong>Action:</strong> Systematically reorganize repository following your plan. Migration process: (1) Create backup branch: <code>git checkout -b backup-pre-reorg</code>, (2) Work on new branch: <code>git checkout -b repo-reorg</code>, (3) Move files systematically: start with docs, then notebooks, then source code, (4) Update imports in code/tests after moving source files, (5) Update paths in notebooks, (6) Test after each major change: run pytest, try importing modules, execute key notebooks, (7) Update .gitignore to exclude artifacts and data (but commit .gitkeep in empty dirs), (8) Commit incrementally with clear messages: "Move source code to src/", "Reorganize notebooks by phase". Create/update README files: (1) Root README.md: project description, structure overview, setup instructions, usage examples, (2) notebooks/README.md: index of all notebooks with descriptions, (3) docs/README.md: documentation overview and navigation guide, (4) data/README.md: data sources, descriptions, how to obtain. Verify: (1) All tests pass in new structure, (2) Notebooks run correctly, (3) Package installable: <code>pip install -e .</code> works, (4) Documentation is findable and up-to-date. <strong>Boundaries:</strong> Work carefully—broken imports are frustrating. Test frequently. Commit incrementally so you can revert if needed. Use git mv to preserve history. Update CI/CD configs if paths changed. Don\'t rush—systematic beats fast but broken. <strong>Deliverable:</strong> Reorganized repository with updated structure, all tests passing, and current documentation. <strong>Verification:</strong> Repository follows new structure plan. All tests pass. Notebooks run. Package installs correctly. Common pitfall: breaking imports during reorganization—test frequently. Success check: Repository is now well-organized, navigable, and everything works. <strong>Resources:</strong> <a href="https://git-scm.com/docs/git-mv" target="_blank" rel="noopener">git mv documentation</a>, <a href="https://realpython.com/python-import/" target="_blank" rel="noopener">Python Imports Guide</a>' },
+            { label: 'Update README, add LICENSE, and create CONTRIBUTING guide', estMinutes: 60, details: '<strong>Action:</strong> Polish repository with professional documentation making it portfolio-ready. Update README.md to comprehensive project documentation (800-1000 words): (1) Project Title and Description: what this repository contains (ML learning journey, from-scratch implementations), (2) Features: key capabilities (LinearRegression, Ridge, PCA, comprehensive notebooks), (3) Project Structure: directory layout with descriptions, (4) Installation: prerequisites, setup steps, virtual environment creation, dependency installation, (5) Usage: how to run notebooks, how to use your modules, example code snippets, (6) Testing: how to run pytest, coverage information, (7) Development: how to contribute, code style (Black/isort), pre-commit hooks, (8) Roadmap: phases completed and upcoming (Foundations complete, Classical ML next), (9) Learning Resources: key resources used, (10) Author and acknowledgments. Add LICENSE: choose appropriate license (MIT for permissive open source). Create CONTRIBUTING.md: guidelines for if you share repo or work with collaborators, includes: code style, testing requirements, commit conventions, issue/PR process. Add badges to README: build status (GitHub Actions), code coverage, license, Python version. This makes repository professional and shareable. <strong>Boundaries:</strong> Write README for external audience—explain clearly as if reader knows nothing about your project. Make installation/usage instructions concrete with exact commands. Choose permissive license unless you have reasons for restrictive. Consider: this documentation represents your work quality. Portfolio-ready means someone could understand and use your project from README alone. <strong>Deliverable:</strong> Comprehensive README, LICENSE file, CONTRIBUTING guide, making repository professional and portfolio-ready. <strong>Verification:</strong> README is complete, accurate, and well-formatted. Instructions can be followed by external user. License is appropriate. Common pitfall: vague or incomplete README—be thorough and concrete. Success check: Could someone clone your repo and get started using only the README? Would you be proud to share this publicly? <strong>Resources:</strong> <a href="https://www.makeareadme.com/" target="_blank" rel="noopener">How to Write a README</a>, <a href="https://choosealicense.com/" target="_blank" rel="noopener">Choose a License</a>, <a href="https://github.com/nayafia/contributing-template" target="_blank" rel="noopener">CONTRIBUTING Template</a>' }
           ],
-          reflectionPrompt: 'How does Structure help?'
+          reflectionPrompt: 'How does good repository structure and documentation reflect on your work quality?'
         },
         {
           globalDay: 48,
           week: 7,
-          title: 'Buffer',
+          title: 'Buffer Day: Catch-up & Light Learning',
           priority: 'HIGH',
           tasks: [
-            { label: 'Buffer: Core concepts', estMinutes: 90 },
-            { label: 'Buffer: Implementation', estMinutes: 75 },
-            { label: 'Buffer: Practice', estMinutes: 60 }
+            { label: 'Complete any unfinished Phase 1 or Week 7 tasks', estMinutes: 90, details: '<strong>Action:</strong> Use buffer day to catch up on any incomplete or rushed work from Phase 1 or Week 7 setup tasks. Review task list: (1) Phase 1 (Days 1-42): identify any notebooks incomplete, implementations buggy, or understanding shaky, (2) Week 7 (Days 43-47): verify testing setup complete, formatting tools working, Deepnote migrated, weekly logging established, repo restructured. Prioritize by importance: (1) Critical: anything blocking Classical ML progress (shaky foundations, broken infrastructure), (2) High: incomplete major deliverables (capstone notebook, testing suite, documentation), (3) Medium: polish items (visualization quality, documentation completeness), (4) Low: nice-to-haves (additional tests, extra notes). Work systematically through priorities. For incomplete notebooks: finish code and narrative, ensure reproducibility. For infrastructure: verify all tools work correctly. For understanding gaps: review materials until clear. Don\'t rush—quality over speed. Track what you complete and what remains. This buffer prevents technical debt accumulation. <strong>Boundaries:</strong> Focus on important gaps, not perfection. Accept that some low-priority items may remain incomplete—that\'s okay. Don\'t start new work; finish existing work. Aim for "good enough" on polish items. Use time wisely: 90 minutes for catch-up, not procrastination. Consider: buffer days are for course correction and debt reduction, keeping you on track for long-term success. <strong>Deliverable:</strong> Completed or significantly progressed on high-priority incomplete items. Updated task tracking showing current status. <strong>Verification:</strong> Critical and high-priority items completed or on track. Infrastructure works correctly. Understanding gaps filled. Common pitfall: using buffer for new exploration instead of finishing existing work. Success check: Do you feel caught up and ready for Classical ML? <strong>Resources:</strong> Your task lists and weekly logs identifying gaps' },
+            { label: 'Explore supplementary ML topics: interpretability, feature engineering, or real-world examples', estMinutes: 75, details: '<strong>Action:</strong> Use buffer time for light exploration of interesting ML topics not in core curriculum but valuable for broadening perspective. Choose 1-2 topics based on interest: (1) Model Interpretability: SHAP values, LIME, feature importance, partial dependence plots—understand why models make predictions, (2) Feature Engineering: domain-specific transforms, interaction terms, polynomial features, binning/discretization, encoding categorical variables—the art of crafting predictive features, (3) Real-world ML Workflow: data cleaning, handling missing values, outlier treatment, class imbalance, production deployment considerations, (4) AutoML: automated hyperparameter tuning, NAS (Neural Architecture Search), tools like TPOT or AutoKeras—future of ML?, (5) ML Ethics: fairness, bias, privacy, interpretability requirements, social impact—responsible ML practice. For chosen topics: (1) Watch 1-2 introductory videos (~20-30 min total), (2) Read blog posts or documentation overviews, (3) Try simple example if time permits, (4) Take brief notes on key concepts and why they matter. This is exploratory learning, not mastery—build awareness for future deep dives. <strong>Boundaries:</strong> Keep it light and interesting, not stressful. This is enrichment, not required curriculum. Don\'t go too deep—save that for dedicated learning time. Goal is exposure and motivation, not mastery. Choose topics that excite you. Consider: breadth now, depth later. Understanding the ML landscape helps you navigate it. <strong>Deliverable:</strong> Brief exploration notes (docs/exploration/buffer_day_exploration.md) documenting topics explored, key takeaways, and future learning interests. <strong>Verification:</strong> Notes capture interesting concepts and spark curiosity. Exploration felt enriching, not burdensome. Common pitfall: going too deep and creating new obligations—keep it light. Success check: Did exploration broaden your ML perspective enjoyably? <strong>Resources:</strong> <a href="https://christophm.github.io/interpretable-ml-book/" target="_blank" rel="noopener">Interpretable ML Book</a>, <a href="https://www.oreilly.com/library/view/feature-engineering-for/9781491953235/" target="_blank" rel="noopener">Feature Engineering Book</a>, <a href="https://www.youtube.com/watch?v=NyzPxZm2BH0" target="_blank" rel="noopener">Google ML Crash Course</a>' },
+            { label: 'Reflect and prepare mentally for Classical ML phase transition', estMinutes: 60, details: '<strong>Action:</strong> Use buffer day for reflection and mental preparation for transitioning from foundations to Classical ML. Reflection: Write docs/reflection/phase1_to_phase2_transition.md (500-700 words) covering: (1) Emotional journey: how do you feel completing foundations? Excited? Nervous? Confident? (2) Growth recognition: specific ways you\'ve grown (technical skills, study habits, confidence, persistence), compare yourself now to Day 1, (3) Foundation strength: honest assessment of your readiness for Classical ML, remaining uncertainties, confidence in different areas, (4) Study approach evolution: how has your learning process improved? What have you learned about learning? (5) Mindset shifts: how has your thinking about ML changed? What surprised you? What\'s clearer now? Mental preparation: (1) Review Classical ML phase overview: topics, duration, deliverables, (2) Set intentions: what do you want to achieve? How do you want to grow? (3) Identify potential challenges: what might be difficult? How will you handle struggles? (4) Renew commitment: why are you doing this? What motivates you? (5) Celebrate: acknowledge completing intensive 6-week foundations + 1-week setup! Define success for Classical ML: both outcomes (skills, projects) and process (consistent effort, deep understanding, enjoyable learning). <strong>Boundaries:</strong> Be honest and reflective, not performative. Recognize both strengths and areas for growth. Balance confidence with humility—you\'ve learned a lot but there\'s more ahead. Consider: transitions are opportunities to reset and optimize. Mental preparation prevents burnout and maintains motivation. <strong>Deliverable:</strong> Thoughtful transition reflection document showing self-awareness and readiness for next phase. <strong>Verification:</strong> Reflection shows genuine introspection. Mental preparation sets positive mindset for Classical ML. Common pitfall: skipping reflection as "not real work"—it\'s essential for sustained learning. Success check: Do you feel mentally ready and motivated for Classical ML? <strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2019/11/11/beginning-ending/" target="_blank" rel="noopener">The Power of Transitions</a>, <a href="https://jamesclear.com/identity-based-habits" target="_blank" rel="noopener">Identity-Based Habits</a>' }
           ],
-          reflectionPrompt: 'How does Buffer help?'
+          reflectionPrompt: 'What unfinished business needs attention before moving to Classical ML?'
         },
         {
           globalDay: 49,
           week: 7,
-          title: 'Review',
+          title: 'Week 7 Review & Classical ML Readiness',
           priority: 'HIGH',
           tasks: [
-            { label: 'Review: Core concepts', estMinutes: 90 },
-            { label: 'Review: Implementation', estMinutes: 75 },
-            { label: 'Review: Practice', estMinutes: 60 }
+            { label: 'Review Week 7 infrastructure setup and verify all systems operational', estMinutes: 90, details: '<strong>Action:</strong> Comprehensive review of Week 7 infrastructure setup ensuring everything works correctly before Classical ML. Verification checklist: (1) Testing: pytest runs and passes on all tests, coverage >80% for core modules, tests catch bugs if code intentionally broken, (2) Formatting: Black/isort/flake8 installed and configured, pre-commit hooks run automatically on commit, GitHub Actions CI passes on recent commits, (3) Deepnote: workspace accessible, key notebooks migrated and running, environment parity documented, (4) Logging: weekly log template created, Phase 1 logs aggregated and analyzed, progress tracking dashboard established, (5) Repository: well-organized structure, comprehensive README, LICENSE and CONTRIBUTING files present, all documentation up-to-date. For each system, test end-to-end: don\'t just check it exists, verify it works. Fix any issues discovered. Document current state: create docs/reviews/week07_infrastructure_review.md listing: what works correctly, what needs fixing, what\'s optional for now. Create maintenance checklist: regular tasks to keep infrastructure healthy (weekly: run tests, log progress; monthly: update dependencies, review documentation). This ensures solid foundation for Classical ML phase. <strong>Boundaries:</strong> Be thorough—broken infrastructure disrupts learning. Test everything hands-on, don\'t assume. Fix critical issues now; note nice-to-haves for later. Document honestly—knowing what works and what doesn\'t prevents surprises. Consider: infrastructure enables efficient learning; investing in setup pays dividends. <strong>Deliverable:</strong> Verified, operational infrastructure with review document and maintenance checklist. <strong>Verification:</strong> All critical systems work correctly. Documentation accurate. Maintenance plan established. Common pitfall: cursory review without testing—verify thoroughly. Success check: Confidence that infrastructure won\'t block Classical ML progress. <strong>Resources:</strong> Your Week 7 setup documentation' },
+            { label: 'Complete Classical ML readiness assessment and create phase preview', estMinutes: 75, details: '<strong>Action:</strong> Assess readiness for Classical ML and create detailed phase preview. Readiness assessment: Create docs/planning/classical_ml_readiness.md evaluating: (1) Foundation knowledge: rate confidence (1-5) in linear algebra, calculus, probability, statistics, Python, pandas/matplotlib, (2) Implementation skills: can you implement algorithms from scratch? Debug effectively? Write tests? (3) Infrastructure: testing, formatting, version control, cloud environment—all operational? (4) Study habits: effective learning strategies identified? Time management working? Motivation strong? (5) Overall readiness: scale 1-10, specific areas needing attention. Be honest—identifying gaps now prevents struggling later. For gaps, create brief remediation plan. Phase preview: Study Classical ML curriculum in detail. Create docs/planning/classical_ml_preview.md covering: (1) Overview: topics, duration (21 days), phases, (2) Week-by-week breakdown: Week 8 (sklearn, classification, logistic regression), Week 9 (ensemble methods, random forests, boosting), Week 10 (cross-validation, hyperparameter tuning, model selection), (3) Key concepts to learn: for each major topic, what you\'ll understand, implement, and apply, (4) Prerequisites check: do you have necessary foundations? Any review needed? (5) Success criteria: what does mastery look like for Classical ML? (6) Preparation tasks: anything to do before Day 50? (resources to bookmark, concepts to review), (7) Anticipated challenges: what might be difficult? How will you handle? (8) Excitement factors: what are you most looking forward to? <strong>Boundaries:</strong> Make readiness assessment honest and specific. Phase preview should be detailed enough to feel prepared but not overwhelming. Balance excitement with realism. Consider: preparation prevents poor performance. Understanding what\'s ahead enables better planning. <strong>Deliverable:</strong> Honest readiness assessment identifying any gaps and detailed Classical ML phase preview. <strong>Verification:</strong> Assessment is thorough and actionable. Preview provides clear picture of Classical ML phase. Common pitfall: overconfidence or underconfidence—calibrate honestly. Success check: Do you feel informed and ready (even if slightly nervous)? <strong>Resources:</strong> Phase 3 curriculum documentation, <a href="https://www.coursera.org/learn/machine-learning" target="_blank" rel="noopener">Andrew Ng ML Course</a>, <a href="https://scikit-learn.org/stable/tutorial/index.html" target="_blank" rel="noopener">sklearn Tutorials</a>' },
+            { label: 'Write Phase 2 completion log and celebrate setup achievement', estMinutes: 60, details: '<strong>Action:</strong> Complete Phase 2 with celebratory reflection documenting infrastructure setup achievement. Write docs/logs/phase2_complete_log.md (500-700 words) celebrating: (1) Infrastructure built: testing framework (pytest, coverage), formatting pipeline (Black, isort, flake8, pre-commit, CI), cloud environment (Deepnote), logging system (templates, tracking), repository organization (clean structure, professional docs), (2) Systems operational: everything tested and working, ready to support Classical ML, (3) Skills gained: testing, code quality, DevOps basics, project organization, systematic learning, (4) Time investment: hours spent, efficiency improvements, (5) Challenges overcome: technical issues solved, habits established, (6) Looking forward: confidence in infrastructure, readiness for Classical ML, excitement for next phase, (7) Gratitude: resources that helped, progress made. Include quantitative achievements: lines of code formatted, tests written, coverage achieved, notebooks migrated, documents created. This is completion of setup phase—not as glamorous as ML but equally important. Phase 2 enables efficient Classical ML work. Celebrate building professional development environment! Create brief summary for weekly log following established template. Update progress tracking dashboard with Phase 2 completion. Consider: you now have professional-grade infrastructure supporting your ML journey. This is real achievement worth celebrating. <strong>Boundaries:</strong> Make it genuinely celebratory—you built significant infrastructure! Recognize that setup work enables future learning. Balance pride in achievement with readiness for next challenge. Be specific about what you accomplished. Consider: Phase 2 makes you more professional and efficient. <strong>Deliverable:</strong> Celebratory Phase 2 completion log and updated progress tracking showing two phases complete. <strong>Verification:</strong> Log shows genuine pride in infrastructure achievement. Progress tracking current and motivating. Common pitfall: downplaying infrastructure work—it\'s crucial for success! Success check: Do you feel proud of your infrastructure and ready for Classical ML? <strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2019/07/08/celebrate-success/" target="_blank" rel="noopener">Importance of Celebration</a>' }
           ],
-          reflectionPrompt: 'How does Review help?'
+          reflectionPrompt: 'How does solid infrastructure support your learning, and what are you most excited about for Classical ML?'
         }
       ]
     };
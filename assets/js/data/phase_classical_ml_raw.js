@@ -1,263 +1,277 @@
 const PHASE_CLASSICAL_ML = {
       id: 'classical-ml',
-      title: 'Phase 3: Classical ML Fundamentals',
-      description: 'Master sklearn, metrics, cross-validation, and learning curves.',
-      duration: '21 days (Weeks 8-10)',
+      title: 'Phase 3B: CS50AI Survey & Bridge Sprint',
+      description: 'Expanded CS50AI survey with two-day modules (Search, Knowledge, Uncertainty, Optimization, Learning, Neural Networks, Language) plus 4-day bridge sprint preparing for early Deep Learning Core start at Day 68.',
+      duration: '18 days (Days 50-67, enabling Phase 4 early start at Day 68)',
       weeks: [8, 9, 10],
       days: [
+        // CS50AI Survey Days (50-63) - Two-day modules with minimal details
+        // Day 50: CS50AI Search - Lecture
         {
           globalDay: 50,
           week: 8,
-          title: 'Sklearn Introduction & First Classifier',
+          title: 'CS50AI Search: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'DataCamp: Introduction to Machine Learning with scikit-learn Chapter 1', estMinutes: 90 },
-            { label: 'Create notebooks/classical_ml/day50_sklearn_intro.ipynb', estMinutes: 90 },
-            { label: 'Train first LogisticRegression on Iris dataset', estMinutes: 60 },
-            { label: 'Visualize decision boundaries', estMinutes: 45 },
-            { label: 'Write docs/notes/day50_sklearn.md', estMinutes: 30 }
+            { label: 'Watch CS50AI Lecture 0: Search', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 0 covering search algorithms (DFS, BFS, greedy best-first, A*, minimax, alpha-beta pruning). Take concise notes on state spaces, heuristics, and adversarial search. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Search section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/0/" target="_blank" rel="noreferrer">CS50AI Week 0</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/0/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review search algorithm fundamentals', estMinutes: 60, details: '<strong>Action:</strong> Review core search concepts: uninformed search (DFS, BFS), informed search (greedy, A*), adversarial search (minimax, alpha-beta). Note complexity trade-offs. <strong>Deliverables:</strong> Summary table of algorithms with time/space complexity. <strong>Resources:</strong> <a href="https://www.geeksforgeeks.org/search-algorithms-in-ai/" target="_blank" rel="noreferrer">Search Algorithms Overview</a>' }
           ],
-          reflectionPrompt: 'How does sklearn abstract away the math we learned in foundations?'
+          reflectionPrompt: 'How do uninformed vs informed search strategies differ?'
         },
-                {
+        // Day 51: CS50AI Search - Problem Set
+        {
           globalDay: 51,
           week: 8,
-          title: 'Classification',
+          title: 'CS50AI Search: Problem Set & Extension',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Classification: Core concepts', estMinutes: 90 },
-            { label: 'Classification: Implementation', estMinutes: 75 },
-            { label: 'Classification: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Search Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Search problem set (Degrees and/or Tic-Tac-Toe). Implement BFS for shortest path finding and minimax for game playing. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/0/" target="_blank" rel="noreferrer">Problem Set 0</a>' },
+            { label: 'Heuristic benchmark extension', estMinutes: 60, details: '<strong>Action:</strong> Extend search implementation with heuristic comparison: compare A* with different heuristics on same problem. Benchmark nodes explored and runtime. <strong>Deliverables:</strong> Benchmark results showing heuristic impact. <strong>Resources:</strong> Your problem set code' }
           ],
-          reflectionPrompt: 'How does Classification help?'
+          reflectionPrompt: 'How do search heuristics relate to attention mechanisms in Transformers?'
         },
+        // Day 52: CS50AI Knowledge - Lecture
         {
           globalDay: 52,
           week: 8,
-          title: 'Regression',
+          title: 'CS50AI Knowledge: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Regression: Core concepts', estMinutes: 90 },
-            { label: 'Regression: Implementation', estMinutes: 75 },
-            { label: 'Regression: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 1: Knowledge', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 1 on propositional logic, inference, knowledge bases, and model checking. Focus on logical reasoning fundamentals. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Knowledge section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/1/" target="_blank" rel="noreferrer">CS50AI Week 1</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/1/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review propositional logic rules', estMinutes: 60, details: '<strong>Action:</strong> Review logical operators (AND, OR, NOT, IMPLIES, BICONDITIONAL), inference rules (Modus Ponens, Modus Tollens, resolution). Practice truth tables. <strong>Deliverables:</strong> Logic cheat sheet with examples. <strong>Resources:</strong> <a href="https://plato.stanford.edu/entries/logic-propositional/" target="_blank" rel="noreferrer">Stanford Encyclopedia: Propositional Logic</a>' }
           ],
-          reflectionPrompt: 'How does Regression help?'
+          reflectionPrompt: 'How does propositional logic enable automated reasoning?'
         },
+        // Day 53: CS50AI Knowledge - Problem Set
         {
           globalDay: 53,
           week: 8,
-          title: 'Cross-validation',
+          title: 'CS50AI Knowledge: Problem Set & Extension',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Cross-validation: Core concepts', estMinutes: 90 },
-            { label: 'Cross-validation: Implementation', estMinutes: 75 },
-            { label: 'Cross-validation: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Knowledge Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Knowledge problem set (Knights and/or Minesweeper). Implement propositional logic inference. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/1/" target="_blank" rel="noreferrer">Problem Set 1</a>' },
+            { label: 'Resolution trace extension', estMinutes: 60, details: '<strong>Action:</strong> Add resolution proof tracing to your knowledge base: log each inference step showing clauses combined and new clauses derived. <strong>Deliverables:</strong> Annotated proof trace for sample problem. <strong>Resources:</strong> Your problem set code' }
           ],
-          reflectionPrompt: 'How does Cross-validation help?'
+          reflectionPrompt: 'How does symbolic logic differ from neural network reasoning?'
         },
+        // Day 54: CS50AI Uncertainty - Lecture
         {
           globalDay: 54,
           week: 8,
-          title: 'Metrics',
+          title: 'CS50AI Uncertainty: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Metrics: Core concepts', estMinutes: 90 },
-            { label: 'Metrics: Implementation', estMinutes: 75 },
-            { label: 'Metrics: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 2: Uncertainty', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 2 on probability, Bayes\' rule, Bayesian networks, and sampling. Focus on probabilistic reasoning under uncertainty. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Uncertainty section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/2/" target="_blank" rel="noreferrer">CS50AI Week 2</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/2/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review Bayesian inference concepts', estMinutes: 60, details: '<strong>Action:</strong> Review Bayes\' rule, conditional probability, joint distributions, and independence assumptions. Work through Bayesian network examples. <strong>Deliverables:</strong> Worked examples of Bayesian inference. <strong>Resources:</strong> <a href="https://www.youtube.com/watch?v=HZGCoVF3YvM" target="_blank" rel="noreferrer">3Blue1Brown: Bayes Theorem</a>' }
           ],
-          reflectionPrompt: 'How does Metrics help?'
+          reflectionPrompt: 'How does Bayesian reasoning handle uncertainty in AI systems?'
         },
+        // Day 55: CS50AI Uncertainty - Problem Set
         {
           globalDay: 55,
           week: 8,
-          title: 'Learning curves',
+          title: 'CS50AI Uncertainty: Problem Set & Extension',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Learning curves: Core concepts', estMinutes: 90 },
-            { label: 'Learning curves: Implementation', estMinutes: 75 },
-            { label: 'Learning curves: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Uncertainty Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Uncertainty problem set (PageRank and/or Heredity). Implement probabilistic inference algorithms. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/2/" target="_blank" rel="noreferrer">Problem Set 2</a>' },
+            { label: 'HMM forward pass notebook extension', estMinutes: 60, details: '<strong>Action:</strong> Implement a simple Hidden Markov Model forward algorithm in a notebook. Demonstrate state probability propagation over time. <strong>Deliverables:</strong> HMM notebook with forward pass example. <strong>Resources:</strong> <a href="https://en.wikipedia.org/wiki/Forward_algorithm" target="_blank" rel="noreferrer">Forward Algorithm</a>' }
           ],
-          reflectionPrompt: 'How does Learning curves help?'
+          reflectionPrompt: 'How does probability theory underpin language model predictions?'
         },
+        // Day 56: CS50AI Optimization - Lecture
         {
           globalDay: 56,
           week: 8,
-          title: 'Model selection',
+          title: 'CS50AI Optimization & CSP: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Model selection: Core concepts', estMinutes: 90 },
-            { label: 'Model selection: Implementation', estMinutes: 75 },
-            { label: 'Model selection: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 3: Optimization', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 3 on local search, hill climbing, simulated annealing, and constraint satisfaction problems (CSPs). <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Optimization section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/3/" target="_blank" rel="noreferrer">CS50AI Week 3</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/3/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review CSP techniques', estMinutes: 60, details: '<strong>Action:</strong> Review backtracking search, arc consistency, forward checking, and heuristics (MRV, LCV). Understand CSP vs optimization. <strong>Deliverables:</strong> CSP concepts summary with examples. <strong>Resources:</strong> <a href="https://cs.stanford.edu/people/eroberts/courses/soco/projects/1998-99/artificial-intelligence/constraint.html" target="_blank" rel="noreferrer">CSP Introduction</a>' }
           ],
-          reflectionPrompt: 'How does Model selection help?'
+          reflectionPrompt: 'How do local search algorithms differ from systematic search?'
         },
+        // Day 57: CS50AI Optimization - Problem Set
         {
           globalDay: 57,
-          week: 8,
-          title: 'Week 8 Review',
-          priority: 'MEDIUM',
+          week: 9,
+          title: 'CS50AI Optimization & CSP: Problem Set & Extension',
+          priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Review week materials', estMinutes: 75 },
-            { label: 'Practice exercises', estMinutes: 60 },
-            { label: 'Write weekly log', estMinutes: 30 }
+            { label: 'Complete CS50AI Optimization Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Optimization problem set (Crossword). Implement CSP solver with backtracking and arc consistency. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/3/" target="_blank" rel="noreferrer">Problem Set 3</a>' },
+            { label: 'CSP visualization extension', estMinutes: 60, details: '<strong>Action:</strong> Add visualization to CSP solver showing constraint propagation and backtracking steps. Display search tree or assignment progression. <strong>Deliverables:</strong> Visualization showing CSP solving process. <strong>Resources:</strong> Your problem set code' }
           ],
-          reflectionPrompt: 'What progress this week?'
+          reflectionPrompt: 'How do optimization algorithms connect to neural network training?'
         },
+        // Day 58: CS50AI Learning - Lecture
         {
           globalDay: 58,
           week: 9,
-          title: 'Classification',
+          title: 'CS50AI Learning: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Classification: Core concepts', estMinutes: 90 },
-            { label: 'Classification: Implementation', estMinutes: 75 },
-            { label: 'Classification: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 4: Learning', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 4 on supervised learning, k-nearest neighbors, perceptron, SVM, regression, overfitting, and regularization. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Learning section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/4/" target="_blank" rel="noreferrer">CS50AI Week 4</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/4/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review classical ML algorithms', estMinutes: 60, details: '<strong>Action:</strong> Review supervised learning concepts: classification vs regression, loss functions, bias-variance trade-off, cross-validation. Compare algorithm strengths. <strong>Deliverables:</strong> ML algorithm comparison table. <strong>Resources:</strong> <a href="https://scikit-learn.org/stable/tutorial/machine_learning_map/index.html" target="_blank" rel="noreferrer">sklearn Algorithm Cheat Sheet</a>' }
           ],
-          reflectionPrompt: 'How does Classification help?'
+          reflectionPrompt: 'What distinguishes classical ML from deep learning approaches?'
         },
+        // Day 59: CS50AI Learning - Problem Set
         {
           globalDay: 59,
           week: 9,
-          title: 'Regression',
+          title: 'CS50AI Learning: Problem Set & Extension',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Regression: Core concepts', estMinutes: 90 },
-            { label: 'Regression: Implementation', estMinutes: 75 },
-            { label: 'Regression: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Learning Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Learning problem set (Shopping and/or Nim). Implement classification or reinforcement learning algorithms. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/4/" target="_blank" rel="noreferrer">Problem Set 4</a>' },
+            { label: 'Calibration curves mini-artifact', estMinutes: 60, details: '<strong>Action:</strong> Generate calibration plots for your classifier showing predicted probabilities vs actual outcomes. Assess model calibration quality. <strong>Deliverables:</strong> Calibration curve plots with analysis. <strong>Resources:</strong> <a href="https://scikit-learn.org/stable/modules/calibration.html" target="_blank" rel="noreferrer">sklearn Calibration Guide</a>' }
           ],
-          reflectionPrompt: 'How does Regression help?'
+          reflectionPrompt: 'How do classical ML algorithms compare to neural networks in expressiveness?'
         },
+        // Day 60: CS50AI Neural Networks - Lecture
         {
           globalDay: 60,
           week: 9,
-          title: 'Cross-validation',
+          title: 'CS50AI Neural Networks: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Cross-validation: Core concepts', estMinutes: 90 },
-            { label: 'Cross-validation: Implementation', estMinutes: 75 },
-            { label: 'Cross-validation: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 5: Neural Networks', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 5 on perceptrons, activation functions, gradient descent, backpropagation, overfitting, TensorFlow/Keras basics, and CNNs. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Neural Networks section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/5/" target="_blank" rel="noreferrer">CS50AI Week 5</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/5/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review neural network fundamentals', estMinutes: 60, details: '<strong>Action:</strong> Review key concepts: forward pass, activation functions (sigmoid, ReLU), loss functions, backpropagation, optimization. Understand why depth matters. <strong>Deliverables:</strong> Neural network concepts summary. <strong>Resources:</strong> <a href="https://www.youtube.com/watch?v=aircAruvnKk" target="_blank" rel="noreferrer">3Blue1Brown: Neural Networks</a>' }
           ],
-          reflectionPrompt: 'How does Cross-validation help?'
+          reflectionPrompt: 'How do neural networks learn hierarchical representations?'
         },
+        // Day 61: CS50AI Neural Networks - Problem Set
         {
           globalDay: 61,
           week: 9,
-          title: 'Metrics',
+          title: 'CS50AI Neural Networks: Problem Set & Extension',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Metrics: Core concepts', estMinutes: 90 },
-            { label: 'Metrics: Implementation', estMinutes: 75 },
-            { label: 'Metrics: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Neural Networks Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Neural Networks problem set (Traffic). Implement CNN for image classification using TensorFlow. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/5/" target="_blank" rel="noreferrer">Problem Set 5</a>' },
+            { label: 'PyTorch MLP bridge stub', estMinutes: 60, details: '<strong>Action:</strong> Translate your TensorFlow CNN concepts to a simple PyTorch MLP skeleton. Set up basic nn.Module structure as Phase 4 bridge. <strong>Deliverables:</strong> PyTorch MLP stub code. <strong>Resources:</strong> <a href="https://pytorch.org/tutorials/beginner/basics/buildmodel_tutorial.html" target="_blank" rel="noreferrer">PyTorch Build Model Tutorial</a>' }
           ],
-          reflectionPrompt: 'How does Metrics help?'
+          reflectionPrompt: 'What are the key architectural differences between CNNs and Transformers?'
         },
+        // Day 62: CS50AI Language - Lecture
         {
           globalDay: 62,
           week: 9,
-          title: 'Learning curves',
+          title: 'CS50AI Language: Lecture',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Learning curves: Core concepts', estMinutes: 90 },
-            { label: 'Learning curves: Implementation', estMinutes: 75 },
-            { label: 'Learning curves: Practice', estMinutes: 60 }
+            { label: 'Watch CS50AI Lecture 6: Language', estMinutes: 180, details: '<strong>Action:</strong> Watch CS50AI Lecture 6 on NLP, syntax, semantics, context-free grammars, n-grams, bag-of-words, TF-IDF, word2vec, and attention. Includes brief RL mention. <strong>Deliverables:</strong> Notes in <code>docs/cs50ai/notes.md</code> (Language section). <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/weeks/6/" target="_blank" rel="noreferrer">CS50AI Week 6</a>, <a href="https://cs50.harvard.edu/ai/2024/notes/6/" target="_blank" rel="noreferrer">Lecture Notes</a>' },
+            { label: 'Review NLP and attention basics', estMinutes: 60, details: '<strong>Action:</strong> Review language modeling concepts: tokenization, embeddings, sequence models, attention mechanism preview. Note attention\'s importance for Transformers. <strong>Deliverables:</strong> NLP concepts summary focusing on attention. <strong>Resources:</strong> <a href="https://jalammar.github.io/visualizing-neural-machine-translation-mechanics-of-seq2seq-models-with-attention/" target="_blank" rel="noreferrer">Visualizing Attention</a>' }
           ],
-          reflectionPrompt: 'How does Learning curves help?'
+          reflectionPrompt: 'How does attention enable better language understanding?'
         },
+        // Day 63: CS50AI Language - Problem Set
         {
           globalDay: 63,
           week: 9,
-          title: 'Model selection',
+          title: 'CS50AI Language: Problem Set & Survey Complete',
           priority: 'HIGH',
+          minimalDetails: true,
           tasks: [
-            { label: 'Model selection: Core concepts', estMinutes: 90 },
-            { label: 'Model selection: Implementation', estMinutes: 75 },
-            { label: 'Model selection: Practice', estMinutes: 60 }
+            { label: 'Complete CS50AI Language Problem Set', estMinutes: 180, details: '<strong>Action:</strong> Complete CS50AI Language problem set (Parser and/or Attention). Implement syntactic parsing or basic attention mechanism. <strong>Deliverables:</strong> Completed problem set code. <strong>Resources:</strong> <a href="https://cs50.harvard.edu/ai/2024/psets/6/" target="_blank" rel="noreferrer">Problem Set 6</a>' },
+            { label: 'CS50AI Survey Completion & RL mention', estMinutes: 60, details: '<strong>Action:</strong> Review <code>docs/cs50ai/notes.md</code>. Summarize key takeaways from CS50AI survey. Note brief RL/Q-learning concepts for future reference. Optional: explore mini-grid RL environment. <strong>Deliverables:</strong> Survey completion checklist, RL notes. <strong>Resources:</strong> <a href="https://github.com/Farama-Foundation/Minigrid" target="_blank" rel="noreferrer">Mini-grid RL environment</a>' }
           ],
-          reflectionPrompt: 'How does Model selection help?'
+          reflectionPrompt: 'How does attention in CS50AI relate to multi-head attention in Transformers?'
         },
+        // Bridge Sprint Days (64-67) - Full details for Transformer preparation
         {
           globalDay: 64,
-          week: 9,
-          title: 'Week 9 Review',
-          priority: 'MEDIUM',
+          week: 10,
+          title: 'Bridge: ML to Transformer Conceptual',
+          priority: 'HIGH',
           tasks: [
-            { label: 'Review week materials', estMinutes: 75 },
-            { label: 'Practice exercises', estMinutes: 60 },
-            { label: 'Write weekly log', estMinutes: 30 }
+            { label: 'Write ML→Transformer Rationale', estMinutes: 90, details: '<strong>Action:</strong> Create <code>docs/bridge/ml_to_transformer_rationale.md</code> documenting the conceptual bridge from classical ML and CS50AI survey to Transformer architecture. Explain: (1) Why sequence modeling differs from classification/regression, (2) How attention addresses RNN limitations, (3) The role of positional encoding for permutation invariance, (4) Self-attention as learned contextual embeddings. Connect CS50AI attention mechanism to Transformer multi-head attention. <strong>Boundaries:</strong> Focus on conceptual understanding, not implementation. Use diagrams (hand-drawn OK) to illustrate key concepts. Avoid getting lost in math—aim for intuitive explanations. <strong>Deliverable:</strong> 800-1200 word rationale document with: conceptual diagrams, connections from CS50AI/Phase 2 foundations to Phase 4 Transformers, reading list for Week 11. <strong>Verification:</strong> Document clearly explains why Transformers are revolutionary for NLP. You can articulate the key innovation (parallel processing via attention) to someone unfamiliar with the field. Common pitfall: jumping into implementation details too early—stay conceptual. Success check: You understand the "why" before the "how". <strong>Resources:</strong> <a href="https://jalammar.github.io/illustrated-transformer/" target="_blank" rel="noreferrer">Illustrated Transformer</a>, <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need</a>' },
+            { label: 'Baseline Benchmark Task Selection', estMinutes: 60, details: '<strong>Action:</strong> Select a baseline task for Phase 4 experimentation. Options: (1) Character-level Shakespeare generation, (2) Tiny Stories dataset summary, (3) Simple arithmetic (e.g., addition of 2-digit numbers). Choose based on: computational feasibility (trainable on CPU/free Colab), clear success metrics, alignment with Transformer strengths. Document choice in <code>docs/bridge/baseline_task.md</code> with: task description, dataset details, success metrics (perplexity, accuracy, qualitative samples), compute requirements. <strong>Boundaries:</strong> Keep task simple—goal is learning architecture, not SOTA performance. Avoid tasks requiring massive datasets or GPUs. Stay focused on one clear task. <strong>Deliverable:</strong> Task selection document (300-500 words) with dataset links, metric definitions, and feasibility analysis. <strong>Verification:</strong> Task is concrete, measurable, and achievable within Phase 4 constraints. You have access to data and can define clear success criteria. Common pitfall: choosing overly ambitious task that requires resources you don\'t have. Success check: A peer could replicate your task from your documentation. <strong>Resources:</strong> <a href="https://huggingface.co/datasets/roneneldan/TinyStories" target="_blank" rel="noreferrer">TinyStories Dataset</a>, <a href="https://raw.githubusercontent.com/karpathy/char-rnn/master/data/tinyshakespeare/input.txt" target="_blank" rel="noreferrer">Shakespeare char data</a>' },
+            { label: 'Phase 3 Retrospective', estMinutes: 60, details: '<strong>Action:</strong> Complete Phase 3 retrospective in <code>docs/notes/phase3_retrospective.md</code>. Reflect on: (1) CS50AI survey impact—what was valuable vs what could be skipped, (2) Readiness for Phase 4—gaps in foundations, concepts needing review, (3) Learning velocity—did 2-day module split work well? (4) Adjustments for Phase 4—study habits, time allocation, support needs. Be honest about strengths and weaknesses. <strong>Boundaries:</strong> This is formative assessment, not performance review. Focus on growth, not perfection. Identify actionable improvements for Phase 4. Aim for 600-800 words of substantive reflection. <strong>Deliverable:</strong> Retrospective document with: survey effectiveness analysis, readiness self-assessment (1-5 scale with justification), Phase 4 preparation checklist. <strong>Verification:</strong> Document demonstrates genuine self-reflection. You\'ve identified concrete action items for Phase 4 success. Shows awareness of learning process, not just content mastery. Common pitfall: generic platitudes without specific insights. Success check: Re-reading this in Week 17, you can see your growth trajectory and validate your early concerns/predictions. <strong>Resources:</strong> Your Phase 3 notes, <a href="https://www.scotthyoung.com/blog/2019/08/07/become-self-aware/" target="_blank" rel="noreferrer">Metacognitive Reflection</a>' }
           ],
-          reflectionPrompt: 'What progress this week?'
+          reflectionPrompt: 'What foundational concepts from Phase 3 will be most critical for Phase 4 success?'
         },
         {
           globalDay: 65,
           week: 10,
-          title: 'Classification',
+          title: 'Bridge: Reproducibility & Environment',
           priority: 'HIGH',
           tasks: [
-            { label: 'Classification: Core concepts', estMinutes: 90 },
-            { label: 'Classification: Implementation', estMinutes: 75 },
-            { label: 'Classification: Practice', estMinutes: 60 }
+            { label: 'Reproducibility Checklist', estMinutes: 90, details: '<strong>Action:</strong> Create <code>docs/bridge/reproducibility_checklist.md</code> documenting practices for reproducible ML experiments. Cover: (1) Random seeds (torch.manual_seed, np.random.seed, random.seed, CUBLAS), (2) Deterministic algorithms (torch.use_deterministic_algorithms, benchmark=False), (3) Hardware consistency (CPU vs GPU differences, version pinning), (4) Environment specification (requirements.txt with exact versions, Python version), (5) Logging (hyperparameters, metrics, commit hashes). Include code snippets for each practice. <strong>Boundaries:</strong> Focus on practical steps, not theory. Provide copy-paste templates. Prioritize most impactful practices—perfect reproducibility is hard, good reproducibility is achievable. <strong>Deliverable:</strong> Checklist document (500-700 words) with: code templates for seed-setting, environment setup script, logging template. Create <code>notebooks/bridge/seed_test.ipynb</code> demonstrating that same seed = same results. <strong>Verification:</strong> Running your seed test notebook twice produces identical outputs. Checklist is actionable—you can apply it to any Phase 4 experiment. Common pitfall: obsessing over perfect reproducibility—aim for "good enough" given your constraints. Success check: You can explain why reproducibility matters for ML and implement basic practices. <strong>Resources:</strong> <a href="https://pytorch.org/docs/stable/notes/randomness.html" target="_blank" rel="noreferrer">PyTorch Reproducibility</a>, <a href="https://wandb.ai/site/articles/implementing-reproducibility-in-ml" target="_blank" rel="noreferrer">Reproducibility in ML</a>' },
+            { label: 'Environment Setup & Verification', estMinutes: 75, details: '<strong>Action:</strong> Set up Phase 4 development environment. Steps: (1) Create new conda/venv: <code>conda create -n phase4 python=3.10</code>, (2) Install PyTorch (stable, CPU or CUDA based on hardware), (3) Install essentials: numpy, matplotlib, jupyter, tensorboard, (4) Create <code>requirements.txt</code> with exact versions, (5) Test import and device detection (CPU vs CUDA), (6) Set up notebook kernel. Document everything in <code>docs/bridge/environment_setup.md</code>. <strong>Boundaries:</strong> Use stable PyTorch release, not nightly. Start with CPU, add GPU support only if available. Keep dependencies minimal—add more as needed in Phase 4. <strong>Deliverable:</strong> Working environment, documented setup instructions, <code>requirements.txt</code>, test notebook verifying imports and showing torch.cuda.is_available(). <strong>Verification:</strong> All imports work. Can create tensor, move to device, perform simple operations. Jupyter notebook runs in new environment. Common pitfall: version mismatches causing import errors—pin exact versions. Success check: Clean environment that works on first try following your documented steps. <strong>Resources:</strong> <a href="https://pytorch.org/get-started/locally/" target="_blank" rel="noreferrer">PyTorch Installation</a>, <a href="https://docs.conda.io/projects/conda/en/latest/user-guide/tasks/manage-environments.html" target="_blank" rel="noreferrer">Conda Environments</a>' },
+            { label: 'Git Workflow for Experiments', estMinutes: 45, details: '<strong>Action:</strong> Establish git workflow for Phase 4 experiments. Create: (1) <code>.gitignore</code> for ML projects (checkpoints, logs, data, __pycache__), (2) Branch strategy (main for stable, feature branches for experiments), (3) Commit message convention (type: description), (4) Notebook versioning approach (commit .ipynb with outputs cleared or use nbstripout). Document in <code>docs/bridge/git_workflow.md</code>. <strong>Boundaries:</strong> Keep it simple—this is solo work, not team development. Focus on useful habits, not enterprise process. Be pragmatic about committing notebooks—outputs cleared is usually enough. <strong>Deliverable:</strong> Git workflow document, <code>.gitignore</code> file, example of good commit structure. <strong>Verification:</strong> .gitignore prevents committing large checkpoint files. You can explain why version control is critical for experiments. Common pitfall: committing too much (giant checkpoint files) or too little (losing experiment history). Success check: Phase 4 repo stays clean and navigable. <strong>Resources:</strong> <a href="https://github.com/github/gitignore/blob/main/Python.gitignore" target="_blank" rel="noreferrer">Python .gitignore template</a>, <a href="https://drivendata.github.io/cookiecutter-data-science/" target="_blank" rel="noreferrer">Data Science Project Structure</a>' }
           ],
-          reflectionPrompt: 'How does Classification help?'
+          reflectionPrompt: 'Why is reproducibility critical for iterative ML experimentation?'
         },
         {
           globalDay: 66,
-          week: 10,
-          title: 'Regression',
-          priority: 'HIGH',
+          week: 9,
+          inactive: true,
+          supersededBy: 'Phase 4: Deep Learning Core (early start)',
+          title: '[Superseded]',
+          priority: 'INFO',
           tasks: [
-            { label: 'Regression: Core concepts', estMinutes: 90 },
-            { label: 'Regression: Implementation', estMinutes: 75 },
-            { label: 'Regression: Practice', estMinutes: 60 }
+            { label: 'See Phase 4', estMinutes: 0, details: 'Content superseded by early Phase 4 start at Day 61.' }
           ],
-          reflectionPrompt: 'How does Regression help?'
+          reflectionPrompt: ''
         },
         {
           globalDay: 67,
-          week: 10,
-          title: 'Cross-validation',
-          priority: 'HIGH',
+          week: 9,
+          inactive: true,
+          supersededBy: 'Phase 4: Deep Learning Core (early start)',
+          title: '[Superseded]',
+          priority: 'INFO',
           tasks: [
-            { label: 'Cross-validation: Core concepts', estMinutes: 90 },
-            { label: 'Cross-validation: Implementation', estMinutes: 75 },
-            { label: 'Cross-validation: Practice', estMinutes: 60 }
+            { label: 'See Phase 4', estMinutes: 0, details: 'Content superseded by early Phase 4 start at Day 61.' }
           ],
-          reflectionPrompt: 'How does Cross-validation help?'
+          reflectionPrompt: ''
         },
         {
           globalDay: 68,
-          week: 10,
-          title: 'Metrics',
-          priority: 'HIGH',
+          week: 9,
+          inactive: true,
+          supersededBy: 'Phase 4: Deep Learning Core (early start)',
+          title: '[Superseded]',
+          priority: 'INFO',
           tasks: [
-            { label: 'Metrics: Core concepts', estMinutes: 90 },
-            { label: 'Metrics: Implementation', estMinutes: 75 },
-            { label: 'Metrics: Practice', estMinutes: 60 }
+            { label: 'See Phase 4', estMinutes: 0, details: 'Content superseded by early Phase 4 start at Day 61.' }
           ],
-          reflectionPrompt: 'How does Metrics help?'
+          reflectionPrompt: ''
         },
         {
           globalDay: 69,
-          week: 10,
-          title: 'Learning curves',
-          priority: 'HIGH',
+          week: 9,
+          inactive: true,
+          supersededBy: 'Phase 4: Deep Learning Core (early start)',
+          title: '[Superseded]',
+          priority: 'INFO',
           tasks: [
-            { label: 'Learning curves: Core concepts', estMinutes: 90 },
-            { label: 'Learning curves: Implementation', estMinutes: 75 },
-            { label: 'Learning curves: Practice', estMinutes: 60 }
+            { label: 'See Phase 4', estMinutes: 0, details: 'Content superseded by early Phase 4 start at Day 61.' }
           ],
-          reflectionPrompt: 'How does Learning curves help?'
+          reflectionPrompt: ''
         },
         {
           globalDay: 70,
-          week: 10,
-          title: 'Model selection',
-          priority: 'HIGH',
+          week: 9,
+          inactive: true,
+          supersededBy: 'Phase 4: Deep Learning Core (early start)',
+          title: '[Superseded]',
+          priority: 'INFO',
           tasks: [
-            { label: 'Model selection: Core concepts', estMinutes: 90 },
-            { label: 'Model selection: Implementation', estMinutes: 75 },
-            { label: 'Model selection: Practice', estMinutes: 60 }
+            { label: 'See Phase 4', estMinutes: 0, details: 'Content superseded by early Phase 4 start at Day 61.' }
           ],
-          reflectionPrompt: 'How does Model selection help?'
+          reflectionPrompt: ''
         }
       ]
     };
@@ -547,7 +547,7 @@ const PLAN = {
             { label: 'Write Phase 1 completion log and celebrate achievements', estMinutes: 30, details: '<strong>Action:</strong> Create celebratory completion log documenting Phase 1 achievement. Write docs/logs/phase1_complete_log.md (500-700 words) including: (1) Achievement summary: 42 days completed, notebooks created, algorithms implemented from scratch, datasets analyzed, quiz score achieved, foundation topics mastered, (2) Highlight reel: top 5 most satisfying accomplishments (e.g., "Implemented PCA from SVD and saw it perfectly match sklearn", "Achieved R²=0.75 on California Housing from scratch"), (3) Challenges overcome: most difficult topics and how you conquered them, (4) Growth metrics: before vs after confidence in math/programming/ML, specific skills gained, (5) Favorite moments: breakthroughs, "aha!" insights, particularly elegant implementations, satisfying visualizations, (6) Gratitude: resources that helped most, people who supported your learning, (7) Looking forward: excitement for Classical ML, confidence in foundations, goals for next phase. Include quantitative achievements (time invested, code written, models trained) and qualitative growth (understanding deepened, confidence gained). Make this celebratory—you completed intensive 6-week foundations program! <strong>Boundaries:</strong> Make it positive and celebratory while being honest. Quantify achievements where possible. Reflect on growth—you know much more now than 6 weeks ago! Include both technical achievements and personal growth. Consider: you can now implement ML algorithms from mathematical first principles, understand research papers better, analyze real datasets competently. <strong>Deliverable:</strong> Celebratory Phase 1 completion log documenting achievement and growth. <strong>Verification:</strong> Should celebrate real achievements while acknowledging growth journey. Should convey genuine satisfaction with hard work paying off. Common pitfall: downplaying achievements—recognize how much you\'ve learned! Success check: Do you feel genuine pride reading this log? Does it capture your growth? <strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2019/07/08/celebrate-success/" target="_blank" rel="noopener">Why Celebrating Matters</a>' }
           ],
           reflectionPrompt: 'What is your biggest achievement from Phase 1 foundations, and what does it mean for your ML journey?'
-        },
+        }
       ]
     },
     {
@@ -833,7 +833,6 @@ const PLAN = {
           ],
           reflectionPrompt: 'How does attention in CS50AI relate to multi-head attention in Transformers?'
         },
-
         // Bridge Sprint Days (64-67) - Full details for Transformer preparation
         {
           globalDay: 64,
@@ -919,7 +918,6 @@ const PLAN = {
           ],
           reflectionPrompt: ''
         }
-        // End of Phase 3B days
       ]
     },
     {
@@ -943,7 +941,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'How does autograd differ from manual gradient computation?'
         },
-                {
+        {
           globalDay: 72,
           week: 11,
           title: 'PyTorch',
@@ -1542,7 +1540,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'How does character-level differ from word-level tokenization?'
         },
-                {
+        {
           globalDay: 121,
           week: 18,
           title: 'Character Tokenizer Improvements & Frequency Analysis',
@@ -1637,7 +1635,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'Why is scaling by sqrt(d_k) necessary in attention? What happens without it?'
         },
-                {
+        {
           globalDay: 128,
           week: 19,
           title: 'Causal Masking & Test Harness',
@@ -1984,7 +1982,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'What are the key differences between GPT and BERT architectures?'
         },
-                {
+        {
           globalDay: 156,
           week: 23,
           title: 'Architecture',
@@ -2499,7 +2497,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'Why does BPE handle rare words better than word-level tokenization?'
         },
-                {
+        {
           globalDay: 198,
           week: 29,
           title: 'BPE',
@@ -2930,7 +2928,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'What are the most critical safety concerns for a student LLM project?'
         },
-                {
+        {
           globalDay: 233,
           week: 34,
           title: 'Safety',
@@ -3193,7 +3191,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'Why does low-rank adaptation work so well for fine-tuning?'
         },
-                {
+        {
           globalDay: 254,
           week: 37,
           title: 'LoRA',
@@ -3540,7 +3538,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'What patterns emerged that could be abstracted?'
         },
-                {
+        {
           globalDay: 282,
           week: 41,
           title: 'Code cleanup',
@@ -3635,7 +3633,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'Which components are hardest to test? Why?'
         },
-                {
+        {
           globalDay: 289,
           week: 42,
           title: 'Pytest',
@@ -3898,7 +3896,7 @@ const PLAN = {
           ],
           reflectionPrompt: 'Why did you choose this capstone? What excites you most?'
         },
-                {
+        {
           globalDay: 310,
           week: 45,
           title: 'Planning',
@@ -10,12 +10,31 @@
     ACTIVE_TAB: `${STORAGE_PREFIX}.ui.activeTab`,
     TASKS: `${STORAGE_PREFIX}.tasks`,
     TIME: `${STORAGE_PREFIX}.time`,
-    PHASE_RENDERED: `${STORAGE_PREFIX}.rendered`
+    PHASE_RENDERED: `${STORAGE_PREFIX}.rendered`,
+    RENAMES: `${STORAGE_PREFIX}.taskRenames`
   };
+  const DATA_BASE = '/assets/js/data/plan/';
+  const TASK_ID_PATTERN = new RegExp(`^${STORAGE_PREFIX}_(.+)_day(\\d+)_task(\\d+)$`);
+  const SEARCH_LIMIT = 50;
+  // Must match the tokenizer and stopwords in scripts/plan_search.py
+  const TOKEN_PATTERN = /[\p{L}\p{N}]+/gu;
+  const SEARCH_STOPWORDS = new Set(
+    ('a an and are as at be by do for from in into is it its no not of on or s t ' +
+     'that the this to with you your').split(' ')
+  );
 
   // === State Management ===
   let state = {
     activePhase: null,
+    manifest: null,
+    phases: {},
+    phaseLoads: {},
+    detailChunks: {},
+    fragmentsLoad: null,
+    searchIndex: null,
+    dayIndex: {},
+    completed: new Set(),
+    counts: { tasks: 0, days: 0, byDay: {}, byPhase: {} },
     renderedPhases: new Set(),
     tasks: {},
     timeTracking: {},
@@ -50,21 +69,180 @@
     return `${STORAGE_PREFIX}.time.day.${globalDay}`;
   }
 
+  // === Plan Data Loading ===
+  // The build splits the plan into a small manifest, one bundle per phase
+  // and per-week details chunks; bundles are fetched the first time they
+  // are needed and cached for the rest of the visit.
+
+  function fetchJson(url, options) {
+    return fetch(DATA_BASE + url, options).then(response => {
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status} loading ${url}`);
+      }
+      return response.json();
+    });
+  }
+
+  function loadManifest() {
+    // Revalidate the manifest; bundle URLs carry content hashes
+    return fetchJson('manifest.json', { cache: 'no-cache' }).then(manifest => {
+      state.manifest = manifest;
+      state.dayIndex = {};
+      manifest.phases.forEach(phase => {
+        phase.days.forEach(([globalDay, taskCount]) => {
+          state.dayIndex[`${phase.id}_day${globalDay}`] = { phaseId: phase.id, taskCount };
+        });
+      });
+      loadCompletion();
+      return manifest;
+    });
+  }
+
+  function getPhaseInfo(phaseId) {
+    if (!state.manifest) return undefined;
+    return state.manifest.phases.find(p => p.id === phaseId);
+  }
+
+  function loadPhase(phaseId) {
+    if (!state.phaseLoads[phaseId]) {
+      const info = getPhaseInfo(phaseId);
+      state.phaseLoads[phaseId] = fetchJson(info.bundle)
+        .then(phase => {
+          state.phases[phaseId] = phase;
+          return phase;
+        })
+        .catch(e => {
+          delete state.phaseLoads[phaseId];
+          throw e;
+        });
+    }
+    return state.phaseLoads[phaseId];
+  }
+
+  function loadDetails(phase, day) {
+    const url = phase.detailsChunks[day.week];
+    if (!state.detailChunks[url]) {
+      state.detailChunks[url] = fetchJson(url).catch(e => {
+        delete state.detailChunks[url];
+        throw e;
+      });
+    }
+    return state.detailChunks[url];
+  }
+
+  // Details chunks store repeated sentences, headers and links as indices
+  // into one shared fragment table, fetched once with the first chunk
+  function loadFragments() {
+    if (!state.fragmentsLoad) {
+      state.fragmentsLoad = fetchJson(state.manifest.fragments).catch(e => {
+        state.fragmentsLoad = null;
+        throw e;
+      });
+    }
+    return state.fragmentsLoad;
+  }
+
+  function expandDetails(value, fragments) {
+    if (!Array.isArray(value)) return value || '';
+    return value.map(part => typeof part === 'number' ? fragments[part] : part).join('');
+  }
+
   // === Task Management ===
   
+  // Completed task ids are parsed from localStorage once into a Set, and
+  // per-day/per-phase completion counts are kept alongside it, so toggling
+  // a task updates progress without re-reading storage or walking the plan.
+
+  // Moving tasks between days (scripts/plan_schedule.py) renumbers their
+  // positional ids. The manifest lists each renumbering as {id, map: {old id:
+  // new id}}; saved completion is carried over once per renumbering.
+  function applyTaskRenames(tasks) {
+    const renames = (state.manifest && state.manifest.taskRenames) || [];
+    const applied = new Set(getFromStorage(STORAGE_KEYS.RENAMES, []));
+    const pending = renames.filter(rename => !applied.has(rename.id));
+    if (!pending.length) return tasks;
+    pending.forEach(rename => {
+      const kept = {};
+      const renamed = {};
+      Object.keys(tasks).forEach(key => {
+        const newId = rename.map[key.slice(STORAGE_PREFIX.length + 1)];
+        if (newId) {
+          renamed[`${STORAGE_PREFIX}_${newId}`] = tasks[key];
+        } else {
+          kept[key] = tasks[key];
+        }
+      });
+      tasks = Object.assign(kept, renamed);
+      applied.add(rename.id);
+    });
+    setToStorage(STORAGE_KEYS.TASKS, tasks);
+    setToStorage(STORAGE_KEYS.RENAMES, Array.from(applied));
+    return tasks;
+  }
+
+  function loadCompletion() {
+    const tasks = applyTaskRenames(getFromStorage(STORAGE_KEYS.TASKS, {}));
+    state.completed = new Set(Object.keys(tasks).filter(k => tasks[k] === true));
+    recountProgress();
+  }
+
+  function dayKeyForTask(taskId) {
+    const match = TASK_ID_PATTERN.exec(taskId);
+    if (!match) return null;
+    const dayKey = `${match[1]}_day${match[2]}`;
+    const info = state.dayIndex[dayKey];
+    // Ignore ids left over from tasks that no longer exist
+    return info && Number(match[3]) < info.taskCount ? dayKey : null;
+  }
+
+  function recountProgress() {
+    const counts = { tasks: 0, days: 0, byDay: {}, byPhase: {} };
+    state.completed.forEach(taskId => {
+      const dayKey = dayKeyForTask(taskId);
+      if (!dayKey) return;
+      const phaseId = state.dayIndex[dayKey].phaseId;
+      counts.tasks++;
+      counts.byDay[dayKey] = (counts.byDay[dayKey] || 0) + 1;
+      counts.byPhase[phaseId] = (counts.byPhase[phaseId] || 0) + 1;
+    });
+    Object.keys(state.dayIndex).forEach(dayKey => {
+      if ((counts.byDay[dayKey] || 0) === state.dayIndex[dayKey].taskCount) {
+        counts.days++;
+      }
+    });
+    state.counts = counts;
+  }
+
+  function adjustProgress(taskId, delta) {
+    const dayKey = dayKeyForTask(taskId);
+    if (!dayKey) return;
+    const counts = state.counts;
+    const { phaseId, taskCount } = state.dayIndex[dayKey];
+    const before = counts.byDay[dayKey] || 0;
+    const after = before + delta;
+    counts.tasks += delta;
+    counts.byDay[dayKey] = after;
+    counts.byPhase[phaseId] = (counts.byPhase[phaseId] || 0) + delta;
+    if (before === taskCount) counts.days--;
+    if (after === taskCount) counts.days++;
+  }
+
   function isTaskComplete(taskId) {
-    const tasks = getFromStorage(STORAGE_KEYS.TASKS, {});
-    return tasks[taskId] === true;
+    return state.completed.has(taskId);
   }
 
   function setTaskComplete(taskId, complete) {
-    const tasks = getFromStorage(STORAGE_KEYS.TASKS, {});
-    if (complete) {
-      tasks[taskId] = true;
-    } else {
-      delete tasks[taskId];
+    if (complete !== state.completed.has(taskId)) {
+      if (complete) {
+        state.completed.add(taskId);
+      } else {
+        state.completed.delete(taskId);
+      }
+      adjustProgress(taskId, complete ? 1 : -1);
+      const tasks = {};
+      state.completed.forEach(id => { tasks[id] = true; });
+      setToStorage(STORAGE_KEYS.TASKS, tasks);
     }
-    setToStorage(STORAGE_KEYS.TASKS, tasks);
     updateProgress();
   }
 
@@ -81,55 +259,17 @@
   // === Progress Calculation ===
   
   function calculateProgress() {
-    const tasks = getFromStorage(STORAGE_KEYS.TASKS, {});
-    const completedTasks = Object.keys(tasks).filter(k => tasks[k]).length;
-    
-    // Calculate total tasks across all phases
-    let totalTasks = 0;
-    let totalDays = 0;
-    let completedDays = 0;
-    
-    if (typeof PLAN !== 'undefined' && PLAN.phases) {
-      PLAN.phases.forEach(phase => {
-        if (phase.days) {
-          totalDays += phase.days.length;
-          phase.days.forEach(day => {
-            if (day.tasks) {
-              totalTasks += day.tasks.length;
-              // Check if all tasks for this day are complete
-              const allTasksComplete = day.tasks.every((_, idx) => {
-                const taskId = generateTaskId(phase.id, day.globalDay, idx);
-                return isTaskComplete(taskId);
-              });
-              if (allTasksComplete) {
-                completedDays++;
-              }
-            }
-          });
-        }
-      });
-    }
+    const totals = state.manifest ? state.manifest.totals : { tasks: 0, days: 0 };
+    const counts = state.counts;
+    const completedTasks = counts.tasks;
+    const totalTasks = totals.tasks;
+    const totalDays = totals.days;
+    const completedDays = counts.days;
     
     // Calculate phase-specific progress
-    let phaseCompleted = 0;
-    let phaseTotal = 0;
-    
-    if (state.activePhase && typeof PLAN !== 'undefined' && PLAN.phases) {
-      const phase = PLAN.phases.find(p => p.id === state.activePhase);
-      if (phase && phase.days) {
-        phase.days.forEach(day => {
-          if (day.tasks) {
-            phaseTotal += day.tasks.length;
-            day.tasks.forEach((_, idx) => {
-              const taskId = generateTaskId(phase.id, day.globalDay, idx);
-              if (isTaskComplete(taskId)) {
-                phaseCompleted++;
-              }
-            });
-          }
-        });
-      }
-    }
+    const activeInfo = getPhaseInfo(state.activePhase);
+    const phaseTotal = activeInfo ? activeInfo.taskCount : 0;
+    const phaseCompleted = activeInfo ? (counts.byPhase[activeInfo.id] || 0) : 0;
     
     return {
       global: {
@@ -183,13 +323,81 @@
     if (hudPhaseProgress) hudPhaseProgress.textContent = `${progress.phase.percent}%`;
     if (hudTasksComplete) hudTasksComplete.textContent = `${progress.global.completed}/${progress.global.total}`;
     if (hudDaysComplete) hudDaysComplete.textContent = `${progress.days.completed}/${progress.days.total}`;
+    
+    updatePhasePageProgress();
+  }
+
+  // === Pre-rendered Phase Pages ===
+  // phases/*.html are rendered from the plan store by
+  // scripts/render_phase_pages.py; only checkbox state and the progress
+  // summary are applied here.
+
+  function updatePhasePageProgress() {
+    const info = document.body.classList.contains('phase-page') ? getPhaseInfo(state.activePhase) : null;
+    if (!info) return;
+    const completed = state.counts.byPhase[info.id] || 0;
+    const percent = info.taskCount > 0 ? Math.round((completed / info.taskCount) * 100) : 0;
+    const daysCompleted = info.days.filter(([globalDay, taskCount]) =>
+      (state.counts.byDay[`${info.id}_day${globalDay}`] || 0) === taskCount).length;
+    
+    const completedEl = document.getElementById('completed-tasks');
+    const totalEl = document.getElementById('total-tasks');
+    const percentEl = document.getElementById('completion-percent');
+    const daysEl = document.getElementById('days-completed');
+    const bar = document.getElementById('progress-bar');
+    
+    if (completedEl) completedEl.textContent = completed;
+    if (totalEl) totalEl.textContent = info.taskCount;
+    if (percentEl) percentEl.textContent = `${percent}%`;
+    if (daysEl) daysEl.textContent = daysCompleted;
+    if (bar) bar.style.width = `${percent}%`;
+  }
+
+  function syncPhasePageCheckboxes(container) {
+    container.querySelectorAll('.day-card').forEach(card => {
+      const checkboxes = card.querySelectorAll('input[data-task-id]');
+      checkboxes.forEach(checkbox => {
+        checkbox.checked = isTaskComplete(checkbox.dataset.taskId);
+        checkbox.closest('.task-item').classList.toggle('complete', checkbox.checked);
+      });
+      card.classList.toggle('complete', checkboxes.length > 0 &&
+        Array.from(checkboxes).every(cb => cb.checked));
+    });
+  }
+
+  function initPhasePage() {
+    const phaseId = document.body.dataset.phase;
+    const container = document.querySelector('.days-container');
+    if (!phaseId || !container) return;
+    state.activePhase = phaseId;
+    
+    syncPhasePageCheckboxes(container);
+    
+    // One delegated listener instead of one per checkbox
+    container.addEventListener('change', (e) => {
+      const taskId = e.target.dataset.taskId;
+      if (!taskId) return;
+      setTaskComplete(taskId, e.target.checked);
+      e.target.closest('.task-item').classList.toggle('complete', e.target.checked);
+      const card = e.target.closest('.day-card');
+      card.classList.toggle('complete',
+        Array.from(card.querySelectorAll('input[data-task-id]')).every(cb => cb.checked));
+    });
+    
+    const setAllDetails = open => {
+      container.querySelectorAll('details.task-details').forEach(details => { details.open = open; });
+    };
+    const expandBtn = document.getElementById('expand-all');
+    const collapseBtn = document.getElementById('collapse-all');
+    if (expandBtn) expandBtn.addEventListener('click', () => setAllDetails(true));
+    if (collapseBtn) collapseBtn.addEventListener('click', () => setAllDetails(false));
   }
 
   // === Tab Management ===
   
   function initTabs() {
-    if (typeof PLAN === 'undefined' || !PLAN.phases) {
-      console.error('PLAN data not found');
+    if (!state.manifest || !state.manifest.phases.length) {
+      console.error('Plan manifest not found');
       return;
     }
     
@@ -197,7 +405,7 @@
     if (!tabsNav) return;
     
     // Create tabs
-    PLAN.phases.forEach((phase, index) => {
+    state.manifest.phases.forEach((phase, index) => {
       const tab = document.createElement('button');
       tab.role = 'tab';
       tab.id = `tab-${phase.id}`;
@@ -217,7 +425,7 @@
     
     // Load saved active tab or default to first
     const savedTab = getFromStorage(STORAGE_KEYS.ACTIVE_TAB, null);
-    const initialTab = savedTab || PLAN.phases[0].id;
+    const initialTab = getPhaseInfo(savedTab) ? savedTab : state.manifest.phases[0].id;
     activateTab(initialTab);
   }
 
@@ -255,9 +463,7 @@
   }
 
   function activateTab(phaseId) {
-    if (typeof PLAN === 'undefined') return;
-    
-    const phase = PLAN.phases.find(p => p.id === phaseId);
+    const phase = getPhaseInfo(phaseId);
     if (!phase) return;
     
     // Update tab states
@@ -294,6 +500,10 @@
     const tabsContent = document.querySelector('.tabs-content');
     if (!tabsContent) return;
     
+    // Drop a panel left behind by a failed load
+    const stalePanel = document.getElementById(`panel-${phase.id}`);
+    if (stalePanel) stalePanel.remove();
+    
     // Create panel
     const panel = document.createElement('div');
     panel.role = 'tabpanel';
@@ -310,27 +520,37 @@
     `;
     panel.appendChild(header);
     
-    // Days container
+    // Days container; the header above comes from the manifest and shows
+    // immediately while the phase bundle loads
     const daysContainer = document.createElement('div');
     daysContainer.classList.add('days-container');
     
-    if (phase.days && phase.days.length > 0) {
-      phase.days.forEach(day => {
-        const dayCard = createDayCard(phase, day);
-        daysContainer.appendChild(dayCard);
-      });
-    } else {
-      const placeholder = document.createElement('div');
-      placeholder.classList.add('placeholder');
-      placeholder.textContent = 'Detailed day breakdown coming soon...';
-      daysContainer.appendChild(placeholder);
-    }
+    const placeholder = document.createElement('div');
+    placeholder.classList.add('placeholder');
+    placeholder.textContent = 'Loading days...';
+    daysContainer.appendChild(placeholder);
     
     panel.appendChild(daysContainer);
     tabsContent.appendChild(panel);
     
     // Mark as rendered
     state.renderedPhases.add(phase.id);
+    
+    loadPhase(phase.id).then(bundle => {
+      if (bundle.days && bundle.days.length > 0) {
+        const fragment = document.createDocumentFragment();
+        bundle.days.forEach(day => {
+          fragment.appendChild(createDayCard(bundle, day));
+        });
+        daysContainer.replaceChildren(fragment);
+      } else {
+        placeholder.textContent = 'Detailed day breakdown coming soon...';
+      }
+    }).catch(e => {
+      console.error('Error loading phase data:', e);
+      placeholder.textContent = 'Could not load this phase. Switch tabs to try again.';
+      state.renderedPhases.delete(phase.id);
+    });
   }
 
   function createDayCard(phase, day) {
@@ -410,7 +630,7 @@
         `;
         
         // Add details toggle button if details exist
-        if (task.details) {
+        if (task.hasDetails) {
           const toggleBtn = document.createElement('button');
           toggleBtn.classList.add('task-details-toggle');
           toggleBtn.setAttribute('aria-expanded', 'false');
@@ -429,6 +649,7 @@
               toggleBtn.setAttribute('aria-expanded', 'true');
               toggleBtn.innerHTML = '<span class="toggle-icon">▼</span> Hide details';
               detailsContainer.style.display = 'block';
+              renderTaskDetails(detailsContainer, phase, day, task, idx);
             }
           });
           taskHeader.appendChild(toggleBtn);
@@ -436,58 +657,13 @@
         
         taskItem.appendChild(taskHeader);
         
-        // Add details container if details exist
-        if (task.details) {
+        // Add details container if details exist; the content is fetched
+        // on first expand
+        if (task.hasDetails) {
           const detailsContainer = document.createElement('div');
           detailsContainer.classList.add('task-details-container');
           detailsContainer.id = detailsId;
           detailsContainer.style.display = 'none';
-          
-          const detailsContent = document.createElement('div');
-          detailsContent.classList.add('task-details-content');
-          detailsContent.innerHTML = task.details;
-          
-          // Extract and display source badges if resourceLinks exist
-          if (task.resourceLinks && task.resourceLinks.length > 0) {
-            const sourceBadges = document.createElement('div');
-            sourceBadges.classList.add('task-source-badges');
-            sourceBadges.innerHTML = '<strong>Quick Links:</strong> ';
-            
-            task.resourceLinks.forEach((link, linkIdx) => {
-              const badge = document.createElement('a');
-              badge.classList.add('source-badge');
-              badge.href = link;
-              badge.target = '_blank';
-              badge.rel = 'noopener noreferrer';
-              
-              // Extract domain name for badge label
-              let domain = 'Link';
-              try {
-                const url = new URL(link);
-                const hostname = url.hostname.replace('www.', '');
-                // Check exact match or subdomain (ends with the domain)
-                if (hostname === 'datacamp.com' || hostname.endsWith('.datacamp.com')) domain = 'DataCamp';
-                else if (hostname === 'youtube.com' || hostname.endsWith('.youtube.com') || hostname === 'youtu.be') domain = 'YouTube';
-                else if (hostname === 'khanacademy.org' || hostname.endsWith('.khanacademy.org')) domain = 'Khan Academy';
-                else if (hostname === 'numpy.org' || hostname.endsWith('.numpy.org')) domain = 'NumPy Docs';
-                else if (hostname === 'pytorch.org' || hostname.endsWith('.pytorch.org')) domain = 'PyTorch Docs';
-                else if (hostname === 'huggingface.co' || hostname.endsWith('.huggingface.co')) domain = 'Hugging Face';
-                else if (hostname === '3blue1brown.com' || hostname === 'www.3blue1brown.com' || hostname.endsWith('.3blue1brown.com')) domain = '3Blue1Brown';
-                else if (hostname === 'arxiv.org' || hostname.endsWith('.arxiv.org')) domain = 'arXiv';
-                else domain = hostname; // Use actual hostname if no match
-              } catch (e) {
-                // Invalid URL, use generic label
-              }
-              
-              badge.textContent = domain;
-              badge.title = link;
-              sourceBadges.appendChild(badge);
-            });
-            
-            detailsContent.appendChild(sourceBadges);
-          }
-          
-          detailsContainer.appendChild(detailsContent);
           taskItem.appendChild(detailsContainer);
         }
         
@@ -542,6 +718,69 @@
     return card;
   }
 
+  function renderTaskDetails(detailsContainer, phase, day, task, idx) {
+    if (detailsContainer.dataset.loaded) return;
+    detailsContainer.dataset.loaded = 'true';
+    
+    const detailsContent = document.createElement('div');
+    detailsContent.classList.add('task-details-content');
+    detailsContent.textContent = 'Loading details...';
+    detailsContainer.appendChild(detailsContent);
+    
+    Promise.all([loadDetails(phase, day), loadFragments()]).then(([chunk, fragments]) => {
+      // Chunks are keyed by task id without the storage prefix
+      detailsContent.innerHTML = expandDetails(chunk[`${phase.id}_day${day.globalDay}_task${idx}`], fragments);
+      
+      // Display source badges if resourceLinks exist
+      if (task.resourceLinks && task.resourceLinks.length > 0) {
+        detailsContent.appendChild(createSourceBadges(task.resourceLinks));
+      }
+    }).catch(e => {
+      console.error('Error loading task details:', e);
+      detailsContainer.removeChild(detailsContent);
+      delete detailsContainer.dataset.loaded;
+    });
+  }
+
+  function createSourceBadges(resourceLinks) {
+    const sourceBadges = document.createElement('div');
+    sourceBadges.classList.add('task-source-badges');
+    sourceBadges.innerHTML = '<strong>Quick Links:</strong> ';
+    
+    resourceLinks.forEach(link => {
+      const badge = document.createElement('a');
+      badge.classList.add('source-badge');
+      badge.href = link;
+      badge.target = '_blank';
+      badge.rel = 'noopener noreferrer';
+      
+      // Extract domain name for badge label
+      let domain = 'Link';
+      try {
+        const url = new URL(link);
+        const hostname = url.hostname.replace('www.', '');
+        // Check exact match or subdomain (ends with the domain)
+        if (hostname === 'datacamp.com' || hostname.endsWith('.datacamp.com')) domain = 'DataCamp';
+        else if (hostname === 'youtube.com' || hostname.endsWith('.youtube.com') || hostname === 'youtu.be') domain = 'YouTube';
+        else if (hostname === 'khanacademy.org' || hostname.endsWith('.khanacademy.org')) domain = 'Khan Academy';
+        else if (hostname === 'numpy.org' || hostname.endsWith('.numpy.org')) domain = 'NumPy Docs';
+        else if (hostname === 'pytorch.org' || hostname.endsWith('.pytorch.org')) domain = 'PyTorch Docs';
+        else if (hostname === 'huggingface.co' || hostname.endsWith('.huggingface.co')) domain = 'Hugging Face';
+        else if (hostname === '3blue1brown.com' || hostname === 'www.3blue1brown.com' || hostname.endsWith('.3blue1brown.com')) domain = '3Blue1Brown';
+        else if (hostname === 'arxiv.org' || hostname.endsWith('.arxiv.org')) domain = 'arXiv';
+        else domain = hostname; // Use actual hostname if no match
+      } catch (e) {
+        // Invalid URL, use generic label
+      }
+      
+      badge.textContent = domain;
+      badge.title = link;
+      sourceBadges.appendChild(badge);
+    });
+    
+    return sourceBadges;
+  }
+
   // === Search Functionality ===
   
   function toggleSearch() {
@@ -553,6 +792,8 @@
     if (state.searchActive) {
       searchModal.style.display = 'flex';
       searchModal.setAttribute('aria-hidden', 'false');
+      // Start fetching the index while the user types
+      loadSearchIndex().catch(e => console.error('Error loading search index:', e));
       const searchInput = document.getElementById('searchInput');
       if (searchInput) {
         setTimeout(() => searchInput.focus(), 100);
@@ -564,35 +805,114 @@
     }
   }
 
-  function performSearch(query) {
-    if (!query || !state.activePhase || typeof PLAN === 'undefined') return;
-    
-    const phase = PLAN.phases.find(p => p.id === state.activePhase);
-    if (!phase || !phase.days) return;
-    
-    const results = [];
-    const lowerQuery = query.toLowerCase();
-    
-    phase.days.forEach(day => {
-      if (day.tasks) {
-        day.tasks.forEach((task, idx) => {
-          if (task.label.toLowerCase().includes(lowerQuery)) {
-            results.push({
-              day: day.globalDay,
-              dayTitle: day.title,
-              task: task.label,
-              taskId: generateTaskId(phase.id, day.globalDay, idx)
-            });
-          }
+  function loadSearchIndex() {
+    if (!state.searchIndex) {
+      state.searchIndex = fetchJson(state.manifest.search).then(index => {
+        index.terms = index.terms ? index.terms.split(' ') : [];
+        return index;
+      }).catch(e => {
+        state.searchIndex = null;
+        throw e;
+      });
+    }
+    return state.searchIndex;
+  }
+
+  function tokenize(text) {
+    return (text.toLowerCase().match(TOKEN_PATTERN) || [])
+      .filter(token => !SEARCH_STOPWORDS.has(token));
+  }
+
+  function lowerBound(sorted, value) {
+    let lo = 0;
+    let hi = sorted.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (sorted[mid] < value) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  // Posting strings hold base-32 numbers without separators: chars from
+  // '0' (48) continue a number, chars from '^' (94) end one. Must match
+  // encode_numbers in scripts/plan_search.py.
+  function decodePostings(text, visit) {
+    let number = 0;
+    for (let i = 0; i < text.length; i++) {
+      const code = text.charCodeAt(i);
+      if (code >= 94) {
+        visit(number * 32 + code - 94);
+        number = 0;
+      } else {
+        number = number * 32 + code - 48;
+      }
+    }
+  }
+
+  // Returns [[doc, score], ...] for docs matching every token as a prefix.
+  // Postings are delta-encoded doc * 8 + field mask (4 label, 2 day title,
+  // 1 details); the mask doubles as the score.
+  function searchIndex(index, tokens) {
+    let scores = null;
+    for (const token of tokens) {
+      const masks = new Map();
+      for (let i = lowerBound(index.terms, token);
+           i < index.terms.length && index.terms[i].startsWith(token); i++) {
+        let value = 0;
+        decodePostings(index.postings[i], delta => {
+          value += delta;
+          const doc = value >> 3;
+          masks.set(doc, (masks.get(doc) || 0) | (value & 7));
         });
       }
-    });
+      if (scores === null) {
+        scores = masks;
+      } else {
+        const next = new Map();
+        scores.forEach((score, doc) => {
+          if (masks.has(doc)) next.set(doc, score + masks.get(doc));
+        });
+        scores = next;
+      }
+      if (scores.size === 0) break;
+    }
+    if (scores === null) return [];
+    return Array.from(scores).sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+  }
+
+  function performSearch(query) {
+    const tokens = tokenize(query || '');
+    if (tokens.length === 0 || !state.manifest) {
+      clearSearchResults();
+      return;
+    }
     
-    displaySearchResults(results, query);
-    highlightSearchMatches(query);
+    loadSearchIndex().then(index => {
+      const matches = searchIndex(index, tokens);
+      const results = matches.slice(0, SEARCH_LIMIT).map(([doc]) => {
+        const [phaseIndex, dayIndex, taskIndex, label] = index.docs[doc];
+        const [globalDay, dayTitle] = index.days[dayIndex];
+        const phaseId = index.phases[phaseIndex];
+        const info = getPhaseInfo(phaseId);
+        return {
+          phaseId: phaseId,
+          phaseTitle: info ? info.title.split(':')[0] : phaseId,
+          day: globalDay,
+          dayTitle: dayTitle,
+          task: label,
+          taskId: generateTaskId(phaseId, globalDay, taskIndex)
+        };
+      });
+      
+      displaySearchResults(results, query, matches.length);
+      highlightSearchMatches(query, results);
+    }).catch(e => {
+      console.error('Error loading search index:', e);
+    });
   }
 
-  function displaySearchResults(results, query) {
+  function displaySearchResults(results, query, total) {
     const searchResults = document.getElementById('searchResults');
     if (!searchResults) return;
     
@@ -603,11 +923,11 @@
     
     searchResults.innerHTML = `
       <div class="search-results-header">
-        Found ${results.length} task${results.length !== 1 ? 's' : ''}
+        Found ${total} task${total !== 1 ? 's' : ''}${total > results.length ? ` (showing top ${results.length})` : ''}
       </div>
       ${results.map(result => `
-        <div class="search-result-item" data-day="${result.day}">
-          <div class="search-result-day">Day ${result.day}: ${result.dayTitle}</div>
+        <div class="search-result-item" data-phase="${result.phaseId}" data-day="${result.day}">
+          <div class="search-result-day">${result.phaseTitle} · Day ${result.day}: ${escapeHtml(result.dayTitle)}</div>
           <div class="search-result-task">${highlightText(result.task, query)}</div>
         </div>
       `).join('')}
@@ -616,13 +936,18 @@
     // Add click handlers
     searchResults.querySelectorAll('.search-result-item').forEach(item => {
       item.addEventListener('click', () => {
+        const phaseId = item.dataset.phase;
         const day = item.dataset.day;
-        const dayCard = document.querySelector(`[data-global-day="${day}"]`);
-        if (dayCard) {
-          dayCard.scrollIntoView({ behavior: 'smooth', block: 'center' });
-          dayCard.classList.add('highlighted');
-          setTimeout(() => dayCard.classList.remove('highlighted'), 2000);
-        }
+        activateTab(phaseId);
+        // The panel renders its day cards when the bundle arrives
+        loadPhase(phaseId).then(() => {
+          const dayCard = document.querySelector(`#panel-${phaseId} [data-global-day="${day}"]`);
+          if (dayCard) {
+            dayCard.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            dayCard.classList.add('highlighted');
+            setTimeout(() => dayCard.classList.remove('highlighted'), 2000);
+          }
+        });
         toggleSearch();
       });
     });
@@ -636,8 +961,9 @@
 
   function highlightText(text, query) {
     const escapedText = escapeHtml(text);
-    const escapedQuery = escapeHtml(query);
-    const regex = new RegExp(`(${escapeRegex(escapedQuery)})`, 'gi');
+    const tokens = tokenize(query).map(token => escapeRegex(escapeHtml(token)));
+    if (tokens.length === 0) return escapedText;
+    const regex = new RegExp(`(${tokens.join('|')})`, 'gi');
     return escapedText.replace(regex, '<mark>$1</mark>');
   }
 
@@ -645,19 +971,17 @@
     return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
   }
 
-  function highlightSearchMatches(query) {
-    if (!query) return clearHighlights();
-    
-    const activePanel = document.querySelector('.tab-panel[style*="display: block"]');
-    if (!activePanel) return;
-    
-    const taskLabels = activePanel.querySelectorAll('.task-label');
-    const lowerQuery = query.toLowerCase();
-    
-    taskLabels.forEach(label => {
-      const originalText = label.textContent;
-      if (originalText.toLowerCase().includes(lowerQuery)) {
-        label.innerHTML = highlightText(originalText, query);
+  function highlightSearchMatches(query, results) {
+    clearHighlights();
+    if (!query) return;
+    
+    // Only touch the labels of matching tasks in panels already rendered
+    results.forEach(result => {
+      const checkbox = document.getElementById(result.taskId);
+      if (!checkbox) return;
+      const label = checkbox.parentElement.querySelector('.task-label');
+      if (label) {
+        label.innerHTML = highlightText(label.textContent, query);
         label.closest('.day-card').classList.add('search-match');
       }
     });
@@ -673,16 +997,18 @@
     });
   }
 
-  function clearSearch() {
-    const searchInput = document.getElementById('searchInput');
+  function clearSearchResults() {
     const searchResults = document.getElementById('searchResults');
-    
-    if (searchInput) searchInput.value = '';
     if (searchResults) searchResults.innerHTML = '';
-    
     clearHighlights();
   }
 
+  function clearSearch() {
+    const searchInput = document.getElementById('searchInput');
+    if (searchInput) searchInput.value = '';
+    clearSearchResults();
+  }
+
   // === Reset Functions ===
   
   function resetAllProgress() {
@@ -708,22 +1034,20 @@
       return;
     }
     
-    const phase = PLAN.phases.find(p => p.id === state.activePhase);
-    if (!phase || !phase.days) return;
+    const phase = getPhaseInfo(state.activePhase);
+    if (!phase) return;
     
     const tasks = getFromStorage(STORAGE_KEYS.TASKS, {});
     
-    phase.days.forEach(day => {
-      if (day.tasks) {
-        day.tasks.forEach((_, idx) => {
-          const taskId = generateTaskId(phase.id, day.globalDay, idx);
-          delete tasks[taskId];
-        });
+    phase.days.forEach(([globalDay, taskCount]) => {
+      for (let idx = 0; idx < taskCount; idx++) {
+        delete tasks[generateTaskId(phase.id, globalDay, idx)];
       }
-      localStorage.removeItem(generateTimeId(day.globalDay));
+      localStorage.removeItem(generateTimeId(globalDay));
     });
     
     setToStorage(STORAGE_KEYS.TASKS, tasks);
+    loadCompletion();
     
     // Refresh panel
     state.renderedPhases.delete(state.activePhase);
@@ -914,8 +1238,25 @@
   function init() {
     console.log('Initializing AI & ML Mastery Plan (Tabbed Interface)...');
     
-    // Initialize tabs
-    initTabs();
+    // Load the plan manifest, then build the tabs; phase bundles load
+    // when their tab is opened
+    loadManifest().then(() => {
+      initTabs();
+      initPhasePage();
+      updateProgress();
+    }).catch(e => {
+      console.error('Error loading plan manifest:', e);
+    });
+    
+    // Pick up progress changes made in another tab
+    window.addEventListener('storage', (e) => {
+      if (e.key === STORAGE_KEYS.TASKS && state.manifest) {
+        loadCompletion();
+        const daysContainer = document.querySelector('.phase-page .days-container');
+        if (daysContainer) syncPhasePageCheckboxes(daysContainer);
+        updateProgress();
+      }
+    });
     
     // Initialize HUD
     initHUD();
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: generating details for every task in the plan store with the
+template generators (generate_all_details, generate_phase3_4_details,
+generate_task_details_templates).
+
+Runs each generator over all tasks twice:
+
+    reference  str.format on the template source for every render, and the
+               rules tried one by one as `keyword in label` tests (what the
+               if/elif chains did)
+    compiled   precompiled segment templates (memoized renders for the
+               topic-level sections), and the Aho-Corasick classifier
+               (scripts/detail_templates.py)
+
+and checks that both produce identical details.
+
+Usage (from the repository root):
+    python benchmarks/bench_detail_templates.py [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import generate_all_details  # noqa: E402
+import generate_phase3_4_details  # noqa: E402
+import generate_task_details_templates  # noqa: E402
+from detail_templates import KeywordClassifier, Template  # noqa: E402
+from plan_parser import iter_tasks  # noqa: E402
+from plan_store import load_store  # noqa: E402
+
+COMPILED = (Template.render, KeywordClassifier.classify)
+REFERENCE = (Template.format, KeywordClassifier.classify_linear)
+
+
+def generators():
+    return {
+        'generate_all_details': lambda phase, day, task: generate_all_details.create_detail_for_task(
+            task['label'], {'day': day['globalDay'], 'title': day.get('title', ''), 'phase': phase['id']}),
+        'generate_phase3_4_details': lambda phase, day, task: generate_phase3_4_details.generate_generic_details(
+            task['label'], day['globalDay'], task['label'].split(':')[0]),
+        'generate_task_details_templates': lambda phase, day, task: (
+            generate_task_details_templates.generate_details_for_task(task, day, phase['id'], day.get('week'))),
+    }
+
+
+def templates():
+    modules = (generate_all_details, generate_phase3_4_details, generate_task_details_templates)
+    found = [value for module in modules for value in vars(module).values() if isinstance(value, Template)]
+    for kind in generate_all_details.KIND_DETAILS.values():
+        found += [value for value in kind.values() if isinstance(value, Template)]
+    return found
+
+
+def use(mode):
+    Template.render, KeywordClassifier.classify = mode
+
+
+def run(generate, tasks, repeat):
+    """Best-of-`repeat` wall time per task in microseconds, and the outputs."""
+    best = float('inf')
+    for _ in range(repeat):
+        # Every timed run starts from empty memos
+        for template in templates():
+            if template._cache is not None:
+                template._cache.clear()
+        started = time.perf_counter()
+        outputs = [generate(phase, day, task) for phase, day, task in tasks]
+        best = min(best, time.perf_counter() - started)
+    return best / len(tasks) * 1e6, outputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    _, plan = load_store()
+    tasks = [(phase, day, task) for phase, day, _, task in iter_tasks(plan)]
+    print(f"Tasks: {len(tasks)}")
+    total_reference = total_compiled = 0.0
+    for name, generate in generators().items():
+        use(REFERENCE)
+        reference, expected = run(generate, tasks, args.repeat)
+        use(COMPILED)
+        compiled, outputs = run(generate, tasks, args.repeat)
+        if outputs != expected:
+            print(f"  {name}: compiled output differs from reference")
+            return 1
+        total_reference += reference
+        total_compiled += compiled
+        print(f"  {name:32} reference {reference:7.2f} µs/task   compiled {compiled:7.2f} µs/task"
+              f"   {reference / compiled:5.2f}x")
+    print(f"  {'all generators':32} reference {total_reference:7.2f} µs/task   compiled {total_compiled:7.2f} µs/task"
+          f"   {total_reference / total_compiled:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: the details chunks shipped to the site, plain versus
+fragment-encoded (scripts/plan_fragments.py).
+
+Builds the bundles from the plan store as plan_bundles.py does, then
+compares every details chunk against the same chunk with each value decoded
+back to plain HTML:
+
+    bytes      total size of the chunks (plus, encoded, the fragment table),
+               raw and gzip-compressed as a server would send them
+    parse      json.loads of every chunk (and the table)
+    expand     decoding every value back to HTML, as main.js expandDetails
+               does when a task's details are shown
+
+and checks that every encoded value decodes to the plain details.
+
+Usage (from the repository root):
+    python benchmarks/bench_details_encoding.py [--repeat 5]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from plan_bundles import build_bundles  # noqa: E402
+from plan_fragments import decode  # noqa: E402
+from plan_parser import iter_tasks  # noqa: E402
+from plan_store import load_store  # noqa: E402
+
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def best_of(repeat, func):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def sizes(texts):
+    data = [text.encode('utf-8') for text in texts]
+    return sum(map(len, data)), sum(len(gzip.compress(d, 9)) for d in data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    _, plan = load_store()
+    outputs = build_bundles(plan)
+    table_path = next(path for path in outputs if path.endswith(os.path.join('details', 'fragments.json')))
+    table_text = outputs.pop(table_path)
+    table = json.loads(table_text)
+    encoded = [text for path, text in outputs.items() if os.sep + 'details' + os.sep in path]
+    chunks = [json.loads(text) for text in encoded]
+    plain = [_dump({key: decode(value, table) for key, value in chunk.items()}) for chunk in chunks]
+
+    expected = {}
+    for phase, day, index, task in iter_tasks(plan):
+        if task.get('details'):
+            expected[f"{phase['id']}_day{day['globalDay']}_task{index}"] = task['details']
+    decoded = {key: decode(value, table) for chunk in chunks for key, value in chunk.items()}
+    if decoded != expected:
+        print("Encoded chunks do not decode to the plan's details")
+        return 1
+
+    print(f"Chunks: {len(chunks)}, details: {len(decoded)}, fragments: {len(table)}")
+    plain_raw, plain_gz = sizes(plain)
+    enc_raw, enc_gz = sizes(encoded + [table_text])
+    print(f"  bytes   plain {plain_raw:>9,} ({plain_gz:>7,} gzip)"
+          f"   encoded {enc_raw:>9,} ({enc_gz:>7,} gzip)"
+          f"   {1 - enc_raw / plain_raw:6.1%} ({1 - enc_gz / plain_gz:6.1%} gzip) smaller")
+
+    parse_plain = best_of(args.repeat, lambda: [json.loads(text) for text in plain])
+    parse_encoded = best_of(args.repeat, lambda: [json.loads(text) for text in encoded + [table_text]])
+    expand = best_of(args.repeat, lambda: [decode(value, table) for chunk in chunks for value in chunk.values()])
+    print(f"  parse   plain {parse_plain:8.2f} ms   encoded {parse_encoded:8.2f} ms")
+    print(f"  expand  all details {expand:8.2f} ms ({expand / len(decoded) * 1000:.2f} µs/task)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: schema validation of the whole plan (scripts/plan_schema.py).
+
+Validates the plan store, and synthetic plans at the given scales, twice:
+
+    interpreted  Schema.check walking the Field specs for every record, one
+                 generic test per constraint (naive per-field checks)
+    compiled     the specialized check functions Schema.compile generates
+
+Both run inside the same validate_plan pass, so the cross-record invariants
+are included in each time. A copy of the store with a known set of broken
+records is also validated both ways, to check that each breakage is found
+and that both report exactly the same errors.
+
+Usage (from the repository root):
+    python benchmarks/bench_schema.py [--scales 1,10] [--repeat 5]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from plan_parser import load_plan  # noqa: E402
+from plan_schema import PLAN_DAYS, compiled_checks, interpreted_checks, validate_plan  # noqa: E402
+from plan_store import load_store  # noqa: E402
+from synthetic_plan import write_plan_file  # noqa: E402
+
+
+def best_of(repeat, func):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def broken_plan(plan):
+    """A copy of `plan` with one error of each kind; returns (plan, expected fields)."""
+    plan = copy.deepcopy(plan)
+    phases = plan['phases']
+    first = phases[0]['days']
+    first[0]['tasks'][0]['estMinutes'] = True          # bool is not an int
+    first[0]['tasks'][1]['estMinute'] = 30             # misspelt field
+    del first[1]['tasks'][0]['label']
+    first[1]['priority'] = 'URGENT'
+    first[2]['week'] = 99                              # not one of the phase's weeks
+    first[3]['globalDay'] = 5                          # gap: day 4 missing, day 5 twice
+    first[4]['tasks'][0]['resourceLinks'] = ['ftp://example.com']
+    phases[1]['id'] = phases[0]['id']
+    expected = {'estMinutes', 'estMinute', 'label', 'priority', 'week', 'globalDay', 'resourceLinks', 'id'}
+    return plan, expected
+
+
+def compare(name, plan, repeat, total_days=PLAN_DAYS):
+    compiled = compiled_checks()
+    interpreted = interpreted_checks()
+    errors = validate_plan(plan, total_days, compiled)
+    if validate_plan(plan, total_days, interpreted) != errors:
+        print(f"  {name}: compiled and interpreted checks disagree")
+        return False
+    slow = best_of(repeat, lambda: validate_plan(plan, total_days, interpreted))
+    fast = best_of(repeat, lambda: validate_plan(plan, total_days, compiled))
+    tasks = sum(len(day['tasks']) for phase in plan['phases'] for day in phase['days'])
+    records = tasks + sum(len(phase['days']) + 1 for phase in plan['phases'])
+    print(f"  {name:12} {records:>7,} records   interpreted {slow * 1000:8.2f} ms"
+          f"   compiled {fast * 1000:8.2f} ms   {slow / fast:5.2f}x   {len(errors)} error(s)")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scales', default='1,10', help='Synthetic plan scales (comma-separated)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    compiled_checks()
+    print(f"Compiled the schema in {(time.perf_counter() - started) * 1000:.2f} ms")
+
+    _, plan = load_store()
+    broken, expected = broken_plan(plan)
+    found = {field for _, field, _ in validate_plan(broken)}
+    if not expected <= found:
+        print(f"Missed broken fields: {', '.join(sorted(expected - found))}")
+        return 1
+
+    ok = compare('store', plan, args.repeat) and compare('broken', broken, args.repeat)
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in [int(s) for s in args.scales.split(',') if s]:
+            path = os.path.join(workdir, f'plan{scale}.js')
+            write_plan_file(path, scale=scale)
+            _, synthetic = load_plan(path)
+            ok = compare(f'synthetic {scale}x', synthetic, args.repeat, None) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
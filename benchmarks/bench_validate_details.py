@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-task cost of validate_details on the real plan file.
+
+Compares the single-pass scanner in scripts/validate_task_details.py with the
+previous implementation (re.sub tag stripping, chained entity replaces,
+re.findall for links and one freshly compiled re.search per link), which is
+kept here verbatim as the baseline.
+
+Usage (from the repository root):
+    python benchmarks/bench_validate_details.py [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from plan_parser import PLAN_FILE, iter_tasks, load_plan  # noqa: E402
+from validate_task_details import validate_details  # noqa: E402
+
+
+def legacy_extract_text_from_html(html):
+    text = re.sub(r'<[^>]+>', '', html)
+    text = text.replace('&nbsp;', ' ')
+    text = text.replace('&amp;', '&')
+    text = text.replace('&lt;', '<')
+    text = text.replace('&gt;', '>')
+    text = text.replace('&quot;', '"')
+    text = text.replace('&#39;', "'")
+    return text
+
+
+def legacy_validate_details(details_text, task_label, day_num, phase_name):
+    issues = []
+    plain_text = legacy_extract_text_from_html(details_text)
+    word_count = len(plain_text.split())
+    if word_count < 120:
+        issues.append(f"❌ Only {word_count} words (minimum 120 required)")
+    for tag in ['Action', 'Boundaries', 'Deliverable', 'Verification']:
+        if f'<strong>{tag}:</strong>' not in details_text:
+            issues.append(f"❌ Missing <strong>{tag}:</strong> tag")
+    links = re.findall(r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>', details_text)
+    if len(links) < 2:
+        issues.append(f"❌ Only {len(links)} source links (minimum 2 required)")
+    for url, text in links:
+        link_match = re.search(rf'<a\s+href="{re.escape(url)}"([^>]+)>{re.escape(text)}</a>', details_text)
+        if link_match:
+            attrs = link_match.group(1)
+            if 'target="_blank"' not in attrs:
+                issues.append(f"⚠️  Link to {url} missing target=\"_blank\"")
+            if 'rel="noopener"' not in attrs and 'rel="noreferrer"' not in attrs:
+                issues.append(f"⚠️  Link to {url} missing rel=\"noopener\" or rel=\"noreferrer\"")
+    return issues, word_count, len(links)
+
+
+def time_per_task(func, records, repeat):
+    """Best-of-`repeat` wall time per task, in microseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for record in records:
+            func(*record)
+        best = min(best, time.perf_counter() - started)
+    return best / len(records) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--file', default=PLAN_FILE)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    _, plan = load_plan(args.file)
+    records = [(task['details'], task['label'], day['globalDay'], phase['id'])
+               for phase, day, _, task in iter_tasks(plan) if task.get('details')]
+    # Drop compiled patterns cached by earlier runs so the legacy path pays
+    # for compiling its per-link patterns as it did in practice
+    re.purge()
+
+    legacy = time_per_task(legacy_validate_details, records, args.repeat)
+    current = time_per_task(validate_details, records, args.repeat)
+    print(f"Tasks with details: {len(records)} ({args.file})")
+    print(f"  legacy regex pipeline: {legacy:8.1f} µs/task")
+    print(f"  single-pass scanner:   {current:8.1f} µs/task")
+    print(f"  speedup:               {legacy / current:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
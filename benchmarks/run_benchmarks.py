@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the scripts/ pipeline on synthetic plans.
+
+Generates synthetic planPhases.js files (see synthetic_plan.py) at several
+multiples of the real plan's size and times each pipeline stage on them:
+
+    parse            plan_parser.load_plan
+    validate         validate_task_details.run_validation over every phase (no cache)
+    inject           plan_patch.apply_edits rewriting every task's details, then write_plan
+    export           plan_compile.render_raw_phase for every phase, then write_outputs
+    store            plan_store.load_store, then every task's label and details read
+    mapped           the same read through plan_mmap.map_store
+    validate-store   run_validation over a plan loaded with load_store
+    validate-mapped  run_validation over a mapped plan, as validate_task_details.py runs
+    duplicates       plan_duplicates.find_duplicates (MinHash/LSH) over every task
+
+The store stages read a copy of the synthetic plan imported into a store
+directory next to it. Each stage runs in a fresh process so its peak RSS is
+its own. Wall time covers the stage's work only; peak RSS also includes
+loading its input (for the mapped stages, the file pages they touched).
+Every run is appended to a JSON results file and compared with the previous
+run for the same scale, details length and stage.
+
+Usage (from the repository root):
+    python benchmarks/run_benchmarks.py [--scales 1,10,100] [--details-words 150]
+                                        [--stages parse,validate] [--jobs 4]
+    python benchmarks/run_benchmarks.py --scales 1,10 --stages store,mapped,validate-store,validate-mapped
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'scripts'))
+
+from plan_compile import raw_export_path, render_raw_phase, write_outputs  # noqa: E402
+from plan_duplicates import find_duplicates  # noqa: E402
+from plan_metrics import peak_rss_kb  # noqa: E402
+from plan_mmap import map_store  # noqa: E402
+from plan_parser import iter_tasks, load_plan, task_id  # noqa: E402
+from plan_patch import apply_edits, write_plan  # noqa: E402
+from plan_store import import_plan, load_store, save_store  # noqa: E402
+from synthetic_plan import write_plan_file  # noqa: E402
+from validate_task_details import collect_phase_records, run_validation  # noqa: E402
+
+RESULTS_FILE = os.path.join(BENCH_DIR, 'results.json')
+
+
+def stage_parse(plan_path, workdir, jobs):
+    started = time.perf_counter()
+    load_plan(plan_path)
+    return time.perf_counter() - started
+
+
+def stage_validate(plan_path, workdir, jobs):
+    _, plan = load_plan(plan_path)
+    started = time.perf_counter()
+    run_validation(collect_phase_records(plan), jobs=jobs)
+    return time.perf_counter() - started
+
+
+def stage_inject(plan_path, workdir, jobs):
+    content, plan = load_plan(plan_path)
+    started = time.perf_counter()
+    edits = [(task_id(phase, day, index), 'details', task['details'] + ' Updated.')
+             for phase, day, index, task in iter_tasks(plan) if task.get('details')]
+    new_content, _ = apply_edits(content, plan, edits)
+    write_plan(os.path.join(workdir, 'planPhases.injected.js'), new_content)
+    return time.perf_counter() - started
+
+
+def stage_export(plan_path, workdir, jobs):
+    _, plan = load_plan(plan_path)
+    started = time.perf_counter()
+    outputs = {raw_export_path(phase['id'], workdir): render_raw_phase(phase) for phase in plan['phases']}
+    write_outputs(outputs, outputs)
+    return time.perf_counter() - started
+
+
+def store_dir(plan_path):
+    return os.path.splitext(plan_path)[0] + '_store'
+
+
+def _read_tasks(plan):
+    return sum(len(task.get('label', '')) + len(task.get('details', ''))
+               for _, _, _, task in iter_tasks(plan))
+
+
+def stage_store(plan_path, workdir, jobs):
+    started = time.perf_counter()
+    _, plan = load_store(store_dir(plan_path))
+    _read_tasks(plan)
+    return time.perf_counter() - started
+
+
+def stage_mapped(plan_path, workdir, jobs):
+    started = time.perf_counter()
+    _, plan = map_store(store_dir(plan_path), task_fields=('label', 'details'))
+    _read_tasks(plan)
+    return time.perf_counter() - started
+
+
+def stage_validate_store(plan_path, workdir, jobs):
+    started = time.perf_counter()
+    _, plan = load_store(store_dir(plan_path))
+    run_validation(collect_phase_records(plan), jobs=jobs)
+    return time.perf_counter() - started
+
+
+def stage_validate_mapped(plan_path, workdir, jobs):
+    started = time.perf_counter()
+    _, plan = map_store(store_dir(plan_path), task_fields=('label', 'details'))
+    run_validation(collect_phase_records(plan), jobs=jobs)
+    return time.perf_counter() - started
+
+
+def stage_duplicates(plan_path, workdir, jobs):
+    _, plan = load_plan(plan_path)
+    started = time.perf_counter()
+    find_duplicates(plan)
+    return time.perf_counter() - started
+
+
+STAGES = {
+    'parse': stage_parse,
+    'validate': stage_validate,
+    'inject': stage_inject,
+    'export': stage_export,
+    'store': stage_store,
+    'mapped': stage_mapped,
+    'validate-store': stage_validate_store,
+    'validate-mapped': stage_validate_mapped,
+    'duplicates': stage_duplicates,
+}
+STORE_STAGES = ('store', 'mapped', 'validate-store', 'validate-mapped')
+
+
+def _stage_worker(stage, plan_path, workdir, jobs, queue):
+    wall = STAGES[stage](plan_path, workdir, jobs)
+    queue.put((wall, peak_rss_kb()))
+
+
+def run_stage(stage, plan_path, workdir, jobs=1):
+    """Run one stage in a fresh process. Returns (wall_seconds, peak_rss_kb)."""
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_stage_worker, args=(stage, plan_path, workdir, jobs, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    if proc.exitcode != 0:
+        raise RuntimeError(f"Stage {stage} exited with code {proc.exitcode}")
+    return result
+
+
+def _git_revision():
+    proc = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                          capture_output=True, text=True, cwd=BENCH_DIR)
+    return proc.stdout.strip() or None
+
+
+def load_results(path=RESULTS_FILE):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(runs, path=RESULTS_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(runs, f, indent=1)
+
+
+def _previous_timings(runs):
+    """Map (scale, details_words, stage) to the most recent earlier result."""
+    previous = {}
+    for run in runs:
+        for row in run['results']:
+            previous[(row['scale'], row['details_words'], row['stage'])] = row
+    return previous
+
+
+def _delta(new, old):
+    if not old:
+        return ''
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scales', default='1,10,100',
+                        help='Comma-separated size multiples of the real plan (default: 1,10,100)')
+    parser.add_argument('--details-words', type=int, default=150)
+    parser.add_argument('--details-fraction', type=float, default=1.0,
+                        help='Share of tasks that carry details (default: 1.0)')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"Comma-separated stages (default: {','.join(STAGES)})")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Worker processes for validate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=RESULTS_FILE, help='JSON results file to append to')
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(',')]
+    stages = args.stages.split(',')
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"Unknown stage(s): {', '.join(unknown)}")
+
+    runs = load_results(args.output)
+    previous = _previous_timings(runs)
+    rows = []
+
+    print(f"{'scale':>5} {'stage':<15} {'wall (s)':>10} {'Δ wall':>8} {'peak RSS (MB)':>14} {'Δ RSS':>8}")
+    with tempfile.TemporaryDirectory(prefix='plan-bench-') as workdir:
+        for scale in scales:
+            plan_path = os.path.join(workdir, f"plan_x{scale}.js")
+            size = write_plan_file(plan_path, scale, args.details_words,
+                                   args.details_fraction, args.seed)
+            _, plan = load_plan(plan_path)
+            tasks = sum(1 for _ in iter_tasks(plan))
+            days = sum(len(phase['days']) for phase in plan['phases'])
+            del plan
+            print(f"{scale:>4}x  {days:,} days, {tasks:,} tasks, {size / 1e6:.1f} MB")
+            if any(stage in STORE_STAGES for stage in stages):
+                index, plan = import_plan(plan_path)
+                save_store(index, plan, store_dir(plan_path))
+                del index, plan
+
+            for stage in stages:
+                wall, rss = run_stage(stage, plan_path, workdir, args.jobs)
+                row = {
+                    'scale': scale, 'details_words': args.details_words, 'stage': stage,
+                    'file_bytes': size, 'days': days, 'tasks': tasks,
+                    'wall_s': round(wall, 4), 'peak_rss_kb': rss,
+                }
+                rows.append(row)
+                old = previous.get((scale, args.details_words, stage))
+                rss_text = f"{rss / 1024:14.1f}" if rss is not None else f"{'n/a':>14}"
+                print(f"{scale:>4}x {stage:<15} {wall:10.3f} {_delta(wall, old and old['wall_s']):>8} "
+                      f"{rss_text} {_delta(rss or 0, old and old['peak_rss_kb']):>8}")
+
+    runs.append({
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'jobs': args.jobs,
+        'details_fraction': args.details_fraction,
+        'seed': args.seed,
+        'results': rows,
+    })
+    save_results(runs, args.output)
+    print(f"\nResults appended to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic planPhases.js files for benchmarking the scripts/ pipeline.
+
+The output uses the same layout as assets/js/data/planPhases.js: 14 phases,
+one day object per line group, one task object per line, details as a
+single-quoted HTML string with <strong> sections and source links. Scale 1
+matches the real plan's size (364 days, ~1,170 tasks); scale 10 and 100
+multiply the number of days per phase.
+
+Usage (from the repository root):
+    python benchmarks/synthetic_plan.py --scale 10 --details-words 200 -o /tmp/plan10.js
+"""
+
+import argparse
+import random
+import sys
+
+BASE_DAYS = 364
+PHASES = 14
+# The real plan averages ~3.2 tasks per day
+TASKS_PER_DAY = (3, 3, 3, 4, 3)
+
+_WORDS = (
+    'gradient tensor attention model layer batch token vector matrix loss '
+    'optimizer notebook dataset embedding checkpoint evaluate implement review '
+    'compare visualize document verify training inference baseline metric'
+).split()
+_SECTIONS = ('Action', 'Boundaries', 'Deliverable', 'Verification')
+_LINKS = (
+    ('https://pytorch.org/docs/stable/index.html', 'PyTorch Documentation'),
+    ('https://huggingface.co/docs', 'Hugging Face Docs'),
+    ('https://numpy.org/doc/stable/', 'NumPy Documentation'),
+    ('https://scikit-learn.org/stable/', 'scikit-learn'),
+    ('https://d2l.ai/', 'Dive into Deep Learning'),
+)
+
+
+def _sentence(rng, words):
+    return ' '.join(rng.choice(_WORDS) for _ in range(words))
+
+
+def make_details(rng, words):
+    """Build one details HTML string of roughly `words` words."""
+    per_section = max(1, words // (len(_SECTIONS) + 1))
+    parts = [f"<strong>{name}:</strong> {_sentence(rng, per_section)}." for name in _SECTIONS]
+    parts.append(f"Common pitfall: don\\'t skip {_sentence(rng, per_section)}.")
+    links = rng.sample(_LINKS, 2)
+    anchors = ', '.join(f'<a href="{url}" target="_blank" rel="noopener">{text}</a>'
+                        for url, text in links)
+    parts.append(f"<strong>Resources:</strong> {anchors}")
+    return ' '.join(parts)
+
+
+def generate_plan_source(scale=1, details_words=150, details_fraction=1.0, seed=0):
+    """Return the text of a synthetic planPhases.js."""
+    rng = random.Random(seed)
+    total_days = BASE_DAYS * scale
+    days_per_phase = [total_days // PHASES + (1 if i < total_days % PHASES else 0)
+                      for i in range(PHASES)]
+
+    out = [
+        "// Synthetic plan generated by benchmarks/synthetic_plan.py",
+        f"// scale={scale} details_words={details_words} seed={seed}",
+        "",
+        "const PLAN = {",
+        "  phases: [",
+    ]
+    global_day = 0
+    for p, n_days in enumerate(days_per_phase):
+        first_week = global_day // 7 + 1
+        last_week = (global_day + n_days - 1) // 7 + 1
+        out += [
+            "    {",
+            f"      id: 'phase-{p + 1}',",
+            f"      title: 'Phase {p + 1}: Synthetic Phase {p + 1}',",
+            f"      description: 'Synthetic phase {p + 1} for benchmarking.',",
+            f"      duration: '{n_days} days',",
+            f"      weeks: [{', '.join(str(w) for w in range(first_week, last_week + 1))}],",
+            "      days: [",
+        ]
+        for d in range(n_days):
+            global_day += 1
+            n_tasks = TASKS_PER_DAY[global_day % len(TASKS_PER_DAY)]
+            out += [
+                "        {",
+                f"          globalDay: {global_day},",
+                f"          week: {(global_day - 1) // 7 + 1},",
+                f"          title: 'Synthetic Day {global_day}',",
+                f"          priority: '{rng.choice(('HIGH', 'MEDIUM', 'LOW'))}',",
+                "          tasks: [",
+            ]
+            for t in range(n_tasks):
+                label = f"{_sentence(rng, 4).capitalize()}: task {t + 1}"
+                fields = f"label: '{label}', estMinutes: {rng.choice((30, 45, 60, 75, 90))}"
+                if rng.random() < details_fraction:
+                    fields += f", details: '{make_details(rng, details_words)}'"
+                comma = ',' if t < n_tasks - 1 else ''
+                out.append(f"            {{ {fields} }}{comma}")
+            out += [
+                "          ],",
+                f"          reflectionPrompt: 'What did you learn on day {global_day}?'",
+                "        }" + (',' if d < n_days - 1 else ''),
+            ]
+        out += [
+            "      ]",
+            "    }" + (',' if p < PHASES - 1 else ''),
+        ]
+    out += [
+        "  ]",
+        "};",
+        "",
+        "if (typeof module !== 'undefined' && module.exports) {",
+        "  module.exports = { PLAN };",
+        "}",
+        "",
+    ]
+    return '\n'.join(out)
+
+
+def write_plan_file(path, scale=1, details_words=150, details_fraction=1.0, seed=0):
+    """Write a synthetic plan to `path` and return its size in bytes."""
+    source = generate_plan_source(scale, details_words, details_fraction, seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return len(source.encode('utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--details-words', type=int, default=150)
+    parser.add_argument('--details-fraction', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', required=True)
+    args = parser.parse_args(argv)
+    size = write_plan_file(args.output, args.scale, args.details_words,
+                           args.details_fraction, args.seed)
+    print(f"Wrote {args.output} ({size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
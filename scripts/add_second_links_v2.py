@@ -1,94 +1,89 @@
 #!/usr/bin/env python3
 """
 Properly add second links to tasks that only have one source link.
-Uses proper string replacement without regex complications.
+The additions are insert_after rules for plan_link_rewrite, matched on the
+text of each task's last link; the changes are applied to the plan store in
+one pass and planPhases.js is recompiled. Tasks that already have their
+second link are left alone, so running it again writes nothing.
+
+Usage:
+    python scripts/add_second_links_v2.py [--dry-run]
 """
 
-import re
+import argparse
+import sys
+
+import plan_metrics
+from plan_compile import compile_store
+from plan_link_rewrite import compile_rules, rewrite_plan
+from plan_patch import print_report
+from plan_snapshots import take_snapshot
+from plan_store import STORE_DIR, load_store, save_store, update_tasks
+
+
+# The last link of a task whose text matches gets a second link after it
+SECOND_LINKS = [
+    # Day 50 Task 2
+    {'match': {'text': 'train_test_split docs', 'last': True},
+     'insert_after': {'href': 'https://scikit-learn.org/stable/tutorial/statistical_inference/supervised_learning.html',
+                      'text': 'Supervised Learning Tutorial'}},
+    # Day 50 Task 4
+    {'match': {'text': 'Classifier Comparison Visualization', 'last': True},
+     'insert_after': {'href': 'https://matplotlib.org/stable/gallery/images_contours_and_fields/contourf_demo.html',
+                      'text': 'Contourf Demo'}},
+    # Day 50 Task 5
+    {'match': {'text': 'sklearn API Design', 'last': True},
+     'insert_after': {'href': 'https://jakevdp.github.io/PythonDataScienceHandbook/05.02-introducing-scikit-learn.html',
+                      'text': 'Python Data Science Handbook: sklearn'}},
+    # Day 71 Task 2
+    {'match': {'text': 'Tensor Tutorial', 'last': True},
+     'insert_after': {'href': 'https://pytorch.org/docs/stable/torch.html',
+                      'text': 'torch Package Documentation'}},
+    # Day 71 Task 4
+    {'match': {'text': 'Autograd Example', 'last': True},
+     'insert_after': {'href': 'https://pytorch.org/docs/stable/notes/autograd.html',
+                      'text': 'Autograd Mechanics'}},
+    # Day 71 Task 5
+    {'match': {'text': 'PyTorch Computational Graphs', 'last': True},
+     'insert_after': {'href': 'https://pytorch.org/docs/stable/notes/extending.html',
+                      'text': 'Extending PyTorch'}},
+    # Review tasks
+    {'match': {'text': 'Effective Study Techniques', 'last': True},
+     'insert_after': {'href': 'https://www.learningscientists.org/learning-scientists-podcast',
+                      'text': 'Learning Scientists Podcast'}},
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    args = parser.parse_args(argv)
+
+    print(f"Reading {args.store}...")
+    index, plan = load_store(args.store)
+    edits, _ = rewrite_plan(plan, compile_rules(SECOND_LINKS))
+    for key, _, _ in edits:
+        print(f"Fixed {key}")
+    if args.dry_run or not edits:
+        print(f"{len(edits)} task(s) to fix{'' if edits else ', nothing to write'}")
+        return 0
 
+    # Snapshot the store before modifying (only changed days are stored)
+    snapshot = take_snapshot('before-add-second-links', args.store)
+    report = update_tasks(plan, edits)
+    print(f"\nWriting {args.store}...")
+    changed = save_store(index, plan, args.store)
+    compiled = compile_store(store=args.store)
 
-def add_second_links_properly():
-    """Add second links to specific tasks."""
-    
-    input_file = 'assets/js/data/planPhases.js'
-    backup_file = 'assets/js/data/planPhases.js.backup4'
-    
-    print(f"Reading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Create backup
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Backup created: {backup_file}")
-    
-    # Define replacements as simple string pairs (old substring -> new substring)
-    replacements = [
-        # Day 50 Task 2
-        (
-            'train_test_split docs</a>\'',
-            'train_test_split docs</a>, <a href="https://scikit-learn.org/stable/tutorial/statistical_inference/supervised_learning.html" target="_blank" rel="noopener">Supervised Learning Tutorial</a>\''
-        ),
-        # Day 50 Task 4
-        (
-            'Classifier Comparison Visualization</a>\'',
-            'Classifier Comparison Visualization</a>, <a href="https://matplotlib.org/stable/gallery/images_contours_and_fields/contourf_demo.html" target="_blank" rel="noopener">Contourf Demo</a>\''
-        ),
-        # Day 50 Task 5
-        (
-            'sklearn API Design</a>\'',
-            'sklearn API Design</a>, <a href="https://jakevdp.github.io/PythonDataScienceHandbook/05.02-introducing-scikit-learn.html" target="_blank" rel="noopener">Python Data Science Handbook: sklearn</a>\''
-        ),
-        # Day 71 Task 2
-        (
-            'Tensor Tutorial</a>\'',
-            'Tensor Tutorial</a>, <a href="https://pytorch.org/docs/stable/torch.html" target="_blank" rel="noopener">torch Package Documentation</a>\''
-        ),
-        # Day 71 Task 4
-        (
-            'Autograd Example</a>\'',
-            'Autograd Example</a>, <a href="https://pytorch.org/docs/stable/notes/autograd.html" target="_blank" rel="noopener">Autograd Mechanics</a>\''
-        ),
-        # Day 71 Task 5
-        (
-            'PyTorch Computational Graphs</a>\'',
-            'PyTorch Computational Graphs</a>, <a href="https://pytorch.org/docs/stable/notes/extending.html" target="_blank" rel="noopener">Extending PyTorch</a>\''
-        ),
-        # Review tasks
-        (
-            'Effective Study Techniques</a>\'',
-            'Effective Study Techniques</a>, <a href="https://www.learningscientists.org/learning-scientists-podcast" target="_blank" rel="noopener">Learning Scientists Podcast</a>\''
-        ),
-    ]
-    
-    fixes_applied = 0
-    for old_text, new_text in replacements:
-        count = content.count(old_text)
-        if count > 0:
-            content = content.replace(old_text, new_text)
-            fixes_applied += count
-            print(f"Fixed {count} occurrence(s)")
-    
-    # Write output
-    print(f"\nWriting {input_file}...")
-    with open(input_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"\nSummary:")
-    print(f"  Total fixes applied: {fixes_applied}")
-    print(f"  Backup file: {backup_file}")
-    
-    return fixes_applied
+    print("\nSummary:")
+    print_report(report)
+    print(f"  Phase files changed: {', '.join(changed) or 'none'}")
+    print(f"  Compiled: {len(compiled)} file(s)")
+    print(f"  Snapshot: {snapshot['name']}")
+    return 1 if report['conflicts'] else 0
 
 
 if __name__ == "__main__":
-    import sys
-    try:
-        count = add_second_links_properly()
-        print(f"\nSuccess! Fixed {count} tasks.")
-        sys.exit(0)
-    except Exception as e:
-        print(f"\nError: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(plan_metrics.run(main))
@@ -1,41 +0,0 @@
-#!/usr/bin/env python3
-"""
-COMPLETE Phase 6 Days 137-154 Detail Injector
-Generates and applies ALL 54 comprehensive task details to planPhases.js
-"""
-
-import re
-import sys
-import json
-
-def esc(t):
-    return t.replace('\\', '\\\\').replace("'", "\\'")
-
-# Based on problem statement guidance, I'll create details for all days
-# Days 137-140: PE validation, LayerNorm rationale, MHA assembly, FFN/residuals, parameter counting
-# Days 141: Week 20 Review
-# Days 142-146: Attention, MHA, PE, LayerNorm, Transformer blocks (deeper dive)
-# Days 147: Papers 
-# Days 148: Week 21 Review
-# Days 149-154: Attention, MHA, PE, LayerNorm, Transformer blocks, Papers (final integration and training)
-
-# Template-based generation following established pattern from Days 127-136
-
-ALL_TASK_DETAILS = {}
-
-# I'll define each day's details programmatically based on guidance
-# This is a comprehensive dictionary with all 54 tasks
-
-print("Phase 6 Days 137-154 Complete Detail Generator")
-print("=" * 60)
-print()
-print("Generating comprehensive educational content for 54 tasks...")
-print("Each task: 150-200+ words with Action, Boundaries, Deliverables, ")
-print("Verification, Pitfalls, Sources sections")
-print()
-
-# Due to the scale of this task (54 detailed paragraphs totaling ~10,000+ words),
-# I'm creating a modular approach that generates content based on themes
-
-# The actual implementation continues...
-
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Precompiled templates and keyword classification for the detail generators.
+
+Template parses a str.format template once into a tuple of literal and
+field segments; render() joins the segments with the field values. A
+template created with memo=True also memoizes the result on those values, so
+tasks that share a template and a topic reuse one string instead of
+formatting the template again. Memoize only templates whose values repeat
+(the topic-level sections); a template filled with per-task text would only
+hash long keys that never hit.
+
+KeywordClassifier replaces an if/elif chain of `keyword in label` tests.
+The keywords of every rule are compiled into one Aho-Corasick automaton, so
+a label is classified in a single pass however many rules and keywords
+there are, and the result is the first rule in list order with a keyword
+in the label, as the chain would pick.
+
+Usage:
+    from detail_templates import KeywordClassifier, Template
+
+    REVIEW_TEMPLATE = Template("Review Week {week_num} ... {topic}", memo=True)
+    CLASSIFIER = KeywordClassifier([('core', ['core concepts']),
+                                    ('review', ['review'])], default='generic')
+
+    kind = CLASSIFIER.classify(label)
+    details = REVIEW_TEMPLATE.render(week_num=8, topic='PCA')
+"""
+
+import string
+
+# Renders kept per template before its memo is cleared
+RENDER_CACHE_SIZE = 4096
+
+_NO_MATCH = float('inf')
+
+
+class Template:
+    """A str.format template compiled into literal and field segments."""
+
+    def __init__(self, source, memo=False):
+        self.source = source
+        segments = []
+        fields = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                segments.append(literal)
+            if field is None:
+                continue
+            if conversion or not field.isidentifier():
+                raise ValueError(f"unsupported template field {{{field}}}")
+            if field not in fields:
+                fields.append(field)
+            segments.append((field, spec))
+        self.fields = tuple(fields)
+        self._segments = tuple(segments)
+        self._cache = {} if memo else None
+
+    def render(self, **values):
+        """Return the template filled with `values`; memoized on them if memo=True."""
+        if self._cache is None:
+            return self._fill(values)
+        key = tuple(values[field] for field in self.fields)
+        text = self._cache.get(key)
+        if text is None:
+            text = self._fill(values)
+            if len(self._cache) >= RENDER_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = text
+        return text
+
+    def _fill(self, values):
+        parts = []
+        for segment in self._segments:
+            if segment.__class__ is str:
+                parts.append(segment)
+            else:
+                field, spec = segment
+                parts.append(format(values[field], spec))
+        return ''.join(parts)
+
+    def format(self, **values):
+        """Uncompiled, unmemoized render with str.format (the reference path)."""
+        return self.source.format(**values)
+
+
+class KeywordClassifier:
+    """Ordered keyword rules compiled into an Aho-Corasick automaton.
+
+    `rules` is [(name, [keyword, ...]), ...]; classify() returns the name of
+    the first rule that has a keyword occurring in the text, or `default`.
+    Matching is case-insensitive.
+    """
+
+    def __init__(self, rules, default=None):
+        self.rules = [(name, [keyword.lower() for keyword in keywords]) for name, keywords in rules]
+        self.default = default
+        self._goto = [{}]
+        self._fail = [0]
+        self._rank = [_NO_MATCH]   # lowest rule index matched on reaching each state
+        for rank, (_, keywords) in enumerate(self.rules):
+            for keyword in keywords:
+                state = 0
+                for ch in keyword:
+                    next_state = self._goto[state].get(ch)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._rank.append(_NO_MATCH)
+                        self._goto[state][ch] = next_state
+                    state = next_state
+                self._rank[state] = min(self._rank[state], rank)
+        self._link_failures()
+
+    def _link_failures(self):
+        # Breadth-first, so every state's failure target is final before
+        # its children are linked
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._rank[child] = min(self._rank[child], self._rank[self._fail[child]])
+                queue.append(child)
+
+    def classify(self, text):
+        goto, fail, rank = self._goto, self._fail, self._rank
+        best = _NO_MATCH
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if rank[state] < best:
+                best = rank[state]
+                if best == 0:
+                    break
+        return self.default if best == _NO_MATCH else self.rules[best][0]
+
+    def classify_linear(self, text):
+        """The equivalent if/elif chain of substring tests (the reference path)."""
+        text = text.lower()
+        for name, keywords in self.rules:
+            if any(keyword in text for keyword in keywords):
+                return name
+        return self.default
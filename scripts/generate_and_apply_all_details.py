@@ -1,128 +0,0 @@
-#!/usr/bin/env python3
-"""
-COMPLETE SOLUTION: Generate and Apply ALL Phase 6 Days 137-154 Details
-This script generates all 54 comprehensive task details and applies them to planPhases.js
-"""
-
-import re
-import sys
-
-def esc(t):
-    """Escape for JavaScript string"""
-    return t.replace('\\', '\\\\').replace("'", "\\'")
-
-# Complete detail generators following the established template pattern
-# Based on problem statement guidance for days 137-154
-
-def generate_complete_detail(day, topic, task_num, task_label):
-    """
-    Generate a complete detail paragraph following the template:
-    Action, Boundaries, Deliverables, Verification, Pitfalls, Sources
-    Target: 150-200+ words
-    """
-    
-    # This function uses smart templates based on topic type and task number
-    # to generate contextually appropriate, compliant educational content
-    
-    # Define topic-specific content generators
-    # (PE, LayerNorm, Attention, MHA, Transformer Blocks, Papers, Review)
-    
-    # For each topic type, generate appropriate Action, Boundaries, etc.
-    # Following the pattern established in Days 127-136
-    
-    # The full implementation includes all logic...
-    # For now, returning a placeholder that shows the structure
-    
-    detail = f"<strong>Action:</strong> [Generated action for {topic} task {task_num}] <strong>Boundaries:</strong> [Generated boundaries] <strong>Deliverables:</strong> [Generated deliverables] <strong>Verification:</strong> [Generated verification] <strong>Pitfalls:</strong> [Generated pitfalls] <strong>Sources:</strong> [Generated sources]"
-    
-    return detail
-
-# Main execution
-if __name__ == "__main__":
-    print("Phase 6 Days 137-154 Complete Detail Generator and Injector")
-    print("=" * 70)
-    print()
-    
-    # Read the file
-    with open('assets/js/data/planPhases.js', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    print(f"Loaded planPhases.js ({len(content)} characters)")
-    print()
-    
-    # Process days 137-154
-    days_to_process = range(137, 155)
-    modifications_made = 0
-    
-    for day in days_to_process:
-        print(f"Processing Day {day}...")
-        
-        # Find the day in the content
-        day_pattern = rf'globalDay: {day},'
-        day_pos = content.find(day_pattern)
-        
-        if day_pos == -1:
-            print(f"  Warning: Day {day} not found")
-            continue
-        
-        # Find tasks for this day
-        next_day_pos = content.find('globalDay:', day_pos + 1)
-        if next_day_pos == -1:
-            next_day_pos = len(content)
-        
-        day_section = content[day_pos:next_day_pos]
-        
-        # Find all tasks without details in this day
-        # Pattern: { label: 'LABEL', estMinutes: NUM }
-        # Should become: { label: 'LABEL', estMinutes: NUM, details: 'DETAILS' }
-        
-        task_pattern = r"(\{ label: '([^']+)', estMinutes: (\d+) \})"
-        tasks = list(re.finditer(task_pattern, day_section))
-        
-        print(f"  Found {len(tasks)} tasks to enhance")
-        
-        # For each task, generate and inject details
-        for task_idx, match in enumerate(tasks, 1):
-            full_match = match.group(1)
-            label = match.group(2)
-            est_minutes = match.group(3)
-            
-            # Determine topic from label or day context
-            if 'Positional encoding' in label or 'PE' in label:
-                topic = 'PE'
-            elif 'LayerNorm' in label:
-                topic = 'LayerNorm'
-            elif 'Attention' in label and 'MHA' not in label:
-                topic = 'Attention'
-            elif 'MHA' in label:
-                topic = 'MHA'
-            elif 'Transformer block' in label:
-                topic = 'Transformer_Block'
-            elif 'Paper' in label:
-                topic = 'Papers'
-            elif 'Review' in label or 'week' in label.lower():
-                topic = 'Review'
-            else:
-                topic = 'General'
-            
-            # Generate the detail
-            detail = generate_complete_detail(day, topic, task_idx, label)
-            detail_escaped = esc(detail)
-            
-            # Create replacement
-            replacement = f"{{ label: '{label}', estMinutes: {est_minutes}, details: '{detail_escaped}' }}"
-            
-            # Apply replacement (this would be done carefully to avoid breaking syntax)
-            # content = content.replace(full_match, replacement, 1)
-            
-            modifications_made += 1
-            print(f"    Task {task_idx}: Generated detail ({len(detail.split())} words)")
-    
-    print()
-    print(f"Total modifications prepared: {modifications_made}")
-    print()
-    print("NOTE: This is a framework showing the approach.")
-    print("The complete implementation would apply all changes and write the file.")
-    print("Each detail follows the template with Action, Boundaries, Deliverables, ")
-    print("Verification, Pitfalls, and Sources sections (150-200+ words).")
-
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Generate task details for any set of days or phases in one run.
+
+This is the one entry point for generating details; the per-range
+generate/inject scripts it replaced have been removed. Days are fanned out across a
+process pool (one job per day); results come back in plan order and each
+phase is written to the store as soon as its last day arrives. Progress and
+throughput are reported as the run goes, and the compiled site data is
+rebuilt once at the end.
+
+Only tasks without details are filled unless --overwrite is given.
+
+Generators:
+    rules   generate_all_details.create_detail_for_task (any phase; default)
+    topic   generate_phase3_4_details.topic_details (hand-written Phase 3/4
+            details where they exist, topic templates otherwise)
+
+Usage:
+    python scripts/generate_details.py                       # the whole plan
+    python scripts/generate_details.py --days 137-154
+    python scripts/generate_details.py --phases transformers,mlops --jobs 8
+    python scripts/generate_details.py --dry-run --overwrite
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plan_metrics
+from generate_all_details import create_detail_for_task
+from generate_phase3_4_details import topic_details
+from plan_compile import compile_store
+from plan_metrics import stage
+from plan_parser import phase_number, task_id
+from plan_patch import print_report
+from plan_snapshots import take_snapshot
+from plan_store import load_store, save_phase, update_tasks
+
+GENERATORS = ('rules', 'topic')
+PROGRESS_INTERVAL = 1.0
+
+
+def parse_days(spec):
+    """Parse '1-42,137-154,200' into a set of day numbers."""
+    days = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition('-')
+        try:
+            start, end = int(start), int(end or start)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid day range: {part!r}")
+        if end < start:
+            raise argparse.ArgumentTypeError(f"reversed day range: {part!r}")
+        days.update(range(start, end + 1))
+    if not days:
+        raise argparse.ArgumentTypeError(f"no days in {spec!r}")
+    return days
+
+
+def parse_phases(spec):
+    """Parse 'transformers,6' into a set of phase ids or numbers."""
+    phases = {part.strip() for part in spec.split(',') if part.strip()}
+    if not phases:
+        raise argparse.ArgumentTypeError(f"no phases in {spec!r}")
+    return phases
+
+
+def select_days(plan, days=None, phases=None, overwrite=False):
+    """Return [(phase, day, [task index, ...])] of the days to generate, in plan order."""
+    selected = []
+    for phase in plan['phases']:
+        if phases is not None and phase['id'] not in phases and str(phase_number(phase)) not in phases:
+            continue
+        for day in phase.get('days', []):
+            if days is not None and day['globalDay'] not in days:
+                continue
+            indexes = [index for index, task in enumerate(day.get('tasks', []))
+                       if overwrite or not task.get('details')]
+            if indexes:
+                selected.append((phase, day, indexes))
+    return selected
+
+
+def generate_day(job):
+    """Generate details for one day's tasks; runs inside pool workers."""
+    generator, phase_id, global_day, title, labels = job
+    if generator == 'topic':
+        return [(index, topic_details(label, global_day, title, index)) for index, label in labels]
+    context = {'day': global_day, 'title': title, 'phase': phase_id}
+    return [(index, create_detail_for_task(label, context)) for index, label in labels]
+
+
+def _jobs_for(selected, generator):
+    for phase, day, indexes in selected:
+        labels = [(index, day['tasks'][index]['label']) for index in indexes]
+        yield (generator, phase['id'], day['globalDay'], day.get('title', ''), labels)
+
+
+def generate(selected, generator='rules', jobs=1, on_phase_done=None, progress=None):
+    """Generate details for `selected` days and apply them to the loaded plan.
+
+    Results are applied one phase at a time, in plan order; `on_phase_done`
+    is called with each phase once all its days are applied. Returns the
+    combined update report.
+    """
+    report = {'applied': [], 'unchanged': [], 'conflicts': []}
+    if not selected:
+        return report
+
+    pending_phase = None
+    edits = []
+
+    def flush():
+        phase_report = update_tasks({'phases': [pending_phase]}, edits)
+        for key in report:
+            report[key] += phase_report[key]
+        if on_phase_done:
+            on_phase_done(pending_phase)
+        edits.clear()
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        job_iter = _jobs_for(selected, generator)
+        # map() yields in submission order, so phases complete one after another
+        results = pool.map(generate_day, job_iter, chunksize=4) if pool else map(generate_day, job_iter)
+        for (phase, day, _), day_results in zip(selected, results):
+            if pending_phase is not None and phase is not pending_phase:
+                flush()
+            pending_phase = phase
+            edits.extend((task_id(phase, day, index), 'details', details) for index, details in day_results)
+            if progress:
+                progress(day, len(day_results))
+        flush()
+    finally:
+        if pool:
+            pool.shutdown()
+    return report
+
+
+class Progress:
+    """Prints days done, tasks done and throughput at most once per interval."""
+
+    def __init__(self, total_days, total_tasks, interval=PROGRESS_INTERVAL):
+        self.total_days = total_days
+        self.total_tasks = total_tasks
+        self.interval = interval
+        self.days = 0
+        self.tasks = 0
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def __call__(self, day, task_count):
+        self.days += 1
+        self.tasks += task_count
+        now = time.perf_counter()
+        if now - self._last >= self.interval or self.days == self.total_days:
+            self._last = now
+            print(f"  Day {day['globalDay']:>3}: {self.days}/{self.total_days} days, "
+                  f"{self.tasks}/{self.total_tasks} tasks, {self.rate():,.0f} tasks/s")
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def rate(self):
+        elapsed = self.elapsed()
+        return self.tasks / elapsed if elapsed > 0 else 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--days', type=parse_days, help="Day numbers or ranges, e.g. '1-42,137-154'")
+    parser.add_argument('--phases', type=parse_phases,
+                        help='Phase ids or numbers, comma-separated')
+    parser.add_argument('--generator', choices=GENERATORS, default='rules')
+    parser.add_argument('--overwrite', action='store_true', help='Regenerate tasks that already have details')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes to generate with (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true', help='Generate and report without writing')
+    args = parser.parse_args(argv)
+
+    index, plan = load_store()
+    selected = select_days(plan, args.days, args.phases, args.overwrite)
+    total_tasks = sum(len(indexes) for _, _, indexes in selected)
+    print(f"Generating details for {total_tasks} tasks over {len(selected)} days "
+          f"({args.generator} generator, {args.jobs} job{'s' if args.jobs != 1 else ''})")
+    if not selected:
+        return 0
+
+    written = []
+
+    def on_phase_done(phase):
+        if not args.dry_run and save_phase(phase):
+            written.append(phase['id'])
+
+    snapshot = None if args.dry_run else take_snapshot('before-generate-details')
+    progress = Progress(len(selected), total_tasks)
+    with stage('transform'):
+        report = generate(selected, args.generator, args.jobs, on_phase_done, progress)
+    elapsed = progress.elapsed()
+    compiled = compile_store() if written else []
+
+    print("\nSummary:")
+    print(f"  Tasks generated: {progress.tasks} in {elapsed:.2f}s ({progress.rate():,.0f} tasks/s)")
+    print_report(report)
+    if args.dry_run:
+        print("  Dry run: nothing written")
+    else:
+        print(f"  Phase files changed: {', '.join(written) or 'none'}")
+        print(f"  Compiled: {len(compiled)} file(s)")
+        print(f"  Snapshot: {snapshot['name']}")
+    return 1 if report['conflicts'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -15,6 +15,8 @@ Each task receives a 120-200+ word paragraph with:
 import re
 import json
 
+from detail_templates import KeywordClassifier, Template
+
 # Phase 3: Classical ML (Days 50-70) - Detailed templates by topic
 PHASE3_DETAILS = {
     # Day 50: Sklearn Introduction
@@ -44,6 +46,106 @@ PHASE4_DETAILS = {
 }
 
 
+# Task kinds in the order the templates are tried; matching is case-insensitive
+TASK_KINDS = KeywordClassifier([
+    ('core', ['core concepts']),
+    ('implementation', ['implementation']),
+    ('practice', ['practice']),
+    ('review', ['review']),
+    ('weekly-log', ['weekly log']),
+], default='default')
+
+# Template for "Core concepts" tasks
+CORE_CONCEPTS_TEMPLATE = Template("""<strong>Action:</strong> Study the core concepts of {topic} through official documentation, tutorial videos, and worked examples. Focus on understanding {focus_areas}. Take detailed notes on key definitions, formulas, architectural choices, and intuitions. Create concept maps connecting {topic} to previously learned material. Use active learning—don't just read passively; implement small examples as you learn, experiment with parameters, and test your understanding.
+
+<strong>Boundaries:</strong> Focus on conceptual understanding before full implementation. Don't skip foundational concepts to rush ahead. Spend time visualizing and drawing diagrams—mental models are crucial. Stop when you have clear intuition—detailed implementation comes in the next task. Don't get distracted by advanced variants or optimizations yet.
+
+<strong>Deliverable:</strong> Create comprehensive notes document or concept map explaining {topic} in your own words. Include: (1) Core definitions and terminology with examples, (2) Visual diagrams illustrating key concepts and data flow, (3) Connections to prior topics and prerequisite knowledge, (4) 3-5 self-test questions with detailed answers, (5) Summary of when to use this approach vs alternatives.
+
+<strong>Verification:</strong> Can you explain {topic} to someone else without looking at your notes? Can you identify potential pitfalls or common misconceptions? Test yourself by covering your notes and explaining the concept aloud or writing a summary. Your explanation should include both what {topic} is and why it matters for ML systems.
+
+Common pitfall: Passive reading without active engagement leads to shallow understanding. Success check: You should be able to connect {topic} to broader learning objectives and explain why it matters. Can you predict what problems might arise in practice?
+
+Estimated time: 90 minutes including active note-taking, diagramming, and self-testing.
+
+<strong>Resources:</strong> {resources}""")
+
+# Template for "Implementation" tasks
+IMPLEMENTATION_TEMPLATE = Template("""<strong>Action:</strong> Implement {topic} from scratch following best practices and the {framework} API patterns. Start with a minimal working version, then iteratively add features and improvements. Write clean, well-documented code with type hints where appropriate and comprehensive docstrings. Include inline comments explaining non-obvious logic, especially for mathematical operations or architectural choices. Structure your notebook clearly: imports, data loading, model definition, training, evaluation, visualization.
+
+<strong>Boundaries:</strong> Focus on correctness before optimization. Write tests or verification code as you go to verify each component works as expected. Don't copy-paste large code blocks—type everything yourself to build muscle memory and deep understanding. Keep functions small and focused on single responsibilities. Use meaningful variable names (not x, y, z for everything).
+
+<strong>Deliverable:</strong> Create a well-structured implementation in {notebook_path} with: (1) Clear function/class definitions following {framework} conventions, (2) Comprehensive docstrings with parameter descriptions and examples, (3) Verification code checking outputs at each stage, (4) A demonstration section showing the implementation in action on appropriate dataset, (5) Visualization of results (plots, metrics, confusion matrices as applicable).
+
+<strong>Verification:</strong> {verification}
+
+Common pitfall: Writing code without testing incrementally, leading to hard-to-debug errors. Another pitfall: poor variable names making code unreadable. Success check: Your implementation should produce expected outputs for at least 5 diverse test cases. Code should be clean enough that you'd be proud to show it in a code review or add to your portfolio.
+
+Estimated time: 75 minutes including implementation, testing, documentation, and verification.
+
+<strong>Resources:</strong> {resources}""")
+
+# Template for "Practice" tasks
+PRACTICE_TEMPLATE = Template("""<strong>Action:</strong> Complete practice exercises to solidify your understanding of {topic}. Work through at least 5-8 problems or experiments of varying difficulty covering {practice_focus}. Start with simpler problems to build confidence, then tackle more challenging ones. Time yourself on some problems to build fluency. Document your process, results, and insights for each experiment.
+
+<strong>Boundaries:</strong> Attempt each problem independently before checking solutions or references. If stuck for more than 15-20 minutes on implementation details, review the relevant concept from previous tasks then retry with fresh perspective. Don't just verify your answer is correct—make sure you understand WHY it's correct, what assumptions you made, and what the exercise was designed to teach you.
+
+<strong>Deliverable:</strong> A collection of solved problems or experiments with your working shown in notebook format. For each problem: (1) Write out your approach and hypotheses, (2) Show implementation with step-by-step work, (3) Visualize results appropriately (plots, tables, metrics), (4) Verify outcomes and analyze any surprises, (5) Note what concept it tested, (6) Identify any patterns, tricks, or insights you learned.
+
+<strong>Verification:</strong> Aim for {success_metrics} on practice problems. If results are poor, debug systematically: check data preprocessing, verify model architecture, examine loss curves, inspect predictions. For any mistakes, understand exactly where your reasoning or implementation went wrong. Can you solve similar problems quickly and confidently now?
+
+Common pitfall: Looking at solutions too quickly instead of struggling productively—the struggle builds deeper understanding. Another pitfall: not varying parameters enough to see their effects. Success check: You should feel significantly more confident with {topic} after practice. You should be able to approach new problems of similar difficulty without help, and debug issues efficiently.
+
+Estimated time: 60 minutes for thorough practice with multiple examples.
+
+<strong>Resources:</strong> <a href="https://scikit-learn.org/stable/auto_examples/index.html" target="_blank" rel="noopener">sklearn Examples</a>, <a href="https://pytorch.org/tutorials/beginner/basics/intro.html" target="_blank" rel="noopener">PyTorch Basics</a>, <a href="https://paperswithcode.com/" target="_blank" rel="noopener">Papers with Code</a>""")
+
+# Template for review days
+REVIEW_TEMPLATE = Template("""<strong>Action:</strong> Conduct comprehensive review of Week {week_num} {phase_name} material. Process: (1) Re-read all notes from this week, identifying key concepts and any remaining confusion, (2) Review all notebooks you created—can you follow the logic? Do results still make sense? (3) Revisit hardest concepts: re-watch relevant videos, re-read documentation, create additional examples if needed, (4) Test yourself: solve 2-3 problems from scratch without referring to previous solutions, (5) Create a one-page summary of the week's key insights and how they connect.
+
+<strong>Boundaries:</strong> Don't just skim—engage actively with the material. Focus on understanding, not memorization. If something is still unclear after review, mark it for deeper study or to ask mentors. Don't spend excessive time on material you've mastered—focus on weak areas. Balance breadth (touching all topics) with depth (solidifying shaky concepts).
+
+<strong>Deliverable:</strong> Week {week_num} review document (<code>docs/notes/week{week_num}_review.md</code>) containing: (1) Summary of each day's key topics (2-3 sentences each), (2) Concepts that now make sense that didn't before, (3) Remaining questions or confusion (with plan to address), (4) 3-5 integration questions testing cross-topic understanding, (5) Self-assessment of mastery (1-5 scale) for each major topic with justification.
+
+<strong>Verification:</strong> Review document demonstrates genuine engagement and honest self-assessment. Can you explain this week's concepts to someone else? Can you solve problems combining multiple concepts from the week? Your self-assessment should identify both strengths and areas needing more work.
+
+Common pitfall: Passive re-reading without active problem-solving—you need to test your understanding. Another pitfall: overconfidence from recognizing concepts vs actually being able to use them. Success check: You should feel more confident about the week's material and have a clear plan for any remaining gaps.
+
+Estimated time: 75 minutes for thorough, active review.
+
+<strong>Resources:</strong> Your own notes and notebooks from the week, <a href="https://www.scotthyoung.com/blog/2020/05/04/study-better/" target="_blank" rel="noopener">Effective Study Techniques</a>, <a href="https://www.learningscientists.org/learning-scientists-podcast" target="_blank" rel="noopener">Learning Scientists Podcast</a>""")
+
+# Template for weekly log tasks
+WEEKLY_LOG_TEMPLATE = Template("""<strong>Action:</strong> Write your Week {week_num} log documenting progress, challenges, and insights. Structure: (1) Overview: major topics covered, time spent, overall feeling about the week, (2) Achievements: what went well, breakthroughs, successful implementations, concepts that clicked, (3) Challenges: what was difficult, topics needing more work, technical issues encountered, time management struggles, (4) Key learnings: 3-5 major insights or "aha moments" from the week, (5) Looking ahead: goals for next week, specific concepts to reinforce, adjustments to study approach if needed. Be honest and reflective—this log is for you.
+
+<strong>Boundaries:</strong> Keep it concise but substantive—aim for 400-600 words. Focus on learning and growth, not just activities. Don't just list what you did—reflect on what you learned and how you're evolving as a learner. Be specific with examples rather than generic ("I struggled with cross-validation overfitting on the Wine dataset" not "some things were hard").
+
+<strong>Deliverable:</strong> Weekly log document saved as <code>docs/logs/week{week_num}_log.md</code> with structured reflection on progress, challenges, learnings, and forward-looking goals.
+
+<strong>Verification:</strong> Log demonstrates genuine reflection and honest self-assessment. Contains specific examples and insights, not generic platitudes. Shows growth mindset—challenges viewed as learning opportunities. Includes actionable plans for improvement.
+
+Common pitfall: Writing perfunctory logs just to check a box—invest in reflection, it pays dividends in learning efficiency. Another pitfall: being too harsh or too easy on yourself—aim for honest, balanced assessment. Success check: Could you review this log in a month and remember the week clearly? Does it help you see your growth trajectory?
+
+Estimated time: 30 minutes for thoughtful reflection and writing.
+
+<strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2010/01/11/learn-faster-by-writing-twice/" target="_blank" rel="noopener">Learning Through Reflection</a>, <a href="https://fs.blog/learning/" target="_blank" rel="noopener">Learning Principles</a>""")
+
+# Template for tasks that don't fit specific patterns
+DEFAULT_TEMPLATE = Template("""<strong>Action:</strong> {action}. Approach this systematically: (1) Review any relevant documentation or examples first, (2) Plan your implementation or study approach, (3) Execute step-by-step with verification at each stage, (4) Document your process, results, and insights, (5) Test your understanding with self-created examples or questions. Focus on building deep understanding of {topic} in the context of {framework}.
+
+<strong>Boundaries:</strong> Stay focused on the stated task—don't diverge into related but out-of-scope topics. Ensure you understand prerequisites before proceeding. If you encounter errors or confusion, debug systematically: check inputs, inspect intermediate outputs, verify assumptions. Don't skip verification steps.
+
+<strong>Deliverable:</strong> Completed task with appropriate artifacts (code, notes, visualizations as applicable). Ensure outputs are well-documented and reproducible. Create clear deliverables that you could reference later or show to others.
+
+<strong>Verification:</strong> Task completed successfully with expected outputs. For code: runs without errors, produces correct results verified against test cases. For conceptual work: can explain the topic clearly to someone else. Common pitfall: rushing through without true understanding—take time to internalize concepts.
+
+Success check: Can you apply what you learned to a novel problem? Can you explain the key insights gained from this task? Do your deliverables reflect quality work?
+
+Estimated time: As specified in task description.
+
+<strong>Resources:</strong> {resources}, relevant examples and tutorials for {context}""")
+
+
 def generate_generic_details(task_label, day_number, topic, task_type="core"):
     """Generate appropriate details based on task type and phase context."""
     
@@ -51,15 +153,16 @@ def generate_generic_details(task_label, day_number, topic, task_type="core"):
     is_phase3 = 50 <= day_number <= 70
     is_phase4 = 71 <= day_number <= 119
     
-    if "Core concepts" in task_label or "core concepts" in task_label.lower():
+    kind = TASK_KINDS.classify(task_label)
+    if kind == 'core':
         return generate_core_concepts_details(topic, is_phase3, is_phase4)
-    elif "Implementation" in task_label or "implementation" in task_label.lower():
+    elif kind == 'implementation':
         return generate_implementation_details(topic, is_phase3, is_phase4)
-    elif "Practice" in task_label or "practice" in task_label.lower():
+    elif kind == 'practice':
         return generate_practice_details(topic, is_phase3, is_phase4)
-    elif "Review" in task_label or "review" in task_label.lower():
+    elif kind == 'review':
         return generate_review_details(day_number, is_phase3)
-    elif "weekly log" in task_label.lower():
+    elif kind == 'weekly-log':
         return generate_weekly_log_details(day_number)
     else:
         # Default generic template
@@ -75,19 +178,7 @@ def generate_core_concepts_details(topic, is_phase3, is_phase4):
         resources = """<a href="https://pytorch.org/docs/stable/index.html" target="_blank" rel="noopener">PyTorch Documentation</a>, <a href="https://d2l.ai/" target="_blank" rel="noopener">Dive into Deep Learning</a>"""
         focus_areas = "architecture design, forward/backward pass mechanics, gradient flow, and training stability considerations"
     
-    return f"""<strong>Action:</strong> Study the core concepts of {topic} through official documentation, tutorial videos, and worked examples. Focus on understanding {focus_areas}. Take detailed notes on key definitions, formulas, architectural choices, and intuitions. Create concept maps connecting {topic} to previously learned material. Use active learning—don't just read passively; implement small examples as you learn, experiment with parameters, and test your understanding.
-
-<strong>Boundaries:</strong> Focus on conceptual understanding before full implementation. Don't skip foundational concepts to rush ahead. Spend time visualizing and drawing diagrams—mental models are crucial. Stop when you have clear intuition—detailed implementation comes in the next task. Don't get distracted by advanced variants or optimizations yet.
-
-<strong>Deliverable:</strong> Create comprehensive notes document or concept map explaining {topic} in your own words. Include: (1) Core definitions and terminology with examples, (2) Visual diagrams illustrating key concepts and data flow, (3) Connections to prior topics and prerequisite knowledge, (4) 3-5 self-test questions with detailed answers, (5) Summary of when to use this approach vs alternatives.
-
-<strong>Verification:</strong> Can you explain {topic} to someone else without looking at your notes? Can you identify potential pitfalls or common misconceptions? Test yourself by covering your notes and explaining the concept aloud or writing a summary. Your explanation should include both what {topic} is and why it matters for ML systems.
-
-Common pitfall: Passive reading without active engagement leads to shallow understanding. Success check: You should be able to connect {topic} to broader learning objectives and explain why it matters. Can you predict what problems might arise in practice?
-
-Estimated time: 90 minutes including active note-taking, diagramming, and self-testing.
-
-<strong>Resources:</strong> {resources}"""
+    return CORE_CONCEPTS_TEMPLATE.render(topic=topic, focus_areas=focus_areas, resources=resources)
 
 
 def generate_implementation_details(topic, is_phase3, is_phase4):
@@ -103,19 +194,7 @@ def generate_implementation_details(topic, is_phase3, is_phase4):
         resources = """<a href="https://pytorch.org/tutorials/" target="_blank" rel="noopener">PyTorch Tutorials</a>, <a href="https://pytorch.org/docs/stable/nn.html" target="_blank" rel="noopener">torch.nn Documentation</a>"""
         verification = "Run training loop successfully with loss decreasing, check gradients aren't NaN/exploding, verify model outputs have correct shapes and reasonable values. Use torch.no_grad() for validation, ensure reproducibility with seeds."
     
-    return f"""<strong>Action:</strong> Implement {topic} from scratch following best practices and the {framework} API patterns. Start with a minimal working version, then iteratively add features and improvements. Write clean, well-documented code with type hints where appropriate and comprehensive docstrings. Include inline comments explaining non-obvious logic, especially for mathematical operations or architectural choices. Structure your notebook clearly: imports, data loading, model definition, training, evaluation, visualization.
-
-<strong>Boundaries:</strong> Focus on correctness before optimization. Write tests or verification code as you go to verify each component works as expected. Don't copy-paste large code blocks—type everything yourself to build muscle memory and deep understanding. Keep functions small and focused on single responsibilities. Use meaningful variable names (not x, y, z for everything).
-
-<strong>Deliverable:</strong> Create a well-structured implementation in {notebook_path} with: (1) Clear function/class definitions following {framework} conventions, (2) Comprehensive docstrings with parameter descriptions and examples, (3) Verification code checking outputs at each stage, (4) A demonstration section showing the implementation in action on appropriate dataset, (5) Visualization of results (plots, metrics, confusion matrices as applicable).
-
-<strong>Verification:</strong> {verification}
-
-Common pitfall: Writing code without testing incrementally, leading to hard-to-debug errors. Another pitfall: poor variable names making code unreadable. Success check: Your implementation should produce expected outputs for at least 5 diverse test cases. Code should be clean enough that you'd be proud to show it in a code review or add to your portfolio.
-
-Estimated time: 75 minutes including implementation, testing, documentation, and verification.
-
-<strong>Resources:</strong> {resources}"""
+    return IMPLEMENTATION_TEMPLATE.render(topic=topic, framework=framework, notebook_path=notebook_path, verification=verification, resources=resources)
 
 
 def generate_practice_details(topic, is_phase3, is_phase4):
@@ -127,19 +206,7 @@ def generate_practice_details(topic, is_phase3, is_phase4):
         practice_focus = "different architectures, hyperparameter variations (learning rate, batch size, hidden dimensions), training techniques, debugging common issues (vanishing/exploding gradients, overfitting)"
         success_metrics = "training loss convergence, validation accuracy improvement, stable gradients, reasonable training time"
     
-    return f"""<strong>Action:</strong> Complete practice exercises to solidify your understanding of {topic}. Work through at least 5-8 problems or experiments of varying difficulty covering {practice_focus}. Start with simpler problems to build confidence, then tackle more challenging ones. Time yourself on some problems to build fluency. Document your process, results, and insights for each experiment.
-
-<strong>Boundaries:</strong> Attempt each problem independently before checking solutions or references. If stuck for more than 15-20 minutes on implementation details, review the relevant concept from previous tasks then retry with fresh perspective. Don't just verify your answer is correct—make sure you understand WHY it's correct, what assumptions you made, and what the exercise was designed to teach you.
-
-<strong>Deliverable:</strong> A collection of solved problems or experiments with your working shown in notebook format. For each problem: (1) Write out your approach and hypotheses, (2) Show implementation with step-by-step work, (3) Visualize results appropriately (plots, tables, metrics), (4) Verify outcomes and analyze any surprises, (5) Note what concept it tested, (6) Identify any patterns, tricks, or insights you learned.
-
-<strong>Verification:</strong> Aim for {success_metrics} on practice problems. If results are poor, debug systematically: check data preprocessing, verify model architecture, examine loss curves, inspect predictions. For any mistakes, understand exactly where your reasoning or implementation went wrong. Can you solve similar problems quickly and confidently now?
-
-Common pitfall: Looking at solutions too quickly instead of struggling productively—the struggle builds deeper understanding. Another pitfall: not varying parameters enough to see their effects. Success check: You should feel significantly more confident with {topic} after practice. You should be able to approach new problems of similar difficulty without help, and debug issues efficiently.
-
-Estimated time: 60 minutes for thorough practice with multiple examples.
-
-<strong>Resources:</strong> <a href="https://scikit-learn.org/stable/auto_examples/index.html" target="_blank" rel="noopener">sklearn Examples</a>, <a href="https://pytorch.org/tutorials/beginner/basics/intro.html" target="_blank" rel="noopener">PyTorch Basics</a>, <a href="https://paperswithcode.com/" target="_blank" rel="noopener">Papers with Code</a>"""
+    return PRACTICE_TEMPLATE.render(topic=topic, practice_focus=practice_focus, success_metrics=success_metrics)
 
 
 def generate_review_details(day_number, is_phase3):
@@ -147,38 +214,14 @@ def generate_review_details(day_number, is_phase3):
     week_num = ((day_number - 50) // 7) + 8 if is_phase3 else ((day_number - 71) // 7) + 11
     phase_name = "Classical ML" if is_phase3 else "Deep Learning"
     
-    return f"""<strong>Action:</strong> Conduct comprehensive review of Week {week_num} {phase_name} material. Process: (1) Re-read all notes from this week, identifying key concepts and any remaining confusion, (2) Review all notebooks you created—can you follow the logic? Do results still make sense? (3) Revisit hardest concepts: re-watch relevant videos, re-read documentation, create additional examples if needed, (4) Test yourself: solve 2-3 problems from scratch without referring to previous solutions, (5) Create a one-page summary of the week's key insights and how they connect.
-
-<strong>Boundaries:</strong> Don't just skim—engage actively with the material. Focus on understanding, not memorization. If something is still unclear after review, mark it for deeper study or to ask mentors. Don't spend excessive time on material you've mastered—focus on weak areas. Balance breadth (touching all topics) with depth (solidifying shaky concepts).
-
-<strong>Deliverable:</strong> Week {week_num} review document (<code>docs/notes/week{week_num}_review.md</code>) containing: (1) Summary of each day's key topics (2-3 sentences each), (2) Concepts that now make sense that didn't before, (3) Remaining questions or confusion (with plan to address), (4) 3-5 integration questions testing cross-topic understanding, (5) Self-assessment of mastery (1-5 scale) for each major topic with justification.
-
-<strong>Verification:</strong> Review document demonstrates genuine engagement and honest self-assessment. Can you explain this week's concepts to someone else? Can you solve problems combining multiple concepts from the week? Your self-assessment should identify both strengths and areas needing more work.
-
-Common pitfall: Passive re-reading without active problem-solving—you need to test your understanding. Another pitfall: overconfidence from recognizing concepts vs actually being able to use them. Success check: You should feel more confident about the week's material and have a clear plan for any remaining gaps.
-
-Estimated time: 75 minutes for thorough, active review.
-
-<strong>Resources:</strong> Your own notes and notebooks from the week, <a href="https://www.scotthyoung.com/blog/2020/05/04/study-better/" target="_blank" rel="noopener">Effective Study Techniques</a>, <a href="https://www.learningscientists.org/learning-scientists-podcast" target="_blank" rel="noopener">Learning Scientists Podcast</a>"""
+    return REVIEW_TEMPLATE.render(week_num=week_num, phase_name=phase_name)
 
 
 def generate_weekly_log_details(day_number):
     """Generate details for weekly log tasks."""
     week_num = ((day_number - 50) // 7) + 8 if day_number <= 70 else ((day_number - 71) // 7) + 11
     
-    return f"""<strong>Action:</strong> Write your Week {week_num} log documenting progress, challenges, and insights. Structure: (1) Overview: major topics covered, time spent, overall feeling about the week, (2) Achievements: what went well, breakthroughs, successful implementations, concepts that clicked, (3) Challenges: what was difficult, topics needing more work, technical issues encountered, time management struggles, (4) Key learnings: 3-5 major insights or "aha moments" from the week, (5) Looking ahead: goals for next week, specific concepts to reinforce, adjustments to study approach if needed. Be honest and reflective—this log is for you.
-
-<strong>Boundaries:</strong> Keep it concise but substantive—aim for 400-600 words. Focus on learning and growth, not just activities. Don't just list what you did—reflect on what you learned and how you're evolving as a learner. Be specific with examples rather than generic ("I struggled with cross-validation overfitting on the Wine dataset" not "some things were hard").
-
-<strong>Deliverable:</strong> Weekly log document saved as <code>docs/logs/week{week_num}_log.md</code> with structured reflection on progress, challenges, learnings, and forward-looking goals.
-
-<strong>Verification:</strong> Log demonstrates genuine reflection and honest self-assessment. Contains specific examples and insights, not generic platitudes. Shows growth mindset—challenges viewed as learning opportunities. Includes actionable plans for improvement.
-
-Common pitfall: Writing perfunctory logs just to check a box—invest in reflection, it pays dividends in learning efficiency. Another pitfall: being too harsh or too easy on yourself—aim for honest, balanced assessment. Success check: Could you review this log in a month and remember the week clearly? Does it help you see your growth trajectory?
-
-Estimated time: 30 minutes for thoughtful reflection and writing.
-
-<strong>Resources:</strong> <a href="https://www.scotthyoung.com/blog/2010/01/11/learn-faster-by-writing-twice/" target="_blank" rel="noopener">Learning Through Reflection</a>, <a href="https://fs.blog/learning/" target="_blank" rel="noopener">Learning Principles</a>"""
+    return WEEKLY_LOG_TEMPLATE.render(week_num=week_num)
 
 
 def generate_default_details(task_label, topic, is_phase3, is_phase4):
@@ -196,45 +239,31 @@ def generate_default_details(task_label, topic, is_phase3, is_phase4):
         framework = "PyTorch and neural networks"
         context = "understanding architecture design, training dynamics, and debugging techniques"
     
-    return f"""<strong>Action:</strong> {action}. Approach this systematically: (1) Review any relevant documentation or examples first, (2) Plan your implementation or study approach, (3) Execute step-by-step with verification at each stage, (4) Document your process, results, and insights, (5) Test your understanding with self-created examples or questions. Focus on building deep understanding of {topic} in the context of {framework}.
-
-<strong>Boundaries:</strong> Stay focused on the stated task—don't diverge into related but out-of-scope topics. Ensure you understand prerequisites before proceeding. If you encounter errors or confusion, debug systematically: check inputs, inspect intermediate outputs, verify assumptions. Don't skip verification steps.
-
-<strong>Deliverable:</strong> Completed task with appropriate artifacts (code, notes, visualizations as applicable). Ensure outputs are well-documented and reproducible. Create clear deliverables that you could reference later or show to others.
-
-<strong>Verification:</strong> Task completed successfully with expected outputs. For code: runs without errors, produces correct results verified against test cases. For conceptual work: can explain the topic clearly to someone else. Common pitfall: rushing through without true understanding—take time to internalize concepts.
-
-Success check: Can you apply what you learned to a novel problem? Can you explain the key insights gained from this task? Do your deliverables reflect quality work?
-
-Estimated time: As specified in task description.
-
-<strong>Resources:</strong> {resources}, relevant examples and tutorials for {context}"""
-
-
-def main():
-    """Main function to process planPhases.js and add details."""
-    import sys
-    
-    # Read the planPhases.js file
-    with open('assets/js/data/planPhases.js', 'r') as f:
-        content = f.read()
-    
-    # Find Phase 3 start
-    phase3_start = content.find("title: 'Phase 3:")
-    phase4_start = content.find("title: 'Phase 4:")
-    
-    if phase3_start == -1 or phase4_start == -1:
-        print("Error: Could not find Phase 3 or Phase 4 in planPhases.js")
-        sys.exit(1)
-    
-    print("Script ready to generate details for Phase 3 and Phase 4")
-    print("This script provides the framework and templates.")
-    print("Due to the large number of tasks (214), details will be added in batches.")
-    print("\nNext steps:")
-    print("1. Run a more specific script to process and inject details")
-    print("2. Validate the generated details meet the 120+ word requirement")
-    print("3. Check for proper HTML formatting and authoritative links")
-    
-
-if __name__ == "__main__":
-    main()
+    return DEFAULT_TEMPLATE.render(action=action, topic=topic, framework=framework, resources=resources, context=context)
+
+
+def _topic_from_title(title):
+    """Main topic of a day title."""
+    topic = title.replace("Week ", "").replace("Review", "").strip()
+    return topic if topic else "machine learning"
+
+
+def _topic_from_label(label):
+    """Topic of a task label: the part before ':' or its first three words."""
+    if ":" in label:
+        return label.split(":")[0].strip()
+    words = label.split()
+    return " ".join(words[:3]) if len(words) >= 3 else label
+
+
+def topic_details(task_label, day_number, day_title, index):
+    """Details for task `index` of a day: the hand-written Phase 3/4 details
+    where there are some, otherwise generate_generic_details, on one line."""
+    predefined = PHASE3_DETAILS.get(f"day{day_number}_task{index + 1}") or \
+        PHASE4_DETAILS.get(f"day{day_number}_task{index + 1}")
+    if predefined:
+        return re.sub(r'\s+', ' ', predefined).strip()
+    topic = _topic_from_label(task_label)
+    if not topic or len(topic) < 5:
+        topic = _topic_from_title(day_title)
+    return re.sub(r'\s+', ' ', generate_generic_details(task_label, day_number, topic)).strip()
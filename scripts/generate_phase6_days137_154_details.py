@@ -1,44 +0,0 @@
-#!/usr/bin/env python3
-"""
-Generate comprehensive task details for Phase 6 Days 137-154.
-Following the established template from Days 127-136 with Action, Boundaries, 
-Deliverables, Verification, Pitfalls, and Sources sections.
-"""
-
-# Day 137: Positional Encoding (validation and properties)
-DAY_137_DETAILS = [
-    # Task 1: Core concepts
-    '''<strong>Action:</strong> Deep dive into positional encoding validation in <code>notebooks/transformers/day137_pe_validation.ipynb</code>: (1) Verify sinusoidal PE formula implementation matches paper equation exactly: PE(pos,2i)=sin(pos/10000^(2i/d_model)), PE(pos,2i+1)=cos(pos/10000^(2i/d_model)), (2) Test frequency spectrum by computing FFT of PE vectors across positions, (3) Validate relative position property: demonstrate that PE(pos+k) can be expressed as linear transformation of PE(pos) through matrix multiplication, (4) Compare distance metrics: cosine similarity between PE vectors at different offsets, (5) Visualize first 256 positions for d_model=256 as heatmap showing frequency patterns. Use torch operations for efficiency, include unit tests for boundary conditions (pos=0, pos=max_seq_len-1). <strong>Boundaries:</strong> Focus on validation and mathematical properties, do NOT implement new PE schemes (RoPE, ALiBi) yet. Keep d_model ≤512 for visualization clarity. Do NOT integrate with full model today—pure PE analysis. Verify properties claimed in paper Section 3.5 empirically. Stop after validation; implementation improvements come later. <strong>Deliverables:</strong> Validation notebook with ≥5 unit tests, frequency spectrum plot saved to <code>artifacts/day137_pe_spectrum.png</code>, relative position transformation verification (numerical test showing PE(pos+k) ≈ A(k)@PE(pos)), similarity heatmap showing position relationships, summary document <code>docs/notes/day137_pe_validation.md</code> (400-500 words) explaining verified properties and implications for Transformer learning. <strong>Verification:</strong> All unit tests pass (PE shape correct, even dims use sin, odd use cos, frequencies decrease exponentially). Relative position property holds within tolerance 1e-5. Similarity heatmap shows that nearby positions have higher similarity than distant ones. Frequency spectrum shows expected log-linear spacing. Can reproduce paper's mathematical claims computationally. <strong>Pitfalls:</strong> Incorrect frequency calculation (off-by-one in dimension indexing 2i vs i); not testing edge cases (first/last positions, d_model not divisible by 2); expecting perfect linear relationship in relative position (numerical precision limits); using wrong similarity metric (L2 vs cosine—paper uses dot product relationships); not normalizing before similarity computation; missing that PE enables relative position through attention mechanism; testing with too small d_model (patterns don't emerge); floating point precision issues in FFT (use appropriate tolerances). <strong>Sources:</strong> <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need (Section 3.5)</a>, <a href="https://kazemnejad.com/blog/transformer_architecture_positional_encoding/" target="_blank" rel="noreferrer">Transformer Positional Encoding Explained (Kazem Nejad)</a>, <a href="https://pytorch.org/docs/stable/generated/torch.fft.fft.html" target="_blank" rel="noreferrer">PyTorch FFT Documentation</a>''',
-    
-    # Task 2: Implementation
-    '''<strong>Action:</strong> Refactor and optimize positional encoding implementation in <code>src/model/positional_encoding.py</code>: (1) Create <code>class PositionalEncoding(nn.Module)</code> with cached PE matrix (compute once, reuse), (2) Implement efficient batched PE addition: <code>x = x + self.pe[:, :seq_len, :]</code> supporting variable sequence lengths up to max_len=2048, (3) Add dropout option: <code>nn.Dropout(p=0.1)</code> on PE-augmented embeddings (modern practice for regularization), (4) Implement alternative learned PE for comparison: <code>nn.Embedding(max_len, d_model)</code>, (5) Create factory function: <code>create_positional_encoding(type='sinusoidal', max_len=2048, d_model=512, dropout=0.1)</code> supporting both types. Include comprehensive docstrings with shape annotations. Register PE as buffer (not parameter) so it's not trained but moves with model to GPU. <strong>Boundaries:</strong> Implement standard sinusoidal and learned PE only—no RoPE, ALiBi, or other variants yet. Keep code clean and well-documented. Do NOT implement relative position bias (different mechanism). Focus on efficiency: cache PE matrix, support variable seq lengths without recomputation. Use max_len=2048 as reasonable default for Phase 6 experiments. <strong>Deliverables:</strong> Module file <code>src/model/positional_encoding.py</code> with PositionalEncoding class, unit tests in <code>tests/test_positional_encoding.py</code> verifying: output shape correctness, PE caching (no redundant computation), GPU transfer works, dropout is applied correctly, factory function returns correct type, comparison tests showing learned vs sinusoidal behavior. <strong>Verification:</strong> PE buffer is registered (check model.buffers()). Output shape is (batch, seq_len, d_model). PE is not in optimizer parameters (trainable=False for sinusoidal). Dropout is applied only during training (model.eval() disables it). Can handle variable sequence lengths ≤max_len without error. GPU transfer: model.to('cuda') moves PE buffer. Unit tests achieve ≥95% coverage of module. <strong>Pitfalls:</strong> Registering PE as parameter instead of buffer (PE shouldn't be trained for sinusoidal); not handling variable seq_len (hardcoding sequence length); computing PE every forward pass (inefficient—cache it); not detaching PE when logging (memory leak); incorrect buffer registration (use register_buffer, not register_parameter); dropout applied to PE instead of PE+embeddings sum; not testing GPU compatibility (fails silently then crashes during training); broadcasting errors with batch dimension. <strong>Sources:</strong> <a href="https://pytorch.org/docs/stable/generated/torch.nn.Module.html#torch.nn.Module.register_buffer" target="_blank" rel="noreferrer">PyTorch register_buffer Documentation</a>, <a href="https://github.com/karpathy/nanoGPT/blob/master/model.py" target="_blank" rel="noreferrer">Karpathy nanoGPT Positional Encoding</a>, <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need</a>''',
-    
-    # Task 3: Practice
-    '''<strong>Action:</strong> Conduct ablation study on positional encoding in <code>notebooks/transformers/day137_pe_ablation.ipynb</code>: (1) Train 4-layer Transformer (d_model=256, n_heads=4) on char-level LM for 10,000 steps with four configurations: no PE, sinusoidal PE, learned PE, dropout(0.1) on PE, (2) Compare validation perplexity every 500 steps, (3) Test extrapolation: evaluate on sequences 2× training length (train seq_len=64, test seq_len=128), (4) Visualize attention patterns with/without PE: do patterns show position awareness?, (5) Analyze learned PE after training: plot heatmap, compare to sinusoidal—do learned embeddings develop interpretable structure? Use same random seed across configs except PE type. Keep hyperparameters constant: lr=3e-4, batch_size=32, warmup_steps=2000. <strong>Boundaries:</strong> Quick ablation study (10k steps max per config, ≈40k total). Do NOT perform extensive hyperparameter search—control all variables except PE. Use small model (4 layers) for fast iteration. Focus on understanding PE impact, not achieving SOTA perplexity. Test only standard PE types, no exotic variants. <strong>Deliverables:</strong> Ablation notebook with training curves for all 4 configs, comparison table showing final perplexity (in-distribution and extrapolation), attention pattern visualizations saved to <code>artifacts/day137_attention_with_without_pe.png</code>, learned PE heatmap analysis, summary findings (300-400 words) answering: Is PE necessary? Sinusoidal vs learned trade-offs? How does dropout on PE affect training? <strong>Verification:</strong> No PE baseline performs significantly worse (perplexity ≥20% higher—model can't distinguish positions). Sinusoidal PE extrapolates better to longer sequences (perplexity increase &lt;30% vs learned PE ≥50% increase). Learned PE performs similar or slightly better on training distribution. Dropout regularizes without hurting in-distribution performance significantly. Attention patterns show position-aware structure with PE (e.g., attending to specific relative positions). All configs trained with same data/seed (controlled experiment). <strong>Pitfalls:</strong> Unfair comparison (different seeds, learning rates, or training duration confound results); not controlling for dropout in baseline (compare PE with/without dropout separately); insufficient training steps (PE benefits emerge over time); testing extrapolation with learned PE beyond max_len (crashes—clamp or handle gracefully); drawing strong conclusions from single run (variance matters—ideally run 3+ seeds); not visualizing attention (quantitative metrics don't tell full story); forgetting that PE importance depends on task (position-invariant tasks don't need PE); comparing models with different parameter counts (learned PE adds params). <strong>Sources:</strong> <a href="https://arxiv.org/abs/1803.02155" target="_blank" rel="noreferrer">Universal Transformers (positional encoding analysis)</a>, <a href="https://arxiv.org/abs/2104.09864" target="_blank" rel="noreferrer">RoFormer: Enhanced Transformer with Rotary Position Embedding</a>, <a href="https://jalammar.github.io/illustrated-transformer/" target="_blank" rel="noreferrer">The Illustrated Transformer (Jay Alammar)</a>'''
-]
-
-# Day 138: LayerNorm (understanding and variants)
-DAY_138_DETAILS = [
-    # Task 1: Core concepts  
-    '''<strong>Action:</strong> Analyze LayerNorm vs BatchNorm trade-offs in <code>notebooks/transformers/day138_norm_comparison.ipynb</code>: (1) Implement both LayerNorm and BatchNorm for Transformers, (2) Compare mathematical formulations: LayerNorm normalizes across features per sample, BatchNorm across batch per feature, (3) Test with variable batch sizes (1, 8, 32, 128) and sequence lengths (16, 64, 256): which norm is robust?, (4) Measure batch statistics sensitivity: train model with BatchNorm, evaluate with different batch size—performance degrades?, (5) Visualize activation distributions during training with both norms: which is more stable?, (6) Benchmark inference speed: single sample vs batched (LayerNorm has no batch dependency). Document why Transformers universally use LayerNorm: (1) works with seq_len=1 (BatchNorm needs batch), (2) no train/eval discrepancy, (3) normalizes per-sample (better for variable length sequences). <strong>Boundaries:</strong> Compare only LayerNorm vs BatchNorm today, do NOT implement RMSNorm, GroupNorm yet. Focus on understanding why LayerNorm is standard in Transformers, not general normalization theory. Test with Transformer architecture (attention + FFN), not standalone. Keep model small (2 layers) for fast experiments. <strong>Deliverables:</strong> Comparison notebook with side-by-side implementations, training curves showing LayerNorm stability advantage, batch size robustness plot (perplexity vs batch_size for both norms) saved to <code>artifacts/day138_norm_robustness.png</code>, activation distribution visualizations, inference speed benchmark table, analysis document <code>docs/notes/day138_layernorm_rationale.md</code> (500-600 words) explaining why LayerNorm is preferred for Transformers. <strong>Verification:</strong> LayerNorm training is stable across all batch sizes tested. BatchNorm degrades with batch_size=1 or different train/eval batch sizes. Activation distributions are more consistent with LayerNorm (smaller variance across training steps). LayerNorm inference is batch-size independent (constant time per sample). Implementations match PyTorch nn.LayerNorm and nn.BatchNorm1d outputs exactly. Analysis clearly explains the three key advantages of LayerNorm for Transformers. <strong>Pitfalls:</strong> Using BatchNorm1d incorrectly (wrong dimension—should normalize across sequence not features); not testing with batch_size=1 (misses key BatchNorm limitation); comparing with same batch size for train/eval (doesn't reveal BatchNorm issue); incorrect LayerNorm implementation (normalizing across wrong dim); not using eval mode for BatchNorm (uses training stats—unfair comparison); concluding BatchNorm never works (it's fine for CNNs, just not Transformers); forgetting that BatchNorm has running statistics updated during training; not controlling for parameter count (LayerNorm and BatchNorm have different param shapes). <strong>Sources:</strong> <a href="https://arxiv.org/abs/1607.06450" target="_blank" rel="noreferrer">Layer Normalization (Ba et al., 2016)</a>, <a href="https://arxiv.org/abs/1502.03167" target="_blank" rel="noreferrer">Batch Normalization (Ioffe & Szegedy, 2015)</a>, <a href="https://pytorch.org/docs/stable/generated/torch.nn.LayerNorm.html" target="_blank" rel="noreferrer">PyTorch LayerNorm Documentation</a>''',
-    
-    # Task 2: Implementation
-    '''<strong>Action:</strong> Implement Pre-LN vs Post-LN Transformer block comparison in <code>src/model/transformer_block.py</code>: (1) Create <code>class TransformerBlock(nn.Module)</code> with configurable norm placement: <code>norm_type='pre_ln'</code> or <code>'post_ln'</code>, (2) Pre-LN: <code>x = x + self.attn(self.norm1(x)); x = x + self.ffn(self.norm2(x))</code>, (3) Post-LN: <code>x = self.norm1(x + self.attn(x)); x = self.norm2(x + self.ffn(x))</code>, (4) Train both for 15,000 steps on char-level LM (4 layers, d_model=256): track loss, gradient norms, learning rate sensitivity, (5) Measure training stability: count gradient explosions (norm &gt;10), NaN occurrences, warmup necessity. Implement with same architecture except norm placement. Include option for no final LayerNorm (Pre-LN typically adds final norm after all blocks). <strong>Boundaries:</strong> Implement and compare Pre-LN vs Post-LN only. Do NOT implement ReZero, T-Fixup, or other normalization-free approaches yet. Use standard hyperparameters (lr=3e-4, warmup=4000 steps). Focus on gradient flow and training stability differences. Keep comparison controlled (same seed, data, architecture depth). <strong>Deliverables:</strong> Module file with TransformerBlock supporting both placements, training comparison notebook, gradient norm plots over training saved to <code>artifacts/day138_preln_postln_gradients.png</code>, learning rate sensitivity comparison (train with lr in [1e-4, 3e-4, 1e-3] for each type), stability metrics table (NaNs, explosions, convergence speed), architectural diagrams showing norm placement differences in <code>docs/notes/day138_norm_placement.md</code>. <strong>Verification:</strong> Pre-LN shows more stable gradient norms (variance &lt;50% of Post-LN). Pre-LN works with higher learning rates (lr=1e-3 stable for Pre-LN, unstable for Post-LN). Post-LN requires warmup (without warmup: NaNs or divergence), Pre-LN does not (can use constant lr from step 1). Both converge to similar final perplexity given sufficient training and proper hyperparameters. Implementations exactly match literature descriptions (verify architectural diagrams). <strong>Pitfalls:</strong> Incorrect residual connection placement (should add input to sublayer output, not other way); forgetting final LayerNorm in Pre-LN (modern practice includes it); not testing without warmup (misses key Pre-LN advantage); using Post-LN hyperparameters for Pre-LN (masks benefits); unfair comparison (different random seeds, batch sizes); not monitoring gradient norms (key diagnostic for stability); concluding one is always better (task and scale dependent—but Pre-LN generally more stable); implementing Post-LN with wrong norm order (should norm after add, not before); not understanding why Pre-LN is more stable (gradients bypass norms via residual in early training). <strong>Sources:</strong> <a href="https://arxiv.org/abs/2002.04745" target="_blank" rel="noreferrer">On Layer Normalization in the Transformer Architecture (Xiong et al., 2020)</a>, <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need (original Post-LN)</a>, <a href="https://github.com/karpathy/nanoGPT/blob/master/model.py" target="_blank" rel="noreferrer">Karpathy nanoGPT (Pre-LN reference)</a>''',
-    
-    # Task 3: Practice
-    '''<strong>Action:</strong> Build normalization diagnostics suite in <code>notebooks/transformers/day138_norm_diagnostics.ipynb</code>: (1) Implement activation statistics tracker logging per-layer: mean, variance, min, max, skewness, kurtosis during training, (2) Add gradient flow analyzer: compute and visualize gradient magnitudes from output backwards through all layers—does LayerNorm prevent vanishing/explosion?, (3) Create layer-wise learning rate sensitivity analysis: perturb each layer's gradients by scaling factors [0.1, 1.0, 10.0], measure impact on loss, (4) Visualize "effective depth" with LayerNorm vs without: train 8-layer model with/without LayerNorm, measure gradient signal reaching layer 1, (5) Test LayerNorm invariances: scale input by 10×, check that output changes minimally (LayerNorm should make model scale-invariant). Run on 2-layer and 8-layer Transformers to see depth effects. <strong>Boundaries:</strong> Diagnostic and analysis work—focus on understanding, not optimization. Do NOT implement new normalization schemes. Test with existing model from Day 137-138. Keep experiments short (2000 steps max per test). Visualizations must clearly show LayerNorm's effect on training dynamics. <strong>Deliverables:</strong> Diagnostics notebook with 5+ analysis tools, gradient flow visualization comparing with/without LayerNorm saved to <code>artifacts/day138_gradient_flow.png</code>, activation statistics plots over training, scale invariance test results, effective depth measurement showing LayerNorm enables deeper models, summary document <code>docs/notes/day138_norm_insights.md</code> (400-500 words) with key findings about LayerNorm's role in training stability. <strong>Verification:</strong> With LayerNorm: gradients flow to all layers (magnitude at layer 1 &gt;1% of layer N), activations stay bounded (mean≈0, std≈1), training is stable for depth=8. Without LayerNorm: gradient vanishing (layer 1 gets &lt;0.1% of layer N gradient), activations drift (variance explodes or collapses), depth=8 fails to train or trains very slowly. Scale invariance: 10× input scaling changes output &lt;5% with LayerNorm, &gt;1000% without. Diagnostics catch training pathologies early (activation explosion, gradient vanishing). <strong>Pitfalls:</strong> Not detaching tensors when logging statistics (memory leak from gradient tape); logging too frequently (I/O overhead slows training); not using appropriate visualization scales (log scale for gradients often better); comparing different models without controlling architecture (confounds analysis); drawing conclusions from too few training steps (some effects emerge slowly); not testing edge cases (very deep models, very large learning rates); forgetting that some gradient variance is healthy (not all variation is bad); missing that LayerNorm interacts with residual connections (they work together to enable depth). <strong>Sources:</strong> <a href="https://arxiv.org/abs/1607.06450" target="_blank" rel="noreferrer">Layer Normalization Paper</a>, <a href="https://wandb.ai/wandb/gradient-monitoring/reports/How-to-Monitor-Gradients--Vmlldzo5OTA0OQ" target="_blank" rel="noreferrer">Weights & Biases: Gradient Monitoring Guide</a>, <a href="https://arxiv.org/abs/1810.04805" target="_blank" rel="noreferrer">BERT Paper (training stability techniques)</a>'''
-]
-
-# Continue with Days 139-154...
-# I'll create a comprehensive set for all days following the problem statement guidance
-
-def generate_details_for_day(day_num, title, tasks_structure):
-    """Generate details based on day number and title following the pattern."""
-    # This would contain the full logic, but for now I'll embed the complete details directly
-    pass
-
-if __name__ == "__main__":
-    print("Day 137 Details Generated")
-    print(f"Task 1 length: {len(DAY_137_DETAILS[0].split())} words")
-    print(f"Task 2 length: {len(DAY_137_DETAILS[1].split())} words") 
-    print(f"Task 3 length: {len(DAY_137_DETAILS[2].split())} words")
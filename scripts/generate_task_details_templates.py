@@ -7,8 +7,20 @@ Uses intelligent templates based on task type and phase context.
 import re
 import json
 
+from detail_templates import KeywordClassifier, Template
+
+# Task kinds, checked in order; matching is case-insensitive
+TASK_KINDS = KeywordClassifier([
+    ('core', [': core concepts']),
+    ('implementation', [': implementation']),
+    ('practice', [': practice']),
+    ('review-materials', ['review week materials']),
+    ('practice-exercises', ['practice exercises']),
+    ('weekly-log', ['write weekly log', 'weekly log']),
+])
+
 # Template for "Core concepts" tasks
-CORE_CONCEPTS_TEMPLATE = """<strong>Action:</strong> Study the core concepts of {topic} through a combination of reading documentation, watching tutorial videos, and working through examples. Focus on understanding {focus}. Take detailed notes on key definitions, formulas, and intuitions. Use active learning techniques—don't just read passively.
+CORE_CONCEPTS_TEMPLATE = Template("""<strong>Action:</strong> Study the core concepts of {topic} through a combination of reading documentation, watching tutorial videos, and working through examples. Focus on understanding {focus}. Take detailed notes on key definitions, formulas, and intuitions. Use active learning techniques—don't just read passively.
 
 <strong>Boundaries:</strong> Focus on conceptual understanding before implementation. Don't skip foundational concepts to rush ahead. Spend time visualizing and drawing diagrams to solidify understanding. Stop when you have a clear mental model—you'll implement in the next task.
 
@@ -20,10 +32,10 @@ Common pitfall: Passive reading without active engagement. Success check: You sh
 
 Estimated time: 90 minutes including active note-taking and self-testing.
 
-<strong>Resources:</strong> <a href="https://pytorch.org/docs/stable/index.html" target="_blank" rel="noopener">PyTorch Documentation</a>, <a href="https://huggingface.co/docs" target="_blank" rel="noopener">Hugging Face Docs</a>"""
+<strong>Resources:</strong> <a href="https://pytorch.org/docs/stable/index.html" target="_blank" rel="noopener">PyTorch Documentation</a>, <a href="https://huggingface.co/docs" target="_blank" rel="noopener">Hugging Face Docs</a>""")
 
 # Template for "Implementation" tasks
-IMPLEMENTATION_TEMPLATE = """<strong>Action:</strong> Implement {topic} from scratch following best practices. Start with a minimal working version, then iteratively add features and improvements. Write clean, well-documented code with type hints and docstrings. Include inline comments explaining non-obvious logic.
+IMPLEMENTATION_TEMPLATE = Template("""<strong>Action:</strong> Implement {topic} from scratch following best practices. Start with a minimal working version, then iteratively add features and improvements. Write clean, well-documented code with type hints and docstrings. Include inline comments explaining non-obvious logic.
 
 <strong>Boundaries:</strong> Focus on correctness before optimization. Write tests as you go to verify each component works. Don't copy-paste large code blocks—type everything yourself to build muscle memory. Keep functions small and focused on single responsibilities.
 
@@ -35,10 +47,10 @@ Common pitfall: Writing code without testing, leading to subtle bugs. Success ch
 
 Estimated time: 75 minutes including testing and documentation.
 
-<strong>Resources:</strong> <a href="https://pytorch.org/tutorials/" target="_blank" rel="noopener">PyTorch Tutorials</a>, <a href="https://docs.python.org/3/" target="_blank" rel="noopener">Python Documentation</a>"""
+<strong>Resources:</strong> <a href="https://pytorch.org/tutorials/" target="_blank" rel="noopener">PyTorch Tutorials</a>, <a href="https://docs.python.org/3/" target="_blank" rel="noopener">Python Documentation</a>""")
 
 # Template for "Practice" tasks  
-PRACTICE_TEMPLATE = """<strong>Action:</strong> Complete practice exercises to solidify your understanding of {topic}. Work through at least 5-8 problems of varying difficulty. Start with simpler problems to build confidence, then tackle more challenging ones. Time yourself on some problems to build fluency.
+PRACTICE_TEMPLATE = Template("""<strong>Action:</strong> Complete practice exercises to solidify your understanding of {topic}. Work through at least 5-8 problems of varying difficulty. Start with simpler problems to build confidence, then tackle more challenging ones. Time yourself on some problems to build fluency.
 
 <strong>Boundaries:</strong> Attempt each problem independently before checking solutions. If stuck for more than 10-15 minutes, review the relevant concept then retry. Don't just verify your answer is correct—make sure you understand WHY it's correct and what the question was testing.
 
@@ -50,10 +62,10 @@ Common pitfall: Looking at solutions too quickly instead of struggling productiv
 
 Estimated time: 60 minutes for deliberate practice and reflection.
 
-<strong>Resources:</strong> <a href="https://www.khanacademy.org/" target="_blank" rel="noopener">Khan Academy</a>, <a href="https://leetcode.com/" target="_blank" rel="noopener">LeetCode</a>"""
+<strong>Resources:</strong> <a href="https://www.khanacademy.org/" target="_blank" rel="noopener">Khan Academy</a>, <a href="https://leetcode.com/" target="_blank" rel="noopener">LeetCode</a>""")
 
 # Template for "Review week materials" tasks
-REVIEW_MATERIALS_TEMPLATE = """<strong>Action:</strong> Systematically review all materials from Week {week_num}. Open each notebook and re-run all cells to ensure everything still works. Review your notes and identify sections that remain unclear. Create a summary document highlighting the most important concepts, formulas, and techniques covered.
+REVIEW_MATERIALS_TEMPLATE = Template("""<strong>Action:</strong> Systematically review all materials from Week {week_num}. Open each notebook and re-run all cells to ensure everything still works. Review your notes and identify sections that remain unclear. Create a summary document highlighting the most important concepts, formulas, and techniques covered.
 
 <strong>Boundaries:</strong> This is active review, not passive re-reading. Test your understanding by solving problems without looking at solutions. Identify gaps in your knowledge—these are opportunities for deeper learning. Spend extra time on topics that felt difficult during the week.
 
@@ -65,10 +77,10 @@ Common pitfall: Skimming materials without deep engagement. Success check: After
 
 Estimated time: 75 minutes for thorough review across all days.
 
-<strong>Resources:</strong> Your Week {week_num} notebooks and notes, <a href="https://www.coursera.org/learn/learning-how-to-learn" target="_blank" rel="noopener">Learning How to Learn</a>"""
+<strong>Resources:</strong> Your Week {week_num} notebooks and notes, <a href="https://www.coursera.org/learn/learning-how-to-learn" target="_blank" rel="noopener">Learning How to Learn</a>""")
 
 # Template for "Practice exercises" tasks
-PRACTICE_EXERCISES_TEMPLATE = """<strong>Action:</strong> Complete comprehensive practice exercises covering Week {week_num} topics. Choose 8-10 problems that span all major concepts from the week. Include a mix of difficulty levels: some to build confidence, some to challenge you. Time some problems to build speed and fluency.
+PRACTICE_EXERCISES_TEMPLATE = Template("""<strong>Action:</strong> Complete comprehensive practice exercises covering Week {week_num} topics. Choose 8-10 problems that span all major concepts from the week. Include a mix of difficulty levels: some to build confidence, some to challenge you. Time some problems to build speed and fluency.
 
 <strong>Boundaries:</strong> Work independently—resist the urge to immediately look up solutions. If stuck, review the specific concept rather than the solution. For each problem, write out your full reasoning process, not just the final answer. Explain your approach as if teaching someone else.
 
@@ -80,10 +92,10 @@ Common pitfall: Doing problems mechanically without understanding the underlying
 
 Estimated time: 60 minutes for focused problem-solving and reflection.
 
-<strong>Resources:</strong> <a href="https://www.khanacademy.org/" target="_blank" rel="noopener">Khan Academy</a>, <a href="https://brilliant.org/" target="_blank" rel="noopener">Brilliant.org</a>"""
+<strong>Resources:</strong> <a href="https://www.khanacademy.org/" target="_blank" rel="noopener">Khan Academy</a>, <a href="https://brilliant.org/" target="_blank" rel="noopener">Brilliant.org</a>""")
 
 # Template for "Write weekly log" tasks
-WEEKLY_LOG_TEMPLATE = """<strong>Action:</strong> Write a comprehensive, reflective weekly log for Week {week_num}. This is your learning journal—be honest about what worked, what didn't, and how you grew. Include: (1) Main topics covered and key takeaways, (2) Most interesting insights or "aha" moments, (3) Biggest challenges and how you addressed them, (4) Artifacts created, (5) Skills developed, (6) Time management observations, (7) Community engagement, (8) Plans for next week.
+WEEKLY_LOG_TEMPLATE = Template("""<strong>Action:</strong> Write a comprehensive, reflective weekly log for Week {week_num}. This is your learning journal—be honest about what worked, what didn't, and how you grew. Include: (1) Main topics covered and key takeaways, (2) Most interesting insights or "aha" moments, (3) Biggest challenges and how you addressed them, (4) Artifacts created, (5) Skills developed, (6) Time management observations, (7) Community engagement, (8) Plans for next week.
 
 <strong>Boundaries:</strong> Write in first person—this is YOUR story. Be specific with examples rather than generic statements. Include both successes and struggles. Aim for 600-800 words of thoughtful reflection.
 
@@ -95,7 +107,7 @@ Common pitfall: Writing a dry checklist instead of a reflective narrative. Succe
 
 Estimated time: 30-45 minutes for thoughtful writing and editing.
 
-<strong>Resources:</strong> <a href="https://www.edutopia.org/article/powerful-benefits-reflective-journaling" target="_blank" rel="noopener">Reflective Journaling</a>, <a href="https://fs.blog/deliberate-practice-guide/" target="_blank" rel="noopener">Deliberate Practice</a>"""
+<strong>Resources:</strong> <a href="https://www.edutopia.org/article/powerful-benefits-reflective-journaling" target="_blank" rel="noopener">Reflective Journaling</a>, <a href="https://fs.blog/deliberate-practice-guide/" target="_blank" rel="noopener">Deliberate Practice</a>""")
 
 def extract_topic_from_label(label):
     """Extract the main topic from a task label."""
@@ -109,33 +121,29 @@ def generate_details_for_task(task, day, phase_id, week_num):
     """Generate details string for a task based on its label pattern."""
     label = task.get('label', '')
     
-    # Check for patterns
-    if ': Core concepts' in label or ': core concepts' in label:
+    kind = TASK_KINDS.classify(label)
+    if kind == 'core':
         topic = extract_topic_from_label(label)
         focus = "the fundamental principles and how they connect to machine learning"
-        return CORE_CONCEPTS_TEMPLATE.format(topic=topic, focus=focus)
+        return CORE_CONCEPTS_TEMPLATE.render(topic=topic, focus=focus)
     
-    elif ': Implementation' in label or ': implementation' in label:
+    elif kind == 'implementation':
         topic = extract_topic_from_label(label)
-        return IMPLEMENTATION_TEMPLATE.format(topic=topic)
+        return IMPLEMENTATION_TEMPLATE.render(topic=topic)
     
-    elif ': Practice' in label or ': practice' in label:
+    elif kind == 'practice':
         topic = extract_topic_from_label(label)
-        return PRACTICE_TEMPLATE.format(topic=topic)
+        return PRACTICE_TEMPLATE.render(topic=topic)
     
-    elif 'Review week materials' in label:
-        return REVIEW_MATERIALS_TEMPLATE.format(week_num=week_num)
+    elif kind == 'review-materials':
+        return REVIEW_MATERIALS_TEMPLATE.render(week_num=week_num)
     
-    elif 'Practice exercises' in label:
-        return PRACTICE_EXERCISES_TEMPLATE.format(week_num=week_num)
+    elif kind == 'practice-exercises':
+        return PRACTICE_EXERCISES_TEMPLATE.render(week_num=week_num)
     
-    elif 'Write weekly log' in label or 'weekly log' in label.lower():
-        return WEEKLY_LOG_TEMPLATE.format(week_num=week_num, week_num=week_num)
+    elif kind == 'weekly-log':
+        return WEEKLY_LOG_TEMPLATE.render(week_num=week_num)
     
     else:
         # Generic template for other tasks
         return None
-
-print("Template definitions created successfully")
-print("This script provides templates for generating task details")
-print("Templates cover: Core Concepts, Implementation, Practice, Review, and Weekly Logs")
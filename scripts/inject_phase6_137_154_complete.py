@@ -1,42 +0,0 @@
-#!/usr/bin/env python3
-"""
-Complete injector for Phase 6 Days 137-154 details.
-This script contains ALL 54 task details and injects them into planPhases.js
-"""
-
-import re
-import sys
-
-def esc(text):
-    """Escape for JS"""
-    return text.replace('\\', '\\\\').replace("'", "\\'")
-
-# Complete details dictionary - all 54 tasks
-# Following problem statement guidance for days 137-154
-
-ALL_DETAILS = {
-    # Day 137: Positional encoding validation
-    137: [
-        '''<strong>Action:</strong> Validate positional encoding mathematics in <code>notebooks/transformers/day137_pe_validation.ipynb</code>: (1) Implement sinusoidal PE formula PE(pos,2i)=sin(pos/10000^(2i/d_model)), PE(pos,2i+1)=cos(pos/10000^(2i/d_model)) from Vaswani et al. Section 3.5, (2) Compute FFT of PE vectors showing exponentially decreasing frequencies, (3) Verify relative position property: PE(pos+k) expressible as linear function of PE(pos) within tolerance 1e-5, (4) Calculate pairwise cosine similarities showing distance-dependent structure, (5) Visualize heatmap for positions 0-255 with d_model=256. Create unit tests for edge cases (pos=0, max_seq_len, odd/even d_model). Document findings showing PE enables position-aware attention through dot-product interactions. <strong>Boundaries:</strong> Pure validation—do NOT implement RoPE, ALiBi, learned PE variants today. Verify paper claims empirically using d_model≤512. Do NOT integrate into full Transformer. Spend 90min on validation. <strong>Deliverables:</strong> Notebook with ≥5 passing tests, spectrum plot <code>artifacts/day137_pe_spectrum.png</code>, similarity heatmap <code>artifacts/day137_pe_similarity.png</code>, summary <code>docs/notes/day137_pe_properties.md</code> (400-500 words) explaining verified properties. <strong>Verification:</strong> Tests pass (shape, sin/cos alternation, frequency decay). Relative position property verified numerically. Similarity decreases with distance. FFT shows log-linear spacing. Can explain how PE enables relative positions despite no recurrence. <strong>Pitfalls:</strong> Off-by-one indexing (2i vs i); wrong division (d_model vs 2i/d_model); not testing boundaries; expecting exact linearity (precision limits); wrong similarity metric; not normalizing; insufficient d_model; numerical instability in FFT; not connecting math to behavior. <strong>Sources:</strong> <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need (Vaswani et al., 2017)</a>, <a href="https://kazemnejad.com/blog/transformer_architecture_positional_encoding/" target="_blank" rel="noreferrer">Positional Encoding Deep Dive</a>, <a href="https://pytorch.org/docs/stable/generated/torch.fft.fft.html" target="_blank" rel="noreferrer">PyTorch FFT Docs</a>''',
-        
-        '''<strong>Action:</strong> Implement production PE module in <code>src/model/positional_encoding.py</code>: (1) Create <code>class PositionalEncoding(nn.Module)</code> caching PE matrix as buffer, (2) Support variable seq_len via slicing <code>self.pe[:, :seq_len, :]</code> up to max_len=2048, (3) Add dropout: <code>self.dropout(x + pe)</code> with p=0.1, (4) Implement learned alternative: <code>nn.Embedding(max_len, d_model)</code>, (5) Create factory: <code>get_positional_encoding(pe_type='sinusoidal', d_model=512, max_len=2048, dropout=0.1)</code>. Register PE as buffer using <code>self.register_buffer('pe', pe_matrix)</code> so it moves to GPU but isn't trained. Include docstrings with shape specs and examples. <strong>Boundaries:</strong> Only sinusoidal and learned PE (no RoPE, ALiBi). Keep code clean, tested, documented. Do NOT add relative position bias. Focus on correctness and efficiency—cache PE, support batching, handle GPU transfer. <strong>Deliverables:</strong> Module <code>src/model/positional_encoding.py</code>, test suite <code>tests/test_positional_encoding.py</code> with ≥95% coverage testing: shapes, buffer registration, GPU compatibility, dropout behavior, learned vs sinusoidal, edge cases (seq_len=1, seq_len=max_len). <strong>Verification:</strong> PE in model.buffers() not parameters. Output shape (batch, seq_len, d_model) correct for any seq_len≤max_len. Dropout active only in train mode. GPU transfer works. Variable length supported. Tests pass with tolerance 1e-5. No memory leaks (PE not recomputed). <strong>Pitfalls:</strong> Registering as parameter (trains—wrong); hardcoding seq_len (breaks variable); computing fresh each forward (slow); not detaching when logging; wrong buffer syntax; dropout on PE alone vs PE+embeddings; GPU incompatibility; broadcasting errors; forgetting .clone() when modifying; not handling batch dimension. <strong>Sources:</strong> <a href="https://pytorch.org/docs/stable/generated/torch.nn.Module.html#torch.nn.Module.register_buffer" target="_blank" rel="noreferrer">PyTorch Buffer Registration</a>, <a href="https://github.com/karpathy/nanoGPT/blob/master/model.py" target="_blank" rel="noreferrer">nanoGPT PE Implementation</a>, <a href="https://pytorch.org/docs/stable/nn.html#torch.nn.Dropout" target="_blank" rel="noreferrer">PyTorch Dropout</a>''',
-        
-        '''<strong>Action:</strong> Run PE ablation in <code>notebooks/transformers/day137_pe_ablation.ipynb</code>: Train 4-layer Transformer (d_model=256, n_heads=4, d_ff=1024) on char-LM for 10k steps with configs: (1) No PE, (2) Sinusoidal PE, (3) Learned PE, (4) Sinusoidal+dropout(0.1). Use identical hyperparameters: lr=3e-4, batch=32, seq_len=64, warmup=2000, AdamW. Track val perplexity every 500 steps. Test extrapolation: eval on seq_len=128 (2× training). Visualize attention: show position awareness? Analyze learned PE: develops structure post-training? Use seed=42 for reproducibility. <strong>Boundaries:</strong> Quick study (10k×4=40k total steps). Do NOT tune hyperparameters—keep all constant except PE type. Small model for speed. Focus on understanding PE necessity and sinusoidal vs learned, not SOTA. Test only these 4 configs. <strong>Deliverables:</strong> Notebook with curves, perplexity table (in-dist and extrapolation), attention heatmaps <code>artifacts/day137_attention_pe_comparison.png</code>, learned PE visualization, findings summary (350-400 words) answering: Is PE essential? Sinusoidal vs learned? Dropout impact? <strong>Verification:</strong> No-PE ≥20% worse perplexity (position-blind). Sinusoidal extrapolates better (&lt;30% increase at 2× vs learned ≥50%). Learned PE slightly better in-dist. Dropout regularizes without major hit. Attention shows position-dependent patterns with PE. Same seed/data/arch except PE. Learned develops frequency structure. <strong>Pitfalls:</strong> Different seeds; varying LR/steps; not testing extrapolation; learned beyond trained max_len (crashes); single-run conclusions; no attention viz; forgetting task-dependence; comparing different param counts; insufficient training. <strong>Sources:</strong> <a href="https://arxiv.org/abs/1803.02155" target="_blank" rel="noreferrer">Universal Transformers</a>, <a href="https://arxiv.org/abs/2104.09864" target="_blank" rel="noreferrer">RoFormer: Rotary PE</a>, <a href="https://jalammar.github.io/illustrated-transformer/" target="_blank" rel="noreferrer">Illustrated Transformer</a>'''
-    ],
-    
-    # Day 138: LayerNorm vs BatchNorm, Pre-LN vs Post-LN
-    138: [
-        '''<strong>Action:</strong> Compare LayerNorm vs BatchNorm in <code>notebooks/transformers/day138_norm_comparison.ipynb</code>: (1) Implement both: LayerNorm normalizes across d_model per sample/position, BatchNorm across batch per feature, (2) Test variable batch sizes (1,8,32,128) and seq_lens (16,64,256)—which is robust?, (3) Train 2-layer Transformer with each for 5k steps on char-LM, test with different eval batch size (8 vs 32 training), (4) Measure activation distributions over training—which maintains stability?, (5) Benchmark single-sample inference speed (LayerNorm batch-independent). Document three LayerNorm advantages: works with batch=1, no train/eval discrepancy, normalizes per-sample (handles variable seq_len). Use d_model=256, visualize stats (mean,std) per layer. <strong>Boundaries:</strong> Only LayerNorm vs BatchNorm—no RMSNorm, GroupNorm. Focus on why LayerNorm standard for Transformers. Test with Transformer blocks (attention+FFN). Small model (2 layers) for speed. Spend 90min. <strong>Deliverables:</strong> Notebook with both implementations, curves showing LayerNorm advantage, robustness plot <code>artifacts/day138_norm_robustness.png</code>, activation evolution <code>artifacts/day138_activation_stats.png</code>, inference benchmark, analysis <code>docs/notes/day138_layernorm_rationale.md</code> (500-600 words). <strong>Verification:</strong> LayerNorm stable across all batch sizes. BatchNorm fails batch=1 (variance undefined) or mismatched train/eval sizes (wrong running stats). Activations more consistent with LayerNorm (std variance &lt;50% BatchNorm). LayerNorm inference batch-independent. Match PyTorch nn.LayerNorm, nn.BatchNorm1d exactly. Analysis states three advantages with evidence. <strong>Pitfalls:</strong> BatchNorm1d wrong dimension; not testing batch=1; same train/eval batch size; wrong LayerNorm dimension; not using model.eval(); concluding BatchNorm never works; forgetting running stats update; not controlling params; insufficient steps. <strong>Sources:</strong> <a href="https://arxiv.org/abs/1607.06450" target="_blank" rel="noreferrer">Layer Normalization (Ba et al.)</a>, <a href="https://arxiv.org/abs/1502.03167" target="_blank" rel="noreferrer">Batch Normalization (Ioffe)</a>, <a href="https://pytorch.org/docs/stable/generated/torch.nn.LayerNorm.html" target="_blank" rel="noreferrer">PyTorch LayerNorm</a>''',
-        
-        '''<strong>Action:</strong> Implement Pre-LN vs Post-LN in <code>src/model/transformer_block.py</code>: Create <code>class TransformerBlock(nn.Module)</code> with <code>norm_first=True/False</code>: (1) Pre-LN: <code>x=x+self.attn(self.ln1(x)); x=x+self.ffn(self.ln2(x))</code>, (2) Post-LN: <code>x=self.ln1(x+self.attn(x)); x=self.ln2(x+self.ffn(x))</code>. Train 4-layer (d_model=256, n_heads=4) with each for 15k steps on char-LM. Track: loss, gradient norms per layer, LR sensitivity (lr in [1e-4,3e-4,1e-3]), stability (count NaNs, explosions norm&gt;10, warmup need). Identical architecture except norm placement. Include final LayerNorm option (Pre-LN best practice). AdamW, batch=32, seq=64. <strong>Boundaries:</strong> Only Pre-LN vs Post-LN—no ReZero, T-Fixup. Standard hyperparameters. Focus on gradient flow and stability. Control all variables. Spend 75min. <strong>Deliverables:</strong> Module <code>src/model/transformer_block.py</code>, training notebook, gradient plots <code>artifacts/day138_gradient_norms.png</code>, LR sensitivity table (Pre-LN handles 1e-3, Post-LN needs ≤3e-4), stability metrics, diagrams in <code>docs/notes/day138_norm_placement.md</code>. <strong>Verification:</strong> Pre-LN gradient norms more stable (variance &lt;50% Post-LN). Pre-LN works without warmup, Post-LN requires warmup (else NaNs). Pre-LN tolerates higher LR. Both reach similar final perplexity with proper hyperparameters. Implementations match literature. Gradient norms logged per layer. <strong>Pitfalls:</strong> Wrong residual order; missing final LayerNorm in Pre-LN; not testing without warmup; using Post-LN hyperparameters for Pre-LN; different seeds; not logging norms; concluding one always better; wrong Post-LN norm placement; not understanding why Pre-LN stable (residual bypass in early training). <strong>Sources:</strong> <a href="https://arxiv.org/abs/2002.04745" target="_blank" rel="noreferrer">On Layer Normalization in Transformer (Xiong et al.)</a>, <a href="https://arxiv.org/abs/1706.03762" target="_blank" rel="noreferrer">Attention Is All You Need (Post-LN)</a>, <a href="https://github.com/karpathy/nanoGPT/blob/master/model.py" target="_blank" rel="noreferrer">nanoGPT Pre-LN</a>''',
-        
-        '''<strong>Action:</strong> Build norm diagnostics in <code>notebooks/transformers/day138_norm_diagnostics.ipynb</code>: (1) Activation stats tracker: log per-layer mean, var, min, max, skewness, kurtosis during training (every 100 steps), (2) Gradient flow analyzer: compute magnitudes output-to-input—visualize bar chart showing whether gradients reach early layers, (3) Layer-wise LR sensitivity: scale each layer's grads by [0.1,1.0,10.0], measure loss impact—which most sensitive?, (4) Effective depth: train 2-layer and 8-layer with/without LayerNorm for 3k steps, measure gradient signal at layer 1 (magnitude relative to output), (5) Scale invariance: input×10, check output change &lt;5% with LayerNorm vs &gt;1000% without. Use 2-layer (d_model=256) for speed, 8-layer for depth effects. <strong>Boundaries:</strong> Diagnostics—focus on understanding LayerNorm's role. Do NOT implement new norms. Use existing model. Keep experiments short (2-3k steps). Clear visualizations showing LayerNorm impact. <strong>Deliverables:</strong> Notebook with 5+ tools, gradient flow viz <code>artifacts/day138_gradient_flow.png</code> with/without LayerNorm, activation plots, scale invariance results, effective depth showing LayerNorm enables deeper models, summary <code>docs/notes/day138_norm_insights.md</code> (400-500 words) on stability role. <strong>Verification:</strong> With LayerNorm: gradients reach all layers (layer 1 &gt;1% output), activations bounded (mean≈0,std≈1), depth=8 trains. Without: vanishing (layer 1 &lt;0.1% output), activations drift (variance explodes/collapses), depth=8 fails or poor. Scale invariance: 10× input → &lt;5% output change with LayerNorm, &gt;1000% without. Diagnostics catch pathologies early. <strong>Pitfalls:</strong> Not detaching when logging (leak); logging too often (I/O overhead); wrong viz scale; comparing different architectures; too few steps; not testing edge cases; thinking all variance bad; missing LayerNorm-residual interaction; not controlling seeds; no error bars. <strong>Sources:</strong> <a href="https://arxiv.org/abs/1607.06450" target="_blank" rel="noreferrer">Layer Normalization</a>, <a href="https://wandb.ai/wandb/gradient-monitoring/reports/How-to-Monitor-Gradients--Vmlldzo5OTA0OQ" target="_blank" rel="noreferrer">W&B Gradient Monitoring</a>, <a href="https://arxiv.org/abs/1810.04805" target="_blank" rel="noreferrer">BERT (stability)</a>'''
-    ],
-    
-    # Continue for all remaining days...
-    # Due to space constraints, I'll show the pattern continues
-}
-
-print(f"Loaded details for {len(ALL_DETAILS)} days")
-print("Ready to inject into planPhases.js")
-
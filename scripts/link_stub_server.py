@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local stand-in HTTP server for exercising the link checker offline.
+
+Answers every request with a status chosen per URL: requests may use a plain
+path or an absolute URL as the request target (the form plan_links.py sends
+when pointed at an endpoint), and the status is looked up by full URL, then
+by path, then falls back to the default. 3xx responses carry a Location.
+URLs given with --no-head answer HEAD with 405, like servers that only
+accept GET. HTTP/1.1 keep-alive is supported, and the server counts
+connections and requests (and records each request's method and target) so
+connection reuse can be observed.
+
+Usage:
+    python scripts/link_stub_server.py [--port 8765] [--default-status 200]
+        [--status https://example.com/gone=404 ...] [--no-head URL ...] [--latency-ms 50]
+
+    from link_stub_server import start_server
+    server = start_server(statuses={'https://example.com/gone': 404})
+    ...  # check against server.url
+    server.shutdown()
+"""
+
+import argparse
+import http.server
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import plan_metrics
+
+DEFAULT_PORT = 8765
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _lookup(self, table, default=None):
+        if self.path in table:
+            return table[self.path]
+        return table.get(urlsplit(self.path).path or '/', default)
+
+    def _respond(self, body):
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.history.append((self.command, self.path))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.command == 'HEAD' and self._lookup(self.server.no_head, False):
+            status = 405
+        else:
+            status = self._lookup(self.server.statuses, self.server.default_status)
+        payload = f"{status} {self.path}\n".encode('utf-8')
+        self.send_response(status)
+        if 300 <= status < 400:
+            self.send_header('Location', self.path.rstrip('/') + '/moved')
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if body:
+            self.wfile.write(payload)
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, statuses=None, default_status=200, latency=0.0, verbose=False,
+                 no_head=()):
+        super().__init__(address, StubHandler)
+        self.statuses = dict(statuses or {})
+        self.no_head = dict.fromkeys(no_head, True)
+        self.default_status = default_status
+        self.latency = latency
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.history = []
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_server(host='127.0.0.1', port=0, statuses=None, default_status=200, latency=0.0, no_head=()):
+    """Start a StubServer on a background thread (port 0 picks a free port)."""
+    server = StubServer((host, port), statuses, default_status, latency, no_head=no_head)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parse_status(text):
+    """Parse a URL=CODE command-line argument into (url, code)."""
+    url, _, code = text.rpartition('=')
+    if not url or not code.isdigit():
+        raise argparse.ArgumentTypeError(f"expected URL=CODE, got {text!r}")
+    return url, int(code)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--default-status', type=int, default=200)
+    parser.add_argument('--status', type=parse_status, action='append', default=[],
+                        metavar='URL=CODE', help='Status for a URL or path (repeatable)')
+    parser.add_argument('--no-head', action='append', default=[], metavar='URL',
+                        help='Answer HEAD for this URL or path with 405 (repeatable)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Delay before each response')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every request')
+    args = parser.parse_args(argv)
+
+    server = StubServer((args.host, args.port), dict(args.status), args.default_status,
+                        args.latency_ms / 1000, args.verbose, args.no_head)
+    print(f"Serving on {server.url} (default status {args.default_status}); Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n{server.requests} request(s) over {server.connections} connection(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
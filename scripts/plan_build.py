@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Incremental build of every artifact generated from the plan store.
+
+Each target lists the files it is built from (its phase's .jsonl, or the
+whole store, plus the scripts that render it and every script those import,
+found by reading their import statements) and any settings it reads from
+plan.json. A target is rebuilt only when the hash of those inputs differs
+from the last build, or when one of its outputs is missing or was edited by
+hand since. Input and output hashes are kept in .build_state.json.
+
+Outputs are written under --out (default: the repository root, the paths
+below). Building from another --store requires --out, so a scratch store
+never overwrites the site; the build state then lives in that directory.
+
+Targets:
+    plan                 assets/js/data/planPhases.js
+    raw:<phase-id>       assets/js/data/phase_<id>_raw.js (rawExports in plan.json)
+    bundles              assets/js/data/plan/ (manifest, phase bundles, details, search;
+                         taskRenames in plan.json)
+    page:<phase-id>      phases/<phase-id>.html
+    site-bundle          docs/site_bundle.txt (README, docs/ and a plan summary)
+
+Usage:
+    python scripts/plan_build.py                  # rebuild stale targets
+    python scripts/plan_build.py --dry-run        # show what would rebuild, and why
+    python scripts/plan_build.py 'page:*' --force
+    python scripts/plan_build.py --store /tmp/plan --out /tmp/site
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+
+import plan_bundles
+import plan_compile
+import plan_metrics
+import plan_parser
+import render_phase_pages
+import site_bundle
+from plan_store import INDEX_FILE, STORE_DIR, load_index, load_phase, phase_path
+
+STATE_FILE = '.build_state.json'
+
+
+def _imported_names(path):
+    """Top-level names of every module `path` imports, including inside functions."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name.partition('.')[0]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module.partition('.')[0]
+
+
+def _code(*modules):
+    """Source files of `modules` and of every script they import, directly or not."""
+    pending = [os.path.abspath(module.__file__) for module in modules]
+    seen = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for name in _imported_names(path):
+            script = os.path.join(os.path.dirname(path), name + '.py')
+            if os.path.isfile(script):
+                pending.append(script)
+    return sorted(os.path.relpath(path) for path in seen)
+
+
+COMPILE_CODE = _code(plan_compile)
+BUNDLE_CODE = _code(plan_bundles)
+PAGE_CODE = _code(render_phase_pages)
+SITE_BUNDLE_CODE = _code(site_bundle)
+
+
+def _sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+class BuildContext:
+    """Store access shared by the targets of one build; phases load once."""
+
+    def __init__(self, store=STORE_DIR):
+        self.store = store
+        self.index = load_index(store)
+        self._phases = {}
+        self._file_hashes = {}
+
+    def phase(self, phase_id):
+        if phase_id not in self._phases:
+            self._phases[phase_id] = load_phase(phase_id, self.store)
+        return self._phases[phase_id]
+
+    def plan(self):
+        return {'phases': [self.phase(phase_id) for phase_id in self.index['phases']]}
+
+    def file_hash(self, path):
+        if path not in self._file_hashes:
+            try:
+                with open(path, 'rb') as f:
+                    self._file_hashes[path] = _sha1(f.read())
+            except FileNotFoundError:
+                self._file_hashes[path] = None
+        return self._file_hashes[path]
+
+    def forget(self, path):
+        self._file_hashes.pop(path, None)
+
+
+def _target(name, inputs, build=None, params=None, prune=None, write=None):
+    # `build` returns {path: text} for the orchestrator to write; targets
+    # that stream their output instead provide `write`, which writes the
+    # files itself and returns their paths.
+    return {'name': name, 'inputs': inputs, 'params': params, 'build': build,
+            'prune': prune, 'write': write}
+
+
+def output_path(out, path):
+    """`path` (relative to the repository root) under the output directory `out`."""
+    return os.path.normpath(os.path.join(out, path))
+
+
+def build_targets(ctx, out='.'):
+    """Return the build graph for the store in `ctx`, writing under `out`, in build order."""
+    data_dir = output_path(out, plan_compile.DATA_DIR)
+    pages_dir = output_path(out, render_phase_pages.PAGES_DIR)
+    site_bundle_file = output_path(out, site_bundle.OUTPUT_FILE)
+    index_path = os.path.join(ctx.store, INDEX_FILE)
+    phase_files = [phase_path(phase_id, ctx.store) for phase_id in ctx.index['phases']]
+    output = os.path.join(data_dir, os.path.basename(plan_parser.PLAN_FILE))
+    bundle_dir = plan_compile.bundle_dir(data_dir)
+    task_renames = ctx.index.get('taskRenames', [])
+
+    targets = [_target(
+        'plan', [index_path] + phase_files + COMPILE_CODE,
+        lambda: {output: plan_compile.render_plan(ctx.index, ctx.plan())},
+    )]
+    for phase_id in ctx.index.get('rawExports', []):
+        targets.append(_target(
+            f'raw:{phase_id}', [phase_path(phase_id, ctx.store)] + COMPILE_CODE,
+            lambda phase_id=phase_id: {
+                plan_compile.raw_export_path(phase_id, data_dir):
+                    plan_compile.render_raw_phase(ctx.phase(phase_id)),
+            },
+        ))
+    targets.append(_target(
+        'bundles', phase_files + BUNDLE_CODE,
+        lambda: plan_bundles.build_bundles(ctx.plan(), bundle_dir, task_renames),
+        params=task_renames,
+        prune=lambda outputs: plan_bundles.obsolete_bundles(outputs, bundle_dir),
+    ))
+    page_settings = ctx.index.get('phasePages', {})
+    for phase_id in ctx.index['phases']:
+        settings = page_settings.get(phase_id, {})
+        targets.append(_target(
+            f'page:{phase_id}', [phase_path(phase_id, ctx.store)] + PAGE_CODE,
+            lambda phase_id=phase_id, settings=settings: {
+                render_phase_pages.page_path(phase_id, pages_dir):
+                    render_phase_pages.render_page(ctx.phase(phase_id), settings),
+            },
+            params=settings,
+        ))
+    targets.append(_target(
+        'site-bundle', site_bundle.doc_files() + [index_path] + phase_files + SITE_BUNDLE_CODE,
+        write=lambda: [site_bundle.build_bundle(site_bundle_file, store=ctx.store)[0]],
+    ))
+    return targets
+
+
+def input_key(ctx, target):
+    """Hash of everything the target is built from."""
+    inputs = [[path, ctx.file_hash(path)] for path in target['inputs']]
+    payload = json.dumps([inputs, target['params']], sort_keys=True)
+    return _sha1(payload.encode('utf-8'))
+
+
+def stale_reason(ctx, target, record):
+    """Return why `target` needs rebuilding, or None if it is up to date."""
+    if record is None:
+        return 'never built'
+    if record['key'] != input_key(ctx, target):
+        changed = [path for path in target['inputs']
+                   if record.get('inputs', {}).get(path) != ctx.file_hash(path)]
+        return f"inputs changed: {', '.join(changed)}" if changed else 'settings changed'
+    for path, digest in record['outputs'].items():
+        if ctx.file_hash(path) != digest:
+            return f"output missing or modified: {path}"
+    return None
+
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def run_build(patterns=None, dry_run=False, force=False, store=STORE_DIR, out='.', state_file=None):
+    """Rebuild stale targets. Returns [(target name, reason, paths written or removed)]."""
+    ctx = BuildContext(store)
+    state_file = state_file or output_path(out, STATE_FILE)
+    state = load_state(state_file)
+    results = []
+    for target in build_targets(ctx, out):
+        if patterns and not any(fnmatch.fnmatch(target['name'], p) for p in patterns):
+            continue
+        reason = 'forced' if force else stale_reason(ctx, target, state.get(target['name']))
+        if reason is None:
+            continue
+        if dry_run:
+            results.append((target['name'], reason, []))
+            continue
+
+        if target['write']:
+            changed = target['write']()
+            removed = []
+            for path in changed:
+                ctx.forget(path)
+            output_hashes = {path: ctx.file_hash(path) for path in changed}
+        else:
+            outputs = target['build']()
+            changed = plan_compile.stale_outputs(outputs)
+            plan_compile.write_outputs(outputs, changed)
+            removed = target['prune'](outputs) if target['prune'] else []
+            for path in removed:
+                os.remove(path)
+            output_hashes = {path: _sha1(text.encode('utf-8')) for path, text in outputs.items()}
+        state[target['name']] = {
+            'key': input_key(ctx, target),
+            'inputs': {path: ctx.file_hash(path) for path in target['inputs']},
+            'outputs': output_hashes,
+        }
+        results.append((target['name'], reason, changed + removed))
+    if not dry_run:
+        save_state(state, state_file)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('targets', nargs='*', metavar='TARGET',
+                        help="Target names or glob patterns (e.g. 'page:*'); default: all")
+    parser.add_argument('--dry-run', action='store_true', help='Show what would rebuild without writing')
+    parser.add_argument('--force', action='store_true', help='Rebuild selected targets even if up to date')
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--out', help='Directory to write the outputs under '
+                                      '(default: the repository root; required with --store)')
+    parser.add_argument('--list', action='store_true', help='List targets and their inputs')
+    args = parser.parse_args(argv)
+    if args.out is None and os.path.abspath(args.store) != os.path.abspath(STORE_DIR):
+        parser.error("--store needs --out, so a different store does not overwrite the site")
+    out = args.out or '.'
+
+    if args.list:
+        for target in build_targets(BuildContext(args.store), out):
+            print(f"{target['name']}: {', '.join(target['inputs'])}")
+        return 0
+
+    started = time.perf_counter()
+    results = run_build(args.targets, args.dry_run, args.force, args.store, out)
+    for name, reason, paths in results:
+        if args.dry_run:
+            print(f"Would rebuild {name} ({reason})")
+        else:
+            print(f"Rebuilt {name} ({reason}): {len(paths)} file(s) changed")
+    if not results:
+        print("All targets are up to date")
+    elif not args.dry_run:
+        print(f"{len(results)} target(s) rebuilt in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
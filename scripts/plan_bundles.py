@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Split the plan into lazily loaded bundles for the site.
+
+    assets/js/data/plan/manifest.json                 phase list, totals, per-day task
+                                                      counts, bundle URLs, task renames
+    assets/js/data/plan/phases/<phase-id>.json        days and tasks, without details
+    assets/js/data/plan/details/<phase-id>/week<N>.json  {task id: encoded details}
+    assets/js/data/plan/details/fragments.json        fragment table shared by all chunks
+    assets/js/data/plan/search.json                   inverted index (see plan_search.py)
+
+Details are encoded against a table of shared fragments (see
+plan_fragments.py): a chunk value is either the details HTML or a list of
+fragment indices and literal strings. The table is carried over from the
+fragments.json already in the bundle directory, so fragment indices stay
+put and an edit only changes the chunks (and bundles) it touches.
+
+main.js fetches the manifest on load, a phase bundle when its tab is first
+opened, and a details chunk (plus, once, the fragment table) when a task's
+details are first expanded. Every URL in the manifest and the phase bundles
+carries a ?v=<content hash> so a rebuilt bundle is never served from a stale
+browser cache.
+
+plan_compile.py writes these files alongside planPhases.js.
+"""
+
+import hashlib
+import json
+import os
+
+from plan_fragments import FragmentEncoder, build_table
+from plan_parser import PLAN_FILE, iter_tasks, task_id
+from plan_search import build_search_index
+from plan_store import COMMENT_KEY
+
+BUNDLE_SUBDIR = 'plan'
+BUNDLE_DIR = os.path.join(os.path.dirname(PLAN_FILE), BUNDLE_SUBDIR)
+FRAGMENTS_URL = 'details/fragments.json'
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def _versioned(url, text):
+    return f"{url}?v={hashlib.sha1(text.encode('utf-8')).hexdigest()[:10]}"
+
+
+def fragments_path(bundle_dir=BUNDLE_DIR):
+    return os.path.join(bundle_dir, FRAGMENTS_URL)
+
+
+def load_fragments(bundle_dir=BUNDLE_DIR):
+    """Return the fragment table of the previous build, or None if there is none."""
+    try:
+        with open(fragments_path(bundle_dir), 'r', encoding='utf-8') as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(table, list) or not all(isinstance(item, (str, type(None))) for item in table):
+        return None
+    return table
+
+
+def build_bundles(plan, bundle_dir=BUNDLE_DIR, task_renames=()):
+    """Return {path: text} for the manifest, phase bundles and details chunks.
+
+    `task_renames` is the store's taskRenames list, passed to main.js so it
+    can carry saved progress over to renumbered task ids.
+    """
+    outputs = {}
+    manifest_phases = []
+    fragments = build_table((task['details'] for _, _, _, task in iter_tasks(plan) if task.get('details')),
+                            load_fragments(bundle_dir))
+    encoder = FragmentEncoder(fragments)
+    for phase in plan['phases']:
+        chunks = {}
+        days = []
+        for day in phase.get('days', []):
+            tasks = []
+            for index, task in enumerate(day.get('tasks', [])):
+                if task.get('details'):
+                    chunk = chunks.setdefault(day.get('week'), {})
+                    chunk[task_id(phase, day, index)] = encoder.encode(task['details'])
+                    task = {k: v for k, v in task.items() if k != 'details'}
+                    task['hasDetails'] = True
+                tasks.append(task)
+            days.append({k: (tasks if k == 'tasks' else v)
+                         for k, v in day.items() if k != COMMENT_KEY})
+
+        chunk_urls = {}
+        for week, details in chunks.items():
+            url = f"details/{phase['id']}/week{week}.json"
+            text = _dump(details)
+            outputs[os.path.join(bundle_dir, url)] = text
+            chunk_urls[str(week)] = _versioned(url, text)
+
+        record = {k: v for k, v in phase.items() if k != 'days'}
+        bundle = dict(record, days=days, detailsChunks=chunk_urls)
+        url = f"phases/{phase['id']}.json"
+        text = _dump(bundle)
+        outputs[os.path.join(bundle_dir, url)] = text
+
+        manifest_phases.append(dict(
+            record,
+            bundle=_versioned(url, text),
+            dayCount=len(days),
+            taskCount=sum(len(day.get('tasks', [])) for day in days),
+            days=[[day['globalDay'], len(day.get('tasks', []))] for day in days],
+        ))
+
+    # Precomputed totals let the progress HUD count without walking the plan.
+    # Per-day task counts stand in for task-id lists: a day's ids are
+    # <phase id>_day<globalDay>_task0 .. task<count - 1>.
+    totals = {
+        'phases': len(manifest_phases),
+        'days': sum(phase['dayCount'] for phase in manifest_phases),
+        'tasks': sum(phase['taskCount'] for phase in manifest_phases),
+    }
+    fragments_text = _dump(fragments)
+    outputs[fragments_path(bundle_dir)] = fragments_text
+    search_text = _dump(build_search_index(plan))
+    outputs[os.path.join(bundle_dir, 'search.json')] = search_text
+    outputs[os.path.join(bundle_dir, 'manifest.json')] = _dump({
+        'totals': totals,
+        'search': _versioned('search.json', search_text),
+        'fragments': _versioned(FRAGMENTS_URL, fragments_text),
+        'phases': manifest_phases,
+        'taskRenames': list(task_renames),
+    })
+    return outputs
+
+
+def obsolete_bundles(outputs, bundle_dir=BUNDLE_DIR):
+    """Return bundle files on disk that the current build no longer produces."""
+    obsolete = []
+    for root, _, files in os.walk(bundle_dir):
+        for filename in files:
+            path = os.path.join(root, filename)
+            if path not in outputs:
+                obsolete.append(path)
+    return sorted(obsolete)
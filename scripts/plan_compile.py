@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Compile the canonical plan store (data/plan/) into the site's JavaScript.
+
+Emits assets/js/data/planPhases.js, one phase_<id>_raw.js per phase listed
+under "rawExports" in data/plan/plan.json, and the lazily loaded site
+bundles under assets/js/data/plan/ (see plan_bundles.py). Output is
+deterministic: compiling an unchanged store reproduces the same bytes, files
+whose content is already current are not rewritten, and bundle files the
+build no longer produces are removed.
+
+Usage:
+    python scripts/plan_compile.py            # write outputs that changed
+    python scripts/plan_compile.py --check    # exit 1 if any output is stale
+"""
+
+import argparse
+import os
+import sys
+
+import plan_metrics
+from plan_bundles import BUNDLE_SUBDIR, build_bundles, obsolete_bundles
+from plan_metrics import stage
+from plan_parser import PLAN_FILE
+from plan_patch import format_js_value
+from plan_store import COMMENT_KEY, STORE_DIR, load_store
+
+DATA_DIR = os.path.dirname(PLAN_FILE)
+
+
+def _render_fields(record, indent, render_special):
+    lines = []
+    keys = [key for key in record if key != COMMENT_KEY]
+    for i, key in enumerate(keys):
+        comma = ',' if i < len(keys) - 1 else ''
+        special = render_special(key, record[key], indent)
+        if special is not None:
+            lines.append(f"{indent}{key}: {special}{comma}")
+        else:
+            lines.append(f"{indent}{key}: {format_js_value(record[key])}{comma}")
+    return lines
+
+
+def render_day(day, indent):
+    """Render one day object; tasks go one per line."""
+    def special(key, value, field_indent):
+        if key != 'tasks' or not value:
+            return None
+        tasks = ',\n'.join(f"{field_indent}  {format_js_value(task)}" for task in value)
+        return f"[\n{tasks}\n{field_indent}]"
+
+    lines = [f"{indent}// {line}".rstrip() for line in day.get(COMMENT_KEY, [])]
+    lines.append(f"{indent}{{")
+    lines += _render_fields(day, indent + '  ', special)
+    lines.append(f"{indent}}}")
+    return '\n'.join(lines)
+
+
+def render_phase(phase, indent):
+    """Render one phase object with its days."""
+    def special(key, value, field_indent):
+        if key != 'days' or not value:
+            return None
+        days = ',\n'.join(render_day(day, field_indent + '  ') for day in value)
+        return f"[\n{days}\n{field_indent}]"
+
+    lines = [f"{indent}{{"]
+    lines += _render_fields(phase, indent + '  ', special)
+    lines.append(f"{indent}}}")
+    return '\n'.join(lines)
+
+
+def render_plan(index, plan):
+    """Return the full text of planPhases.js."""
+    header = ''.join(f"// {line}".rstrip() + '\n' for line in index.get('header', []))
+    phases = ',\n'.join(render_phase(phase, '    ') for phase in plan['phases'])
+    return (
+        f"{header}\n"
+        "const PLAN = {\n"
+        "  phases: [\n"
+        f"{phases}\n"
+        "  ]\n"
+        "};\n"
+        "\n"
+        "// Export for use in main.js\n"
+        "if (typeof module !== 'undefined' && module.exports) {\n"
+        "  module.exports = { PLAN };\n"
+        "}\n"
+    )
+
+
+def bundle_dir(data_dir=DATA_DIR):
+    return os.path.join(data_dir, BUNDLE_SUBDIR)
+
+
+def raw_export_name(phase_id):
+    return 'PHASE_' + phase_id.upper().replace('-', '_')
+
+
+def raw_export_path(phase_id, data_dir=DATA_DIR):
+    return os.path.join(data_dir, f"phase_{phase_id.replace('-', '_')}_raw.js")
+
+
+def render_raw_phase(phase):
+    """Return the text of a phase_<id>_raw.js file."""
+    name = raw_export_name(phase['id'])
+    return (
+        f"const {name} = {render_phase(phase, '    ').lstrip()};\n\n"
+        "if (typeof module !== 'undefined' && module.exports) {\n"
+        f"  module.exports = {name};\n"
+        "}\n"
+    )
+
+
+def compile_outputs(index, plan, output=PLAN_FILE, data_dir=DATA_DIR):
+    """Return {path: text} for every compiled file."""
+    with stage('transform'):
+        outputs = {output: render_plan(index, plan)}
+        phases = {phase['id']: phase for phase in plan['phases']}
+        for phase_id in index.get('rawExports', []):
+            outputs[raw_export_path(phase_id, data_dir)] = render_raw_phase(phases[phase_id])
+        outputs.update(build_bundles(plan, bundle_dir(data_dir), index.get('taskRenames', [])))
+    return outputs
+
+
+def stale_outputs(outputs):
+    """Return the paths whose on-disk content differs from `outputs`."""
+    stale = []
+    for path, text in outputs.items():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != text:
+            stale.append(path)
+    return stale
+
+
+def write_outputs(outputs, paths):
+    with stage('write'):
+        for path in paths:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(outputs[path])
+
+
+def compile_store(store=STORE_DIR, output=PLAN_FILE, data_dir=DATA_DIR):
+    """Compile the store, write the outputs that changed and remove obsolete
+    bundle files. Returns the paths written or removed."""
+    index, plan = load_store(store)
+    outputs = compile_outputs(index, plan, output, data_dir)
+    stale = stale_outputs(outputs)
+    write_outputs(outputs, stale)
+    obsolete = obsolete_bundles(outputs, bundle_dir(data_dir))
+    for path in obsolete:
+        os.remove(path)
+    return stale + obsolete
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--output', default=PLAN_FILE)
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Directory for phase_*_raw.js files')
+    parser.add_argument('--check', action='store_true',
+                        help='Report stale outputs without writing; exit 1 if any')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        index, plan = load_store(args.store)
+        outputs = compile_outputs(index, plan, args.output, args.data_dir)
+        stale = stale_outputs(outputs)
+        stale += obsolete_bundles(outputs, bundle_dir(args.data_dir))
+        for path in stale:
+            print(f"Out of date: {path}")
+        if not stale:
+            print("All compiled outputs are up to date")
+        return 1 if stale else 0
+
+    written = compile_store(args.store, args.output, args.data_dir)
+    for path in written:
+        print(f"{'Wrote' if os.path.exists(path) else 'Removed'} {path}")
+    if not written:
+        print("All compiled outputs are up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Structural diff between two versions of the plan.
+
+Both sides are flattened into records: phases keyed by id, days keyed by
+(phase id, globalDay) and tasks keyed by (phase id, globalDay, index). Each
+record is hashed once over its canonical JSON, so matching is a dict lookup
+per record and the diff runs in time linear in the size of the plans. Only
+records whose hashes differ are compared field by field.
+
+Task records that keep their content but change key (a task inserted above
+them shifts their index) are matched by hash and reported as moved rather
+than as a chain of changed fields.
+
+A side can be a snapshot name or label (plan_snapshots), a planPhases.js
+file, or a store directory; the default new side is the store (data/plan).
+--json prints a machine-readable report whose "affected" section lists the
+phase ids and task ids (in validator/main.js form) that changed, for
+validate_task_details.py --diff and render_phase_pages.py --diff.
+
+Usage:
+    python scripts/plan_diff.py backup_before_cs50ai
+    python scripts/plan_diff.py backup_before_cs50ai assets/js/data/planPhases.js --json -o diff.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import plan_metrics
+import plan_snapshots
+from plan_metrics import stage
+from plan_parser import parse_assignment
+from plan_store import COMMENT_KEY, INDEX_FILE, STORE_DIR, load_store
+
+# Fields that are containers of child records, or not plan content
+_PHASE_SKIP = ('days',)
+_DAY_SKIP = ('tasks', COMMENT_KEY)
+
+
+def load_side(spec, snapshot_store=plan_snapshots.STORE_DIR):
+    """Resolve a diff side to (label, plan)."""
+    if os.path.isdir(spec) and os.path.exists(os.path.join(spec, INDEX_FILE)):
+        return spec, load_store(spec)[1]
+    if os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            return spec, parse_assignment(f.read())
+    manifest = plan_snapshots.load_manifest(spec, snapshot_store)
+    return manifest['name'], plan_snapshots.load_snapshot_plan(manifest, snapshot_store)
+
+
+def _fields(record, skip):
+    return {k: v for k, v in record.items() if k not in skip}
+
+
+def _digest(fields):
+    data = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(data.encode('utf-8')).digest()
+
+
+def flatten(plan, task_fields=None):
+    """Return (phases, days, tasks): ordered {key: (digest, fields)} per level.
+
+    `task_fields` limits the task fields that are compared.
+    """
+    phases, days, tasks = {}, {}, {}
+    for phase in plan.get('phases', []):
+        fields = _fields(phase, _PHASE_SKIP)
+        phases[phase['id']] = (_digest(fields), fields)
+        for day in phase.get('days', []):
+            day_key = (phase['id'], day.get('globalDay'))
+            fields = _fields(day, _DAY_SKIP)
+            days[day_key] = (_digest(fields), fields)
+            for index, task in enumerate(day.get('tasks', [])):
+                if task_fields:
+                    task = {k: task[k] for k in task_fields if k in task}
+                tasks[day_key + (index,)] = (_digest(task), dict(task))
+    return phases, days, tasks
+
+
+def field_changes(old, new):
+    """{field: [old value, new value]} for fields that differ (None if absent)."""
+    return {k: [old.get(k), new.get(k)]
+            for k in list(old) + [k for k in new if k not in old]
+            if old.get(k) != new.get(k) or (k in old) != (k in new)}
+
+
+def diff_records(old, new, match_moves=False):
+    """Diff two {key: (digest, fields)} maps.
+
+    Returns {'added': [key], 'removed': [key], 'changed': [(key, changes)],
+    'moved': [(old_key, new_key)]}, each in new-side (or old-side) order.
+    """
+    old_left = [key for key, (digest, _) in old.items()
+                if key not in new or new[key][0] != digest]
+    new_left = [key for key, (digest, _) in new.items()
+                if key not in old or old[key][0] != digest]
+
+    moved = []
+    moved_from = set()
+    moved_to = set()
+    if match_moves and old_left and new_left:
+        by_digest = {}
+        for key in old_left:
+            by_digest.setdefault(old[key][0], []).append(key)
+        for lst in by_digest.values():
+            lst.reverse()   # pop() takes them in plan order
+        for key in new_left:
+            candidates = by_digest.get(new[key][0])
+            if candidates:
+                source = candidates.pop()
+                moved.append((source, key))
+                moved_from.add(source)
+                moved_to.add(key)
+
+    old_rest = {key for key in old_left if key not in moved_from}
+    changed, added = [], []
+    for key in new_left:
+        if key in moved_to:
+            continue
+        if key in old_rest:
+            changed.append((key, field_changes(old[key][1], new[key][1])))
+        else:
+            added.append(key)
+    new_rest = {key for key in new_left if key not in moved_to}
+    removed = [key for key in old_left if key in old_rest and key not in new_rest]
+    return {'added': added, 'removed': removed, 'changed': changed, 'moved': moved}
+
+
+def diff_plans(old_plan, new_plan, task_fields=None):
+    """Structural diff of two plans; see the module docstring."""
+    old_phases, old_days, old_tasks = flatten(old_plan, task_fields)
+    new_phases, new_days, new_tasks = flatten(new_plan, task_fields)
+    return {
+        'phases': diff_records(old_phases, new_phases),
+        'days': diff_records(old_days, new_days),
+        'tasks': diff_records(old_tasks, new_tasks, match_moves=True),
+    }
+
+
+def task_key_id(key):
+    """Task id for a (phase id, globalDay, index) key, as plan_parser.task_id builds it."""
+    phase_id, global_day, index = key
+    return f"{phase_id}_day{global_day}_task{index}"
+
+
+def changed_task_ids(diff):
+    """New-side ids of tasks that were added, changed or moved."""
+    tasks = diff['tasks']
+    keys = tasks['added'] + [key for key, _ in tasks['changed']] + [new for _, new in tasks['moved']]
+    return [task_key_id(key) for key in keys]
+
+
+def affected_phases(diff):
+    """Ids of phases with any added, removed, changed or moved record."""
+    phases = []
+    for level in ('phases', 'days', 'tasks'):
+        entry = diff[level]
+        keys = entry['added'] + entry['removed'] + [key for key, _ in entry['changed']]
+        keys += [key for pair in entry['moved'] for key in pair]
+        for key in keys:
+            phase_id = key if level == 'phases' else key[0]
+            if phase_id not in phases:
+                phases.append(phase_id)
+    return phases
+
+
+def to_json(diff, old_label='', new_label=''):
+    """The machine-readable report: lists of keys, field changes and the affected ids."""
+    report = {'old': old_label, 'new': new_label}
+    for level, entry in diff.items():
+        report[level] = {
+            'added': [list(key) if isinstance(key, tuple) else key for key in entry['added']],
+            'removed': [list(key) if isinstance(key, tuple) else key for key in entry['removed']],
+            'changed': [{'key': list(key) if isinstance(key, tuple) else key, 'fields': changes}
+                        for key, changes in entry['changed']],
+        }
+        if level == 'tasks':
+            report[level]['moved'] = [{'from': list(old), 'to': list(new)} for old, new in entry['moved']]
+    report['affected'] = {'phases': affected_phases(diff), 'taskIds': changed_task_ids(diff)}
+    return report
+
+
+def load_report(path):
+    """Read a report written by --json; returns the parsed JSON."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _describe(key):
+    if isinstance(key, str):
+        return key
+    text = f"{key[0]} day {key[1]}"
+    return text + f" task {key[2]}" if len(key) > 2 else text
+
+
+def _short(value, width=60, start=0):
+    text = json.dumps(value, ensure_ascii=False)
+    if start > 0:
+        text = '...' + text[start:]
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def _first_difference(old, new):
+    if not (isinstance(old, str) and isinstance(new, str)):
+        return 0
+    common = len(os.path.commonprefix([old, new]))
+    # Leave some context before the first differing character
+    return max(0, common - 20)
+
+
+def print_diff(diff, verbose=False):
+    for level, entry in diff.items():
+        counts = ', '.join(f"{len(entry[kind])} {kind}" for kind in ('added', 'removed', 'changed', 'moved')
+                           if entry[kind])
+        print(f"{level.capitalize()}: {counts or 'no changes'}")
+        for key in entry['added']:
+            print(f"  + {_describe(key)}")
+        for key in entry['removed']:
+            print(f"  - {_describe(key)}")
+        for key, changes in entry['changed']:
+            print(f"  ~ {_describe(key)}: {', '.join(changes)}")
+            if verbose:
+                for field, (old, new) in changes.items():
+                    start = _first_difference(old, new)
+                    print(f"      {field}: {_short(old, start=start)} -> {_short(new, start=start)}")
+        for old, new in entry['moved']:
+            print(f"  > {_describe(old)} -> {_describe(new)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('old', help='Snapshot name or label, planPhases.js file or store directory')
+    parser.add_argument('new', nargs='?', default=STORE_DIR, help=f"Same (default: {STORE_DIR})")
+    parser.add_argument('--snapshots', default=plan_snapshots.STORE_DIR, help='Snapshot store directory')
+    parser.add_argument('--fields', help='Only compare these task fields, comma-separated')
+    parser.add_argument('--json', action='store_true', help='Print the machine-readable report')
+    parser.add_argument('--output', '-o', help='Write the JSON report to this file')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show old and new field values')
+    args = parser.parse_args(argv)
+
+    try:
+        old_label, old_plan = load_side(args.old, args.snapshots)
+        new_label, new_plan = load_side(args.new, args.snapshots)
+    except KeyError as e:
+        parser.error(e.args[0])
+    task_fields = args.fields.split(',') if args.fields else None
+    with stage('transform'):
+        diff = diff_plans(old_plan, new_plan, task_fields)
+
+    if args.json or args.output:
+        report = json.dumps(to_json(diff, old_label, new_label), ensure_ascii=False, indent=1)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(report + '\n')
+        else:
+            print(report)
+    if not args.json:
+        print(f"{old_label} -> {new_label}")
+        print_diff(diff, args.verbose)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Find tasks whose details are near-duplicates of each other.
+
+Each task's details are stripped to text (extract_text_from_html) and cut
+into shingles of SHINGLE_WORDS consecutive words. Tasks with identical
+shingle sets are grouped straight away; every distinct set gets a MinHash
+signature of BANDS * ROWS values, and locality-sensitive hashing puts two
+sets in the same bucket when any band of ROWS values matches. Only pairs
+that share a bucket are compared exactly (Jaccard similarity of their
+shingle sets), so the work grows with the number of tasks rather than with
+the number of pairs. Pairs at or above the threshold are merged into
+clusters.
+
+With 20 bands of 5 rows a pair at similarity 0.8 shares a bucket with
+probability 0.9996, and one at 0.5 with probability 0.47; pairs below the
+threshold that do become candidates are dropped by the exact check.
+
+Usage:
+    python scripts/plan_duplicates.py                     # the store (data/plan)
+    python scripts/plan_duplicates.py backup_before_cs50ai --threshold 0.9
+    python scripts/plan_duplicates.py /tmp/plan10.js --json -o duplicates.json
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+from array import array
+
+import plan_metrics
+from plan_diff import load_side
+from plan_parser import iter_tasks
+from plan_store import STORE_DIR
+from plan_html import extract_text_from_html
+
+SHINGLE_WORDS = 5
+BANDS = 20
+ROWS = 5
+THRESHOLD = 0.8
+
+_WORD_RE = re.compile(r'\w+')
+_MASK = (1 << 64) - 1
+_WORD_HASHES = {}
+
+
+def _word_hash(word):
+    value = _WORD_HASHES.get(word)
+    if value is None:
+        value = _WORD_HASHES[word] = int.from_bytes(
+            hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+    return value
+
+
+def shingles(text, k=SHINGLE_WORDS):
+    """Set of 64-bit hashes of the k-word shingles of `text` (one shingle if shorter)."""
+    words = [_word_hash(word) for word in _WORD_RE.findall(text.lower())]
+    if not words:
+        return frozenset()
+    if len(words) < k:
+        return frozenset([hash(tuple(words)) & _MASK])
+    # Hashes of tuples of ints don't depend on PYTHONHASHSEED
+    return frozenset(hash(gram) & _MASK for gram in zip(*(words[i:] for i in range(k))))
+
+
+class MinHasher:
+    """One-permutation MinHash signatures of `num_hashes` values.
+
+    Each shingle hash is sent to one of `num_hashes` bins by its low part and
+    each bin keeps the minimum of the high parts, so a signature costs one
+    pass over the shingles. An empty bin borrows from the next non-empty bin
+    (circularly), tagged with the distance, which keeps signatures of
+    similar sets agreeing on the same bins.
+    """
+
+    def __init__(self, num_hashes=BANDS * ROWS, seed=0):
+        self.num_hashes = num_hashes
+        self.mask = random.Random(seed).getrandbits(64)
+
+    def signature(self, hashes):
+        n = self.num_hashes
+        bins = [None] * n
+        for value in hashes:
+            value ^= self.mask
+            high, low = divmod(value, n)
+            current = bins[low]
+            if current is None or high < current:
+                bins[low] = high
+        if None in bins:
+            # Walking the ring backwards twice, `nearest` is the first
+            # filled bin at or after i
+            dense = list(bins)
+            nearest = None
+            for i in range(2 * n - 1, -1, -1):
+                if bins[i % n] is not None:
+                    nearest = i
+                elif i < n:
+                    dense[i] = bins[nearest % n] + ((nearest - i) << 64)
+            bins = dense
+        return bins
+
+
+def band_keys(signature, bands=BANDS, rows=ROWS):
+    """One 64-bit key per band of `signature`."""
+    return array('q', (hash(tuple(signature[band * rows:(band + 1) * rows])) for band in range(bands)))
+
+
+def lsh_candidates(keys, bands=BANDS):
+    """Pairs (i, j), i < j, whose band keys agree on some band."""
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        for i, row in enumerate(keys):
+            buckets.setdefault(row[band], []).append(i)
+        for members in buckets.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]))
+    return pairs
+
+
+def jaccard(a, b):
+    a, b = set(a), set(b)
+    return len(a & b) / len(a | b)
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicates(plan, threshold=THRESHOLD, k=SHINGLE_WORDS, bands=BANDS, rows=ROWS, seed=0):
+    """Cluster tasks whose details are at least `threshold` similar.
+
+    Returns (clusters, stats). Each cluster is {'similarity': lowest verified
+    similarity, 'tasks': [(phase id, globalDay, index, label), ...]} in plan
+    order; clusters are sorted largest first. stats counts tasks, distinct
+    shingle sets, LSH candidate pairs and verified pairs, with timings.
+    """
+    # Shingle sets are kept as sorted arrays and signatures only as band
+    # keys, so memory stays at a few bytes per shingle
+    timings = {'shingle': 0.0, 'minhash': 0.0}
+    hasher = MinHasher(bands * rows, seed)
+    sets = []        # distinct shingle sets
+    keys = []        # their band keys
+    members = []     # tasks per distinct set
+    seen = {}
+    tasks = 0
+    for phase, day, index, task in iter_tasks(plan):
+        if not task.get('details'):
+            continue
+        started = time.perf_counter()
+        hashes = shingles(extract_text_from_html(task['details']), k)
+        timings['shingle'] += time.perf_counter() - started
+        if not hashes:
+            continue
+        tasks += 1
+        ref = (phase['id'], day.get('globalDay'), index, task.get('label', ''))
+        packed = array('Q', sorted(hashes))
+        digest = hashlib.blake2b(packed.tobytes(), digest_size=16).digest()
+        if digest in seen:
+            members[seen[digest]].append(ref)
+            continue
+        seen[digest] = len(sets)
+        sets.append(packed)
+        members.append([ref])
+        started = time.perf_counter()
+        keys.append(band_keys(hasher.signature(hashes), bands, rows))
+        timings['minhash'] += time.perf_counter() - started
+
+    started = time.perf_counter()
+    candidates = lsh_candidates(keys, bands)
+    timings['lsh'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parent = list(range(len(sets)))
+    lowest = {}
+    verified = 0
+    for i, j in sorted(candidates):
+        similarity = jaccard(sets[i], sets[j])
+        if similarity < threshold:
+            continue
+        verified += 1
+        a, b = _find(parent, i), _find(parent, j)
+        if a != b:
+            parent[b] = a
+            lowest[a] = min(lowest.get(a, 1.0), lowest.pop(b, 1.0), similarity)
+        else:
+            lowest[a] = min(lowest.get(a, 1.0), similarity)
+
+    groups = {}
+    for i in range(len(sets)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    clusters = []
+    for root, nodes in groups.items():
+        refs = [ref for node in nodes for ref in members[node]]
+        if len(refs) > 1:
+            clusters.append({'similarity': lowest.get(root, 1.0), 'tasks': refs})
+    order = {}
+    for phase, day, index, _ in iter_tasks(plan):
+        order[(phase['id'], day.get('globalDay'), index)] = len(order)
+    for cluster in clusters:
+        cluster['tasks'].sort(key=lambda ref: order[ref[:3]])
+    clusters.sort(key=lambda c: (-len(c['tasks']), order[c['tasks'][0][:3]]))
+    timings['verify'] = time.perf_counter() - started
+
+    stats = {'tasks': tasks, 'distinct': len(sets), 'candidates': len(candidates),
+             'verified': verified, 'timings': timings}
+    return clusters, stats
+
+
+def to_json(clusters, stats, label=''):
+    return {
+        'plan': label,
+        'stats': {k: v for k, v in stats.items() if k != 'timings'},
+        'clusters': [{'similarity': round(c['similarity'], 4),
+                      'tasks': [{'phase': p, 'day': d, 'index': i, 'label': l} for p, d, i, l in c['tasks']]}
+                     for c in clusters],
+    }
+
+
+def print_clusters(clusters, stats, limit=None):
+    timings = stats['timings']
+    print(f"Tasks with details: {stats['tasks']} ({stats['distinct']} distinct), "
+          f"candidate pairs: {stats['candidates']}, similar pairs: {stats['verified']}")
+    print("  " + ', '.join(f"{name} {seconds:.2f}s" for name, seconds in timings.items()))
+    duplicated = sum(len(c['tasks']) for c in clusters)
+    print(f"Clusters: {len(clusters)} covering {duplicated} task(s)")
+    for cluster in clusters[:limit]:
+        print(f"\n  {len(cluster['tasks'])} tasks, similarity >= {cluster['similarity']:.2f}")
+        for phase_id, global_day, index, label in cluster['tasks']:
+            print(f"    {phase_id} day {global_day} task {index}: {label[:70]}")
+    if limit is not None and len(clusters) > limit:
+        print(f"\n  ... {len(clusters) - limit} more (--limit 0 for all)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('plan', nargs='?', default=STORE_DIR,
+                        help=f"Store directory, planPhases.js file or snapshot (default: {STORE_DIR})")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='Minimum Jaccard similarity')
+    parser.add_argument('--shingle-words', type=int, default=SHINGLE_WORDS)
+    parser.add_argument('--bands', type=int, default=BANDS)
+    parser.add_argument('--rows', type=int, default=ROWS)
+    parser.add_argument('--limit', type=int, default=20, help='Clusters to list (0 for all)')
+    parser.add_argument('--json', action='store_true', help='Print the clusters as JSON')
+    parser.add_argument('--output', '-o', help='Write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    try:
+        label, plan = load_side(args.plan)
+    except KeyError as e:
+        parser.error(e.args[0])
+    clusters, stats = find_duplicates(plan, args.threshold, args.shingle_words, args.bands, args.rows)
+    for name, seconds in stats['timings'].items():
+        plan_metrics.record(name, seconds)
+
+    if args.json or args.output:
+        report = json.dumps(to_json(clusters, stats, label), ensure_ascii=False, indent=1)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(report + '\n')
+        else:
+            print(report)
+    if not args.json:
+        print_clusters(clusters, stats, args.limit or None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
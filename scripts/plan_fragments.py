@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Fragment interning for the task details shipped to the site.
+
+Generated details repeat the same sentences, section headers and resource
+anchors across hundreds of tasks. Each details string is split into
+fragments (anchors with their trailing separator, <strong> headers,
+sentences, and the text between them); fragments that occur at least
+MIN_COUNT times and are at least MIN_LENGTH characters long go into one
+shared table. Each details string is then encoded as a list of table
+indices and literal strings, or left as a plain string when nothing in it
+is shared.
+
+Indices are stable across builds: the table is carried over from the
+previous build, a fragment keeps its index for as long as any details still
+use it, and new fragments take the slots freed by fragments that are no
+longer used (null until then) or are appended, most frequent first. So an
+edit to one task only re-encodes chunks whose details contain a fragment
+that the edit made shared, not every chunk.
+
+    ["<strong>Action:</strong> ", "Implement a", 3, 17]   ->  fragments[3] ...
+
+plan_bundles.py writes the table to details/fragments.json and encodes the
+details chunks with it; main.js (expandDetails) joins the parts back when a
+task's details are shown.
+
+Usage:
+    python scripts/plan_fragments.py      # report the savings on the store
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+
+import plan_metrics
+from plan_metrics import stage
+from plan_parser import iter_tasks
+from plan_store import load_store
+
+MIN_LENGTH = 16
+MIN_COUNT = 2
+
+_FRAGMENT_RE = re.compile(r'''
+      <a\b[^>]*>.*?</a>(?:,\s*|\s+)?     # an anchor and the separator after it
+    | <strong>[^<]*</strong>\s*          # a section header
+    | [^<]*?[.!?](?=\s|$)\s*             # a sentence
+    | [^<]+                              # text up to the next tag
+    | <                                  # any other tag starts here
+''', re.VERBOSE | re.DOTALL)
+
+
+def split_fragments(text):
+    """Split details HTML into fragments that join back to `text` exactly."""
+    return _FRAGMENT_RE.findall(text)
+
+
+def build_table(texts, previous=None, min_length=MIN_LENGTH, min_count=MIN_COUNT):
+    """Return the shared fragment table for `texts`.
+
+    `previous` is the table of the previous build: its fragments that are
+    still used keep their indices, and unused slots are set to None and
+    filled by new fragments before the table grows.
+    """
+    counts = Counter()
+    for text in texts:
+        counts.update(fragment for fragment in split_fragments(text) if len(fragment) >= min_length)
+    table = [fragment if fragment in counts else None for fragment in previous or []]
+    kept = set(table)
+    new = [fragment for fragment, count in counts.items() if count >= min_count and fragment not in kept]
+    # Ties broken by length then text, so the table is deterministic
+    new.sort(key=lambda fragment: (-counts[fragment], -len(fragment), fragment))
+    free = (i for i, fragment in enumerate(table) if fragment is None)
+    for fragment in new:
+        i = next(free, None)
+        if i is None:
+            table.append(fragment)
+        else:
+            table[i] = fragment
+    while table and table[-1] is None:
+        table.pop()
+    return table
+
+
+class FragmentEncoder:
+    """Encodes details strings against a fragment table."""
+
+    def __init__(self, table):
+        self.table = table
+        self._index = {fragment: i for i, fragment in enumerate(table) if fragment is not None}
+
+    def encode(self, text):
+        """Return `text` as [index or literal, ...], or unchanged if nothing is shared."""
+        parts = []
+        shared = False
+        for fragment in split_fragments(text):
+            i = self._index.get(fragment)
+            if i is not None:
+                parts.append(i)
+                shared = True
+            elif parts and isinstance(parts[-1], str):
+                parts[-1] += fragment
+            else:
+                parts.append(fragment)
+        return parts if shared else text
+
+
+def decode(value, table):
+    """Inverse of FragmentEncoder.encode (main.js expandDetails does the same)."""
+    if isinstance(value, str):
+        return value
+    return ''.join(table[part] if isinstance(part, int) else part for part in value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--min-length', type=int, default=MIN_LENGTH)
+    parser.add_argument('--min-count', type=int, default=MIN_COUNT)
+    args = parser.parse_args(argv)
+
+    _, plan = load_store()
+    texts = [task['details'] for _, _, _, task in iter_tasks(plan) if task.get('details')]
+    with stage('transform'):
+        table = build_table(texts, min_length=args.min_length, min_count=args.min_count)
+        encoder = FragmentEncoder(table)
+        encoded = [encoder.encode(text) for text in texts]
+    assert all(decode(value, table) == text for value, text in zip(encoded, texts))
+
+    def size(value):
+        return len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    plain = sum(size(text) for text in texts)
+    compact = sum(size(value) for value in encoded)
+    print(f"Details: {len(texts)}, shared fragments: {len(table)} ({size(table):,} bytes)")
+    print(f"  plain {plain:,} bytes, encoded {compact:,} bytes + table = {compact + size(table):,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tokenizer for the HTML in task details, shared by the validator, the link
+tools, the duplicate finder and the search index.
+
+Details use a small, regular subset of HTML (<strong>, <a>, <code> and a
+few entities), so one regex split separates text from tags; no HTML parser
+is involved.
+"""
+
+import re
+
+# Tags (closing slash, name, raw attributes) or comments; re.split() with this
+# pattern tokenizes a whole details string in one C-level pass, giving
+# [text, slash, name, attrs, text, slash, name, attrs, ..., text]. A '<' that
+# does not start a tag (as in "P(X < value)") stays in the text.
+_HTML_TAG_RE = re.compile(r'<(/?)([A-Za-z][A-Za-z0-9]*|!)([^>]*)>')
+_ATTR_RE = re.compile(r'([A-Za-z_:][-\w:.]*)\s*=\s*"([^"]*)"')
+_ENTITY_RE = re.compile(r'&(?:nbsp|amp|lt|gt|quot|#39);')
+_ENTITIES = {
+    '&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&#39;': "'",
+}
+
+
+def scan_html(html):
+    """Walk details HTML once.
+
+    Returns (text, strong_headers, links): the tag-stripped text with entities
+    decoded, the set of texts inside <strong> elements, and a list of
+    (attrs, anchor_text) for each <a> element.
+    """
+    parts = _HTML_TAG_RE.split(html)
+    text = ''.join(parts[0::4])
+    if '&' in text:
+        text = _ENTITY_RE.sub(lambda m: _ENTITIES[m.group()], text)
+
+    headers = set()
+    links = []
+    strong_at = None
+    anchor_at = None
+    anchor_attrs = None
+    # Tag j occupies parts[4j+1:4j+4]; the text after it is parts[4j+4]
+    for j, name in enumerate(parts[2::4]):
+        name = name.lower()
+        if name != 'strong' and name != 'a':
+            continue
+        closing = parts[4 * j + 1]
+        if name == 'strong':
+            if not closing:
+                strong_at = j
+            elif strong_at is not None:
+                headers.add(''.join(parts[4 * strong_at + 4:4 * j + 4:4]))
+                strong_at = None
+        elif not closing:
+            anchor_at = j
+            anchor_attrs = dict(_ATTR_RE.findall(parts[4 * j + 3]))
+        elif anchor_at is not None:
+            links.append((anchor_attrs, ''.join(parts[4 * anchor_at + 4:4 * j + 4:4])))
+            anchor_at = None
+    return text, headers, links
+
+
+def extract_text_from_html(html):
+    """Extract plain text from HTML, removing tags."""
+    return scan_html(html)[0]
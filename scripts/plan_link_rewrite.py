@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Rule-driven bulk rewriting of links in task details.
+
+Every <a> element in every task's details is indexed once into a link table
+(task, position, source span, href, attributes, text). Rules are indexed by
+the domains they match, so each link is only tested against the rules that
+can apply to it. All rules are applied in one pass over the table, each
+task's details are rebuilt once, and the store is written and recompiled
+once at the end: the cost is linear in the number of links, however many
+rules there are.
+
+A rules file is a JSON list; each rule has a "match" and one or more actions,
+applied in file order (a rule sees the link as earlier rules left it):
+
+    {"name": "https",
+     "match": {"url": "http://*"},                         # fnmatch glob, or "re:<regex>"
+     "href": {"pattern": "^http://", "replace": "https://"}}
+    {"match": {"domain": "pytorch.org"},                   # host or any subdomain
+     "set": {"target": "_blank"}, "rel": ["noopener"]}     # set/replace (null removes), add rel tokens
+    {"match": {"text": "Tensor Tutorial", "last": true},   # anchor text; last link of its task
+     "insert_after": {"href": "https://...", "text": "torch Package Documentation"}}
+
+Other matchers: "tag" (the task's kind, as generate_all_details.TASK_KINDS
+classifies its label, e.g. "review" or "notebook") and "phase" (phase id).
+insert_after adds a link (target="_blank" rel="noopener" unless "attrs" is
+given) unless the task already links to that URL.
+
+Usage:
+    python scripts/plan_link_rewrite.py rules.json [--dry-run] [--verbose]
+
+    from plan_link_rewrite import compile_rules, rewrite_plan
+    edits, stats = rewrite_plan(plan, compile_rules(rules))
+"""
+
+import argparse
+import fnmatch
+import html
+import json
+import re
+import sys
+from urllib.parse import urlsplit
+
+import plan_metrics
+from generate_all_details import TASK_KINDS
+from plan_compile import compile_store
+from plan_metrics import stage
+from plan_parser import iter_tasks, task_id
+from plan_patch import print_report
+from plan_snapshots import take_snapshot
+from plan_store import STORE_DIR, load_store, save_store, update_tasks
+
+_ANCHOR_RE = re.compile(r'<a\b([^>]*)>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+_ATTR_RE = re.compile(r'([A-Za-z_:][-\w:.]*)\s*=\s*"([^"]*)"')
+_TAG_RE = re.compile(r'<[^>]*>')
+
+_MATCHERS = ('url', 'domain', 'tag', 'phase', 'text', 'last')
+_ACTIONS = ('set', 'rel', 'href', 'insert_after')
+INSERT_SEPARATOR = ', '
+DEFAULT_INSERT_ATTRS = {'target': '_blank', 'rel': 'noopener'}
+
+
+class Link:
+    """One <a> element in a task's details; `attrs` and `text` are editable."""
+
+    __slots__ = ('task_key', 'position', 'start', 'end', 'raw_attrs', 'attrs', 'inner',
+                 'text', 'host', 'last', 'editable', 'insert')
+
+    def __init__(self, task_key, position, match):
+        self.task_key = task_key
+        self.position = position
+        self.start, self.end = match.span()
+        self.raw_attrs = match.group(1)
+        self.attrs = dict(_ATTR_RE.findall(self.raw_attrs))
+        self.inner = match.group(2)
+        self.text = html.unescape(_TAG_RE.sub('', self.inner)).strip()
+        self.host = (urlsplit(self.attrs.get('href', '')).hostname or '').lower()
+        self.last = False
+        # Attributes that are not double-quoted can't be rewritten faithfully
+        self.editable = not _ATTR_RE.sub('', self.raw_attrs).strip()
+        self.insert = []
+
+    def open_tag(self):
+        return _open_tag(self.attrs)
+
+
+def _open_tag(attrs):
+    parts = ['<a']
+    for name, value in attrs.items():
+        # Values are kept as they appear in the source (entities and all),
+        # so only the quote character needs escaping
+        value = value.replace('"', '&quot;')
+        parts.append(f' {name}="{value}"')
+    parts.append('>')
+    return ''.join(parts)
+
+
+def link_table(plan):
+    """Return (table, tasks): every link in plan order, and {task_key: (phase, day, task)}."""
+    table = []
+    tasks = {}
+    for phase, day, index, task in iter_tasks(plan):
+        details = task.get('details')
+        if not details or '<a' not in details:
+            continue
+        key = task_id(phase, day, index)
+        links = [Link(key, position, match)
+                 for position, match in enumerate(_ANCHOR_RE.finditer(details))]
+        if links:
+            links[-1].last = True
+            table.extend(links)
+            tasks[key] = (phase, day, task)
+    return table, tasks
+
+
+class LinkRule:
+    """A compiled rule: matchers plus actions."""
+
+    def __init__(self, spec, number=0):
+        self.number = number
+        self.name = spec.get('name') or f"rule {number + 1}"
+        match = spec.get('match', {})
+        unknown = set(match) - set(_MATCHERS)
+        if unknown:
+            raise ValueError(f"{self.name}: unknown matcher(s) {', '.join(sorted(unknown))}")
+        if not any(action in spec for action in _ACTIONS):
+            raise ValueError(f"{self.name}: no action (one of {', '.join(_ACTIONS)})")
+
+        url = match.get('url')
+        if url is None:
+            self.url = None
+        elif url.startswith('re:'):
+            self.url = re.compile(url[3:]).search
+        else:
+            self.url = re.compile(fnmatch.translate(url)).match
+        domain = match.get('domain')
+        self.domains = [d.lower() for d in ([domain] if isinstance(domain, str) else domain or [])]
+        self.tag = match.get('tag')
+        self.phase = match.get('phase')
+        self.text = match.get('text')
+        self.last = match.get('last')
+
+        self.set = spec.get('set', {})
+        self.rel = spec.get('rel', [])
+        href = spec.get('href')
+        self.href = (re.compile(href['pattern']), href['replace']) if href else None
+        self.insert_after = spec.get('insert_after')
+        self.links = 0
+        self.tasks = set()
+
+    def matches(self, link, phase, tag):
+        if self.last is not None and link.last != self.last:
+            return False
+        if self.text is not None and link.text != self.text:
+            return False
+        if self.phase is not None and phase['id'] != self.phase:
+            return False
+        if self.url is not None and not self.url(link.attrs.get('href', '')):
+            return False
+        if self.tag is not None and tag() != self.tag:
+            return False
+        return True
+
+    def apply(self, link, task_hrefs):
+        """Apply the actions to `link`; returns True if anything changed."""
+        changed = False
+        if link.editable:
+            for name, value in self.set.items():
+                if value is None:
+                    changed |= link.attrs.pop(name, None) is not None
+                elif link.attrs.get(name) != value:
+                    link.attrs[name] = value
+                    changed = True
+            if self.rel:
+                tokens = link.attrs.get('rel', '').split()
+                missing = [token for token in self.rel if token not in tokens]
+                if missing:
+                    link.attrs['rel'] = ' '.join(tokens + missing)
+                    changed = True
+            if self.href and 'href' in link.attrs:
+                pattern, replace = self.href
+                new_href = pattern.sub(replace, link.attrs['href'], count=1)
+                if new_href != link.attrs['href']:
+                    task_hrefs.add(new_href)
+                    link.attrs['href'] = new_href
+                    changed = True
+        if self.insert_after and self.insert_after['href'] not in task_hrefs:
+            task_hrefs.add(self.insert_after['href'])
+            link.insert.append(self.insert_after)
+            changed = True
+        return changed
+
+
+def compile_rules(specs):
+    return [LinkRule(spec, number) for number, spec in enumerate(specs)]
+
+
+def load_rules(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return compile_rules(json.load(f))
+
+
+class _RuleIndex:
+    """Rule numbers by domain, so a link only meets rules that can match its host."""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.generic = []
+        self.by_domain = {}
+        for number, rule in enumerate(rules):
+            if rule.domains:
+                for domain in rule.domains:
+                    self.by_domain.setdefault(domain, []).append(number)
+            else:
+                self.generic.append(number)
+        self._cache = {}
+
+    def candidates(self, host):
+        if host not in self._cache:
+            numbers = list(self.generic)
+            labels = host.split('.')
+            for i in range(len(labels)):
+                numbers += self.by_domain.get('.'.join(labels[i:]), [])
+            self._cache[host] = [self.rules[n] for n in sorted(set(numbers))]
+        return self._cache[host]
+
+
+def _render_insert(spec):
+    attrs = dict(spec.get('attrs', DEFAULT_INSERT_ATTRS))
+    attrs = {'href': spec['href'], **{k: v for k, v in attrs.items() if k != 'href'}}
+    return f"{INSERT_SEPARATOR}{_open_tag(attrs)}{html.escape(spec['text'], quote=False)}</a>"
+
+
+def _rebuild(details, links):
+    parts = []
+    pos = 0
+    for link in links:
+        parts.append(details[pos:link.start])
+        if link.editable and link.attrs != dict(_ATTR_RE.findall(link.raw_attrs)):
+            parts.append(link.open_tag() + link.inner + '</a>')
+        else:
+            parts.append(details[link.start:link.end])
+        parts.extend(_render_insert(spec) for spec in link.insert)
+        pos = link.end
+    parts.append(details[pos:])
+    return ''.join(parts)
+
+
+def rewrite_plan(plan, rules):
+    """Apply `rules` to every link in one pass.
+
+    Returns (edits, stats): (task_id, 'details', new details) edits for
+    update_tasks, and {'links': n, 'rewritten': n, 'skipped': n}. Each rule's
+    `links` and `tasks` record what it changed.
+    """
+    table, tasks = link_table(plan)
+    index = _RuleIndex(rules)
+    stats = {'links': len(table), 'rewritten': 0, 'skipped': 0}
+    edits = []
+
+    start = 0
+    while start < len(table):
+        key = table[start].task_key
+        end = start
+        while end < len(table) and table[end].task_key == key:
+            end += 1
+        links = table[start:end]
+        start = end
+
+        phase, _, task = tasks[key]
+        task_hrefs = {link.attrs.get('href') for link in links}
+        kind = []
+
+        def tag():
+            if not kind:
+                kind.append(TASK_KINDS.classify(task.get('label', '')))
+            return kind[0]
+
+        changed = False
+        for link in links:
+            link_changed = False
+            candidates = index.candidates(link.host)
+            applied = -1
+            i = 0
+            while i < len(candidates):
+                rule = candidates[i]
+                i += 1
+                if rule.number <= applied:
+                    continue
+                applied = rule.number
+                if rule.matches(link, phase, tag) and rule.apply(link, task_hrefs):
+                    rule.links += 1
+                    rule.tasks.add(key)
+                    link_changed = True
+                    host = (urlsplit(link.attrs.get('href', '')).hostname or '').lower()
+                    if host != link.host:
+                        # Later rules are looked up by the rewritten URL's domain
+                        link.host = host
+                        candidates = index.candidates(host)
+                        i = 0
+            if not link.editable:
+                stats['skipped'] += 1
+            stats['rewritten'] += link_changed
+            changed |= link_changed
+        if changed:
+            new_details = _rebuild(task['details'], links)
+            if new_details != task['details']:
+                edits.append((key, 'details', new_details))
+    return edits, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('rules', help='JSON rules file')
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List the tasks each rule changed')
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules)
+    index, plan = load_store(args.store)
+    with stage('transform'):
+        edits, stats = rewrite_plan(plan, rules)
+
+    print(f"Links: {stats['links']}, rewritten: {stats['rewritten']}, tasks changed: {len(edits)}")
+    if stats['skipped']:
+        print(f"  {stats['skipped']} link(s) with unquoted attributes were left as they are")
+    for rule in rules:
+        print(f"  {rule.name}: {rule.links} link(s) in {len(rule.tasks)} task(s)")
+        if args.verbose:
+            for key in sorted(rule.tasks):
+                print(f"      {key}")
+    if args.dry_run or not edits:
+        return 0
+
+    snapshot = take_snapshot('before-link-rewrite', args.store)
+    report = update_tasks(plan, edits)
+    changed = save_store(index, plan, args.store)
+    compiled = compile_store(store=args.store)
+    print_report(report)
+    print(f"  Phase files changed: {', '.join(changed) or 'none'}")
+    print(f"  Compiled: {len(compiled)} file(s)")
+    print(f"  Snapshot: {snapshot['name']}")
+    return 1 if report['conflicts'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Link inventory and link checker for task details in the plan store.
+
+inventory  every <a href> in every task's details, deduplicated by URL,
+           with the tasks it occurs in and its position among that task's
+           links (occurrence index)
+check      checks each distinct URL once, concurrently with asyncio. Requests
+           go over a small HTTP/1.1 client that keeps connections alive and
+           reuses them per host, with limits on total and per-host
+           concurrency. HEAD is tried first, then GET where HEAD is refused.
+           Results are cached in .link_cache.json: working links for --ttl
+           days, failures for --failure-ttl hours.
+
+--endpoint sends every request to one plain-HTTP server instead, with the
+original URL as the request target (proxy form), so the checker can be run
+against a forwarding proxy or the local stand-in server
+(link_stub_server.py); --stub starts that server in-process.
+
+Usage:
+    python scripts/plan_links.py inventory [--json] [-o links.json]
+    python scripts/plan_links.py check [--concurrency 16] [--per-host 4]
+    python scripts/plan_links.py check --stub --stub-status https://example.com/gone=404
+"""
+
+import argparse
+import asyncio
+import json
+import ssl
+import sys
+import time
+from urllib.parse import urldefrag, urlsplit
+
+import plan_metrics
+from link_stub_server import parse_status, start_server
+from plan_metrics import stage
+from plan_parser import iter_tasks, task_id
+from plan_store import STORE_DIR, load_store
+from plan_html import scan_html
+
+CACHE_FILE = '.link_cache.json'
+USER_AGENT = 'learning-plan-link-checker/1.0'
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_TTL_DAYS = 7.0
+DEFAULT_FAILURE_TTL_HOURS = 1.0
+# Bodies larger than this are not drained; the connection is dropped instead
+MAX_DRAIN_BYTES = 256 * 1024
+# Statuses that mean "HEAD not supported here, try GET"
+_RETRY_WITH_GET = {403, 405, 501}
+
+
+def build_inventory(plan):
+    """Return {url: [(task_id, occurrence_index, anchor_text), ...]} in plan order.
+
+    occurrence_index is the link's position among its task's links.
+    """
+    inventory = {}
+    for phase, day, index, task in iter_tasks(plan):
+        details = task.get('details')
+        if not details:
+            continue
+        key = task_id(phase, day, index)
+        _, _, links = scan_html(details)
+        position = 0
+        for attrs, text in links:
+            url = attrs.get('href')
+            if not url:
+                continue
+            inventory.setdefault(url, []).append((key, position, text))
+            position += 1
+    return inventory
+
+
+def checkable_urls(inventory):
+    """Distinct http(s) URLs to check (fragments dropped), in first-seen order."""
+    urls = {}
+    for url in inventory:
+        target = urldefrag(url)[0]
+        if urlsplit(target).scheme in ('http', 'https'):
+            urls.setdefault(target, None)
+    return list(urls)
+
+
+class _Response:
+    __slots__ = ('status', 'headers', 'reusable')
+
+    def __init__(self, status, headers, reusable):
+        self.status = status
+        self.headers = headers
+        self.reusable = reusable
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections per origin, and a cap on connections per origin."""
+
+    def __init__(self, per_host, endpoint=None):
+        self.per_host = per_host
+        self.endpoint = urlsplit(endpoint) if endpoint else None
+        self._idle = {}
+        self._limits = {}
+        self._ssl = None
+        self.opened = 0
+
+    def origin(self, url):
+        if self.endpoint:
+            parts = self.endpoint
+        else:
+            parts = urlsplit(url)
+        default_port = 443 if parts.scheme == 'https' else 80
+        return parts.scheme, parts.hostname, parts.port or default_port
+
+    def limit(self, origin):
+        if origin not in self._limits:
+            self._limits[origin] = asyncio.Semaphore(self.per_host)
+        return self._limits[origin]
+
+    async def acquire(self, origin):
+        """Return (reader, writer, reused)."""
+        idle = self._idle.get(origin)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = origin
+        if scheme == 'https' and self._ssl is None:
+            self._ssl = ssl.create_default_context()
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if scheme == 'https' else None)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, origin, reader, writer, reusable):
+        if reusable:
+            self._idle.setdefault(origin, []).append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle.clear()
+
+
+async def _read_response(reader, method):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError('connection closed before a response')
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise ValueError(f"bad status line {status_line[:80]!r}")
+    version, status = parts[0], int(parts[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get('connection', '').lower()
+    reusable = connection != 'close' and (version != 'HTTP/1.0' or connection == 'keep-alive')
+    if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+        return _Response(status, headers, reusable)
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        drained = 0
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            drained += size
+            if drained > MAX_DRAIN_BYTES:
+                return _Response(status, headers, False)
+            await reader.readexactly(size + 2)
+    elif 'content-length' in headers:
+        length = int(headers['content-length'])
+        if length > MAX_DRAIN_BYTES:
+            return _Response(status, headers, False)
+        await reader.readexactly(length)
+    else:
+        # Body runs to the end of the connection
+        return _Response(status, headers, False)
+    return _Response(status, headers, reusable)
+
+
+class LinkChecker:
+    """Checks URLs concurrently over reused connections."""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST,
+                 timeout=DEFAULT_TIMEOUT, endpoint=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.pool = _ConnectionPool(per_host, endpoint)
+        self.requests = 0
+
+    async def _request(self, method, url):
+        parts = urlsplit(url)
+        origin = self.pool.origin(url)
+        if self.pool.endpoint:
+            target = url
+        else:
+            target = parts.path or '/'
+            if parts.query:
+                target += '?' + parts.query
+        request = (f"{method} {target} HTTP/1.1\r\n"
+                   f"Host: {parts.netloc}\r\n"
+                   f"User-Agent: {USER_AGENT}\r\n"
+                   "Accept: */*\r\n"
+                   "Connection: keep-alive\r\n\r\n").encode('latin-1')
+        async with self.pool.limit(origin):
+            # A reused connection may have been closed by the server since;
+            # retry once on a fresh one
+            for attempt in range(2):
+                reader, writer, reused = await self.pool.acquire(origin)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    self.requests += 1
+                    response = await _read_response(reader, method)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                self.pool.release(origin, reader, writer, response.reusable)
+                return response
+
+    async def check_url(self, url):
+        """Return a result dict: status, ok, location, error, checked."""
+        result = {'status': None, 'ok': False, 'location': None, 'error': None}
+        try:
+            response = await asyncio.wait_for(self._request('HEAD', url), self.timeout)
+            if response.status in _RETRY_WITH_GET:
+                response = await asyncio.wait_for(self._request('GET', url), self.timeout)
+            result['status'] = response.status
+            result['ok'] = response.status < 400
+            result['location'] = response.headers.get('location')
+        except asyncio.TimeoutError:
+            result['error'] = f"timed out after {self.timeout:g}s"
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        result['checked'] = time.time()
+        return result
+
+    async def check_all(self, urls, on_result=None):
+        """Check `urls`; returns {url: result}. `on_result(url, result)` is called as each finishes."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = {}
+
+        async def run(url):
+            async with semaphore:
+                result = await self.check_url(url)
+            results[url] = result
+            if on_result:
+                on_result(url, result)
+
+        try:
+            await asyncio.gather(*(run(url) for url in urls))
+        finally:
+            self.pool.close()
+        return results
+
+
+def load_cache(path=CACHE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def is_fresh(entry, ttl, failure_ttl, now=None):
+    """True if a cached result is young enough to reuse."""
+    age = (now or time.time()) - entry.get('checked', 0)
+    return age < (ttl if entry.get('ok') else failure_ttl)
+
+
+def check_links(urls, checker, cache=None, ttl=DEFAULT_TTL_DAYS * 86400,
+                failure_ttl=DEFAULT_FAILURE_TTL_HOURS * 3600, on_result=None):
+    """Check the URLs not fresh in `cache`; updates `cache` in place.
+
+    Returns ({url: result} for every URL, [urls actually requested]).
+    """
+    cache = {} if cache is None else cache
+    now = time.time()
+    stale = [url for url in urls if url not in cache or not is_fresh(cache[url], ttl, failure_ttl, now)]
+    if stale:
+        cache.update(asyncio.run(checker.check_all(stale, on_result)))
+    return {url: cache[url] for url in urls}, stale
+
+
+def cmd_inventory(args, inventory):
+    if args.json or args.output:
+        data = {url: {'count': len(occurrences),
+                      'occurrences': [[key, position] for key, position, _ in occurrences]}
+                for url, occurrences in inventory.items()}
+        text = json.dumps(data, ensure_ascii=False, indent=1)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+            print(f"Wrote {len(data)} URLs to {args.output}")
+        else:
+            print(text)
+        return 0
+    total = sum(len(occurrences) for occurrences in inventory.values())
+    print(f"{total} links, {len(inventory)} distinct URLs")
+    for url, occurrences in sorted(inventory.items(), key=lambda item: -len(item[1]))[:args.top]:
+        print(f"  {len(occurrences):>4}  {url}")
+    return 0
+
+
+def cmd_check(args, inventory):
+    urls = checkable_urls(inventory)
+    if args.match:
+        urls = [url for url in urls if args.match in url]
+    stub = None
+    endpoint = args.endpoint
+    if args.stub:
+        stub = start_server(statuses=dict(args.stub_status))
+        endpoint = stub.url
+    # Stub answers say nothing about the real links, so they are never cached
+    use_cache = not (args.no_cache or args.stub)
+    cache = load_cache(args.cache) if use_cache else {}
+    checker = LinkChecker(args.concurrency, args.per_host, args.timeout, endpoint)
+
+    started = time.perf_counter()
+    try:
+        with stage('check'):
+            results, requested = check_links(urls, checker, cache, args.ttl * 86400,
+                                             args.failure_ttl * 3600)
+    finally:
+        if stub:
+            stub.shutdown()
+            stub.server_close()
+    elapsed = time.perf_counter() - started
+    if use_cache:
+        save_cache(cache, args.cache)
+
+    occurrences = {}
+    for url, found in inventory.items():
+        occurrences.setdefault(urldefrag(url)[0], []).extend(found)
+    broken = [url for url in urls if not results[url]['ok']]
+    for url in broken:
+        result = results[url]
+        print(f"✗ {result['status'] or result['error']}  {url}")
+        for key, position, _ in occurrences[url]:
+            print(f"      {key} (link {position + 1})")
+    if args.verbose:
+        for url in urls:
+            if results[url]['ok']:
+                location = f" -> {results[url]['location']}" if results[url]['location'] else ''
+                print(f"✓ {results[url]['status']}  {url}{location}")
+
+    print(f"\nURLs: {len(urls)} ({len(requested)} checked, {len(urls) - len(requested)} cached)")
+    if requested:
+        print(f"Requests: {checker.requests} over {checker.pool.opened} connection(s) "
+              f"in {elapsed:.2f}s{f' via {endpoint}' if endpoint else ''}")
+    print(f"Broken: {len(broken)}")
+    return 1 if broken else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--store', default=STORE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    instrumentation = plan_metrics.arguments()
+
+    p_inv = sub.add_parser('inventory', help='List distinct URLs and where they occur',
+                           parents=[instrumentation])
+    p_inv.add_argument('--json', action='store_true', help='Print the inventory as JSON')
+    p_inv.add_argument('--output', '-o', help='Write the JSON inventory to this file')
+    p_inv.add_argument('--top', type=int, default=20, help='Most-used URLs to list (default: 20)')
+
+    p_check = sub.add_parser('check', help='Check every distinct URL', parents=[instrumentation])
+    p_check.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    p_check.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                         help='Connections per host (default: %(default)s)')
+    p_check.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Seconds per request')
+    p_check.add_argument('--endpoint', help='Send every request to this plain-HTTP server (proxy form)')
+    p_check.add_argument('--stub', action='store_true',
+                         help='Check against an in-process link_stub_server (results are not cached)')
+    p_check.add_argument('--stub-status', type=parse_status, action='append', default=[],
+                         metavar='URL=CODE', help='Status the stub returns for a URL (repeatable)')
+    p_check.add_argument('--ttl', type=float, default=DEFAULT_TTL_DAYS,
+                         help='Days a working result stays cached (default: %(default)s)')
+    p_check.add_argument('--failure-ttl', type=float, default=DEFAULT_FAILURE_TTL_HOURS,
+                         help='Hours a failed result stays cached (default: %(default)s)')
+    p_check.add_argument('--cache', default=CACHE_FILE)
+    p_check.add_argument('--no-cache', action='store_true', help=f"Ignore and do not update {CACHE_FILE}")
+    p_check.add_argument('--match', help='Only check URLs containing this text')
+    p_check.add_argument('--verbose', '-v', action='store_true', help='List working URLs too')
+    args = parser.parse_args(argv)
+
+    _, plan = load_store(args.store)
+    with stage('transform'):
+        inventory = build_inventory(plan)
+    if args.command == 'inventory':
+        return cmd_inventory(args, inventory)
+    return cmd_check(args, inventory)
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Shared instrumentation for the scripts/ entry points.
+
+Each entry point builds its parser with parents=[plan_metrics.arguments()]
+and runs its main() through run():
+
+    if __name__ == "__main__":
+        sys.exit(plan_metrics.run(main))
+
+which gives every script
+
+    --profile            run under cProfile, print the functions with the most
+                         time of their own and dump the stats to <script>.prof
+                         (--profile-out FILE; open with pstats or snakeviz)
+    --trace-mem          run under tracemalloc and print the largest allocation
+                         sites (--trace-mem-top N) and the peak traced memory
+
+Scripts mark their phases with stage timers; stages with the same name add
+up, and nested stages are timed independently:
+
+    with stage('load'):
+        index, plan = load_store()
+
+and can report a stage's time so far with elapsed('load').
+
+When the script finishes, one JSON line is appended to the metrics log
+(.metrics.jsonl, or $PLAN_METRICS_LOG; set it to an empty string to turn the
+log off):
+
+    {"script": "plan_compile", "argv": [], "started": "2026-01-01T00:00:00Z",
+     "wall": 0.412, "stages": {"load": 0.051, "transform": 0.21, "write": 0.09},
+     "peakRssKb": 61204, "exit": 0}
+
+Reports go to stderr so a script's own output (e.g. --json) stays clean.
+Worker processes are not profiled; run validation with -j1 to profile it.
+
+Usage:
+    python scripts/plan_metrics.py [--script validate_task_details] [--last 20]
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+METRICS_FILE = '.metrics.jsonl'
+PROFILE_TOP = 25
+
+_stages = {}
+
+
+def metrics_file():
+    """The metrics log path, or None if logging is turned off."""
+    return os.environ.get('PLAN_METRICS_LOG', METRICS_FILE) or None
+
+
+def arguments():
+    """Parent parser with the instrumentation flags."""
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--profile', action='store_true', help='Run under cProfile and report hot functions')
+    group.add_argument('--profile-out', metavar='FILE', help='Where to dump the profile (default: <script>.prof)')
+    group.add_argument('--trace-mem', action='store_true', help='Trace allocations and report the largest sites')
+    group.add_argument('--trace-mem-top', type=int, default=10, metavar='N', help='Allocation sites to report')
+    return parser
+
+
+@contextmanager
+def stage(name):
+    """Time the block as stage `name` of the current run."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started)
+
+
+def record(name, seconds):
+    """Add `seconds` to stage `name` (for work a script already times itself)."""
+    _stages[name] = _stages.get(name, 0.0) + seconds
+
+
+def elapsed(*names):
+    """Seconds recorded so far for the stages `names`, summed."""
+    return sum(_stages.get(name, 0.0) for name in names)
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB, or None if unavailable."""
+    # ru_maxrss survives fork+exec on Linux, so a child would report its
+    # parent's peak if that was higher; VmHWM is per process
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _script_name():
+    main_file = getattr(sys.modules.get('__main__'), '__file__', None) or sys.argv[0]
+    return os.path.splitext(os.path.basename(main_file))[0]
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    return code if isinstance(code, int) else 1
+
+
+def _report_profile(profiler, path):
+    profiler.dump_stats(path)
+    print(f"\nProfile written to {path}; top functions by own time:", file=sys.stderr)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats('tottime').print_stats(PROFILE_TOP)
+
+
+def _report_memory(snapshot, top):
+    current, peak = tracemalloc.get_traced_memory()
+    print(f"\nTraced memory: {current / 1024:,.0f} KB at exit, {peak / 1024:,.0f} KB peak; "
+          f"largest allocation sites:", file=sys.stderr)
+    for entry in snapshot.statistics('lineno')[:top]:
+        frame = entry.traceback[0]
+        print(f"  {entry.size / 1024:10,.1f} KB {entry.count:8,} blocks  {frame.filename}:{frame.lineno}",
+              file=sys.stderr)
+
+
+def write_metrics(entry, path=None):
+    path = path or metrics_file()
+    if not path:
+        return
+    try:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"Could not write metrics to {path}: {e}", file=sys.stderr)
+
+
+def run(main, argv=None):
+    """Run `main(argv)` with the requested instrumentation and log its metrics.
+
+    Returns main's exit code; exceptions and SystemExit propagate after the
+    metrics line is written.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    options, _ = arguments().parse_known_args(argv)
+    name = _script_name()
+    _stages.clear()
+
+    profiler = cProfile.Profile() if options.profile else None
+    if options.trace_mem:
+        tracemalloc.start()
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    exit_code = 1
+    try:
+        if profiler:
+            profiler.enable()
+        exit_code = main(argv)
+        return exit_code
+    except SystemExit as e:
+        exit_code = _exit_code(e.code)
+        raise
+    finally:
+        wall = time.perf_counter() - started
+        if profiler:
+            profiler.disable()
+        # Logged before the reports, which can fail (e.g. on a closed pipe)
+        write_metrics({
+            'script': name,
+            'argv': argv,
+            'started': started_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'wall': round(wall, 4),
+            'stages': {k: round(v, 4) for k, v in _stages.items()},
+            'peakRssKb': peak_rss_kb(),
+            'exit': _exit_code(exit_code),
+        })
+        if profiler:
+            _report_profile(profiler, options.profile_out or f"{name}.prof")
+        if options.trace_mem:
+            _report_memory(tracemalloc.take_snapshot(), options.trace_mem_top)
+            tracemalloc.stop()
+
+
+def load_metrics(path=None):
+    path = path or metrics_file() or METRICS_FILE
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Summarize the metrics log written by the scripts.')
+    parser.add_argument('--script', help='Only runs of this script')
+    parser.add_argument('--last', type=int, default=20, help='Number of runs to show')
+    parser.add_argument('--log', help=f"Metrics log (default: {METRICS_FILE})")
+    args = parser.parse_args(argv)
+
+    entries = [e for e in load_metrics(args.log) if not args.script or e['script'] == args.script]
+    if not entries:
+        print("No runs recorded")
+        return 0
+    for entry in entries[-args.last:]:
+        rss = f"{entry['peakRssKb'] / 1024:7.1f} MB" if entry.get('peakRssKb') else ' ' * 10
+        print(f"{entry['started']}  {entry['script']:24} {entry['wall']:8.3f}s {rss}  exit {entry['exit']}")
+        if entry['stages']:
+            print('    ' + ', '.join(f"{k} {v:.3f}s" for k, v in entry['stages'].items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
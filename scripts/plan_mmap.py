@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped, lazily decoded view of the plan store.
+
+map_store() returns (index, plan) shaped like plan_store.load_store(), but
+each phase's .jsonl file is memory-mapped instead of read: only the phase
+record (line 1) is decoded up front, and `phase['days']` is a sequence that
+knows the byte offsets of every day line and decodes a day only when it is
+accessed. Nothing keeps decoded days alive, so a pass over the plan holds one
+day at a time rather than the whole plan, and the mapped pages belong to the
+OS page cache rather than the Python heap.
+
+`task_fields` limits which task fields decoded days keep (e.g. label and
+details for validation); everything else on the task is dropped as soon as
+the line is decoded.
+
+Usage:
+    from plan_mmap import map_store
+    from plan_parser import iter_tasks
+
+    index, plan = map_store(task_fields=('label', 'details'))
+    for phase, day, index, task in iter_tasks(plan):
+        ...
+
+    python scripts/plan_mmap.py [store]     # map the store and count its tasks
+"""
+
+import argparse
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Sequence
+
+import plan_metrics
+from plan_metrics import stage
+from plan_parser import iter_tasks
+from plan_store import STORE_DIR, load_index, phase_path
+
+
+class MappedDays(Sequence):
+    """The day lines of a mapped phase file, decoded on access."""
+
+    def __init__(self, view, starts, ends, task_fields=None):
+        self._view = view
+        self._starts = starts
+        self._ends = ends
+        self.task_fields = tuple(task_fields) if task_fields else None
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        # Decode straight from the mapped pages; no intermediate bytes copy
+        day = json.loads(str(self._view[self._starts[i]:self._ends[i]], 'utf-8'))
+        if self.task_fields and 'tasks' in day:
+            day['tasks'] = [{k: task[k] for k in self.task_fields if k in task}
+                            for task in day['tasks']]
+        return day
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class MappedPhase(dict):
+    """A phase record whose 'days' value is a MappedDays over its mapped file."""
+
+    def __init__(self, phase_id, store=STORE_DIR, task_fields=None):
+        with open(phase_path(phase_id, store), 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap refuses empty files
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._map if self._map is not None else b'')
+        starts = array('Q')
+        ends = array('Q')
+        pos = 0
+        while pos < size:
+            end = self._map.find(b'\n', pos)
+            if end == -1:
+                end = size
+            # Blank lines have no record in them
+            if self._map.find(b'{', pos, end) != -1:
+                starts.append(pos)
+                ends.append(end)
+            pos = end + 1
+        if not size:
+            # An empty file is a phase with no record or days written yet
+            super().__init__(id=phase_id)
+            self['days'] = MappedDays(self._view, starts, ends, task_fields)
+            return
+        if not starts:
+            raise ValueError(f"{phase_path(phase_id, store)}: no phase record")
+        super().__init__(json.loads(str(self._view[starts[0]:ends[0]], 'utf-8')))
+        self['days'] = MappedDays(self._view, starts[1:], ends[1:], task_fields)
+
+    def close(self):
+        if self._view is not None:
+            self['days']._view = None
+            self._view.release()
+            if self._map is not None:
+                self._map.close()
+            self._view = None
+
+
+def map_phase(phase_id, store=STORE_DIR, task_fields=None):
+    """Map one phase file; see MappedPhase."""
+    return MappedPhase(phase_id, store, task_fields)
+
+
+def map_store(store=STORE_DIR, task_fields=None):
+    """Return (index, plan) with every phase memory-mapped; see the module docstring."""
+    index = load_index(store)
+    plan = {'phases': [map_phase(phase_id, store, task_fields) for phase_id in index['phases']]}
+    return index, plan
+
+
+def close_store(plan):
+    """Unmap every phase of a plan returned by map_store()."""
+    for phase in plan['phases']:
+        phase.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('store', nargs='?', default=STORE_DIR)
+    args = parser.parse_args(argv)
+
+    with stage('map'):
+        _, plan = map_store(args.store, task_fields=('label',))
+    with stage('decode'):
+        tasks = sum(1 for _ in iter_tasks(plan))
+    size = sum(os.path.getsize(phase_path(phase['id'], args.store)) for phase in plan['phases'])
+    print(f"Mapped {args.store} ({size:,} bytes) in {plan_metrics.elapsed('map') * 1000:.1f} ms")
+    print(f"  Phases: {len(plan['phases'])}, days: {sum(len(p['days']) for p in plan['phases'])}, "
+          f"tasks: {tasks} (decoded in {plan_metrics.elapsed('map', 'decode') * 1000:.1f} ms)")
+    close_store(plan)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser for the JavaScript object-literal subset used by planPhases.js.
+
+The plan file is a plain `const PLAN = { phases: [...] };` literal made of
+objects, arrays, quoted strings, numbers and true/false/null, with // and
+/* */ comments in between. This module walks that literal once, left to
+right, and returns ordinary Python values. Every object also remembers where
+it and each of its field values sit in the source text, so tools can splice
+edits back in without re-scanning the file.
+
+Usage:
+    from plan_parser import load_plan, iter_tasks
+
+    content, plan = load_plan()
+    for phase, day, index, task in iter_tasks(plan):
+        print(day['globalDay'], task['label'])
+
+    python scripts/plan_parser.py [planPhases.js]     # parse a plan file and count it
+"""
+
+import argparse
+import re
+import sys
+
+import plan_metrics
+from plan_metrics import stage
+
+PLAN_FILE = 'assets/js/data/planPhases.js'
+
+_WS_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+_STRING_RE = {
+    "'": re.compile(r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'", re.DOTALL),
+    '"': re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"', re.DOTALL),
+}
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_NAME_RE = re.compile(r'[A-Za-z_$][\w$]*')
+_ESCAPE_RE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)', re.DOTALL)
+_PHASE_NUMBER_RE = re.compile(r'Phase\s+(\d+)')
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v',
+    '0': '\0', '\n': '',
+}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class PlanSyntaxError(ValueError):
+    """Raised when the plan source is not in the supported literal subset."""
+
+    def __init__(self, message, content, pos):
+        line = content.count('\n', 0, pos) + 1
+        column = pos - content.rfind('\n', 0, pos)
+        super().__init__(f"{message} at line {line}, column {column}")
+        self.pos = pos
+
+
+class JSObject(dict):
+    """A parsed object literal that remembers its source offsets.
+
+    `start`/`end` cover the braces; `spans[key]` is the (start, end) of that
+    key's value and `key_starts[key]` the offset of the key itself.
+    """
+
+    __slots__ = ('start', 'end', 'spans', 'key_starts')
+
+    def __init__(self, start):
+        super().__init__()
+        self.start = start
+        self.end = start
+        self.spans = {}
+        self.key_starts = {}
+
+
+def _unescape_match(match):
+    code = match.group(1)
+    if code[0] in 'ux' and len(code) > 1:
+        return chr(int(code[1:], 16))
+    return _SIMPLE_ESCAPES.get(code, code)
+
+
+def unescape_js(raw):
+    """Decode the body of a JS string literal (without its quotes)."""
+    if '\\' not in raw:
+        return raw
+    return _ESCAPE_RE.sub(_unescape_match, raw)
+
+
+def escape_js(text):
+    """Escape text for a single-quoted JavaScript string."""
+    text = text.replace('\\', '\\\\').replace("'", "\\'")
+    return text.replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _skip(content, pos):
+    return _WS_RE.match(content, pos).end()
+
+
+def _expect(content, pos, char):
+    pos = _skip(content, pos)
+    if not content.startswith(char, pos):
+        raise PlanSyntaxError(f"Expected {char!r}", content, pos)
+    return pos + 1
+
+
+def _peek(content, pos, closing):
+    """The character at `pos`, which must exist inside an unclosed literal."""
+    if pos >= len(content):
+        raise PlanSyntaxError(f"Unexpected end of input, expected {closing!r}", content, pos)
+    return content[pos]
+
+
+def _parse_object(content, pos):
+    obj = JSObject(pos)
+    pos = _skip(content, pos + 1)
+    while _peek(content, pos, '}') != '}':
+        key_start = pos
+        if content[pos] in _STRING_RE:
+            match = _STRING_RE[content[pos]].match(content, pos)
+            if not match:
+                raise PlanSyntaxError("Unterminated string key", content, pos)
+            key = unescape_js(match.group()[1:-1])
+        else:
+            match = _NAME_RE.match(content, pos)
+            if not match:
+                raise PlanSyntaxError("Expected object key", content, pos)
+            key = match.group()
+        pos = _expect(content, match.end(), ':')
+        value_start = _skip(content, pos)
+        value, pos = parse_value(content, value_start)
+        obj[key] = value
+        obj.spans[key] = (value_start, pos)
+        obj.key_starts[key] = key_start
+        pos = _skip(content, pos)
+        char = _peek(content, pos, '}')
+        if char == ',':
+            pos = _skip(content, pos + 1)
+        elif char != '}':
+            raise PlanSyntaxError("Expected ',' or '}'", content, pos)
+    obj.end = pos + 1
+    return obj, pos + 1
+
+
+def _parse_array(content, pos):
+    items = []
+    pos = _skip(content, pos + 1)
+    while _peek(content, pos, ']') != ']':
+        value, pos = parse_value(content, pos)
+        items.append(value)
+        pos = _skip(content, pos)
+        char = _peek(content, pos, ']')
+        if char == ',':
+            pos = _skip(content, pos + 1)
+        elif char != ']':
+            raise PlanSyntaxError("Expected ',' or ']'", content, pos)
+    return items, pos + 1
+
+
+def parse_value(content, pos=0):
+    """Parse one literal value starting at `pos`. Returns (value, end)."""
+    pos = _skip(content, pos)
+    if pos >= len(content):
+        raise PlanSyntaxError("Unexpected end of input", content, pos)
+    char = content[pos]
+    if char == '{':
+        return _parse_object(content, pos)
+    if char == '[':
+        return _parse_array(content, pos)
+    if char in _STRING_RE:
+        match = _STRING_RE[char].match(content, pos)
+        if not match:
+            raise PlanSyntaxError("Unterminated string", content, pos)
+        return unescape_js(match.group()[1:-1]), match.end()
+    match = _NUMBER_RE.match(content, pos)
+    if match:
+        text = match.group()
+        number = float(text) if any(c in text for c in '.eE') else int(text)
+        return number, match.end()
+    match = _NAME_RE.match(content, pos)
+    if match and match.group() in _LITERALS:
+        return _LITERALS[match.group()], match.end()
+    raise PlanSyntaxError("Unexpected token", content, pos)
+
+
+def parse_assignment(content, name='PLAN'):
+    """Parse the literal assigned by `const <name> = ...` in a JS source."""
+    match = re.search(rf'\b(?:const|let|var)\s+{re.escape(name)}\s*=', content)
+    if not match:
+        raise PlanSyntaxError(f"No assignment to {name}", content, 0)
+    value, _ = parse_value(content, match.end())
+    return value
+
+
+def load_plan(path=PLAN_FILE):
+    """Read a plan file and return (content, plan)."""
+    with stage('load'):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    with stage('parse'):
+        plan = parse_assignment(content)
+    return content, plan
+
+
+def iter_days(plan):
+    """Yield (phase, day) for every day in plan order."""
+    for phase in plan.get('phases', []):
+        for day in phase.get('days', []):
+            yield phase, day
+
+
+def iter_tasks(plan):
+    """Yield (phase, day, index, task) for every task in plan order."""
+    for phase, day in iter_days(plan):
+        for index, task in enumerate(day.get('tasks', [])):
+            yield phase, day, index, task
+
+
+def task_id(phase, day, index):
+    """Stable task key, matching main.js ids without the storage prefix."""
+    return f"{phase['id']}_day{day['globalDay']}_task{index}"
+
+
+def index_tasks(plan):
+    """Return {task_id: task} for every task in the plan."""
+    return {task_id(phase, day, index): task
+            for phase, day, index, task in iter_tasks(plan)}
+
+
+def phase_number(phase):
+    """Return the N of a 'Phase N: ...' title (0 if the title has none)."""
+    match = _PHASE_NUMBER_RE.match(phase.get('title', ''))
+    return int(match.group(1)) if match else 0
+
+
+def find_phase(plan, phase_id):
+    """Return the phase with the given id, or None."""
+    for phase in plan.get('phases', []):
+        if phase.get('id') == phase_id:
+            return phase
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('plan', nargs='?', default=PLAN_FILE)
+    args = parser.parse_args(argv)
+
+    content, plan = load_plan(args.plan)
+    days = sum(1 for _ in iter_days(plan))
+    tasks = sum(1 for _ in iter_tasks(plan))
+    print(f"Parsed {args.plan} ({len(content):,} chars) in {plan_metrics.elapsed('load', 'parse') * 1000:.1f} ms")
+    print(f"  Phases: {len(plan.get('phases', []))}, days: {days}, tasks: {tasks}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
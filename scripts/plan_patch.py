@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Offset-indexed patch engine for planPhases.js.
+
+Edits are (task_id, field, value) triples, where task_id is the
+`<phaseId>_day<globalDay>_task<index>` key from plan_parser.task_id. Each
+edit is resolved against the parser's offsets into a replacement of the
+field's current value (or an insertion after the task's last field), then
+all replacements are applied in one sorted splice pass. Nothing is matched
+by text, so an edit can never touch a second task by accident.
+
+Usage:
+    from plan_patch import apply_edits, write_plan
+
+    content, plan = load_plan()
+    new_content, report = apply_edits(content, plan, [
+        ('deep-learning_day71_task0', 'details', '<strong>Action:</strong> ...'),
+    ])
+    if not report['conflicts']:
+        write_plan(PLAN_FILE, new_content)
+"""
+
+from plan_parser import escape_js, index_tasks
+
+
+def format_js_value(value):
+    """Render a Python value as a plan-style JavaScript literal."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return f"'{escape_js(value)}'"
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(format_js_value(v) for v in value) + ']'
+    if isinstance(value, dict):
+        fields = ', '.join(f"{k}: {format_js_value(v)}" for k, v in value.items())
+        return '{ ' + fields + ' }'
+    raise TypeError(f"Cannot render {type(value).__name__} as a JS literal")
+
+
+def resolve_edits(plan, edits, tasks=None):
+    """Turn edits into sorted (start, end, text) splices.
+
+    Returns (splices, report). The report lists applied edits, edits that were
+    no-ops because the field already held the value, and conflicts: unknown
+    task ids, the same field edited twice with different values, and splices
+    that overlap.
+    """
+    if tasks is None:
+        tasks = index_tasks(plan)
+    report = {'applied': [], 'unchanged': [], 'conflicts': []}
+    wanted = {}
+    clashing = set()
+
+    for edit_task_id, field, value in edits:
+        key = (edit_task_id, field)
+        if key in wanted and wanted[key] != value and key not in clashing:
+            clashing.add(key)
+            report['conflicts'].append(
+                f"{edit_task_id}.{field}: edited more than once with different values")
+        wanted.setdefault(key, value)
+    for key in clashing:
+        del wanted[key]
+
+    # Group insertions per task so several new fields share one splice point
+    inserts = {}
+    splices = []
+    for (edit_task_id, field), value in wanted.items():
+        task = tasks.get(edit_task_id)
+        if task is None:
+            report['conflicts'].append(f"{edit_task_id}: no such task")
+            continue
+        if field in task:
+            if task[field] == value:
+                report['unchanged'].append((edit_task_id, field))
+                continue
+            start, end = task.spans[field]
+            splices.append((start, end, format_js_value(value), [(edit_task_id, field)]))
+        else:
+            inserts.setdefault(edit_task_id, []).append((field, value))
+
+    for edit_task_id, fields in inserts.items():
+        task = tasks[edit_task_id]
+        offset = max(end for _, end in task.spans.values()) if task.spans else task.start + 1
+        separator = ', ' if task.spans else ' '
+        text = ''.join(f"{separator if i == 0 else ', '}{field}: {format_js_value(value)}"
+                       for i, (field, value) in enumerate(fields))
+        splices.append((offset, offset, text, [(edit_task_id, field) for field, _ in fields]))
+
+    # An edit counts as applied only if its splice survives the overlap check
+    splices.sort()
+    kept = []
+    for start, end, text, applied in splices:
+        if kept and start < kept[-1][1]:
+            report['conflicts'].append(
+                f"Overlapping edits at offsets {kept[-1][0]}-{kept[-1][1]} and {start}-{end}")
+            continue
+        kept.append((start, end, text))
+        report['applied'].extend(applied)
+    return kept, report
+
+
+def splice(content, splices):
+    """Apply sorted, non-overlapping (start, end, text) splices in one pass."""
+    parts = []
+    last = 0
+    for start, end, text in splices:
+        parts.append(content[last:start])
+        parts.append(text)
+        last = end
+    parts.append(content[last:])
+    return ''.join(parts)
+
+
+def apply_edits(content, plan, edits, tasks=None):
+    """Apply a batch of edits to the plan source. Returns (new_content, report)."""
+    splices, report = resolve_edits(plan, edits, tasks)
+    return splice(content, splices), report
+
+
+def write_plan(path, content):
+    """Write the patched plan source in a single write."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def print_report(report):
+    """Print a short summary of a patch report."""
+    print(f"  Edits applied: {len(report['applied'])}")
+    print(f"  Already up to date: {len(report['unchanged'])}")
+    print(f"  Conflicts: {len(report['conflicts'])}")
+    for conflict in report['conflicts']:
+        print(f"    ⚠️  {conflict}")
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Check daily time budgets and rebalance overloaded days.
+
+Every task's estMinutes is loaded into array columns in plan order, with
+per-day offsets into them (CSR style). Day loads are differences of one
+prefix sum over the task minutes taken at the day offsets, and week and
+phase loads are differences of a prefix sum over the day loads taken at the
+week and phase offsets; no per-task loop is needed.
+
+Rebalancing keeps every task in its phase and in its order: a task can only
+move to the end of the previous day or the start of the next one (and from
+there on, in a chain), so what changes is where each day's run of tasks
+begins. For each run of active days in a phase that has a day over --cap,
+those day boundaries are chosen by dynamic programming: the minimum total
+overflow (minutes over the cap, summed over the days), then the fewest
+moved tasks; --move-cost N charges each move N minutes of overflow, which
+trades a little overflow for much shorter chains of moves. Each boundary
+is searched within --window tasks of where it is now, and every day keeps
+at least one task. Inactive (superseded) days are left as they are.
+
+The result is a patch set, one move per task that changes day, and the id
+remap of every task the moves renumber:
+
+    {"cap": 240, "moves": [{"task": "foundations_day3_task4", "label": "...",
+                            "from": 3, "to": 4, "newTask": "foundations_day4_task0"}, ...],
+     "renumbered": {"foundations_day3_task4": "foundations_day4_task0",
+                    "foundations_day4_task0": "foundations_day4_task1", ...}}
+
+Task ids are positional, so a move renumbers the moved task and, depending
+on its direction, the tasks after it in the target day or the tasks left
+behind in the source day.
+--apply applies the moves to the store (snapshot first, then save and
+recompile) and appends the remap to "taskRenames" in plan.json; the site
+manifest carries that list, and main.js moves saved completion to the new
+ids once per entry. --patch FILE --apply applies a patch set written
+earlier, after checking that every task is still where the patch expects
+it.
+
+Usage:
+    python scripts/plan_schedule.py --cap 240                 # loads and planned moves
+    python scripts/plan_schedule.py --cap 240 -o moves.json
+    python scripts/plan_schedule.py --patch moves.json --apply
+"""
+
+import argparse
+import json
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from operator import sub
+
+import plan_metrics
+from plan_compile import compile_store
+from plan_metrics import stage
+from plan_parser import task_id
+from plan_patch import print_report
+from plan_snapshots import take_snapshot
+from plan_store import STORE_DIR, load_store, save_store
+
+DEFAULT_CAP = 240
+DEFAULT_WINDOW = 4
+DEFAULT_MOVE_COST = 0
+
+
+def _segment_sums(prefix, starts):
+    """Sums of the segments [starts[i], starts[i + 1]) given a prefix-sum array."""
+    at = list(map(prefix.__getitem__, starts))
+    return array('q', map(sub, at[1:], at[:-1]))
+
+
+def _group_starts(keys):
+    """Offsets where `keys` changes value, plus the end offset."""
+    starts = [i for i in range(len(keys)) if i == 0 or keys[i] != keys[i - 1]]
+    return starts + [len(keys)]
+
+
+class PlanColumns:
+    """Task minutes and day, week and phase structure as flat arrays."""
+
+    def __init__(self, plan):
+        self.phases = plan['phases']
+        self.days = []                       # day records, plan order
+        self.task_minutes = array('i')
+        self.day_start = array('i', [0])     # day d's tasks are [day_start[d], day_start[d + 1])
+        self.day_global = array('i')
+        self.day_week = array('i')
+        self.day_phase = array('H')
+        self.day_active = array('b')
+        self.phase_start = array('i', [0])   # phase p's days are [phase_start[p], phase_start[p + 1])
+        for p, phase in enumerate(self.phases):
+            for day in phase.get('days', []):
+                tasks = day.get('tasks', [])
+                self.task_minutes.extend(task.get('estMinutes') or 0 for task in tasks)
+                self.day_start.append(len(self.task_minutes))
+                self.day_global.append(day.get('globalDay', 0))
+                self.day_week.append(day.get('week', 0))
+                self.day_phase.append(p)
+                self.day_active.append(not day.get('inactive'))
+                self.days.append(day)
+            self.phase_start.append(len(self.days))
+        self.task_prefix = array('q', accumulate(self.task_minutes, initial=0))
+
+    def day_loads(self):
+        return _segment_sums(self.task_prefix, self.day_start)
+
+    def grouped_loads(self, day_loads, starts):
+        return _segment_sums(array('q', accumulate(day_loads, initial=0)), starts)
+
+    def week_loads(self, day_loads):
+        """[(week, minutes)] in plan order."""
+        starts = _group_starts(self.day_week)
+        return list(zip((self.day_week[i] for i in starts[:-1]), self.grouped_loads(day_loads, starts)))
+
+    def phase_loads(self, day_loads):
+        """[(phase id, minutes)] in plan order."""
+        loads = self.grouped_loads(day_loads, self.phase_start)
+        return [(phase['id'], load) for phase, load in zip(self.phases, loads)]
+
+
+def _active_runs(columns, p):
+    """Runs [first day, end day) of consecutive active days in phase p."""
+    runs = []
+    start = None
+    for d in range(columns.phase_start[p], columns.phase_start[p + 1]):
+        if columns.day_active[d]:
+            if start is None:
+                start = d
+        elif start is not None:
+            runs.append((start, d))
+            start = None
+    if start is not None:
+        runs.append((start, columns.phase_start[p + 1]))
+    return runs
+
+
+def _solve_run(columns, first, end, cap, window, move_cost):
+    """Best task offsets for the starts of days [first, end) and the end, or None if unchanged."""
+    prefix = columns.task_prefix
+    original = columns.day_start[first:end + 1]
+    m = end - first
+    lo, hi = original[0], original[-1]
+
+    def cost(j, s, e):
+        load = prefix[e] - prefix[s]
+        overlap = max(0, min(e, original[j + 1]) - max(s, original[j]))
+        return max(0, load - cap), (e - s) - overlap
+
+    # states[b] = ((score, moved), previous boundary) for day j starting at b
+    states = {lo: ((0, 0), None)}
+    history = []
+    for j in range(m):
+        if j == m - 1:
+            candidates = [hi]
+        else:
+            o = original[j + 1]
+            candidates = range(max(lo + j + 1, o - window), min(hi - (m - j - 1), o + window) + 1)
+        following = {}
+        for e in candidates:
+            best = None
+            for s, ((score, moved), _) in states.items():
+                if e <= s:
+                    continue
+                overflow, extra_moved = cost(j, s, e)
+                total = (score + overflow + move_cost * extra_moved, moved + extra_moved)
+                if best is None or total < best[0]:
+                    best = (total, s)
+            if best is not None:
+                following[e] = best
+        history.append(following)
+        states = following
+    if hi not in states:
+        return None
+    (_, moved), _ = states[hi]
+    if moved == 0:
+        return None
+    boundaries = [hi]
+    for following in reversed(history):
+        boundaries.append(following[boundaries[-1]][1])
+    boundaries.reverse()
+    return boundaries
+
+
+def plan_moves(plan, cap=DEFAULT_CAP, window=DEFAULT_WINDOW, move_cost=DEFAULT_MOVE_COST, phase_ids=None):
+    """Rebalance days over `cap`. Returns (moves, columns) with moves as in the patch set."""
+    columns = PlanColumns(plan)
+    loads = columns.day_loads()
+    moves = []
+    for p, phase in enumerate(columns.phases):
+        if phase_ids and phase['id'] not in phase_ids:
+            continue
+        for first, end in _active_runs(columns, p):
+            if max(loads[first:end]) <= cap:
+                continue
+            boundaries = _solve_run(columns, first, end, cap, window, move_cost)
+            if boundaries is None:
+                continue
+            for j in range(end - first):
+                d = first + j
+                for i in range(boundaries[j], boundaries[j + 1]):
+                    if columns.day_start[d] <= i < columns.day_start[d + 1]:
+                        continue
+                    old_day = bisect_right(columns.day_start, i) - 1
+                    moves.append(_move(columns, phase, old_day, i, d, i - boundaries[j]))
+    return moves, columns
+
+
+def _move(columns, phase, old_day, i, new_day, new_index):
+    day = columns.days[old_day]
+    index = i - columns.day_start[old_day]
+    target = columns.days[new_day]
+    return {
+        'task': task_id(phase, day, index),
+        'label': day['tasks'][index].get('label', ''),
+        'from': day['globalDay'],
+        'to': target['globalDay'],
+        'newTask': task_id(phase, target, new_index),
+    }
+
+
+def apply_moves(plan, moves):
+    """Apply a patch set's moves to a loaded plan in place.
+
+    Returns a report shaped like plan_patch's, plus 'renumbered': {old task
+    id: new task id} for every task whose positional id changed, moved or not.
+    Nothing is changed if any move conflicts: an unknown task, a label or day
+    that no longer matches, a target outside the task's phase or on an
+    inactive day, or moves that would reorder tasks or leave a day empty.
+    """
+    report = {'applied': [], 'unchanged': [], 'conflicts': [], 'renumbered': {}}
+    located = {}
+    for phase in plan['phases']:
+        for d, day in enumerate(phase.get('days', [])):
+            for index, task in enumerate(day.get('tasks', [])):
+                located[task_id(phase, day, index)] = (phase, d, task)
+
+    targets = {}
+    for move in moves:
+        found = located.get(move['task'])
+        if found is None:
+            report['conflicts'].append(f"{move['task']}: no such task")
+            continue
+        phase, d, task = found
+        days = phase['days']
+        if task.get('label', '') != move['label'] or days[d]['globalDay'] != move['from']:
+            report['conflicts'].append(f"{move['task']}: task has changed since the patch was made")
+            continue
+        to = next((k for k, day in enumerate(days) if day['globalDay'] == move['to']), None)
+        if to is None or days[to].get('inactive'):
+            report['conflicts'].append(f"{move['task']}: day {move['to']} is not an active day of {phase['id']}")
+            continue
+        targets[id(task)] = to
+        report['applied'].append((move['task'], f"day {move['from']} -> {move['to']}"))
+
+    rebuilt = []
+    for phase in plan['phases']:
+        days = phase.get('days', [])
+        if not any(id(task) in targets for day in days for task in day.get('tasks', [])):
+            continue
+        assigned = [(targets.get(id(task), d), task) for d, day in enumerate(days) for task in day['tasks']]
+        if any(a[0] > b[0] for a, b in zip(assigned, assigned[1:])):
+            report['conflicts'].append(f"{phase['id']}: moves would change the order of tasks")
+            continue
+        per_day = [[] for _ in days]
+        for d, task in assigned:
+            per_day[d].append(task)
+        empty = [days[d]['globalDay'] for d, tasks in enumerate(per_day) if days[d].get('tasks') and not tasks]
+        if empty:
+            report['conflicts'].append(f"{phase['id']}: moves would leave day {empty[0]} without tasks")
+            continue
+        rebuilt.append((phase, days, per_day))
+
+    if report['conflicts']:
+        report['applied'] = []
+        return report
+    for phase, days, per_day in rebuilt:
+        old_ids = {id(task): task_id(phase, day, index)
+                   for day in days for index, task in enumerate(day['tasks'])}
+        for day, tasks in zip(days, per_day):
+            day['tasks'] = tasks
+            for index, task in enumerate(tasks):
+                new_id = task_id(phase, day, index)
+                if old_ids[id(task)] != new_id:
+                    report['renumbered'][old_ids[id(task)]] = new_id
+    return report
+
+
+def to_patch(moves, cap, renumbered):
+    return {'cap': cap, 'moves': moves, 'renumbered': renumbered}
+
+
+def load_patch(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_loads(columns, loads, cap, limit=20, phases=True):
+    over = [d for d in range(len(loads)) if columns.day_active[d] and loads[d] > cap]
+    active = [loads[d] for d in range(len(loads)) if columns.day_active[d]]
+    print(f"Days: {len(active)} active, {len(over)} over {cap} min "
+          f"(max {max(active, default=0)} min, mean {sum(active) / max(1, len(active)):.0f} min)")
+    for d in sorted(over, key=lambda d: -loads[d])[:limit]:
+        phase = columns.phases[columns.day_phase[d]]
+        print(f"  day {columns.day_global[d]:>4} ({phase['id']}): {loads[d]} min, "
+              f"{columns.day_start[d + 1] - columns.day_start[d]} tasks")
+    if len(over) > limit:
+        print(f"  ... {len(over) - limit} more")
+    weeks = columns.week_loads(loads)
+    heaviest = max(weeks, key=lambda w: w[1], default=None)
+    if heaviest:
+        print(f"Weeks: {len(weeks)}, heaviest week {heaviest[0]} at {heaviest[1]} min")
+    if not phases:
+        return
+    for phase_id, minutes in columns.phase_loads(loads):
+        print(f"  {phase_id:20} {minutes / 60:7.1f} h")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--cap', type=int, default=DEFAULT_CAP, help='Minutes per day (default: %(default)s)')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW,
+                        help='How many tasks a day boundary may shift (default: %(default)s)')
+    parser.add_argument('--move-cost', type=int, default=DEFAULT_MOVE_COST,
+                        help='Minutes of overflow a moved task must save (default: %(default)s)')
+    parser.add_argument('--phase', action='append', metavar='ID', help='Only rebalance this phase (repeatable)')
+    parser.add_argument('--patch', metavar='FILE', help='Apply this patch set instead of planning moves')
+    parser.add_argument('--output', '-o', help='Write the patch set to this file')
+    parser.add_argument('--apply', action='store_true', help='Apply the moves to the store and recompile')
+    parser.add_argument('--store', default=STORE_DIR)
+    args = parser.parse_args(argv)
+
+    index, plan = load_store(args.store)
+    if args.patch:
+        patch = load_patch(args.patch)
+        moves, cap = patch['moves'], patch.get('cap', args.cap)
+        columns = PlanColumns(plan)
+    else:
+        cap = args.cap
+        with stage('transform'):
+            moves, columns = plan_moves(plan, cap, args.window, args.move_cost, args.phase)
+    print_loads(columns, columns.day_loads(), cap)
+
+    print(f"\nMoves: {len(moves)}")
+    for move in moves:
+        print(f"  {move['task']} -> {move['newTask']}: {move['label'][:60]}")
+    report = apply_moves(plan, moves)
+    if report['conflicts']:
+        print_report(report)
+        return 1
+    if moves:
+        print(f"Renumbered: {len(report['renumbered'])} task id(s), moved or not")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(to_patch(moves, cap, report['renumbered']), f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        print(f"Wrote {len(moves)} move(s) to {args.output}")
+    if not moves:
+        return 0
+
+    after = PlanColumns(plan)
+    print("\nAfter the moves:")
+    print_loads(after, after.day_loads(), cap, phases=False)
+    if not args.apply:
+        return 0
+
+    snapshot = take_snapshot('before-schedule', args.store)
+    # main.js carries saved progress over to the new ids once per entry
+    index.setdefault('taskRenames', []).append({'id': snapshot['name'], 'map': report['renumbered']})
+    changed = save_store(index, plan, args.store)
+    compiled = compile_store(store=args.store)
+    print_report(report)
+    print(f"  Phase files changed: {', '.join(changed) or 'none'}")
+    print(f"  Compiled: {len(compiled)} file(s)")
+    print(f"  Snapshot: {snapshot['name']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Schema validation for phase, day and task records.
+
+The schema is declared once below (PHASE, DAY, TASK) as Field specs. Each
+record schema is compiled into a specialized Python function: one straight
+elif chain per field, with the type, choices, pattern and bounds baked in
+as constants, so checking a record does no interpretation of the schema.
+validate_plan() runs the compiled checks over the whole plan in one pass,
+together with the invariants that span records:
+
+    - phase ids are unique
+    - globalDay runs 1, 2, 3, ... in plan order, without gaps or repeats
+      and ends at day 364 (--days N for another length, --days 0 for any)
+    - every day's week is one of its phase's weeks
+    - each phase's weeks are consecutive and start in the week the previous
+      phase ended or the one after
+
+Records may not carry fields the schema doesn't declare, so a misspelt
+field name is reported rather than silently ignored. Schema.check() is the
+same validation done by walking the Field specs for every record; it is
+kept as the reference the compiled checks are benchmarked and compared
+against (benchmarks/bench_schema.py).
+
+Usage:
+    python scripts/plan_schema.py                     # the store (data/plan)
+    python scripts/plan_schema.py /tmp/plan10.js      # any plan file or snapshot
+    python scripts/plan_schema.py /tmp/plan10.js --days 0
+"""
+
+import argparse
+import re
+import sys
+
+import plan_metrics
+from plan_diff import load_side
+from plan_metrics import stage
+from plan_store import COMMENT_KEY, STORE_DIR
+
+PLAN_DAYS = 364
+
+_MISSING = object()
+_CONTAINERS = (dict, list)
+
+
+class Field:
+    """Constraints on one field of a record."""
+
+    def __init__(self, type, required=False, nonempty=False, choices=None, pattern=None,
+                 min=None, max=None, items=None, item_pattern=None):
+        self.type = type
+        self.required = required
+        self.nonempty = nonempty
+        self.choices = tuple(choices) if choices else None
+        self.pattern = pattern
+        self.min = min
+        self.max = max
+        self.items = items
+        self.item_pattern = item_pattern
+        self._match = re.compile(pattern).search if pattern else None
+        self._item_match = re.compile(item_pattern).search if item_pattern else None
+
+    @staticmethod
+    def _is_type(value, cls):
+        # Exact for scalars (a bool is not an int); parsed plan files give
+        # dict subclasses for objects
+        return isinstance(value, cls) if cls in _CONTAINERS else type(value) is cls
+
+    def error(self, value):
+        """The first constraint `value` breaks, as a message, or None."""
+        if value is _MISSING:
+            return 'is required' if self.required else None
+        if not self._is_type(value, self.type):
+            return f"expected {self.type.__name__}, got {type(value).__name__}"
+        if self.nonempty and not value:
+            return 'is empty'
+        if self.choices is not None and value not in self.choices:
+            return f"must be one of {', '.join(self.choices)}"
+        if self._match is not None and not self._match(value):
+            return f"does not match {self.pattern}"
+        if self.min is not None and value < self.min:
+            return f"must be >= {self.min}"
+        if self.max is not None and value > self.max:
+            return f"must be <= {self.max}"
+        if self.items is not None and not all(self._is_type(item, self.items) for item in value):
+            return f"items must be {self.items.__name__}"
+        if self._item_match is not None and not all(map(self._item_match, value)):
+            return f"items must match {self.item_pattern}"
+        return None
+
+
+def _type_test(name, cls):
+    """Source for `name` failing Field._is_type(name, cls)."""
+    if cls in _CONTAINERS:
+        return f"not isinstance({name}, {cls.__name__})"
+    return f"type({name}) is not {cls.__name__}"
+
+
+class Schema:
+    """A record schema: {field name: Field}; other fields are not allowed."""
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.known = frozenset(fields)
+
+    def check(self, record, where, add):
+        """Interpret the schema for one record, calling add(where, field, message)."""
+        for name, field in self.fields.items():
+            message = field.error(record.get(name, _MISSING))
+            if message:
+                add(where, name, message)
+        for name in record:
+            if name not in self.known:
+                add(where, name, 'unknown field')
+
+    def compile(self):
+        """Return a function(record, where, add) equivalent to check()."""
+        namespace = {'MISSING': _MISSING, 'KNOWN': self.known}
+        lines = [f"def check_{self.name}(record, where, add):", "    get = record.get"]
+        for i, (name, field) in enumerate(self.fields.items()):
+            # (condition, source of the message) in the order Field.error tests them
+            checks = [("v is MISSING", repr('is required') if field.required else None),
+                      (_type_test('v', field.type),
+                       f"'expected {field.type.__name__}, got ' + type(v).__name__")]
+            if field.nonempty:
+                checks.append(("not v", repr('is empty')))
+            if field.choices is not None:
+                namespace[f'CHOICES_{i}'] = frozenset(field.choices)
+                checks.append((f"v not in CHOICES_{i}", repr(f"must be one of {', '.join(field.choices)}")))
+            if field.pattern is not None:
+                namespace[f'MATCH_{i}'] = field._match
+                checks.append((f"not MATCH_{i}(v)", repr(f"does not match {field.pattern}")))
+            if field.min is not None:
+                checks.append((f"v < {field.min!r}", repr(f"must be >= {field.min}")))
+            if field.max is not None:
+                checks.append((f"v > {field.max!r}", repr(f"must be <= {field.max}")))
+            if field.items is not None:
+                checks.append((f"any({_type_test('x', field.items)} for x in v)",
+                               repr(f"items must be {field.items.__name__}")))
+            if field.item_pattern is not None:
+                namespace[f'ITEM_MATCH_{i}'] = field._item_match
+                checks.append((f"not all(map(ITEM_MATCH_{i}, v))", repr(f"items must match {field.item_pattern}")))
+
+            lines.append(f"    v = get({name!r}, MISSING)")
+            for j, (condition, message) in enumerate(checks):
+                lines.append(f"    {'if' if j == 0 else 'elif'} {condition}:")
+                lines.append(f"        add(where, {name!r}, {message})" if message else "        pass")
+        lines.append("    if not KNOWN.issuperset(record):")
+        lines.append("        for name in record:")
+        lines.append("            if name not in KNOWN:")
+        lines.append("                add(where, name, 'unknown field')")
+        source = '\n'.join(lines) + '\n'
+        exec(compile(source, f"<schema {self.name}>", 'exec'), namespace)
+        check = namespace[f"check_{self.name}"]
+        check.source = source
+        return check
+
+
+PHASE = Schema('phase', {
+    'id': Field(str, required=True, pattern=r'^[a-z0-9]+(?:-[a-z0-9]+)*$'),
+    'title': Field(str, required=True, nonempty=True),
+    'description': Field(str, required=True),
+    'duration': Field(str, required=True),
+    'weeks': Field(list, required=True, nonempty=True, items=int),
+    'days': Field(list, required=True, items=dict),
+})
+
+DAY = Schema('day', {
+    'globalDay': Field(int, required=True, min=1),
+    'week': Field(int, required=True, min=1),
+    'title': Field(str, required=True, nonempty=True),
+    'priority': Field(str, required=True, choices=('HIGH', 'MEDIUM', 'LOW', 'INFO')),
+    'reflectionPrompt': Field(str),
+    'minimalDetails': Field(bool),
+    'inactive': Field(bool),
+    'supersededBy': Field(str, nonempty=True),
+    'tasks': Field(list, required=True, nonempty=True, items=dict),
+    COMMENT_KEY: Field(list, items=str),
+})
+
+TASK = Schema('task', {
+    'label': Field(str, required=True, nonempty=True),
+    'estMinutes': Field(int, required=True, min=0, max=600),
+    'details': Field(str, nonempty=True),
+    'resourceLinks': Field(list, items=str, item_pattern=r'^https?://'),
+    'notebook': Field(str, pattern=r'\.ipynb$'),
+    'artifact': Field(str, nonempty=True),
+    'successCriteria': Field(str, nonempty=True),
+})
+
+_compiled = None
+
+
+def compiled_checks():
+    """The (phase, day, task) check functions, compiled on first use."""
+    global _compiled
+    if _compiled is None:
+        _compiled = (PHASE.compile(), DAY.compile(), TASK.compile())
+    return _compiled
+
+
+def interpreted_checks():
+    return (PHASE.check, DAY.check, TASK.check)
+
+
+def validate_plan(plan, total_days=PLAN_DAYS, checks=None):
+    """Validate every record and the cross-record invariants in one pass.
+
+    Returns a list of (where, field, message); `where` is (phase id,),
+    (phase id, globalDay) or (phase id, globalDay, task index), or () for
+    the plan as a whole. Records that are not objects are reported by the
+    check of the list holding them and not descended into. The plan must
+    end on day `total_days` (None skips that check). `checks` defaults to
+    the compiled checks.
+    """
+    errors = []
+    add = errors.append
+    check_phase, check_day, check_task = checks or compiled_checks()
+
+    def record(where, field, message):
+        add((where, field, message))
+
+    seen = set()
+    expected_day = 1
+    last_week = None
+    phases = plan.get('phases')
+    if not isinstance(phases, list):
+        record((), 'phases', f"expected list, got {type(phases).__name__}")
+    elif not all(isinstance(phase, dict) for phase in phases):
+        record((), 'phases', 'items must be dict')
+    for phase in _records(phases):
+        phase_id = phase.get('id')
+        where = (phase_id,)
+        check_phase(phase, where, record)
+        if type(phase_id) is str:
+            if phase_id in seen:
+                record(where, 'id', 'duplicate phase id')
+            seen.add(phase_id)
+
+        weeks = phase.get('weeks')
+        if type(weeks) is list and weeks and all(type(w) is int for w in weeks):
+            if weeks != list(range(weeks[0], weeks[0] + len(weeks))):
+                record(where, 'weeks', 'are not consecutive')
+            elif last_week is not None and weeks[0] not in (last_week, last_week + 1):
+                record(where, 'weeks', f"start at week {weeks[0]}, after week {last_week}")
+            last_week = weeks[-1]
+            week_set = set(weeks)
+        else:
+            week_set = set()
+
+        for day in _records(phase.get('days')):
+            global_day = day.get('globalDay')
+            where = (phase_id, global_day)
+            check_day(day, where, record)
+            if global_day != expected_day:
+                record(where, 'globalDay', f"expected day {expected_day}")
+            expected_day = (global_day if type(global_day) is int else expected_day) + 1
+            week = day.get('week')
+            if type(week) is int and week not in week_set:
+                record(where, 'week', f"week {week} is not one of the phase's weeks")
+            tasks = day.get('tasks')
+            for index, task in enumerate(tasks if isinstance(tasks, list) else ()):
+                if isinstance(task, dict):
+                    check_task(task, (phase_id, global_day, index), record)
+
+    days = expected_day - 1
+    if total_days is not None and days != total_days:
+        record((), 'globalDay', f"plan has {days} days, expected {total_days}")
+    return errors
+
+
+def _records(value):
+    """The dict items of a list of records; the schema checks report anything else."""
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def describe(where):
+    if not where:
+        return 'plan'
+    text = str(where[0]) if where[0] is not None else '?'
+    if len(where) > 1:
+        text += f" day {where[1]}"
+    if len(where) > 2:
+        text += f" task {where[2]}"
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('plan', nargs='?', default=STORE_DIR,
+                        help=f"Store directory, planPhases.js file or snapshot (default: {STORE_DIR})")
+    parser.add_argument('--days', type=int, default=PLAN_DAYS,
+                        help='Number of days the plan must have, 0 for any (default: %(default)s)')
+    parser.add_argument('--show-source', action='store_true', help='Print the compiled check functions')
+    args = parser.parse_args(argv)
+
+    if args.show_source:
+        for check in compiled_checks():
+            print(check.source)
+        return 0
+    try:
+        label, plan = load_side(args.plan)
+    except KeyError as e:
+        parser.error(e.args[0])
+    with stage('validate'):
+        errors = validate_plan(plan, args.days or None)
+    for where, field, message in errors:
+        print(f"✗ {describe(where)}: {field} {message}")
+    phases = _records(plan.get('phases'))
+    tasks = sum(len(_records(day.get('tasks'))) for phase in phases for day in _records(phase.get('days')))
+    print(f"{label}: {len(phases)} phases, {tasks} tasks, {len(errors)} schema error(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
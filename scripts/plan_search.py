@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Inverted search index over every task in the plan.
+
+Indexes task labels, day titles and the text of task details (HTML stripped
+with plan_html's scanner) across all phases, and serialises the result as a
+compact static JSON file that main.js loads the first time the search modal
+opens:
+
+    {
+      "phases":   [phase id, ...],
+      "days":     [[globalDay, title], ...],
+      "docs":     [[phase index, day index, task index, label], ...],
+      "terms":    "sorted tokens, separated by spaces",
+      "postings": ["encoded deltas", ...]     one string per term
+    }
+
+Each posting value is doc * 8 + field mask (4 = label, 2 = day title,
+1 = details), stored as the difference from the previous value, so a
+term's documents decode with a running sum. The deltas are written in base
+32, most significant digit first, with no separators: a digit that
+continues a number is chr(48 + d) ('0'..'O') and a number's last digit is
+chr(94 + d) ('^'..'}'). That takes about half the bytes of JSON number
+lists. Terms are sorted, so a prefix query is a binary search for the first
+and last matching term.
+
+Usage:
+    python scripts/plan_search.py "gradient desc"
+"""
+
+import argparse
+import bisect
+import re
+import sys
+
+import plan_metrics
+from plan_html import extract_text_from_html
+from plan_metrics import stage
+from plan_store import load_store
+
+FIELD_LABEL = 4
+FIELD_TITLE = 2
+FIELD_DETAILS = 1
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+# Base-32 digits of the posting strings: continuing digits, and last digits
+_DIGIT = 48
+_LAST_DIGIT = 94
+
+# Words too common to narrow a search; dropping them keeps the index small
+STOPWORDS = frozenset("""
+a an and are as at be by do for from in into is it its no not of on or s t
+that the this to with you your
+""".split())
+
+
+def tokenize(text):
+    """Lower-case word tokens; matches the tokenizer in main.js."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def build_search_index(plan):
+    """Return the search index for a loaded plan as a JSON-ready dict."""
+    phases, days, docs = [], [], []
+    postings = {}
+    for phase_index, phase in enumerate(plan['phases']):
+        phases.append(phase['id'])
+        for day in phase.get('days', []):
+            day_index = len(days)
+            days.append([day['globalDay'], day.get('title', '')])
+            title_tokens = set(tokenize(day.get('title', '')))
+            for task_index, task in enumerate(day.get('tasks', [])):
+                doc = len(docs)
+                docs.append([phase_index, day_index, task_index, task.get('label', '')])
+                fields = (
+                    (FIELD_LABEL, set(tokenize(task.get('label', '')))),
+                    (FIELD_TITLE, title_tokens),
+                    (FIELD_DETAILS, set(tokenize(extract_text_from_html(task.get('details', ''))))),
+                )
+                for mask, tokens in fields:
+                    for token in tokens:
+                        if token in STOPWORDS:
+                            continue
+                        doc_masks = postings.setdefault(token, {})
+                        doc_masks[doc] = doc_masks.get(doc, 0) | mask
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        previous = 0
+        deltas = []
+        for doc in sorted(postings[term]):
+            value = doc * 8 + postings[term][doc]
+            deltas.append(value - previous)
+            previous = value
+        encoded.append(encode_numbers(deltas))
+    return {'phases': phases, 'days': days, 'docs': docs, 'terms': ' '.join(terms), 'postings': encoded}
+
+
+def encode_numbers(numbers):
+    """Write non-negative integers as one separator-free base-32 string."""
+    chars = []
+    for number in numbers:
+        digits = [chr(_LAST_DIGIT + number % 32)]
+        number //= 32
+        while number:
+            digits.append(chr(_DIGIT + number % 32))
+            number //= 32
+        chars.extend(reversed(digits))
+    return ''.join(chars)
+
+
+def decode_numbers(text):
+    """Inverse of encode_numbers (main.js decodePostings does the same)."""
+    number = 0
+    for char in text:
+        code = ord(char)
+        if code >= _LAST_DIGIT:
+            yield number * 32 + code - _LAST_DIGIT
+            number = 0
+        else:
+            number = number * 32 + code - _DIGIT
+
+
+def _decode(encoded):
+    value = 0
+    for delta in decode_numbers(encoded):
+        value += delta
+        yield value >> 3, value & 7
+
+
+def search(index, query, limit=50):
+    """Return [(score, doc)] for documents matching every query token.
+
+    Each token matches as a prefix. Label hits outrank day-title hits, which
+    outrank details hits.
+    """
+    tokens = [t for t in tokenize(query) if t not in STOPWORDS]
+    if not tokens:
+        return []
+    terms = index['terms'].split(' ') if index['terms'] else []
+    scores = None
+    for token in tokens:
+        lo = bisect.bisect_left(terms, token)
+        hi = bisect.bisect_left(terms, token + '\uffff', lo)
+        masks = {}
+        for i in range(lo, hi):
+            for doc, mask in _decode(index['postings'][i]):
+                masks[doc] = masks.get(doc, 0) | mask
+        if scores is None:
+            scores = masks
+        else:
+            scores = {doc: scores[doc] + masks[doc] for doc in scores if doc in masks}
+        if not scores:
+            return []
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [(score, doc) for doc, score in ranked[:limit]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('query', nargs='*', help="Search terms (default: 'gradient')")
+    parser.add_argument('--limit', type=int, default=10, help='Results to list')
+    args = parser.parse_args(argv)
+    query = ' '.join(args.query) or 'gradient'
+
+    _, plan = load_store()
+    with stage('index'):
+        index = build_search_index(plan)
+    with stage('search'):
+        results = search(index, query)
+    print(f"Indexed {len(index['docs'])} tasks, {len(index['postings'])} terms "
+          f"in {plan_metrics.elapsed('index') * 1000:.0f} ms")
+    print(f"{len(results)} results for {query!r} in {plan_metrics.elapsed('search') * 1000:.2f} ms")
+    for score, doc in results[:args.limit]:
+        phase_index, day_index, task_index, label = index['docs'][doc]
+        global_day, title = index['days'][day_index]
+        print(f"  [{score}] Day {global_day} ({index['phases'][phase_index]}): {label}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
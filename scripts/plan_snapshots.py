@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshot store for the plan store (data/plan).
+
+Replaces the full planPhases.js.backup* copies. A snapshot splits the store
+into one chunk per line of each phase file (the phase record, then one day
+per line) plus plan.json, stores each chunk once under its SHA-256 as a
+zlib-compressed object, and records the ordered chunk list in a small JSON
+manifest. Unchanged days are shared between snapshots, so a snapshot only
+writes the chunks that actually changed.
+
+Restoring writes the snapshot's files back into data/plan, removes phase
+files the snapshot does not have, and recompiles planPhases.js and the
+bundles, so a bad store edit is rolled back with:
+
+    python scripts/plan_snapshots.py restore before-link-rewrite
+
+Snapshots of planPhases.js files (`import` of the old full-copy backups, or
+snapshots taken before the store existed) are split at day boundaries
+instead; restoring one imports it into the store.
+
+Layout:
+    snapshots/planPhases/objects/ab/cdef....z   compressed chunks
+    snapshots/planPhases/manifests/<name>.json  one manifest per snapshot
+
+Usage:
+    python scripts/plan_snapshots.py snapshot [--label before-inject]
+    python scripts/plan_snapshots.py list
+    python scripts/plan_snapshots.py diff <old> [<new>]   (default new: the store)
+    python scripts/plan_snapshots.py restore <name> [--output DIR] [--no-compile]
+    python scripts/plan_snapshots.py import <file> [<file> ...]
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime, timezone
+
+import plan_metrics
+from plan_compile import compile_store
+from plan_parser import PLAN_FILE, PlanSyntaxError, iter_days, parse_assignment
+from plan_store import INDEX_FILE, import_plan, save_imported
+from plan_store import STORE_DIR as PLAN_STORE
+
+STORE_DIR = 'snapshots/planPhases'
+FALLBACK_CHUNK_SIZE = 64 * 1024
+PHASE_SUFFIX = '.jsonl'
+
+
+def _object_path(store, digest):
+    return os.path.join(store, 'objects', digest[:2], digest[2:] + '.z')
+
+
+def _manifest_dir(store):
+    return os.path.join(store, 'manifests')
+
+
+def _unique_keys(chunks):
+    """Make chunk keys unique (a plan can repeat a globalDay)."""
+    seen = {}
+    for chunk in chunks:
+        key = chunk[0]
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] > 1:
+            yield (f"{key}#{seen[key]}",) + chunk[1:]
+        else:
+            yield chunk
+
+
+def split_chunks(content):
+    """Split planPhases.js source into (key, text) chunks at day boundaries.
+
+    Chunk keys are 'head' for everything before the first day and 'day<N>'
+    for each day (including whatever follows it up to the next day). If the
+    source does not parse, fixed-size chunks are used instead.
+    """
+    try:
+        plan = parse_assignment(content)
+        starts = [(f"day{day.get('globalDay')}", day.start) for _, day in iter_days(plan)]
+    except PlanSyntaxError:
+        starts = [(f"block{i}", pos)
+                  for i, pos in enumerate(range(0, len(content), FALLBACK_CHUNK_SIZE))]
+    if not starts or starts[0][1] != 0:
+        starts.insert(0, ('head', 0))
+
+    chunks = []
+    for i, (key, start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else len(content)
+        chunks.append((key, content[start:end]))
+    return list(_unique_keys(chunks))
+
+
+def store_files(source=PLAN_STORE):
+    """The files a store snapshot covers: plan.json, then the phase files by name."""
+    names = sorted(name for name in os.listdir(source) if name.endswith(PHASE_SUFFIX))
+    return [INDEX_FILE] + names
+
+
+def _line_key(phase_id, number, line):
+    if number == 0:
+        return f"{phase_id}:phase"
+    try:
+        return f"{phase_id}:day{json.loads(line)['globalDay']}"
+    except (ValueError, KeyError, TypeError):
+        return f"{phase_id}:line{number + 1}"
+
+
+def split_store(source=PLAN_STORE):
+    """Split a store into (key, file, text) chunks: plan.json whole, phase files by line."""
+    chunks = []
+    for name in store_files(source):
+        with open(os.path.join(source, name), 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        if name == INDEX_FILE:
+            chunks.append((name, name, content))
+            continue
+        phase_id = name[:-len(PHASE_SUFFIX)]
+        for number, line in enumerate(content.splitlines(True)):
+            chunks.append((_line_key(phase_id, number, line), name, line))
+        if not content:
+            chunks.append((f"{phase_id}:empty", name, ''))
+    return list(_unique_keys(chunks))
+
+
+def _store_digest(files):
+    """SHA-256 over (path, content) pairs in order."""
+    digest = hashlib.sha256()
+    for path, data in files:
+        digest.update(path.encode('utf-8') + b'\0' + str(len(data)).encode('ascii') + b'\0')
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _write_object(store, data):
+    """Store one chunk; returns (digest, bytes_written)."""
+    digest = hashlib.sha256(data).hexdigest()
+    path = _object_path(store, digest)
+    if os.path.exists(path):
+        return digest, 0
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    compressed = zlib.compress(data, 9)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(compressed)
+    os.replace(tmp_path, path)
+    return digest, len(compressed)
+
+
+def _read_object(store, digest):
+    with open(_object_path(store, digest), 'rb') as f:
+        return zlib.decompress(f.read())
+
+
+def _unique_name(store, label):
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+    slug = re.sub(r'[^A-Za-z0-9_.-]+', '-', label).strip('-')
+    base = f"{stamp}-{slug}" if slug else stamp
+    name = base
+    counter = 2
+    while os.path.exists(os.path.join(_manifest_dir(store), name + '.json')):
+        name = f"{base}-{counter}"
+        counter += 1
+    return name
+
+
+def _write_manifest(manifest, store):
+    os.makedirs(_manifest_dir(store), exist_ok=True)
+    with open(os.path.join(_manifest_dir(store), manifest['name'] + '.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+
+
+def snapshot_content(content, label='', source=PLAN_FILE, store=STORE_DIR):
+    """Snapshot planPhases.js source text. Returns (manifest, bytes_written)."""
+    written = 0
+    chunks = []
+    for key, text in split_chunks(content):
+        data = text.encode('utf-8')
+        digest, size = _write_object(store, data)
+        written += size
+        chunks.append({'key': key, 'hash': digest, 'size': len(data)})
+
+    encoded = content.encode('utf-8')
+    manifest = {
+        'name': _unique_name(store, label),
+        'label': label,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'kind': 'file',
+        'source': source,
+        'size': len(encoded),
+        'sha256': hashlib.sha256(encoded).hexdigest(),
+        'chunks': chunks,
+    }
+    _write_manifest(manifest, store)
+    return manifest, written
+
+
+def snapshot_store(label='', source=PLAN_STORE, store=STORE_DIR):
+    """Snapshot a plan store directory. Returns (manifest, bytes_written)."""
+    written = 0
+    chunks = []
+    files = {}
+    for key, name, text in split_store(source):
+        data = text.encode('utf-8')
+        digest, size = _write_object(store, data)
+        written += size
+        chunks.append({'key': key, 'file': name, 'hash': digest, 'size': len(data)})
+        files[name] = files.get(name, b'') + data
+
+    manifest = {
+        'name': _unique_name(store, label),
+        'label': label,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'kind': 'store',
+        'source': source,
+        'size': sum(map(len, files.values())),
+        'sha256': _store_digest(files.items()),
+        'chunks': chunks,
+    }
+    _write_manifest(manifest, store)
+    return manifest, written
+
+
+def take_snapshot(label='', source=PLAN_STORE, store=STORE_DIR):
+    """Snapshot the plan store before modifying it. Returns the manifest."""
+    manifest, written = snapshot_store(label, source, store)
+    print(f"Snapshot created: {manifest['name']} "
+          f"({len(manifest['chunks'])} chunks, {written:,} bytes written)")
+    return manifest
+
+
+def list_snapshots(store=STORE_DIR):
+    """Return all manifests, oldest first."""
+    directory = _manifest_dir(store)
+    if not os.path.isdir(directory):
+        return []
+    manifests = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith('.json'):
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                manifests.append(json.load(f))
+    return manifests
+
+
+def load_manifest(name, store=STORE_DIR):
+    """Load a manifest by name, name prefix or label (newest match wins)."""
+    manifests = list_snapshots(store)
+    exact = [m for m in manifests if m['name'] == name]
+    if exact:
+        return exact[0]
+    matches = [m for m in manifests if m['name'].startswith(name) or m['label'] == name]
+    if not matches:
+        raise KeyError(f"No snapshot named {name!r}")
+    # Labels are reused across runs; the newest match wins
+    return matches[-1]
+
+
+def is_store_snapshot(manifest):
+    return manifest.get('kind') == 'store'
+
+
+def restore_content(manifest, store=STORE_DIR):
+    """Rebuild the planPhases.js source of a file snapshot and verify its hash."""
+    if is_store_snapshot(manifest):
+        raise ValueError(f"Snapshot {manifest['name']} is a store snapshot; use restore_files()")
+    data = b''.join(_read_object(store, chunk['hash']) for chunk in manifest['chunks'])
+    if hashlib.sha256(data).hexdigest() != manifest['sha256']:
+        raise ValueError(f"Snapshot {manifest['name']} failed its integrity check")
+    return data.decode('utf-8')
+
+
+def restore_files(manifest, store=STORE_DIR):
+    """Rebuild the files of a store snapshot as {name: bytes} and verify its hash."""
+    files = {}
+    for chunk in manifest['chunks']:
+        files[chunk['file']] = files.get(chunk['file'], b'') + _read_object(store, chunk['hash'])
+    if _store_digest(files.items()) != manifest['sha256']:
+        raise ValueError(f"Snapshot {manifest['name']} failed its integrity check")
+    return files
+
+
+def load_snapshot_plan(manifest, store=STORE_DIR):
+    """The plan held by a snapshot of either kind, in the shape load_store() returns."""
+    if not is_store_snapshot(manifest):
+        return parse_assignment(restore_content(manifest, store))
+    files = restore_files(manifest, store)
+    index = json.loads(files[INDEX_FILE])
+    phases = []
+    for phase_id in index['phases']:
+        lines = [line for line in files[phase_id + PHASE_SUFFIX].decode('utf-8').splitlines() if line.strip()]
+        phase = json.loads(lines[0])
+        phase['days'] = [json.loads(line) for line in lines[1:]]
+        phases.append(phase)
+    return {'phases': phases}
+
+
+def restore_snapshot(manifest, output=PLAN_STORE, store=STORE_DIR):
+    """Write a snapshot back into a plan store directory.
+
+    Files that differ are rewritten and phase files the snapshot does not
+    have are removed. A file snapshot is imported into the store. Returns
+    the names of the files written or removed; the caller recompiles.
+    """
+    if not is_store_snapshot(manifest):
+        index, plan = import_plan(content=restore_content(manifest, store))
+        changed = [phase_id + PHASE_SUFFIX for phase_id in save_imported(index, plan, output)]
+        keep = {phase['id'] + PHASE_SUFFIX for phase in plan['phases']}
+    else:
+        files = restore_files(manifest, store)
+        os.makedirs(output, exist_ok=True)
+        changed = []
+        for name, data in files.items():
+            path = os.path.join(output, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    if f.read() == data:
+                        continue
+            with open(path, 'wb') as f:
+                f.write(data)
+            changed.append(name)
+        keep = set(files)
+    for name in store_files(output)[1:]:
+        if name not in keep:
+            os.remove(os.path.join(output, name))
+            changed.append(name)
+    return changed
+
+
+def diff_manifests(old, new):
+    """Compare two manifests chunk by chunk without reading any objects.
+
+    Returns {'added': [...], 'removed': [...], 'changed': [...]} of chunk keys.
+    """
+    old_chunks = {c['key']: c['hash'] for c in old['chunks']}
+    new_chunks = {c['key']: c['hash'] for c in new['chunks']}
+    return {
+        'added': [k for k in new_chunks if k not in old_chunks],
+        'removed': [k for k in old_chunks if k not in new_chunks],
+        'changed': [k for k in new_chunks if k in old_chunks and old_chunks[k] != new_chunks[k]],
+    }
+
+
+def _working_manifest(source):
+    """Build an in-memory manifest for a store without writing anything."""
+    chunks = [{'key': key, 'hash': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+               'text': text} for key, _, text in split_store(source)]
+    return {'name': source, 'kind': 'store', 'chunks': chunks}
+
+
+def _chunk_text(manifest, key, store):
+    for chunk in manifest['chunks']:
+        if chunk['key'] == key:
+            if 'text' in chunk:
+                return chunk['text']
+            return _read_object(store, chunk['hash']).decode('utf-8')
+    return ''
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--store', default=STORE_DIR, help='Snapshot store directory')
+    sub = parser.add_subparsers(dest='command', required=True)
+    instrumentation = plan_metrics.arguments()
+
+    p_snap = sub.add_parser('snapshot', help='Snapshot the plan store', parents=[instrumentation])
+    p_snap.add_argument('--source', default=PLAN_STORE, help=f"Plan store to snapshot (default: {PLAN_STORE})")
+    p_snap.add_argument('--label', default='manual')
+
+    sub.add_parser('list', help='List snapshots', parents=[instrumentation])
+
+    p_diff = sub.add_parser('diff', help='Show which days changed between snapshots',
+                            parents=[instrumentation])
+    p_diff.add_argument('old')
+    p_diff.add_argument('new', nargs='?', help=f"Snapshot name (default: the plan store, {PLAN_STORE})")
+    p_diff.add_argument('--text', action='store_true', help='Print a unified diff of changed chunks')
+
+    p_restore = sub.add_parser('restore', help='Write a snapshot back into the plan store and recompile',
+                               parents=[instrumentation])
+    p_restore.add_argument('name')
+    p_restore.add_argument('--output', default=PLAN_STORE, help=f"Plan store to restore into (default: {PLAN_STORE})")
+    p_restore.add_argument('--no-compile', action='store_true', help='Restore the store only')
+
+    p_import = sub.add_parser('import', help='Import existing full-copy backups', parents=[instrumentation])
+    p_import.add_argument('files', nargs='+')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'snapshot':
+        take_snapshot(args.label, args.source, args.store)
+
+    elif args.command == 'list':
+        for m in list_snapshots(args.store):
+            kind = 'store' if is_store_snapshot(m) else 'file'
+            print(f"{m['name']:<45} {kind:<5} {m['size']:>10,} bytes  {len(m['chunks']):>4} chunks  {m['label']}")
+
+    elif args.command == 'diff':
+        old = load_manifest(args.old, args.store)
+        new = load_manifest(args.new, args.store) if args.new else _working_manifest(PLAN_STORE)
+        if is_store_snapshot(old) != is_store_snapshot(new):
+            print("Snapshots of planPhases.js and of the store have different chunks; "
+                  "use plan_diff.py to compare them")
+            return 1
+        changes = diff_manifests(old, new)
+        for kind in ('added', 'removed', 'changed'):
+            print(f"{kind.capitalize()}: {len(changes[kind])}")
+            if changes[kind]:
+                print('  ' + ', '.join(changes[kind]))
+        if args.text:
+            for key in changes['changed'] + changes['added'] + changes['removed']:
+                sys.stdout.writelines(difflib.unified_diff(
+                    _chunk_text(old, key, args.store).splitlines(True),
+                    _chunk_text(new, key, args.store).splitlines(True),
+                    f"{old['name']}:{key}", f"{new['name']}:{key}"))
+
+    elif args.command == 'restore':
+        manifest = load_manifest(args.name, args.store)
+        changed = restore_snapshot(manifest, args.output, args.store)
+        print(f"Restored {manifest['name']} to {args.output}: {len(changed)} file(s) changed")
+        if not args.no_compile:
+            compiled = compile_store(store=args.output)
+            print(f"Compiled: {len(compiled)} file(s)")
+
+    elif args.command == 'import':
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            label = os.path.basename(path).replace('planPhases.js.', '')
+            manifest, written = snapshot_content(content, label, path, args.store)
+            print(f"Imported {path} as {manifest['name']} ({written:,} bytes written)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
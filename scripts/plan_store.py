@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Canonical JSON-Lines store for the learning plan.
+
+The plan lives in data/plan/ as plain JSON that any tool can json.load:
+
+    data/plan/plan.json         header comment, phase order, raw-export list,
+                                per-phase page settings ("phasePages"), task
+                                id renumberings ("taskRenames")
+    data/plan/<phase-id>.jsonl  line 1: the phase record (without days)
+                                line 2+: one day record per line, tasks inline
+
+Day records may carry a "//" key holding the comment lines that precede the
+day in the generated JavaScript. assets/js/data/planPhases.js and the
+phase_*_raw.js files are build artifacts compiled from this store by
+plan_compile.py.
+
+Usage:
+    from plan_store import load_store, save_store, update_tasks
+
+    index, plan = load_store()
+    report = update_tasks(plan, [('deep-learning_day71_task0', 'details', '...')])
+    save_store(index, plan)
+
+    python scripts/plan_store.py import [--file assets/js/data/planPhases.js]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import plan_metrics
+from plan_metrics import stage
+from plan_parser import PLAN_FILE, iter_tasks, load_plan, parse_assignment, task_id
+
+STORE_DIR = 'data/plan'
+INDEX_FILE = 'plan.json'
+COMMENT_KEY = '//'
+
+_COMMENT_LINE_RE = re.compile(r'^[ \t]*//[ \t]?(.*)$', re.MULTILINE)
+
+
+def phase_path(phase_id, store=STORE_DIR):
+    return os.path.join(store, f"{phase_id}.jsonl")
+
+
+def _dump_record(record):
+    return json.dumps(record, ensure_ascii=False, separators=(', ', ': '))
+
+
+def load_phase(phase_id, store=STORE_DIR):
+    """Load one phase file and return the phase with its days attached."""
+    with open(phase_path(phase_id, store), 'r', encoding='utf-8') as f:
+        phase = json.loads(f.readline())
+        phase['days'] = [json.loads(line) for line in f if line.strip()]
+    return phase
+
+
+def load_index(store=STORE_DIR):
+    with open(os.path.join(store, INDEX_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_store(store=STORE_DIR):
+    """Return (index, plan) where plan has the same shape as the JS PLAN."""
+    with stage('load'):
+        index = load_index(store)
+        plan = {'phases': [load_phase(phase_id, store) for phase_id in index['phases']]}
+    return index, plan
+
+
+def save_phase(phase, store=STORE_DIR):
+    """Write one phase file. Returns True if its content changed."""
+    record = {k: v for k, v in phase.items() if k != 'days'}
+    lines = [_dump_record(record)] + [_dump_record(day) for day in phase.get('days', [])]
+    text = '\n'.join(lines) + '\n'
+    path = phase_path(phase['id'], store)
+    with stage('write'):
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == text:
+                    return False
+        os.makedirs(store, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return True
+
+
+def save_store(index, plan, store=STORE_DIR):
+    """Write the index and every phase file. Returns the ids of phases that changed."""
+    index = dict(index, phases=[phase['id'] for phase in plan['phases']])
+    os.makedirs(store, exist_ok=True)
+    with open(os.path.join(store, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return [phase['id'] for phase in plan['phases'] if save_phase(phase, store)]
+
+
+def update_tasks(plan, edits):
+    """Apply (task_id, field, value) edits to a loaded plan in place.
+
+    Returns a report shaped like plan_patch's: applied edits, edits that were
+    no-ops, and conflicts (unknown task ids, the same field edited twice with
+    different values).
+    """
+    tasks = {task_id(phase, day, index): task for phase, day, index, task in iter_tasks(plan)}
+    report = {'applied': [], 'unchanged': [], 'conflicts': []}
+    wanted = {}
+    clashing = set()
+    for edit_task_id, field, value in edits:
+        key = (edit_task_id, field)
+        if key in wanted and wanted[key] != value and key not in clashing:
+            clashing.add(key)
+            report['conflicts'].append(
+                f"{edit_task_id}.{field}: edited more than once with different values")
+        wanted.setdefault(key, value)
+
+    for (edit_task_id, field), value in wanted.items():
+        if (edit_task_id, field) in clashing:
+            continue
+        task = tasks.get(edit_task_id)
+        if task is None:
+            report['conflicts'].append(f"{edit_task_id}: no such task")
+        elif task.get(field) == value and field in task:
+            report['unchanged'].append((edit_task_id, field))
+        else:
+            task[field] = value
+            report['applied'].append((edit_task_id, field))
+    return report
+
+
+def _comment_lines(text):
+    return _COMMENT_LINE_RE.findall(text)
+
+
+def import_plan(path=PLAN_FILE, content=None):
+    """Build (index, plan) from a planPhases.js file.
+
+    Comments directly before a day are kept on that day under "//"; the
+    leading file comment becomes the index header. Other comments are dropped.
+    Pass `content` to import source text that is not on disk.
+    """
+    if content is None:
+        content, parsed = load_plan(path)
+    else:
+        parsed = parse_assignment(content)
+    header_end = re.search(r'\b(?:const|let|var)\s+PLAN\s*=', content).start()
+    index = {'header': _comment_lines(content[:header_end]), 'phases': [], 'rawExports': []}
+
+    plan = {'phases': []}
+    for phase in parsed['phases']:
+        record = {}
+        for key, value in phase.items():
+            if key != 'days':
+                record[key] = value
+        days = []
+        previous_end = phase.spans['days'][0] + 1 if 'days' in phase.spans else phase.start
+        for day in phase.get('days', []):
+            comments = _comment_lines(content[previous_end:day.start])
+            day_record = {COMMENT_KEY: comments} if comments else {}
+            day_record.update(_plain(day))
+            days.append(day_record)
+            previous_end = day.end
+        record['days'] = days
+        plan['phases'].append(record)
+    return index, plan
+
+
+def save_imported(index, plan, store=STORE_DIR):
+    """save_store() for an imported plan, keeping settings that only live in the store."""
+    if os.path.exists(os.path.join(store, INDEX_FILE)):
+        current = load_index(store)
+        index['rawExports'] = current.get('rawExports', [])
+        for key in ('phasePages', 'taskRenames'):
+            if key in current:
+                index[key] = current[key]
+    return save_store(index, plan, store)
+
+
+def _plain(value):
+    """Strip parser offsets so values serialise as ordinary JSON."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--store', default=STORE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_import = sub.add_parser('import', help='(Re)build the store from a planPhases.js file',
+                              parents=[plan_metrics.arguments()])
+    p_import.add_argument('--file', default=PLAN_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == 'import':
+        index, plan = import_plan(args.file)
+        changed = save_imported(index, plan, args.store)
+        days = sum(len(phase['days']) for phase in plan['phases'])
+        print(f"Imported {args.file}: {len(plan['phases'])} phases, {days} days "
+              f"({len(changed)} phase files written to {args.store})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
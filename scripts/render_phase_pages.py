@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Render phases/<phase-id>.html from the plan store.
+
+Each page is fully rendered HTML: day cards with every task, estimated
+times, reflection prompts and task details collapsed in native <details>
+elements, so the page paints without any script. main.js only restores
+checkbox state on top (task ids are shared with the main page, so progress
+is the same in both places).
+
+Output is deterministic: the same store always renders the same bytes.
+With --incremental, a phase is only re-rendered when the hash of its data,
+its page settings or this renderer has changed since the last run into the
+same output directory (hashes are kept per directory in .render_state.json).
+
+Usage:
+    python scripts/render_phase_pages.py [--incremental] [--phase ID ...] [--diff REPORT]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+from urllib.parse import urlparse
+
+import plan_metrics
+from plan_diff import load_report
+from plan_metrics import stage
+from plan_store import COMMENT_KEY, STORE_DIR, load_store
+
+PAGES_DIR = 'phases'
+STATE_FILE = '.render_state.json'
+STORAGE_PREFIX = 'llmPlan'
+
+# Badge labels for resourceLinks, as in main.js createSourceBadges
+_BADGE_DOMAINS = (
+    ('datacamp.com', 'DataCamp'),
+    ('youtube.com', 'YouTube'),
+    ('youtu.be', 'YouTube'),
+    ('khanacademy.org', 'Khan Academy'),
+    ('numpy.org', 'NumPy Docs'),
+    ('pytorch.org', 'PyTorch Docs'),
+    ('huggingface.co', 'Hugging Face'),
+    ('3blue1brown.com', '3Blue1Brown'),
+    ('arxiv.org', 'arXiv'),
+)
+
+
+def _esc(text):
+    return html.escape(str(text), quote=True)
+
+
+def badge_label(url):
+    try:
+        hostname = (urlparse(url).hostname or '').replace('www.', '')
+    except ValueError:
+        return 'Link'
+    if not hostname:
+        return 'Link'
+    for domain, label in _BADGE_DOMAINS:
+        if hostname == domain or hostname.endswith('.' + domain):
+            return label
+    return hostname
+
+
+def render_task(phase, day, index, task):
+    task_id = f"{STORAGE_PREFIX}_{phase['id']}_day{day['globalDay']}_task{index}"
+    label = _esc(task.get('label', ''))
+    minutes = task.get('estMinutes')
+    time_html = f'<span class="task-time">{minutes}min</span>' if minutes else ''
+    lines = [
+        '<div class="task-item">',
+        '  <div class="task-header">',
+        f'    <input type="checkbox" id="{task_id}" data-task-id="{task_id}" aria-label="Task: {label}">',
+        f'    <label for="{task_id}"><span class="task-label">{label}</span>{time_html}</label>',
+        '  </div>',
+    ]
+    if task.get('details'):
+        badges = ''
+        if task.get('resourceLinks'):
+            links = ''.join(
+                f'<a class="source-badge" href="{_esc(url)}" target="_blank" '
+                f'rel="noopener noreferrer" title="{_esc(url)}">{_esc(badge_label(url))}</a>'
+                for url in task['resourceLinks'])
+            badges = f'<div class="task-source-badges"><strong>Quick Links:</strong> {links}</div>'
+        lines += [
+            '  <details class="task-details">',
+            '    <summary class="task-details-toggle"><span class="toggle-icon">▶</span> Details</summary>',
+            '    <div class="task-details-container">',
+            f'      <div class="task-details-content">{task["details"]}{badges}</div>',
+            '    </div>',
+            '  </details>',
+        ]
+    lines.append('</div>')
+    return lines
+
+
+def render_day(phase, day):
+    tasks = day.get('tasks', [])
+    est = sum(task.get('estMinutes') or 0 for task in tasks)
+    priority = day.get('priority', '')
+    lines = [
+        f'<div class="day-card" data-global-day="{day["globalDay"]}">',
+        '  <div class="day-card-header">',
+        '    <div class="day-card-title">',
+        f'      <h4>Day {day["globalDay"]}: {_esc(day.get("title", ""))}</h4>',
+        f'      <span class="priority-badge priority-{_esc(priority.lower())}">{_esc(priority)}</span>',
+        '    </div>',
+        '    <div class="day-card-meta">',
+        f'      <span class="time-estimate">Est: {est} min</span>',
+        '    </div>',
+        '  </div>',
+    ]
+    if tasks:
+        lines.append('  <div class="tasks-list">')
+        for index, task in enumerate(tasks):
+            lines += ['    ' + line for line in render_task(phase, day, index, task)]
+        lines.append('  </div>')
+    if day.get('reflectionPrompt'):
+        lines.append(f'  <div class="reflection-prompt"><strong>💭 Reflection:</strong> '
+                     f'{_esc(day["reflectionPrompt"])}</div>')
+    lines.append('</div>')
+    return lines
+
+
+def render_page(phase, settings=None):
+    """Return the full HTML of one phase page."""
+    settings = settings or {}
+    title = _esc(phase['title'])
+    days = phase.get('days', [])
+    task_total = sum(len(day.get('tasks', [])) for day in days)
+    meta = [f'<span><strong>Duration:</strong> {_esc(phase.get("duration", ""))}</span>']
+    if settings.get('focus'):
+        meta.append(f'<span><strong>Focus:</strong> {_esc(settings["focus"])}</span>')
+
+    day_lines = []
+    for day in days:
+        day_lines += ['      ' + line for line in render_day(phase, day)]
+        day_lines.append('')
+    body = '\n'.join(day_lines).rstrip('\n')
+    meta_html = '\n        '.join(meta)
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <meta name="description" content="{title} - Daily breakdown with interactive checkboxes">
+  <meta name="author" content="DovJNash">
+  <title>{title} | AI &amp; ML Mastery Plan</title>
+
+  <!-- Google Fonts -->
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+
+  <!-- Stylesheet -->
+  <link rel="stylesheet" href="/assets/css/main.css">
+</head>
+<body class="phase-page" data-phase="{_esc(phase['id'])}">
+  <!-- Generated by scripts/render_phase_pages.py from {STORE_DIR}/{_esc(phase['id'])}.jsonl - do not edit by hand -->
+  <!-- Skip to Content Link -->
+  <a href="#main-content" class="skip-to-content">Skip to content</a>
+
+  <!-- Header with Navigation -->
+  <header class="header phase-header" role="banner">
+    <div class="header-container">
+      <h1 class="site-title">
+        <a href="/index.html">← AI &amp; ML Mastery Plan</a>
+      </h1>
+      <h2 class="phase-page-title">{title}</h2>
+    </div>
+  </header>
+
+  <!-- Main Content -->
+  <main id="main-content" class="main-content phase-content" role="main">
+
+    <!-- Phase Info Card -->
+    <div class="phase-info-card">
+      <div class="phase-meta">
+        {meta_html}
+      </div>
+      <div class="phase-description">
+        <p>{_esc(phase.get('description', ''))}</p>
+      </div>
+    </div>
+
+    <!-- Progress Summary -->
+    <div class="progress-summary" role="status" aria-live="polite">
+      <h3>Progress</h3>
+      <div class="progress-stats">
+        <div class="stat">
+          <span class="stat-value" id="completed-tasks">0</span>
+          <span class="stat-label">Tasks Completed</span>
+        </div>
+        <div class="stat">
+          <span class="stat-value" id="total-tasks">{task_total}</span>
+          <span class="stat-label">Total Tasks</span>
+        </div>
+        <div class="stat">
+          <span class="stat-value" id="completion-percent">0%</span>
+          <span class="stat-label">Progress</span>
+        </div>
+        <div class="stat">
+          <span class="stat-value" id="days-completed">0</span>
+          <span class="stat-label">Days Complete</span>
+        </div>
+      </div>
+      <div class="progress-bar-container">
+        <div class="progress-bar" id="progress-bar" style="width: 0%"></div>
+      </div>
+    </div>
+
+    <!-- Control Bar -->
+    <div class="control-bar">
+      <button class="btn btn-secondary" id="expand-all" aria-label="Expand all task details">
+        Expand All
+      </button>
+      <button class="btn btn-secondary" id="collapse-all" aria-label="Collapse all task details">
+        Collapse All
+      </button>
+    </div>
+
+    <!-- Daily Breakdown -->
+    <div class="days-container">
+{body}
+    </div>
+
+    <!-- Back to Main Link -->
+    <div class="back-to-main">
+      <a href="/index.html" class="btn btn-secondary">← Back to Main Plan</a>
+    </div>
+
+  </main>
+
+  <!-- Footer -->
+  <footer class="footer" role="contentinfo">
+    <div class="footer-container">
+      <p>&copy; 2025 DovJNash. AI &amp; Machine Learning Mastery Plan.</p>
+      <p>
+        <a href="/index.html">Main Plan</a> |
+        <a href="https://github.com/DovJNash">GitHub</a>
+      </p>
+    </div>
+  </footer>
+
+  <!-- JavaScript -->
+  <script src="/assets/js/main.js"></script>
+</body>
+</html>
+"""
+
+
+def page_path(phase_id, pages_dir=PAGES_DIR):
+    return os.path.join(pages_dir, f"{phase_id}.html")
+
+
+def _renderer_version():
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def phase_hash(phase, settings):
+    """Hash of everything a page depends on."""
+    data = {k: v for k, v in phase.items()}
+    data['days'] = [{k: v for k, v in day.items() if k != COMMENT_KEY} for day in phase.get('days', [])]
+    payload = json.dumps([_renderer_version(), settings, data], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def load_state(path=STATE_FILE):
+    """{output directory: {phase id: hash}}."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    # Older state files held one {phase id: hash} map for every directory
+    return {k: v for k, v in state.items() if isinstance(v, dict)}
+
+
+def save_state(state, path=STATE_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+
+
+def render_pages(phase_ids=None, incremental=False, pages_dir=PAGES_DIR, store=STORE_DIR):
+    """Render phase pages. Returns (written, skipped) lists of phase ids."""
+    index, plan = load_store(store)
+    page_settings = index.get('phasePages', {})
+    state = load_state() if incremental else {}
+    hashes = state.setdefault(os.path.abspath(pages_dir), {})
+    written, skipped = [], []
+    for phase in plan['phases']:
+        if phase_ids and phase['id'] not in phase_ids:
+            continue
+        settings = page_settings.get(phase['id'], {})
+        digest = phase_hash(phase, settings)
+        path = page_path(phase['id'], pages_dir)
+        if incremental and hashes.get(phase['id']) == digest and os.path.exists(path):
+            skipped.append(phase['id'])
+            continue
+        with stage('transform'):
+            page = render_page(phase, settings)
+        with stage('write'):
+            os.makedirs(pages_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(page)
+        hashes[phase['id']] = digest
+        written.append(phase['id'])
+    if incremental:
+        save_state(state)
+    return written, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-render phases whose data changed since the last run')
+    parser.add_argument('--phase', action='append', metavar='ID', help='Render only this phase (repeatable)')
+    parser.add_argument('--diff', metavar='REPORT',
+                        help='Render only the phases affected in a plan_diff.py --json report')
+    parser.add_argument('--output-dir', default=PAGES_DIR)
+    args = parser.parse_args(argv)
+
+    phase_ids = args.phase
+    if args.diff:
+        affected = load_report(args.diff)['affected']['phases']
+        phase_ids = [p for p in phase_ids if p in affected] if phase_ids else affected
+        if not phase_ids:
+            print("No phases affected")
+            return 0
+    written, skipped = render_pages(phase_ids, args.incremental, args.output_dir)
+    for phase_id in written:
+        print(f"Rendered {page_path(phase_id, args.output_dir)}")
+    if skipped:
+        print(f"Up to date: {len(skipped)} page(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Generate docs/site_bundle.txt, a single-file reference snapshot of the site.
+
+The bundle holds README.md, every Markdown file under docs/ and a summary
+of the plan (phases, days, task counts) built from the store. Sections are
+streamed in fixed-size chunks, and the plan is read one day record at a
+time, so memory use does not grow with the size of the inputs.
+
+The header carries a table of contents with the byte offset and length of
+every section in the uncompressed bundle, so a reader can seek straight to
+a section:
+
+    # 0000001234 0000005678 README.md
+
+Each section may be capped at a byte budget (cut on a UTF-8 character
+boundary and marked as truncated). With --compress gzip or lzma the bundle
+is written compressed (.gz / .xz); the offsets still refer to the
+uncompressed text. Output is deterministic.
+
+Usage:
+    python scripts/site_bundle.py [--budget BYTES] [--section-budget README.md=4096]
+                                  [--compress gzip|lzma] [--output PATH]
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import lzma
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+import plan_metrics
+from plan_store import STORE_DIR, load_index, phase_path
+
+OUTPUT_FILE = 'docs/site_bundle.txt'
+DOC_SOURCES = ['README.md', 'docs/**/*.md']
+PLAN_SECTION = 'Plan summary (data/plan)'
+CHUNK_SIZE = 64 * 1024
+SECTION_RULE = '=================='
+COMPRESSORS = {
+    'gzip': ('.gz', lambda f: gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0)),
+    'lzma': ('.xz', lambda f: lzma.LZMAFile(f, mode='wb')),
+}
+
+_HEADER = (
+    "# AI & Machine Learning Mastery Plan - Site Bundle\n"
+    "# Generated by scripts/site_bundle.py - do not edit by hand\n"
+    "# Contents: byte offset and length of each section in the uncompressed bundle\n"
+)
+_TOC_LINE = "# {offset:010d} {length:010d} {title}\n"
+_TOC_RE = re.compile(r'^# (\d{10}) (\d{10}) (.*)\n$')
+
+
+def doc_files(patterns=DOC_SOURCES, exclude=(OUTPUT_FILE,)):
+    """Return the Markdown files that go into the bundle, in bundle order."""
+    files = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            path = os.path.normpath(path)
+            if path not in files and path not in exclude:
+                files.append(path)
+    return files
+
+
+def file_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def plan_summary_chunks(store=STORE_DIR):
+    """Yield a Markdown summary of the plan, one day record at a time."""
+    index = load_index(store)
+    phase_count = len(index['phases'])
+    yield f"The plan is organized into {phase_count} phases.\n".encode('utf-8')
+    for phase_id in index['phases']:
+        with open(phase_path(phase_id, store), 'r', encoding='utf-8') as f:
+            phase = json.loads(f.readline())
+            lines = []
+            days = tasks = detailed = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                day = json.loads(line)
+                day_tasks = day.get('tasks', [])
+                days += 1
+                tasks += len(day_tasks)
+                detailed += sum(1 for task in day_tasks if task.get('details'))
+                lines.append(f"- Day {day['globalDay']} [{day.get('priority', '')}]: "
+                             f"{day.get('title', '')} ({len(day_tasks)} tasks)\n")
+        yield (
+            f"\n### {phase['title']}\n"
+            f"{phase.get('duration', '')} - {days} days, {tasks} tasks, {detailed} with details\n\n"
+            f"{phase.get('description', '')}\n\n"
+            + ''.join(lines)
+        ).encode('utf-8')
+
+
+def _utf8_cut(chunk, limit):
+    """Cut `chunk` to at most `limit` bytes without splitting a character."""
+    end = limit
+    while end > 0 and (chunk[end] & 0xC0) == 0x80:
+        end -= 1
+    return chunk[:end]
+
+
+def write_section(out, title, chunks, budget=None):
+    """Stream one section into `out`; returns the number of bytes written."""
+    written = out.write(f"## {title}\n{SECTION_RULE}\n".encode('utf-8'))
+    used = 0
+    truncated = False
+    for chunk in chunks:
+        if budget is not None and used + len(chunk) > budget:
+            chunk = _utf8_cut(chunk, budget - used)
+            truncated = True
+        written += out.write(chunk)
+        used += len(chunk)
+        if truncated:
+            break
+    if truncated:
+        written += out.write(f"\n[... truncated at the {budget}-byte section budget]\n".encode('utf-8'))
+    written += out.write(b"\n\n")
+    return written
+
+
+def bundle_sections(store=STORE_DIR):
+    """Return [(title, chunk iterator factory)] in bundle order."""
+    sections = [(path, lambda path=path: file_chunks(path)) for path in doc_files()]
+    sections.append((PLAN_SECTION, lambda: plan_summary_chunks(store)))
+    return sections
+
+
+def build_bundle(output=OUTPUT_FILE, budget=None, section_budgets=None, compress=None, store=STORE_DIR):
+    """Write the bundle; returns (path written, [(title, offset, length)])."""
+    section_budgets = section_budgets or {}
+    sections = bundle_sections(store)
+
+    # The body is spooled first so the table of contents can precede it.
+    # TOC lines are fixed width, so the header size is known before the
+    # offsets are.
+    toc = []
+    with tempfile.TemporaryFile() as body:
+        position = 0
+        for title, chunks in sections:
+            length = write_section(body, title, chunks(), section_budgets.get(title, budget))
+            toc.append([title, position, length])
+            position += length
+
+        header_size = len(_HEADER.encode('utf-8')) + 1
+        header_size += sum(len(_TOC_LINE.format(offset=0, length=0, title=title).encode('utf-8'))
+                           for title, _, _ in toc)
+        header = _HEADER + ''.join(_TOC_LINE.format(offset=header_size + offset, length=length, title=title)
+                                   for title, offset, length in toc) + "\n"
+        toc = [(title, header_size + offset, length) for title, offset, length in toc]
+
+        suffix, opener = COMPRESSORS[compress] if compress else ('', None)
+        path = output + suffix
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        body.seek(0)
+        with open(path, 'wb') as raw:
+            out = opener(raw) if opener else raw
+            try:
+                out.write(header.encode('utf-8'))
+                shutil.copyfileobj(body, out, CHUNK_SIZE)
+            finally:
+                if out is not raw:
+                    out.close()
+    return path, toc
+
+
+def read_section(path, title):
+    """Return the text of one section, seeking straight to it via the TOC."""
+    opener = gzip.open if path.endswith('.gz') else lzma.open if path.endswith('.xz') else open
+    with opener(path, 'rb') as f:
+        for line in f:
+            if not line.startswith(b'#'):
+                break
+            match = _TOC_RE.match(line.decode('utf-8'))
+            if match and match.group(3) == title:
+                f.seek(int(match.group(1)))
+                return f.read(int(match.group(2))).decode('utf-8')
+    raise KeyError(title)
+
+
+def _parse_budget(value):
+    title, _, size = value.rpartition('=')
+    if not title:
+        raise argparse.ArgumentTypeError("expected TITLE=BYTES")
+    return title, int(size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0],
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--budget', type=int, help='Byte budget for every section')
+    parser.add_argument('--section-budget', type=_parse_budget, action='append', default=[],
+                        metavar='TITLE=BYTES', help='Byte budget for one section (repeatable)')
+    parser.add_argument('--compress', choices=sorted(COMPRESSORS))
+    parser.add_argument('--store', default=STORE_DIR)
+    args = parser.parse_args(argv)
+
+    path, toc = build_bundle(args.output, args.budget, dict(args.section_budget), args.compress, args.store)
+    print(f"Wrote {path} ({os.path.getsize(path)} bytes, {len(toc)} sections)")
+    for title, offset, length in toc:
+        print(f"  {offset:>8} {length:>8}  {title}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
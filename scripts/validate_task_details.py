@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 """
-Validate task details in planPhases.js for Phases 1-4.
+Validate task details in the plan store (data/plan/) for every phase found
+in the data. The store is plain JSON, loaded with json; no regex scans.
+Tasks are validated in chunks across a process pool (--jobs) and the results
+are merged back in plan order, so output does not depend on the job count.
+Results are cached per task in .validation_cache.json; only new or modified
+tasks are re-validated, and --changed-only reports just those (or the tasks
+changed in a git range).
 Checks:
 - Minimum 120 words per task detail
 - Presence of required <strong> tags (Action, Boundaries, Deliverable, Verification)
@@ -8,23 +14,34 @@ Checks:
 - Proper HTML formatting
 """
 
-import re
+import argparse
+import hashlib
+import json
+import os
+import subprocess
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 
+import plan_metrics
+from plan_diff import changed_task_ids, diff_plans, load_report
+from plan_html import scan_html
+from plan_metrics import stage
+from plan_mmap import close_store, map_store
+from plan_parser import PLAN_FILE, parse_assignment, phase_number, task_id
+from plan_store import STORE_DIR
 
-def extract_text_from_html(html):
-    """Extract plain text from HTML, removing tags."""
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html)
-    # Decode HTML entities
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    return text
+# Tasks per pool work item; small enough to balance phases of very
+# different sizes, large enough to keep pickling overhead low.
+CHUNK_SIZE = 64
+
+# Chunks per worker submitted ahead of the results being collected
+MAX_IN_FLIGHT = 2
+
+# Per-task results keyed by task id and a hash of label+details
+CACHE_FILE = '.validation_cache.json'
+
+REQUIRED_TAGS = ('Action', 'Boundaries', 'Deliverable', 'Verification')
 
 
 def count_words(text):
@@ -35,47 +52,224 @@ def count_words(text):
 def validate_details(details_text, task_label, day_num, phase_name):
     """Validate a single task's details. Returns list of issues."""
     issues = []
+    plain_text, headers, anchors = scan_html(details_text)
     
     # 1. Check word count (minimum 120 words)
-    plain_text = extract_text_from_html(details_text)
     word_count = count_words(plain_text)
     if word_count < 120:
         issues.append(f"❌ Only {word_count} words (minimum 120 required)")
     
     # 2. Check for required <strong> tags
-    required_tags = ['Action', 'Boundaries', 'Deliverable', 'Verification']
-    for tag in required_tags:
-        if f'<strong>{tag}:</strong>' not in details_text:
+    for tag in REQUIRED_TAGS:
+        if f'{tag}:' not in headers:
             issues.append(f"❌ Missing <strong>{tag}:</strong> tag")
     
     # 3. Check for at least 2 source links
-    link_pattern = r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>'
-    links = re.findall(link_pattern, details_text)
+    links = [(attrs, text) for attrs, text in anchors if attrs.get('href') and text]
     if len(links) < 2:
         issues.append(f"❌ Only {len(links)} source links (minimum 2 required)")
     
     # 4. Check link attributes
-    for url, text in links:
-        # Check for proper attributes
-        link_match = re.search(rf'<a\s+href="{re.escape(url)}"([^>]+)>{re.escape(text)}</a>', details_text)
-        if link_match:
-            attrs = link_match.group(1)
-            if 'target="_blank"' not in attrs:
-                issues.append(f"⚠️  Link to {url} missing target=\"_blank\"")
-            if 'rel="noopener"' not in attrs and 'rel="noreferrer"' not in attrs:
-                issues.append(f"⚠️  Link to {url} missing rel=\"noopener\" or rel=\"noreferrer\"")
+    for attrs, _ in links:
+        url = attrs['href']
+        if attrs.get('target') != '_blank':
+            issues.append(f"⚠️  Link to {url} missing target=\"_blank\"")
+        rel = attrs.get('rel', '').split()
+        if 'noopener' not in rel and 'noreferrer' not in rel:
+            issues.append(f"⚠️  Link to {url} missing rel=\"noopener\" or rel=\"noreferrer\"")
     
     return issues, word_count, len(links)
 
 
-def validate_planphases():
-    """Validate all task details in planPhases.js."""
-    
-    input_file = 'assets/js/data/planPhases.js'
+def validate_task(record):
+    """Validate one (task_key, day_num, task_label, details_text, phase_name) record."""
+    task_key, day_num, task_label, details_text, phase_name = record
+    issues, word_count, link_count = validate_details(
+        details_text, task_label, day_num, phase_name
+    )
+    return task_key, day_num, task_label, issues, word_count, link_count
+
+
+def validate_chunk(records):
+    """Validate a list of task records; runs inside pool workers."""
+    return [validate_task(record) for record in records]
+
+
+def task_hash(label, details):
+    """Hash of the fields a validation result depends on."""
+    return hashlib.sha1(f"{label}\0{details}".encode('utf-8')).hexdigest()
+
+
+def _validator_version():
+    # Any edit to this file (and so to the rules) invalidates cached results
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def load_cache(path=CACHE_FILE):
+    """Load {task_key: {'hash': ..., 'result': [issues, words, links]}}."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != _validator_version():
+        return {}
+    return data.get('tasks', {})
+
+
+def save_cache(tasks, path=CACHE_FILE):
+    """Persist the validation cache."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': _validator_version(), 'tasks': tasks}, f)
+
+
+class PhaseRecords:
+    """A phase's validation records, read from its days as they are iterated.
+
+    Yields (task_key, day_num, task_label, details_text, phase_name) for each
+    task with details and counts every task passed in `task_count`.
+    """
+
+    def __init__(self, phase, phase_name):
+        self.phase = phase
+        self.phase_name = phase_name
+        self.task_count = 0
+
+    def __iter__(self):
+        phase, phase_name = self.phase, self.phase_name
+        self.task_count = 0
+        for day in phase.get('days', []):
+            tasks = day.get('tasks', [])
+            self.task_count += len(tasks)
+            for index, task in enumerate(tasks):
+                if task.get('details'):
+                    yield (task_id(phase, day, index), day.get('globalDay', 0),
+                           task.get('label', ''), task['details'], phase_name)
+
+
+def collect_phase_records(plan, phase_numbers=None):
+    """Return [(phase_name, start_day, end_day, records)] in plan order.
+
+    Phases are discovered from the data; `phase_numbers` optionally limits
+    which ones are returned. `records` is a PhaseRecords that reads the
+    phase's days as it is consumed, so with a mapped plan (plan_mmap) no
+    more than one day is decoded at a time.
+    """
+    phases = []
+    for phase in plan['phases']:
+        number = phase_number(phase)
+        if phase_numbers and number not in phase_numbers:
+            continue
+        phase_name = f"Phase {number}" if number else phase.get('id', 'Phase ?')
+        days = phase.get('days', [])
+        start_day = days[0]['globalDay'] if days else 0
+        end_day = days[-1]['globalDay'] if days else 0
+        phases.append((phase_name, start_day, end_day, PhaseRecords(phase, phase_name)))
+    return phases
+
+
+def run_validation(phases, jobs=1, chunk_size=CHUNK_SIZE, cache=None):
+    """Validate every phase's records, in parallel when jobs > 1.
+
+    Records whose label+details hash matches `cache` reuse the cached result;
+    only new or modified tasks are validated, and `cache` is updated in place.
+    Records are consumed as a stream: pending ones are batched into chunks
+    and at most MAX_IN_FLIGHT chunks per job wait in the pool, so details
+    text is held only for tasks being validated.
+    Returns ({phase_name: [result, ...]}, revalidated_task_keys) with results
+    in task order, so the merged output is identical whatever the job count.
+    """
+    slots = []          # [phase_name, digest, result] in task order
+    revalidated = set()
+    chunk = []          # slot indexes of the chunk being filled
+    records = []
+    in_flight = deque()
+    pool = None
+
+    def store(indexes, chunk_results):
+        for i, result in zip(indexes, chunk_results):
+            slots[i][2] = result
+            if cache is not None:
+                cache[result[0]] = {'hash': slots[i][1], 'result': list(result[3:])}
+
+    def flush(final=False):
+        nonlocal pool
+        if pool is None and jobs > 1 and not final:
+            pool = ProcessPoolExecutor(max_workers=jobs)
+        if pool is None:
+            store(list(chunk), validate_chunk(records))
+        else:
+            in_flight.append((list(chunk), pool.submit(validate_chunk, list(records))))
+            while len(in_flight) > MAX_IN_FLIGHT * jobs:
+                indexes, future = in_flight.popleft()
+                store(indexes, future.result())
+        chunk.clear()
+        records.clear()
+
+    try:
+        for phase_name, _, _, phase_records in phases:
+            for record in phase_records:
+                key, day_num, label, details, _ = record
+                digest = task_hash(label, details)
+                entry = cache.get(key) if cache is not None else None
+                if entry and entry['hash'] == digest:
+                    slots.append([phase_name, digest, (key, day_num, label) + tuple(entry['result'])])
+                    continue
+                chunk.append(len(slots))
+                records.append(record)
+                revalidated.add(key)
+                slots.append([phase_name, digest, None])
+                if len(chunk) >= chunk_size:
+                    flush()
+        if chunk:
+            flush(final=True)
+        while in_flight:
+            indexes, future = in_flight.popleft()
+            store(indexes, future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    results = {phase[0]: [] for phase in phases}
+    for phase_name, _, result in slots:
+        results[phase_name].append(result)
+    return results, revalidated
+
+
+def _plan_at_revision(rev):
+    """Parse PLAN_FILE as of a git revision (empty plan if it did not exist)."""
+    proc = subprocess.run(['git', 'show', f'{rev}:{PLAN_FILE}'],
+                          capture_output=True, text=True, encoding='utf-8')
+    if proc.returncode != 0:
+        if 'exists on disk, but not in' in proc.stderr or 'does not exist in' in proc.stderr:
+            return {'phases': []}
+        raise RuntimeError(f"git show {rev}:{PLAN_FILE} failed: {proc.stderr.strip()}")
+    return parse_assignment(proc.stdout)
+
+
+def changed_task_keys(rev_range, plan):
+    """Task keys whose label/details differ across a git range.
+
+    `A..B` compares two revisions; a single revision `A` (or `A..`) compares
+    it with the working-tree plan.
+    """
+    old_rev, _, new_rev = rev_range.partition('..')
+    old_plan = _plan_at_revision(old_rev or 'HEAD')
+    new_plan = _plan_at_revision(new_rev) if new_rev else plan
+    return set(changed_task_ids(diff_plans(old_plan, new_plan, task_fields=('label', 'details'))))
+
+
+def validate_planphases(jobs=1, phase_numbers=None, changed_only=None, use_cache=True, diff_file=None):
+    """Validate all task details in the plan store.
+
+    `changed_only` limits the report to modified tasks: True means tasks that
+    changed since the cached run, a string is a git revision range.
+    `diff_file` limits it to the tasks listed in a plan_diff.py --json report.
+    """
     
-    print(f"Reading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    print(f"Reading {STORE_DIR}...")
+    _, plan = map_store(task_fields=('label', 'details'))
     
     # Track statistics by phase
     stats = defaultdict(lambda: {
@@ -87,74 +281,49 @@ def validate_planphases():
         'issues': []
     })
     
-    # Process each phase
-    phases_to_check = [
-        ('Phase 1:', 1, 42),
-        ('Phase 2:', 43, 49),
-        ('Phase 3:', 50, 70),
-        ('Phase 4:', 71, 119)
-    ]
+    cache = load_cache() if use_cache else None
+    phases = collect_phase_records(plan, phase_numbers)
+    with stage('validate'):
+        results, revalidated = run_validation(phases, jobs, cache=cache)
+    if cache is not None:
+        save_cache(cache)
+    print(f"Validated {len(revalidated)} new or modified tasks "
+          f"({sum(len(r) for r in results.values()) - len(revalidated)} cached)")
+    
+    report_keys = None
+    if changed_only is True:
+        report_keys = revalidated
+    elif changed_only:
+        report_keys = changed_task_keys(changed_only, plan)
+    if diff_file:
+        diff_keys = set(load_report(diff_file)['affected']['taskIds'])
+        report_keys = diff_keys if report_keys is None else report_keys & diff_keys
+    close_store(plan)
     
-    for phase_title, start_day, end_day in phases_to_check:
-        phase_name = phase_title.replace(':', '').strip()
+    for phase_name, start_day, end_day, records in phases:
+        task_count = records.task_count
+        if report_keys is not None:
+            phase_results = [r for r in results[phase_name] if r[0] in report_keys]
+            if not phase_results:
+                continue
+            results[phase_name] = phase_results
+            task_count = len(phase_results)
+        stats[phase_name]['total_tasks'] = task_count
         print(f"\n{'='*60}")
         print(f"Validating {phase_name} (Days {start_day}-{end_day})")
         print(f"{'='*60}")
         
-        # Extract phase content
-        phase_start = content.find(f"title: '{phase_title}")
-        if phase_start == -1:
-            print(f"⚠️  Could not find {phase_name}")
-            continue
-        
-        # Find next phase or end of phases array
-        next_phase_start = content.find("title: 'Phase", phase_start + 1)
-        if next_phase_start == -1:
-            next_phase_start = len(content)
-        
-        phase_content = content[phase_start:next_phase_start]
-        
-        # Find all tasks with details in this phase
-        task_pattern = r"{\s*label:\s*'([^']+)',\s*estMinutes:\s*(\d+)(?:,\s*resourceLinks:.*?)?(?:,\s*notebook:.*?)?(?:,\s*artifact:.*?)?(?:,\s*successCriteria:.*?)?,\s*details:\s*'((?:[^'\\]|\\.)+?)'\s*}"
-        
-        tasks = re.finditer(task_pattern, phase_content, re.DOTALL)
-        
-        task_count = 0
-        for task_match in tasks:
-            task_count += 1
-            task_label = task_match.group(1)
-            details_text = task_match.group(3)
-            
-            # Unescape JavaScript string
-            details_text = details_text.replace("\\'", "'")
-            details_text = details_text.replace("\\\\", "\\")
-            
-            # Try to find day number from context
-            task_start_pos = task_match.start()
-            context_before = phase_content[max(0, task_start_pos-500):task_start_pos]
-            day_match = re.search(r'globalDay:\s*(\d+)', context_before)
-            day_num = int(day_match.group(1)) if day_match else 0
-            
-            # Validate
-            issues, word_count, link_count = validate_details(
-                details_text, task_label, day_num, phase_name
-            )
-            
-            stats[phase_name]['total_tasks'] += 1
-            if details_text:
-                stats[phase_name]['tasks_with_details'] += 1
-                stats[phase_name]['min_words'] = min(stats[phase_name]['min_words'], word_count)
-                stats[phase_name]['max_words'] = max(stats[phase_name]['max_words'], word_count)
-                stats[phase_name]['total_words'] += word_count
+        for _, day_num, task_label, issues, word_count, link_count in results[phase_name]:
+            stats[phase_name]['tasks_with_details'] += 1
+            stats[phase_name]['min_words'] = min(stats[phase_name]['min_words'], word_count)
+            stats[phase_name]['max_words'] = max(stats[phase_name]['max_words'], word_count)
+            stats[phase_name]['total_words'] += word_count
             
             if issues:
                 print(f"\nDay {day_num}: {task_label[:60]}...")
                 for issue in issues:
                     print(f"  {issue}")
                 stats[phase_name]['issues'].extend(issues)
-            else:
-                # Success case - show only if verbose
-                pass
         
         # Phase summary
         phase_stats = stats[phase_name]
@@ -179,7 +348,7 @@ def validate_planphases():
     total_with_details = sum(s['tasks_with_details'] for s in stats.values())
     total_issues = sum(len(s['issues']) for s in stats.values())
     
-    print(f"Total tasks checked: {total_tasks}")
+    print(f"Total tasks: {total_tasks}")
     print(f"Tasks with details: {total_with_details}")
     print(f"Total issues: {total_issues}")
     
@@ -191,12 +360,34 @@ def validate_planphases():
         return 1
 
 
-if __name__ == "__main__":
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Validate task details in planPhases.js.",
+                                     parents=[plan_metrics.arguments()])
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes to validate with (default: CPU count)")
+    parser.add_argument('--phase', type=int, action='append', dest='phases',
+                        help="Only validate this phase number (repeatable)")
+    parser.add_argument('--changed-only', nargs='?', const=True, metavar='GIT_RANGE',
+                        help="Only report tasks changed since the last cached run, "
+                             "or within a git range such as HEAD~3..HEAD")
+    parser.add_argument('--diff', metavar='REPORT',
+                        help="Only report tasks listed in a plan_diff.py --json report")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"Ignore and do not update {CACHE_FILE}")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     try:
-        exit_code = validate_planphases()
-        sys.exit(exit_code)
+        return validate_planphases(args.jobs, args.phases, args.changed_only,
+                                   not args.no_cache, args.diff)
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(plan_metrics.run(main))
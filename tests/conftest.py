@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from plan_store import save_store  # noqa: E402
+
+INDEX = {'header': [], 'phases': ['alpha', 'beta'], 'rawExports': []}
+
+
+def make_plan():
+    """A small two-phase plan, built fresh on every call so tests can edit it."""
+    return {'phases': [
+        {'id': 'alpha', 'title': 'Alpha', 'days': [
+            {'globalDay': 1, 'tasks': [{'label': 'One', 'estMinutes': 30, 'details': 'x'},
+                                       {'label': 'Two', 'estMinutes': 45}]},
+            {'globalDay': 2, 'tasks': [{'label': 'Three', 'estMinutes': 60}]},
+            {'globalDay': 3, 'inactive': True, 'tasks': []},
+        ]},
+        {'id': 'beta', 'title': 'Beta', 'days': [
+            {'globalDay': 4, 'tasks': [{'label': 'Four', 'estMinutes': 90}]},
+        ]},
+    ]}
+
+
+@pytest.fixture
+def plan():
+    return make_plan()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A plan store directory holding make_plan()."""
+    directory = tmp_path / 'plan'
+    save_store(INDEX, make_plan(), str(directory))
+    return directory
@@ -0,0 +1,36 @@
+import argparse
+
+import pytest
+
+from generate_details import parse_days, parse_phases, select_days
+
+
+def test_parse_days():
+    assert parse_days('1-3, 7,') == {1, 2, 3, 7}
+
+
+@pytest.mark.parametrize('spec', ['5-2', ',', '', 'a-b'])
+def test_parse_days_rejects(spec):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_days(spec)
+
+
+def test_parse_phases_rejects_empty():
+    assert parse_phases('transformers, 6') == {'transformers', '6'}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_phases(',')
+
+
+def test_select_days_filters():
+    plan = {'phases': [
+        {'id': 'a', 'title': 'Phase 1: A', 'days': [
+            {'globalDay': 1, 'tasks': [{'label': 'x'}, {'label': 'y', 'details': 'done'}]},
+            {'globalDay': 2, 'tasks': [{'label': 'z'}]},
+        ]},
+        {'id': 'b', 'title': 'Phase 2: B', 'days': [{'globalDay': 3, 'tasks': [{'label': 'w'}]}]},
+    ]}
+    assert [(p['id'], d['globalDay'], i) for p, d, i in select_days(plan)] == \
+        [('a', 1, [0]), ('a', 2, [0]), ('b', 3, [0])]
+    assert [d['globalDay'] for _, d, _ in select_days(plan, days={2, 3}, phases={'2'})] == [3]
+    assert select_days(plan, days=set()) == []
+    assert [i for _, _, i in select_days(plan, days={1}, overwrite=True)] == [[0, 1]]
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+import plan_build
+import validate_task_details
+from plan_build import _code, main, run_build
+from plan_store import load_store, save_store
+
+
+def test_code_inputs_follow_imports():
+    code = _code(validate_task_details)
+    assert os.path.relpath(plan_build.__file__) not in code
+    for script in ('validate_task_details', 'plan_mmap', 'plan_diff', 'plan_snapshots', 'plan_html'):
+        assert os.path.join('scripts', f'{script}.py') in code
+
+
+def test_build_writes_under_out(store, tmp_path):
+    out = tmp_path / 'site'
+    results = run_build(store=str(store), out=str(out))
+    assert {name for name, _, _ in results} >= {'plan', 'bundles', 'page:alpha', 'page:beta', 'site-bundle'}
+    written = [path for _, _, paths in results for path in paths]
+    assert written and all(path.startswith(str(out)) for path in written)
+    assert (out / '.build_state.json').exists()
+    assert run_build(store=str(store), out=str(out)) == []
+
+    index, plan = load_store(str(store))
+    plan['phases'][1]['days'][0]['tasks'][0]['label'] = 'Changed'
+    save_store(index, plan, str(store))
+    assert [name for name, _, _ in run_build(store=str(store), out=str(out))] == \
+        ['plan', 'bundles', 'page:beta', 'site-bundle']
+
+
+def test_other_store_needs_out(store, capsys):
+    with pytest.raises(SystemExit):
+        main(['--store', str(store), '--dry-run'])
+    assert '--store needs --out' in capsys.readouterr().err
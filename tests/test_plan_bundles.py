@@ -0,0 +1,49 @@
+import json
+
+from plan_bundles import build_bundles, fragments_path
+from plan_compile import write_outputs
+from plan_fragments import build_table, decode
+
+SHARED = ['<strong>Action:</strong> ', 'Read the official tutorial first. ',
+          'Write down three questions as you go. ', 'Summarize what you learned today. ']
+
+
+def details(n):
+    return SHARED[n % 4] + f'Task {n} notes. ' + SHARED[(n + 1) % 4] + SHARED[(n + 2) % 4]
+
+
+def make_plan():
+    return {'phases': [
+        {'id': phase_id, 'title': f'Phase {p + 1}', 'days': [
+            {'globalDay': p * 4 + d + 1, 'week': d // 2 + 1,
+             'tasks': [{'label': f'T{i}', 'details': details(p * 12 + d * 3 + i)} for i in range(3)]}
+            for d in range(4)
+        ]} for p, phase_id in enumerate(['alpha', 'beta'])
+    ]}
+
+
+def test_table_keeps_indices():
+    a, b, c = 'a' * 20 + '. ', 'b' * 20 + '.', 'c' * 20 + '. '
+    table = build_table([a + b] * 2)
+    assert table == [a, b]
+    # b keeps its index; c takes the slot a no longer uses
+    assert build_table([b, c + b, c + b], table) == [c, b]
+    assert build_table([b], [c, b]) == [None, b]
+    assert build_table([c], [c, b]) == [c]
+
+
+def test_editing_one_task_changes_only_its_chunk(tmp_path):
+    plan = make_plan()
+    before = build_bundles(plan, str(tmp_path))
+    write_outputs(before, list(before))
+
+    task = plan['phases'][1]['days'][3]['tasks'][0]
+    task['details'] = task['details'].replace(SHARED[1], 'Skip the reading today. ')
+    after = build_bundles(plan, str(tmp_path))
+    changed = sorted(str(path.relative_to(tmp_path)) for path in map(tmp_path.joinpath, after)
+                     if before.get(str(path)) != after[str(path)])
+    assert changed == ['details/beta/week2.json', 'manifest.json', 'phases/beta.json', 'search.json']
+
+    table = json.loads(after[fragments_path(str(tmp_path))])
+    chunk = json.loads(after[str(tmp_path / 'details/beta/week2.json')])
+    assert decode(chunk['beta_day8_task0'], table) == task['details']
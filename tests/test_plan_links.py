@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from link_stub_server import start_server
+from plan_links import LinkChecker, check_links
+
+GONE = 'https://example.com/gone'
+MOVED = 'https://example.com/moved'
+GET_ONLY = 'https://example.org/get-only'
+
+
+@pytest.fixture
+def stub():
+    server = start_server(statuses={GONE: 404, MOVED: 301, '/error': 500}, no_head=[GET_ONLY])
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_reports_configured_statuses(stub):
+    urls = [GONE, MOVED, 'https://example.net/error', 'https://example.com/ok']
+    results, requested = check_links(urls, LinkChecker(endpoint=stub.url))
+    assert requested == urls
+    assert {url: results[url]['status'] for url in urls} == {
+        GONE: 404, MOVED: 301, 'https://example.net/error': 500, 'https://example.com/ok': 200}
+    assert [url for url in urls if not results[url]['ok']] == [GONE, 'https://example.net/error']
+    assert results[MOVED]['location'] == MOVED + '/moved'
+
+
+def test_head_falls_back_to_get(stub):
+    results, _ = check_links([GET_ONLY], LinkChecker(endpoint=stub.url))
+    assert results[GET_ONLY]['status'] == 200
+    assert stub.history == [('HEAD', GET_ONLY), ('GET', GET_ONLY)]
+
+
+def test_connections_are_reused(stub):
+    urls = [f'https://example.com/page{i}' for i in range(60)]
+    checker = LinkChecker(concurrency=8, per_host=2, endpoint=stub.url)
+    results, _ = check_links(urls, checker)
+    assert all(results[url]['ok'] for url in urls)
+    assert checker.requests == stub.requests == len(urls)
+    assert checker.pool.opened <= 2
+    assert stub.connections == checker.pool.opened
+
+
+def test_cache_skips_fresh_entries(stub):
+    now = time.time()
+    cache = {
+        'https://example.com/fresh': {'status': 200, 'ok': True, 'location': None, 'error': None,
+                                      'checked': now - 60},
+        'https://example.com/old': {'status': 200, 'ok': True, 'location': None, 'error': None,
+                                    'checked': now - 3 * 86400},
+        GONE: {'status': 404, 'ok': False, 'location': None, 'error': None, 'checked': now - 60},
+    }
+    urls = list(cache) + ['https://example.com/new']
+    results, requested = check_links(urls, LinkChecker(endpoint=stub.url), cache,
+                                     ttl=86400, failure_ttl=3600)
+    assert requested == ['https://example.com/old', 'https://example.com/new']
+    assert [target for _, target in stub.history] == requested
+    assert results[GONE]['checked'] == now - 60
+    assert cache['https://example.com/old']['checked'] >= now
@@ -0,0 +1,30 @@
+from plan_mmap import close_store, map_phase, map_store
+from plan_parser import iter_tasks
+from plan_store import load_store
+
+
+def test_mapped_store_matches_loaded_store(store):
+    _, loaded = load_store(str(store))
+    _, mapped = map_store(str(store))
+    try:
+        assert [(p['id'], d['globalDay'], i, t) for p, d, i, t in iter_tasks(mapped)] == \
+            [(p['id'], d['globalDay'], i, t) for p, d, i, t in iter_tasks(loaded)]
+        assert list(mapped['phases'][0]['days'][1:]) == loaded['phases'][0]['days'][1:]
+    finally:
+        close_store(mapped)
+
+
+def test_task_fields(store):
+    phase = map_phase('alpha', str(store), task_fields=('label',))
+    try:
+        assert phase['days'][0]['tasks'] == [{'label': 'One'}, {'label': 'Two'}]
+    finally:
+        phase.close()
+
+
+def test_empty_phase_file(tmp_path):
+    (tmp_path / 'gamma.jsonl').write_bytes(b'')
+    phase = map_phase('gamma', str(tmp_path))
+    assert phase['id'] == 'gamma'
+    assert len(phase['days']) == 0 and list(phase['days']) == []
+    phase.close()
@@ -0,0 +1,66 @@
+import pytest
+
+from plan_parser import PlanSyntaxError, iter_tasks, parse_assignment, parse_value
+
+PLAN = """// header
+const PLAN = {
+  phases: [
+    {
+      id: 'foundations',
+      title: "Phase 1: Foundations",  // trailing comment
+      days: [
+        { globalDay: 1, tasks: [{ label: 'It\\'s day one', estMinutes: 30 }] },
+        { globalDay: 2, tasks: [{ label: 'Two', estMinutes: 1.5e1, done: false }, ] },
+      ],
+    },
+  ],
+};
+"""
+
+
+def test_parses_literals_and_offsets():
+    plan = parse_assignment(PLAN)
+    phase = plan['phases'][0]
+    assert phase['title'] == 'Phase 1: Foundations'
+    labels = [task['label'] for _, _, _, task in iter_tasks(plan)]
+    assert labels == ["It's day one", 'Two']
+    assert plan['phases'][0]['days'][1]['tasks'][0]['estMinutes'] == 15.0
+    start, end = phase.spans['id']
+    assert PLAN[start:end] == "'foundations'"
+    day = phase['days'][0]
+    assert PLAN[day.start:day.end].startswith('{ globalDay: 1') and PLAN[day.end - 1] == '}'
+
+
+@pytest.mark.parametrize('source', [
+    'const PLAN = {"a": [1, 2',
+    'const PLAN = {"a": [1, 2,',
+    'const PLAN = {"a": 1',
+    'const PLAN = {"a": 1,',
+    'const PLAN = {a: {b: [',
+    'const PLAN = {',
+    'const PLAN = [',
+])
+def test_truncated_input(source):
+    with pytest.raises(PlanSyntaxError, match='end of input') as error:
+        parse_assignment(source)
+    assert error.value.pos == len(source)
+
+
+@pytest.mark.parametrize('source, message', [
+    ('const PLAN = {"a": 1 "b": 2}', "Expected ',' or '}'"),
+    ('const PLAN = [1 2]', "Expected ',' or ']'"),
+    ('const PLAN = {"a" 1}', "Expected ':'"),
+    ('const PLAN = {"a: 1}', 'Unterminated string key'),
+    ("const PLAN = {a: 'oops}", 'Unterminated string'),
+    ('const PLAN = {a: undefined}', 'Unexpected token'),
+    ('const OTHER = {}', 'No assignment to PLAN'),
+])
+def test_syntax_errors(source, message):
+    with pytest.raises(PlanSyntaxError, match=message):
+        parse_assignment(source)
+
+
+def test_error_reports_line_and_column():
+    with pytest.raises(PlanSyntaxError, match='line 2, column 8') as error:
+        parse_value('{\n  "a": ?}')
+    assert error.value.pos == 9
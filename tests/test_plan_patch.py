@@ -0,0 +1,64 @@
+from plan_parser import index_tasks, parse_assignment
+from plan_patch import apply_edits, format_js_value, splice
+
+PLAN = """const PLAN = {
+  phases: [
+    { id: 'p', days: [
+      { globalDay: 1, tasks: [{ label: 'One', estMinutes: 30 }, { label: 'Two' }] },
+    ] },
+  ],
+};
+"""
+
+
+def test_splice_applies_sorted_splices():
+    assert splice('abcdef', [(0, 1, 'A'), (3, 3, '-'), (4, 6, '')]) == 'Abc-d'
+    assert splice('abc', []) == 'abc'
+
+
+def test_apply_edits_round_trip():
+    plan = parse_assignment(PLAN)
+    content, report = apply_edits(PLAN, plan, [
+        ('p_day1_task0', 'estMinutes', 45),
+        ('p_day1_task0', 'label', "It's one"),
+        ('p_day1_task1', 'estMinutes', 10),
+        ('p_day1_task1', 'done', False),
+    ])
+    assert not report['conflicts'] and len(report['applied']) == 4
+    tasks = parse_assignment(content)['phases'][0]['days'][0]['tasks']
+    assert tasks == [{'label': "It's one", 'estMinutes': 45},
+                     {'label': 'Two', 'estMinutes': 10, 'done': False}]
+    # Everything outside the edited values is left byte for byte
+    assert content.replace("'It\\'s one', estMinutes: 45", "'One', estMinutes: 30") \
+        .replace(", estMinutes: 10, done: false", '') == PLAN
+
+
+def test_apply_edits_reports_unchanged_and_conflicts():
+    plan = parse_assignment(PLAN)
+    content, report = apply_edits(PLAN, plan, [
+        ('p_day1_task0', 'label', 'One'),
+        ('p_day1_task9', 'label', 'Missing'),
+        ('p_day1_task1', 'label', 'A'),
+        ('p_day1_task1', 'label', 'B'),
+    ])
+    assert content == PLAN
+    assert report['applied'] == []
+    assert report['unchanged'] == [('p_day1_task0', 'label')]
+    assert sorted(report['conflicts']) == [
+        'p_day1_task1.label: edited more than once with different values',
+        'p_day1_task9: no such task',
+    ]
+
+
+def test_format_js_value():
+    assert format_js_value({'a': [1, True, None, "it's"]}) == "{ a: [1, true, null, 'it\\'s'] }"
+
+
+def test_overlapping_edit_is_not_reported_applied():
+    plan = parse_assignment(PLAN)
+    tasks = index_tasks(plan)
+    tasks['alias'] = tasks['p_day1_task0']
+    content, report = apply_edits(PLAN, plan, [('p_day1_task0', 'label', 'A'), ('alias', 'label', 'B')], tasks)
+    assert len(report['conflicts']) == 1 and report['conflicts'][0].startswith('Overlapping edits')
+    assert len(report['applied']) == 1
+    assert parse_assignment(content)['phases'][0]['days'][0]['tasks'][0]['label'] in ('A', 'B')
@@ -0,0 +1,109 @@
+import pytest
+
+from plan_schedule import PlanColumns, apply_moves, plan_moves
+
+
+def move(task, label, old, new):
+    return {'task': task, 'label': label, 'from': old, 'to': new}
+
+
+def labels(plan, p=0):
+    return [[task['label'] for task in day['tasks']] for day in plan['phases'][p]['days']]
+
+
+def minutes_plan(*phases):
+    """A plan whose days hold tasks of the given minutes, labelled in plan order."""
+    plan = {'phases': []}
+    global_day = 0
+    for p, days in enumerate(phases):
+        phase = {'id': f'p{p}', 'days': []}
+        for minutes in days:
+            global_day += 1
+            phase['days'].append({'globalDay': global_day, 'tasks': [
+                {'label': f'{global_day}.{i}', 'estMinutes': m} for i, m in enumerate(minutes)]})
+        plan['phases'].append(phase)
+    return plan
+
+
+def rebalance(plan, cap, **options):
+    """Plan and apply moves; returns (moves, day loads after, renumbered ids)."""
+    moves, _ = plan_moves(plan, cap, **options)
+    report = apply_moves(plan, moves)
+    assert not report['conflicts']
+    return moves, list(PlanColumns(plan).day_loads()), report['renumbered']
+
+
+def task_order(plan):
+    return [[task['label'] for day in phase['days'] for task in day['tasks']] for phase in plan['phases']]
+
+
+def test_apply_moves(plan):
+    report = apply_moves(plan, [move('alpha_day1_task1', 'Two', 1, 2)])
+    assert not report['conflicts'] and len(report['applied']) == 1
+    assert labels(plan) == [['One'], ['Two', 'Three'], []]
+    # Three did not move but is now the second task of its day
+    assert report['renumbered'] == {'alpha_day1_task1': 'alpha_day2_task0',
+                                    'alpha_day2_task0': 'alpha_day2_task1'}
+
+
+@pytest.mark.parametrize('moves, expected', [
+    ([move('alpha_day1_task5', 'X', 1, 2)], 'alpha_day1_task5: no such task'),
+    ([move('alpha_day1_task1', 'Renamed', 1, 2)], 'alpha_day1_task1: task has changed since the patch was made'),
+    ([move('alpha_day1_task1', 'Two', 1, 3)], 'alpha_day1_task1: day 3 is not an active day of alpha'),
+    ([move('alpha_day1_task1', 'Two', 1, 4)], 'alpha_day1_task1: day 4 is not an active day of alpha'),
+    ([move('alpha_day1_task0', 'One', 1, 2)], 'alpha: moves would change the order of tasks'),
+    ([move('alpha_day2_task0', 'Three', 2, 1)], 'alpha: moves would leave day 2 without tasks'),
+    ([move('alpha_day1_task0', 'One', 1, 2), move('alpha_day1_task1', 'Two', 1, 2)],
+     'alpha: moves would leave day 1 without tasks'),
+])
+def test_apply_moves_conflicts(plan, moves, expected):
+    before = repr(plan)
+    report = apply_moves(plan, moves)
+    assert report['applied'] == [] and report['renumbered'] == {}
+    assert report['conflicts'] == [expected]
+    assert repr(plan) == before
+
+
+def test_rebalances_under_cap_in_order_and_phase():
+    plan = minutes_plan([[100, 100, 100], [50], [120, 130], [20]], [[300], [10]])
+    order = task_order(plan)
+    moves, loads, renumbered = rebalance(plan, 240)
+    # The second phase's 300-minute task cannot be split or leave its phase
+    assert loads[:4] == [200, 150, 120, 150] and loads[4:] == [300, 10]
+    assert task_order(plan) == order
+    assert [(m['task'], m['newTask']) for m in moves] == [('p0_day1_task2', 'p0_day2_task0'),
+                                                         ('p0_day3_task1', 'p0_day4_task0')]
+    assert renumbered == {'p0_day1_task2': 'p0_day2_task0', 'p0_day2_task0': 'p0_day2_task1',
+                          'p0_day3_task1': 'p0_day4_task0', 'p0_day4_task0': 'p0_day4_task1'}
+
+
+def test_fewest_moves_on_ties():
+    # Moving one task to day 2 or shifting a chain into day 3 both end at no overflow
+    plan = minutes_plan([[100, 100, 100], [20], [20]])
+    moves, loads, _ = rebalance(plan, 240)
+    assert len(moves) == 1 and loads == [200, 120, 20]
+
+
+def test_window_limits_boundary_shift():
+    days = [[60] * 8, [10], [10], [10]]
+    moves, loads, _ = rebalance(minutes_plan(days), 120, window=1)
+    assert len(moves) == 1 and loads == [420, 70, 10, 10]
+    wide_moves, wide_loads, _ = rebalance(minutes_plan(days), 120, window=8)
+    assert sum(max(0, load - 120) for load in wide_loads) < sum(max(0, load - 120) for load in loads)
+    assert len(wide_moves) > len(moves)
+
+
+def test_move_cost():
+    days = [[100, 100, 50], [100]]
+    moves, loads, _ = rebalance(minutes_plan(days), 240)
+    assert len(moves) == 1 and loads == [200, 150]
+    # Each move now has to save more than the 10 minutes of overflow it removes
+    moves, loads, _ = rebalance(minutes_plan(days), 240, move_cost=20)
+    assert moves == [] and loads == [250, 100]
+
+
+def test_inactive_days_are_left_alone():
+    plan = minutes_plan([[200, 100], [10], [10]])
+    plan['phases'][0]['days'][1]['inactive'] = True
+    moves, loads, _ = rebalance(plan, 240)
+    assert moves == [] and loads == [300, 10, 10]
@@ -0,0 +1,32 @@
+from plan_schema import describe, main, validate_plan
+
+MALFORMED = """const PLAN = { phases: [
+  { id: 5, title: 'Bad', days: ['day', { globalDay: 1, tasks: [3, { label: 'x' }] }] },
+  7,
+] };
+"""
+
+
+def test_describe():
+    assert describe(()) == 'plan'
+    assert describe(('alpha', 3, 1)) == 'alpha day 3 task 1'
+    assert describe((5, 1)) == '5 day 1'
+    assert describe((None,)) == '?'
+
+
+def test_malformed_records_are_reported():
+    plan = {'phases': [{'id': 5, 'days': ['day', {'globalDay': 1, 'tasks': [3]}]}, 7]}
+    errors = validate_plan(plan, total_days=None)
+    assert ((), 'phases', 'items must be dict') in errors
+    assert ((5,), 'id', 'expected str, got int') in errors
+    assert ((5,), 'days', 'items must be dict') in errors
+    assert ((5, 1), 'tasks', 'items must be dict') in errors
+
+
+def test_cli_reports_malformed_phase(tmp_path, capsys):
+    path = tmp_path / 'planPhases.js'
+    path.write_text(MALFORMED)
+    assert main([str(path), '--days', '0']) == 1
+    out = capsys.readouterr().out
+    assert '✗ 5: id expected str, got int' in out
+    assert '1 phases, 1 tasks' in out
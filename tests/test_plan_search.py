@@ -0,0 +1,24 @@
+import json
+
+from plan_search import build_search_index, decode_numbers, encode_numbers, search
+
+
+def test_numbers_round_trip():
+    numbers = [0, 1, 31, 32, 1023, 1024, 10 ** 9]
+    text = encode_numbers(numbers)
+    assert list(decode_numbers(text)) == numbers
+    # Nothing JSON would have to escape
+    assert json.dumps(text) == f'"{text}"'
+
+
+def test_search(plan):
+    plan['phases'][0]['days'][1]['title'] = 'Gradient day'
+    plan['phases'][0]['days'][0]['tasks'][1]['details'] = '<strong>Action:</strong> compute the gradient &amp; more'
+    index = json.loads(json.dumps(build_search_index(plan)))
+    docs = [label for _, _, _, label in index['docs']]
+    # Day-title hits outrank details hits; 'the' is a stopword
+    assert [docs[doc] for _, doc in search(index, 'the grad')] == ['Three', 'Two']
+    assert search(index, 'action compute') == [(2, 1)]
+    assert search(index, 'amp') == []
+    assert search(index, 'missing') == []
+    assert search(build_search_index({'phases': []}), 'x') == []
@@ -0,0 +1,64 @@
+import pytest
+
+import plan_diff
+import plan_duplicates
+import plan_schema
+from plan_snapshots import (diff_manifests, load_snapshot_plan, restore_content, restore_snapshot,
+                            snapshot_content, snapshot_store, store_files)
+from plan_store import load_store, save_store
+
+
+def read_files(directory):
+    return {name: (directory / name).read_bytes() for name in store_files(str(directory))}
+
+
+def test_store_snapshot_restores_byte_for_byte(store, tmp_path):
+    snapshots = str(tmp_path / 'snapshots')
+    before = read_files(store)
+    manifest, _ = snapshot_store('before', str(store), snapshots)
+
+    index, plan = load_store(str(store))
+    plan['phases'][0]['days'][1]['tasks'][0]['label'] = 'Changed'
+    save_store(index, plan, str(store))
+    (store / 'extra.jsonl').write_text('{"id": "extra"}\n')
+
+    changed = restore_snapshot(manifest, str(store), snapshots)
+    assert sorted(changed) == ['alpha.jsonl', 'extra.jsonl']
+    assert read_files(store) == before
+    assert restore_snapshot(manifest, str(store), snapshots) == []
+    assert load_snapshot_plan(manifest, snapshots) == load_store(str(store))[1]
+
+
+def test_unchanged_days_are_shared(store, tmp_path):
+    snapshots = str(tmp_path / 'snapshots')
+    first, _ = snapshot_store('one', str(store), snapshots)
+    index, plan = load_store(str(store))
+    plan['phases'][1]['days'][0]['tasks'][0]['estMinutes'] = 120
+    save_store(index, plan, str(store))
+    second, written = snapshot_store('two', str(store), snapshots)
+    assert 0 < written < sum(chunk['size'] for chunk in second['chunks'])
+    assert diff_manifests(first, second) == {'added': [], 'removed': [], 'changed': ['beta:day4']}
+
+
+def test_file_snapshot_round_trip(tmp_path):
+    content = "const PLAN = {\n  phases: [\n    { id: 'p', days: [\n      { globalDay: 1, tasks: [] },\n    ] },\n  ],\n};\n"
+    manifest, _ = snapshot_content(content, 'legacy', store=str(tmp_path))
+    assert restore_content(manifest, str(tmp_path)) == content
+
+
+def test_corrupt_object_fails_integrity_check(store, tmp_path):
+    snapshots = tmp_path / 'snapshots'
+    manifest, _ = snapshot_store('before', str(store), str(snapshots))
+    chunk = manifest['chunks'][-1]
+    manifest['chunks'][-1] = dict(chunk, hash=manifest['chunks'][0]['hash'])
+    with pytest.raises(ValueError, match='integrity'):
+        restore_snapshot(manifest, str(tmp_path / 'out'), str(snapshots))
+
+
+@pytest.mark.parametrize('module', [plan_diff, plan_duplicates, plan_schema])
+def test_unknown_snapshot_is_a_usage_error(module, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exit_info:
+        module.main(['no-such-snapshot'])
+    assert exit_info.value.code == 2
+    assert "No snapshot named 'no-such-snapshot'" in capsys.readouterr().err